@@ -14,12 +14,48 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = True
+
+    # Production Server (python -m app.server)
+    server_workers: int = 2  # 워커 프로세스 수
+    server_graceful_timeout_seconds: float = 30  # 종료 시 진행 중인 요청을 기다리는 시간
+    server_drain_timeout_seconds: float = 60  # 종료 시 실행 중인 백그라운드 작업을 기다리는 시간
+    warmup_enabled: bool = True  # 시작 시 Gemini 클라이언트 생성, 합성 분석+렌더링 요청 실행
     
     # CORS
     cors_origins: List[str] = ["http://localhost:3000"]
     
     # Gemini API (Step 3)
     gemini_api_key: str = ""
+    gemini_base_url: str = ""  # 비어 있으면 Google 기본 주소 (테스트용 스텁 서버 지정 가능)
+    gemini_timeout_seconds: float = 60  # 고찰 생성, PDF 추출
+    gemini_report_timeout_seconds: float = 180  # 전체 리포트 생성
+    gemini_max_concurrency: int = 8  # 워커당 동시에 진행할 최대 모델 호출 수
+    gemini_max_input_tokens: int = 1_048_576  # 모델 입력 한도 (추정 토큰 수가 넘으면 호출하지 않음)
+    prompt_token_budget: int = 6000  # 프롬프트 하나의 목표 토큰 수 (매뉴얼, 추가 맥락을 이 안에 맞춰 축약)
+
+    # Parallel Full Report (실험별 섹션을 병렬 생성 후 종합)
+    report_parallel_min_experiments: int = 4  # generation_mode=auto일 때 병렬 생성으로 전환할 실험 수
+    report_parallel_max_concurrency: int = 4  # 리포트 하나가 동시에 진행하는 실험별 호출 수
+
+    # Gemini Resilience (일시 오류 재시도, 서킷 브레이커)
+    gemini_retry_max_attempts: int = 4  # 429/5xx/연결 오류 시 최대 시도 횟수 (제한 시간 안에서)
+    gemini_retry_base_delay_seconds: float = 0.5  # 지수 백오프 기본 대기 시간 (full jitter)
+    gemini_retry_max_delay_seconds: float = 8  # 재시도 간 최대 대기 시간 (Retry-After가 더 길면 그 값)
+    gemini_circuit_failure_threshold: int = 5  # 연속 실패가 이 횟수에 도달하면 호출 중단
+    gemini_circuit_reset_seconds: float = 30  # 호출 중단 후 시험 호출까지 대기 시간
+
+    # LLM Response Cache (같은 프롬프트의 모델 호출 재사용)
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 512
+    llm_cache_ttl_seconds: int = 7 * 24 * 60 * 60
+    llm_cache_db_path: str = ""  # 예: storage/llm_cache.sqlite3 (비어 있으면 메모리만 사용)
+
+    # Manual Extraction Cache (PDF 해시별 매뉴얼 추출 결과)
+    manual_cache_dir: str = "storage/manuals"  # 비어 있으면 메모리만 사용
+    manual_cache_memory_entries: int = 64
+
+    # Admin API (비어 있으면 관리자 API 비활성화)
+    admin_token: str = ""
     
     # Supabase (Step 4에서 사용)
     supabase_url: str = ""
@@ -29,17 +65,67 @@ class Settings(BaseSettings):
     max_file_size_mb: int = 10
     allowed_extensions: List[str] = [".csv", ".xlsx", ".xls"]
 
+    # Upload Reader (청크 단위 읽기, 큰 파일은 임시 파일로 spool)
+    upload_chunk_size_kb: int = 256
+    upload_spool_threshold_mb: int = 1
+    upload_spool_dir: str = ""  # 비어 있으면 시스템 임시 디렉토리
+
+    # CSV Engine
+    csv_engine: str = "auto"  # auto (pyarrow가 설치되어 있으면 사용), pyarrow, c
+
     # PDF Settings
     max_pdf_size_mb: int = 20
     allowed_pdf_extensions: List[str] = [".pdf"]
 
     # Graph Settings
-    graph_dpi: int = 300
+    graph_dpi: int = 300  # print 프로필 (리포트)
+    graph_screen_dpi: int = 150  # screen 프로필
+    graph_preview_dpi: int = 96  # preview 프로필 (분석 API 기본값)
+    graph_png_compress_level: int = 6  # png_optimized 형식의 zlib 압축 수준 (9는 크기 ~15% 감소, 인코딩 ~2배)
+    graph_webp_lossless: bool = True  # webp 형식: 무손실 (글자/선이 번지지 않음)
+    graph_webp_method: int = 4  # webp 인코딩 노력 (0: 빠름 ~ 6: 작음)
     graph_figsize: tuple = (10, 6)
 
+    # Graph Cache Settings (콘텐츠 해시 기반 캐시)
+    graph_cache_enabled: bool = True
+    graph_cache_memory_mb: int = 64
+    graph_cache_dir: str = ""  # 비어 있으면 디스크 계층 비활성화
+    graph_cache_disk_mb: int = 512
+
+    # Graph Asset Store (그래프 이미지 저장소)
+    asset_store_backend: str = "local"  # local, supabase
+    asset_store_dir: str = "storage/assets"
+    asset_public_base_url: str = ""  # 비어 있으면 상대 경로(/api/assets/...) 사용
+    asset_cache_max_age: int = 31536000  # 콘텐츠 해시 ID이므로 장기 캐시 가능
+    supabase_storage_bucket: str = "graphs"
+
     # Batch Analysis Settings
     max_sheets_per_batch: int = 10
-    max_data_points_per_sheet: int = 1000
+    regression_confidence_level: float = 0.95  # 기울기/절편 신뢰구간의 신뢰수준
+    max_data_points_per_sheet: int = 1000  # 그래프에 그리는 최대 점 수 (넘으면 LOD 축소, 회귀는 전체 데이터, 0이면 축소 안 함)
+
+    # Workbook Cache (detect-sheets → batch 재파싱 방지)
+    workbook_cache_max_entries: int = 16
+    workbook_cache_memory_mb: int = 256
+    workbook_cache_ttl_seconds: int = 30 * 60
+
+    # Batch Session Store (full-report 재업로드 방지)
+    batch_store_max_entries: int = 256
+    batch_store_memory_mb: int = 128  # 메모리 계층 총 용량 (인라인 base64 그래프 포함 JSON 크기 기준)
+    batch_store_ttl_seconds: int = 6 * 60 * 60
+    batch_store_db_path: str = ""  # 예: storage/batches.sqlite3 (비어 있으면 메모리만 사용)
+
+    # Background Jobs (큰 배치 분석/리포트 생성을 요청 밖에서 실행)
+    job_db_path: str = "storage/jobs.sqlite3"  # 모든 워커가 작업 상태를 공유
+    job_max_workers: int = 2  # 워커 프로세스당 동시에 실행할 작업 수
+    job_ttl_seconds: int = 60 * 60  # 완료된 작업 결과 보관 시간
+    job_poll_interval_seconds: float = 0.5  # 다른 워커에서 실행 중인 작업의 진행률 확인 간격
+
+    # CPU Executor Settings (이벤트 루프 오프로딩)
+    cpu_thread_workers: int = 4
+    cpu_process_workers: int = 2
+    cpu_max_pending_tasks: int = 32
+    cpu_retry_after_seconds: int = 5
     
     class Config:
         env_file = ".env"
@@ -3,12 +3,24 @@ LabReportAI Backend - FastAPI Application
 실험 데이터 분석 및 리포트 생성 API 서버
 """
 
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.routers.analyze import router as analyze_router
 from app.routers.generate import router as generate_router
+from app.routers.assets import router as assets_router
+from app.routers.admin import router as admin_router
+from app.routers.jobs import router as jobs_router
+from app.services.render_engine import render_engine, warm_render_worker
+from app.services.job_queue import job_queue
+from app.services.warmup import warm_up_application
+from app.utils.executor import cpu_executor
 
 
 # FastAPI 앱 생성
@@ -32,6 +44,47 @@ app.add_middleware(
 # 라우터 등록
 app.include_router(analyze_router)
 app.include_router(generate_router)
+app.include_router(assets_router)
+app.include_router(admin_router)
+app.include_router(jobs_router)
+
+
+@app.on_event("startup")
+async def warm_up_executors():
+    """
+    요청을 받기 전 워커 예열
+
+    렌더링 워커 프로세스 기동(matplotlib/스타일/폰트 로딩), Gemini 클라이언트 생성,
+    합성 분석+렌더링 요청을 마친 뒤에 시작 이벤트가 끝나므로 첫 요청이 느려지지 않습니다.
+    """
+    # Gemini async 클라이언트와 asyncio.to_thread는 기본 스레드 풀을 사용하므로,
+    # CPU 수가 적어도 동시 모델 호출(gemini_max_concurrency)이 막히지 않도록 크기를 늘림
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) + 4) + settings.gemini_max_concurrency,
+        thread_name_prefix="asyncio"
+    ))
+    cpu_executor.set_process_initializer(warm_render_worker)
+
+    # 비정상 종료한 워커를 대신해 기동한 경우 그 워커가 남긴 작업 정리
+    await asyncio.to_thread(job_queue.fail_orphaned_jobs)
+
+    if not settings.warmup_enabled:
+        await render_engine.warm_up()
+        return
+    timings = await warm_up_application()
+    logging.getLogger("uvicorn.error").info(
+        "Warm-up finished (pid %d): %s", os.getpid(),
+        ", ".join(f"{stage} {seconds * 1000:.0f}ms" for stage, seconds in timings.items())
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_executors():
+    """실행 중인 백그라운드 작업을 마무리(제한 시간 초과 시 취소)한 뒤 CPU 실행기 풀 종료"""
+    cancelled = await job_queue.drain(settings.server_drain_timeout_seconds)
+    if cancelled:
+        logging.getLogger("uvicorn.error").warning("Cancelled %d unfinished job(s) on shutdown", cancelled)
+    cpu_executor.shutdown()
 
 
 @app.get("/", tags=["Health"])
@@ -54,7 +107,7 @@ async def health_check():
     }
 
 
-# 개발 서버 실행 (직접 실행 시)
+# 개발 서버 실행 (직접 실행 시, 운영 환경은 python -m app.server 사용)
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
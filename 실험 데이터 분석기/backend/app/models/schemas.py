@@ -20,6 +20,8 @@ class ErrorCode(str, Enum):
     FILE_TOO_LARGE = "FILE_TOO_LARGE"
     ANALYSIS_FAILED = "ANALYSIS_FAILED"
     INTERNAL_ERROR = "INTERNAL_ERROR"
+    SERVER_BUSY = "SERVER_BUSY"
+    UPLOAD_NOT_FOUND = "UPLOAD_NOT_FOUND"
 
 
 class ErrorDetail(BaseModel):
@@ -44,16 +46,46 @@ class StatisticsResult(BaseModel):
     intercept: float = Field(..., description="y절편")
     r_squared: float = Field(..., description="결정계수 (R²)")
     std_error: float = Field(..., description="표준 오차")
+    intercept_std_error: Optional[float] = Field(None, description="y절편 표준 오차")
+    slope_confidence_interval: Optional[Tuple[float, float]] = Field(None, description="기울기 신뢰구간 (하한, 상한)")
+    intercept_confidence_interval: Optional[Tuple[float, float]] = Field(None, description="y절편 신뢰구간 (하한, 상한)")
+    confidence_level: Optional[float] = Field(None, description="신뢰구간의 신뢰수준 (예: 0.95)")
     error_rate_percent: Optional[float] = Field(None, description="오차율 (%)")
     data_points: int = Field(..., description="데이터 포인트 수")
     x_range: Tuple[float, float] = Field(..., description="X축 범위 (min, max)")
     y_range: Tuple[float, float] = Field(..., description="Y축 범위 (min, max)")
 
 
+class ImageDelivery(str, Enum):
+    """그래프 이미지 전달 방식"""
+    INLINE = "inline"  # 응답 JSON에 Base64로 포함
+    URL = "url"        # 에셋 저장소에 저장하고 URL만 반환
+
+
+class GraphResolution(str, Enum):
+    """그래프 출력 해상도 프로필"""
+    PREVIEW = "preview"  # 화면 미리보기/썸네일 (기본 96 dpi)
+    SCREEN = "screen"    # 크게 보기 (기본 150 dpi)
+    PRINT = "print"      # 리포트/인쇄용 (기본 300 dpi)
+
+
+class GraphFormat(str, Enum):
+    """그래프 이미지 형식"""
+    PNG = "png"                      # matplotlib 기본 PNG (RGBA)
+    PNG_OPTIMIZED = "png_optimized"  # 256색 팔레트 PNG (작고 인코딩이 빠름)
+    SVG = "svg"                      # 벡터 (해상도 무관)
+    WEBP = "webp"
+
+
 class GraphResult(BaseModel):
     """그래프 생성 결과"""
-    image_base64: str = Field(..., description="Base64 인코딩된 PNG 이미지")
-    image_url: Optional[str] = Field(None, description="저장된 이미지 URL (옵션)")
+    image_base64: Optional[str] = Field(None, description="Base64 인코딩된 이미지 data URI (inline 모드)")
+    image_url: Optional[str] = Field(None, description="저장된 이미지 URL (url 모드)")
+    asset_id: Optional[str] = Field(None, description="에셋 저장소 ID (url 모드)")
+    resolution: Optional[GraphResolution] = Field(None, description="이미지 해상도 프로필")
+    graph_id: Optional[str] = Field(None, description="그래프 원본 ID (리포트용 고해상도 이미지를 나중에 렌더링할 때 사용)")
+    format: Optional[GraphFormat] = Field(None, description="이미지 형식")
+    plotted_points: Optional[int] = Field(None, description="그래프에 그린 점 수 (LOD 축소 시 statistics.data_points보다 작음)")
 
 
 class DataSummary(BaseModel):
@@ -120,12 +152,14 @@ class DiscussionRequest(BaseModel):
     experiment_title: str = Field(..., description="실험 제목")
     statistics: StatisticsResult = Field(..., description="통계 분석 결과")
     context: Optional[str] = Field(None, description="추가 맥락 정보")
+    regenerate: bool = Field(False, description="True이면 캐시된 응답 대신 새로 생성")
 
 
 class DiscussionResponse(ApiResponse):
     """고찰 생성 응답"""
     discussion: Optional[str] = Field(None, description="생성된 고찰 텍스트 (Markdown)")
     model_used: Optional[str] = Field(None, description="사용된 AI 모델명")
+    prompt_tokens: Optional[int] = Field(None, description="프롬프트 입력 토큰 수 (로컬 추정)")
 
 
 # ============================================================
@@ -151,6 +185,7 @@ class ExperimentManualInfo(BaseModel):
 class PDFExtractionResponse(ApiResponse):
     """PDF 추출 응답"""
     data: Optional[ExperimentManualInfo] = None
+    pdf_sha256: Optional[str] = Field(None, description="PDF 내용 해시 (추출 결과 캐시 키)")
 
 
 # ============================================================
@@ -169,6 +204,7 @@ class MultiSheetDetectionResponse(ApiResponse):
     """멀티시트 감지 응답"""
     sheets: List[SheetInfo] = Field(default_factory=list, description="시트 정보 목록")
     total_sheets: int = Field(0, description="총 시트 수")
+    upload_id: Optional[str] = Field(None, description="업로드 ID (batch/data 요청에서 파일 대신 사용)")
 
 
 class ExperimentConfig(BaseModel):
@@ -225,6 +261,11 @@ class ReportOptions(BaseModel):
     include_data_tables: bool = Field(True, description="데이터 테이블 포함 여부")
     include_individual_analysis: bool = Field(True, description="개별 실험 분석 포함 여부")
     tone: str = Field("academic", description="문체 (academic, casual)")
+    generation_mode: str = Field(
+        "auto",
+        description="생성 방식 (single: 한 번의 호출, parallel: 실험별 병렬 생성 후 종합, "
+                    "auto: 실험 수가 REPORT_PARALLEL_MIN_EXPERIMENTS 이상이면 parallel)"
+    )
 
 
 class ReportSections(BaseModel):
@@ -235,15 +276,72 @@ class ReportSections(BaseModel):
 
 
 class FullReportRequest(BaseModel):
-    """전체 리포트 생성 요청"""
+    """
+    전체 리포트 생성 요청
+
+    experiments를 생략하면 서버에 저장된 batch_id의 배치 결과를 사용합니다.
+    """
     batch_id: str = Field(..., description="배치 분석 ID")
-    report_title: str = Field(..., description="리포트 제목")
-    experiments: List[SingleExperimentResult] = Field(..., description="실험 결과 목록")
-    manual_info: Optional[ExperimentManualInfo] = Field(None, description="매뉴얼 정보")
+    report_title: Optional[str] = Field(None, description="리포트 제목 (생략 시 배치 결과의 제목)")
+    experiments: Optional[List[SingleExperimentResult]] = Field(None, description="실험 결과 목록 (생략 시 서버 저장본 사용)")
+    manual_info: Optional[ExperimentManualInfo] = Field(None, description="매뉴얼 정보 (생략 시 배치 결과의 매뉴얼 정보)")
     options: Optional[ReportOptions] = Field(None, description="리포트 옵션")
+    regenerate: bool = Field(False, description="True이면 캐시된 응답 대신 새로 생성")
 
 
 class FullReportResponse(ApiResponse):
     """전체 리포트 생성 응답"""
     markdown_content: Optional[str] = Field(None, description="마크다운 리포트 전체 내용")
     sections: Optional[ReportSections] = Field(None, description="섹션별 내용")
+    prompt_tokens: Optional[int] = Field(None, description="프롬프트 입력 토큰 수 (로컬 추정, 병렬 생성은 모든 호출의 합)")
+
+
+# ============================================================
+# Background Job Models (백그라운드 작업)
+# ============================================================
+
+class JobStatus(str, Enum):
+    """작업 상태"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobError(BaseModel):
+    """작업 실패 정보"""
+    code: str = Field(..., description="에러 코드")
+    message: str = Field(..., description="에러 메시지")
+
+
+class JobInfo(BaseModel):
+    """작업 상태 및 결과"""
+    job_id: str = Field(..., description="작업 ID")
+    kind: str = Field(..., description="작업 종류 (batch, full_report)")
+    status: JobStatus = Field(..., description="작업 상태")
+    stages: List[str] = Field(default_factory=list, description="작업 단계 목록 (실행 순서)")
+    stage: Optional[str] = Field(None, description="현재 단계")
+    progress: float = Field(0.0, description="진행률 (0~1, 완료한 단계 비율)")
+    error: Optional[JobError] = Field(None, description="실패 시 에러 정보")
+    result: Optional[dict] = Field(None, description="완료 시 결과 (batch: BatchJobResult, full_report: FullReportResponse)")
+    created_at: float = Field(..., description="생성 시각 (Unix time)")
+    updated_at: float = Field(..., description="마지막 갱신 시각 (Unix time)")
+    expires_at: Optional[float] = Field(None, description="결과 만료 시각 (완료 후 설정)")
+
+
+class BatchJobResult(BaseModel):
+    """배치 분석 작업 결과"""
+    batch: BatchAnalysisData = Field(..., description="배치 분석 결과")
+    report: Optional[FullReportResponse] = Field(None, description="전체 리포트 (generate_report=true인 경우)")
+
+
+class JobSubmitResponse(ApiResponse):
+    """작업 제출 응답"""
+    job_id: str = Field(..., description="작업 ID")
+    status: JobStatus = Field(..., description="작업 상태")
+
+
+class JobResponse(ApiResponse):
+    """작업 조회 응답"""
+    data: Optional[JobInfo] = None
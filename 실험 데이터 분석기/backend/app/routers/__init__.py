@@ -1,5 +1,6 @@
 # Routers package
 from app.routers.analyze import router as analyze_router
 from app.routers.generate import router as generate_router
+from app.routers.assets import router as assets_router
 
-__all__ = ['analyze_router', 'generate_router']
+__all__ = ['analyze_router', 'generate_router', 'assets_router']
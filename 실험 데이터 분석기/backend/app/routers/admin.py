@@ -0,0 +1,83 @@
+"""
+LabReportAI Admin Router
+/api/admin/* 엔드포인트 정의 (캐시 관리, 요청 병합 통계)
+"""
+
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app.config import settings
+from app.services.manual_cache import manual_cache, PDF_SHA256_PATTERN
+from app.services.single_flight import analysis_flight
+from app.utils.executor import cpu_executor
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    관리자 토큰 확인 (X-Admin-Token 헤더)
+
+    ADMIN_TOKEN이 설정되지 않았으면 관리자 API 전체를 비활성화합니다.
+    """
+    if not settings.admin_token:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "code": "ADMIN_DISABLED",
+                "message": "관리자 API가 비활성화되어 있습니다. ADMIN_TOKEN을 설정해주세요."
+            }
+        )
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "code": "ADMIN_UNAUTHORIZED",
+                "message": "관리자 토큰이 올바르지 않습니다."
+            }
+        )
+
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/analysis-flight")
+async def analysis_flight_stats():
+    """분석 요청 병합 통계 (병합된 중복 요청 수 포함)"""
+    return analysis_flight.get_stats()
+
+
+@router.get("/manual-cache")
+async def manual_cache_stats():
+    """PDF 매뉴얼 추출 캐시 통계"""
+    return manual_cache.get_stats()
+
+
+@router.delete("/manual-cache/{pdf_sha256}")
+async def invalidate_manual_cache(pdf_sha256: str):
+    """
+    저장된 매뉴얼 추출 결과를 삭제합니다.
+
+    잘못 추출된 매뉴얼을 삭제하면 다음 업로드에서 새로 추출합니다.
+    pdf_sha256은 /api/generate/extract-manual 응답에 포함됩니다.
+    """
+    if not PDF_SHA256_PATTERN.match(pdf_sha256):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "INVALID_PDF_HASH",
+                "message": "pdf_sha256은 64자리 16진수(SHA-256)여야 합니다."
+            }
+        )
+
+    removed = await cpu_executor.run(manual_cache.invalidate, pdf_sha256)
+    if not removed:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "MANUAL_NOT_CACHED",
+                "message": "저장된 매뉴얼 추출 결과가 없습니다."
+            }
+        )
+
+    return {"success": True, "pdf_sha256": pdf_sha256}
@@ -4,8 +4,9 @@ LabReportAI Analyze Router
 """
 
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import json
+import pandas as pd
 
 from app.models.schemas import (
     AnalysisResponse,
@@ -20,18 +21,29 @@ from app.models.schemas import (
     BatchAnalysisRequest,
     BatchAnalysisResponse,
     BatchAnalysisData,
-    SingleExperimentResult,
-    ExperimentManualInfo
+    ExperimentManualInfo,
+    ImageDelivery,
+    GraphFormat,
+    GraphResolution
 )
 from app.services.analysis_engine import analysis_service, AnalysisError
-from app.services.graph_generator import graph_generator
+from app.services.render_engine import render_engine
+from app.services.analysis_pipeline import run_batch_analysis
+from app.services.single_flight import analysis_flight, make_request_key
+from app.utils.executor import cpu_executor, ExecutorSaturatedError
 from app.utils.file_parser import (
     parse_uploaded_file,
+    read_tabular_upload,
+    parse_tabular_upload,
+    read_excel_upload,
+    parse_excel_upload,
     validate_columns,
     get_numeric_columns,
     FileParserError,
-    parse_excel_all_sheets,
-    detect_multi_sheets
+    detect_multi_sheets,
+    parse_cached_sheets,
+    parse_cached_first_sheet,
+    required_sheet_columns
 )
 
 
@@ -40,63 +52,118 @@ router = APIRouter(prefix="/api/analyze", tags=["Analysis"])
 
 @router.post("/data", response_model=AnalysisResponse)
 async def analyze_data(
-    file: UploadFile = File(..., description="CSV 또는 Excel 파일"),
+    file: Optional[UploadFile] = File(None, description="CSV 또는 Excel 파일"),
+    upload_id: Optional[str] = Form(None, description="detect-sheets에서 받은 업로드 ID (file 대신 사용)"),
     title: str = Form(..., description="실험 제목"),
     x_column: str = Form(..., description="X축 열 이름"),
     y_column: str = Form(..., description="Y축 열 이름"),
-    theoretical_slope: Optional[float] = Form(None, description="이론적 기울기 (오차율 계산용)")
+    theoretical_slope: Optional[float] = Form(None, description="이론적 기울기 (오차율 계산용)"),
+    image_mode: ImageDelivery = Form(ImageDelivery.INLINE, description="그래프 전달 방식 (inline: Base64, url: 에셋 URL)"),
+    resolution: GraphResolution = Form(GraphResolution.PREVIEW, description="그래프 해상도 (preview: 화면 미리보기, screen, print: 인쇄용)"),
+    image_format: GraphFormat = Form(GraphFormat.PNG, description="그래프 이미지 형식 (png, png_optimized, svg, webp)")
 ):
     """
     실험 데이터 파일을 업로드하고 통계 분석을 수행합니다.
     
     - **file**: CSV(.csv) 또는 Excel(.xlsx, .xls) 파일
+    - **upload_id**: (선택) detect-sheets 응답의 업로드 ID - 지정하면 파일 없이 첫 번째 시트를 분석
     - **title**: 실험 제목 (예: "RC 회로 시정수 측정 실험")
     - **x_column**: X축으로 사용할 열 이름
     - **y_column**: Y축으로 사용할 열 이름
     - **theoretical_slope**: (선택) 이론적 기울기값 - 오차율 계산에 사용
+    - **image_mode**: (선택) inline(기본) 또는 url - url이면 그래프를 /api/assets/{id}로 제공
+    - **resolution**: (선택) preview(기본, 96dpi), screen(150dpi), print(300dpi)
+    - **image_format**: (선택) png(기본), png_optimized(팔레트 PNG), svg, webp
+
+    같은 파일과 파라미터의 요청이 동시에 들어오면 분석을 한 번만 수행하고
+    결과(analysis_id 포함)를 함께 반환합니다.
     
     Returns:
         통계 분석 결과 및 그래프 이미지
     """
     try:
-        # 1. 파일 파싱
-        df = await parse_uploaded_file(file)
-        
-        # 2. 열 유효성 검사
-        validate_columns(df, x_column, y_column)
-        
-        # 3. 통계 분석 수행
-        statistics, data_summary, cleaned_df = analysis_service.analyze_dataframe(
-            df=df,
-            x_column=x_column,
-            y_column=y_column,
-            theoretical_slope=theoretical_slope
-        )
-        
-        # 4. 그래프 생성
-        graph_result = graph_generator.generate_scatter_with_trendline(
-            df=cleaned_df,
-            x_column=x_column,
-            y_column=y_column,
-            statistics=statistics,
-            title=title
-        )
-        
-        # 5. 분석 ID 생성
-        analysis_id = analysis_service.generate_analysis_id()
-        
-        # 6. 응답 반환
-        return AnalysisResponse(
-            success=True,
-            message="분석이 완료되었습니다.",
-            data=AnalysisData(
-                analysis_id=analysis_id,
+        # 1. 파일 읽기 (upload_id가 있으면 캐시된 워크북 재사용, 파싱은 병합 후 수행)
+        columns = [x_column, y_column]
+        if upload_id:
+            content_hash = upload_id
+            load_dataframe = lambda: parse_cached_first_sheet(upload_id, columns)
+        elif file is not None:
+            upload, extension = await read_tabular_upload(file)
+            content_hash = upload.sha256
+            load_dataframe = lambda: parse_tabular_upload(upload, extension, columns)
+        else:
+            raise FileParserError(
+                code=ErrorCode.INVALID_FILE_FORMAT,
+                message="file 또는 upload_id 중 하나가 필요합니다."
+            )
+
+        async def compute() -> AnalysisData:
+            # 2. 파일 파싱 및 열 유효성 검사
+            df = await load_dataframe()
+            await cpu_executor.run(validate_columns, df, x_column, y_column)
+
+            # 3. 통계 분석 수행
+            statistics, data_summary, cleaned_df = await cpu_executor.run(
+                analysis_service.analyze_dataframe,
+                df=df,
+                x_column=x_column,
+                y_column=y_column,
+                theoretical_slope=theoretical_slope
+            )
+
+            # 4. 그래프 생성 (matplotlib은 GIL을 오래 잡으므로 프로세스 풀 사용)
+            graph_result = await render_engine.render(
+                df=cleaned_df,
+                x_column=x_column,
+                y_column=y_column,
+                statistics=statistics,
+                title=title,
+                image_mode=image_mode,
+                resolution=resolution,
+                image_format=image_format
+            )
+
+            # 5. 분석 ID 생성
+            return AnalysisData(
+                analysis_id=analysis_service.generate_analysis_id(),
                 statistics=statistics,
                 graph=graph_result,
                 data_summary=data_summary
             )
+
+        # 같은 파일/파라미터의 동시 요청은 계산 하나를 공유
+        key = make_request_key("analyze_data", content_hash, {
+            "source": "upload_id" if upload_id else "file",
+            "title": title,
+            "x_column": x_column,
+            "y_column": y_column,
+            "theoretical_slope": theoretical_slope,
+            "image_mode": image_mode,
+            "resolution": resolution,
+            "image_format": image_format
+        })
+        data = await analysis_flight.do("analyze_data", key, compute)
+
+        # 6. 응답 반환
+        return AnalysisResponse(
+            success=True,
+            message="분석이 완료되었습니다.",
+            data=data
         )
         
+    except ExecutorSaturatedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "success": False,
+                "error": {
+                    "code": ErrorCode.SERVER_BUSY.value,
+                    "message": e.message
+                }
+            },
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
     except FileParserError as e:
         raise HTTPException(
             status_code=400,
@@ -134,6 +201,20 @@ async def analyze_data(
         )
 
 
+def _build_column_info(df: pd.DataFrame) -> Tuple[List[ColumnInfo], List[str]]:
+    """열별 정보(타입, 샘플 3개)와 숫자형 열 목록 생성 (동기)"""
+    numeric_cols = get_numeric_columns(df)
+    columns = [
+        ColumnInfo(
+            name=col,
+            dtype=str(df[col].dtype),
+            sample_values=df[col].head(3).astype(str).tolist()
+        )
+        for col in df.columns
+    ]
+    return columns, numeric_cols
+
+
 @router.post("/detect-columns", response_model=ColumnDetectionResponse)
 async def detect_columns(
     file: UploadFile = File(..., description="CSV 또는 Excel 파일")
@@ -147,18 +228,8 @@ async def detect_columns(
         # 파일 파싱
         df = await parse_uploaded_file(file)
         
-        # 숫자형 열만 필터링
-        numeric_cols = get_numeric_columns(df)
-        
-        # 열 정보 생성
-        columns = []
-        for col in df.columns:
-            sample_values = df[col].head(3).astype(str).tolist()
-            columns.append(ColumnInfo(
-                name=col,
-                dtype=str(df[col].dtype),
-                sample_values=sample_values
-            ))
+        # 숫자형 열 필터링과 열 정보 생성 (CPU 작업이므로 실행기에서)
+        columns, numeric_cols = await cpu_executor.run(_build_column_info, df)
         
         return ColumnDetectionResponse(
             success=True,
@@ -166,6 +237,19 @@ async def detect_columns(
             columns=columns
         )
 
+    except ExecutorSaturatedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "success": False,
+                "error": {
+                    "code": ErrorCode.SERVER_BUSY.value,
+                    "message": e.message
+                }
+            },
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
     except FileParserError as e:
         raise HTTPException(
             status_code=400,
@@ -191,18 +275,34 @@ async def detect_sheets(
     Excel 파일의 시트 정보를 감지합니다.
 
     멀티시트 배치 분석 전에 시트 목록과 열 정보를 확인하기 위해 사용합니다.
+    파싱 결과는 캐시되며, 응답의 upload_id를 batch/data 요청에 보내면
+    파일을 다시 업로드하거나 파싱하지 않습니다.
 
     Returns:
-        각 시트의 이름, 열 목록, 행 수, 샘플 데이터
+        각 시트의 이름, 열 목록, 행 수, 샘플 데이터, 업로드 ID
     """
     try:
-        sheet_info_list = await detect_multi_sheets(file)
+        upload_id, sheet_info_list = await detect_multi_sheets(file)
 
         return MultiSheetDetectionResponse(
             success=True,
             message=f"총 {len(sheet_info_list)}개의 시트가 감지되었습니다.",
             sheets=sheet_info_list,
-            total_sheets=len(sheet_info_list)
+            total_sheets=len(sheet_info_list),
+            upload_id=upload_id
+        )
+
+    except ExecutorSaturatedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "success": False,
+                "error": {
+                    "code": ErrorCode.SERVER_BUSY.value,
+                    "message": e.message
+                }
+            },
+            headers={"Retry-After": str(e.retry_after)}
         )
 
     except FileParserError as e:
@@ -231,18 +331,29 @@ async def detect_sheets(
 
 @router.post("/batch", response_model=BatchAnalysisResponse)
 async def analyze_batch(
-    file: UploadFile = File(..., description="Excel 파일 (.xlsx, .xls)"),
+    file: Optional[UploadFile] = File(None, description="Excel 파일 (.xlsx, .xls)"),
+    upload_id: Optional[str] = Form(None, description="detect-sheets에서 받은 업로드 ID (file 대신 사용)"),
     experiments_json: str = Form(..., description="실험 설정 JSON (List[ExperimentConfig])"),
     report_title: str = Form(..., description="리포트 제목"),
-    manual_info_json: Optional[str] = Form(None, description="매뉴얼 정보 JSON (ExperimentManualInfo)")
+    manual_info_json: Optional[str] = Form(None, description="매뉴얼 정보 JSON (ExperimentManualInfo)"),
+    image_mode: ImageDelivery = Form(ImageDelivery.INLINE, description="그래프 전달 방식 (inline: Base64, url: 에셋 URL)"),
+    resolution: GraphResolution = Form(GraphResolution.PREVIEW, description="그래프 해상도 (preview: 화면 미리보기, screen, print: 인쇄용)"),
+    image_format: GraphFormat = Form(GraphFormat.PNG, description="그래프 이미지 형식 (png, png_optimized, svg, webp)")
 ):
     """
     여러 시트의 데이터를 배치로 분석합니다.
 
     - **file**: Excel 파일 (멀티시트)
+    - **upload_id**: (선택) detect-sheets 응답의 업로드 ID - 지정하면 파일 없이 캐시된 워크북 사용
     - **experiments_json**: 각 실험 설정 (JSON 문자열)
     - **report_title**: 리포트 제목
     - **manual_info_json**: (선택) PDF에서 추출한 매뉴얼 정보
+    - **image_mode**: (선택) inline(기본) 또는 url - url이면 응답에 이미지 대신 URL만 포함
+    - **resolution**: (선택) preview(기본), screen, print - 전체 리포트에는 print 해상도 그래프를 다시 렌더링하여 사용
+    - **image_format**: (선택) png(기본), png_optimized(팔레트 PNG), svg, webp
+
+    같은 파일과 파라미터의 요청이 동시에 들어오면 분석을 한 번만 수행하고
+    결과(batch_id 포함)를 함께 반환합니다.
 
     Returns:
         각 실험의 통계 분석 결과, 그래프, 데이터 테이블
@@ -257,58 +368,48 @@ async def analyze_batch(
             manual_data = json.loads(manual_info_json)
             manual_info = ExperimentManualInfo(**manual_data)
 
-        # 2. 모든 시트 파싱
-        sheets_data = await parse_excel_all_sheets(file)
-
-        # 3. 배치 분석 수행
-        analysis_results = analysis_service.analyze_batch(
-            sheets_data=sheets_data,
-            experiments=experiments
-        )
+        # 2. 파일 읽기 (upload_id가 있으면 캐시된 워크북 재사용, 파싱은 병합 후 수행)
+        required = required_sheet_columns(experiments)
+        if upload_id:
+            content_hash = upload_id
+            load_sheets = lambda: parse_cached_sheets(upload_id, required)
+        elif file is not None:
+            upload, extension = await read_excel_upload(file)
+            content_hash = upload.sha256
+            load_sheets = lambda: parse_excel_upload(upload, extension, required)
+        else:
+            raise FileParserError(
+                code=ErrorCode.INVALID_FILE_FORMAT,
+                message="file 또는 upload_id 중 하나가 필요합니다."
+            )
 
-        # 4. 그래프 배치 생성을 위한 데이터 준비
-        graph_input_data = []
-        for i, (stats, data_summary, cleaned_df, data_table) in enumerate(analysis_results):
-            exp_config = experiments[i]
-            graph_input_data.append((
-                cleaned_df,
-                exp_config.x_column,
-                exp_config.y_column,
-                stats,
-                exp_config.experiment_name
-            ))
-
-        # 5. 그래프 배치 생성
-        graph_results = graph_generator.generate_batch_graphs(graph_input_data)
-
-        # 6. 결과 조립
-        experiment_results: List[SingleExperimentResult] = []
-        for i, (stats, data_summary, cleaned_df, data_table) in enumerate(analysis_results):
-            exp_config = experiments[i]
-            graph_result = graph_results[i]
-
-            experiment_results.append(SingleExperimentResult(
-                experiment_name=exp_config.experiment_name,
-                sheet_name=exp_config.sheet_name,
-                statistics=stats,
-                graph=graph_result,
-                data_summary=data_summary,
-                data_table=data_table
-            ))
+        async def compute() -> BatchAnalysisData:
+            # 3. 파싱 → 배치 분석 → 그래프 렌더링 → 결과 저장
+            return await run_batch_analysis(
+                load_sheets=load_sheets,
+                experiments=experiments,
+                report_title=report_title,
+                manual_info=manual_info,
+                image_mode=image_mode,
+                resolution=resolution,
+                image_format=image_format
+            )
 
-        # 7. 배치 ID 생성
-        batch_id = analysis_service.generate_analysis_id()
+        # 같은 파일/파라미터의 동시 요청은 계산 하나와 batch_id를 공유
+        key = make_request_key("analyze_batch", content_hash, {
+            "experiments": experiments,
+            "report_title": report_title,
+            "manual_info": manual_info,
+            "image_mode": image_mode,
+            "resolution": resolution,
+            "image_format": image_format
+        })
+        batch_data = await analysis_flight.do("analyze_batch", key, compute)
 
         return BatchAnalysisResponse(
             success=True,
             message=f"{len(experiments)}개 실험의 배치 분석이 완료되었습니다.",
-            data=BatchAnalysisData(
-                batch_id=batch_id,
-                report_title=report_title,
-                experiments=experiment_results,
-                total_experiments=len(experiments),
-                manual_info=manual_info
-            )
+            data=batch_data
         )
 
     except json.JSONDecodeError as e:
@@ -323,6 +424,19 @@ async def analyze_batch(
             }
         )
 
+    except ExecutorSaturatedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "success": False,
+                "error": {
+                    "code": ErrorCode.SERVER_BUSY.value,
+                    "message": e.message
+                }
+            },
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
     except FileParserError as e:
         raise HTTPException(
             status_code=400,
@@ -0,0 +1,53 @@
+"""
+LabReportAI Assets Router
+/api/assets/* 엔드포인트 정의 (그래프 이미지 제공)
+"""
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from app.config import settings
+from app.services.asset_store import asset_store, ASSET_ID_PATTERN, content_type_for
+from app.utils.executor import cpu_executor
+
+
+router = APIRouter(prefix="/api/assets", tags=["Assets"])
+
+
+@router.get("/{asset_id}")
+async def get_asset(asset_id: str, request: Request):
+    """
+    저장된 그래프 이미지를 반환합니다.
+
+    에셋 ID는 이미지 내용의 해시이므로 내용이 절대 바뀌지 않습니다.
+    따라서 ETag와 장기 Cache-Control(immutable)을 함께 반환하며,
+    If-None-Match가 일치하면 304를 반환합니다.
+    """
+    if not ASSET_ID_PATTERN.match(asset_id):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "ASSET_NOT_FOUND",
+                "message": "잘못된 에셋 ID입니다."
+            }
+        )
+
+    etag = f'"{asset_id.split(".")[0]}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.asset_cache_max_age}, immutable"
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    data = await cpu_executor.run(asset_store.get, asset_id)
+    if data is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "ASSET_NOT_FOUND",
+                "message": "에셋을 찾을 수 없습니다."
+            }
+        )
+
+    return Response(content=data, media_type=content_type_for(asset_id), headers=headers)
@@ -3,23 +3,147 @@ Generate Router
 AI 고찰 생성 API 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
+import asyncio
+import math
+from typing import AsyncIterator, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from app.models.schemas import (
     DiscussionRequest,
     DiscussionResponse,
     PDFExtractionResponse,
     FullReportRequest,
     FullReportResponse,
-    ReportOptions
+    ReportOptions,
+    SingleExperimentResult,
+    ExperimentManualInfo,
+    ErrorCode
 )
-from app.services.gemini_service import get_gemini_service
+from app.services.gemini_service import get_gemini_service, GeminiTimeoutError, GeminiUnavailableError
+from app.services.analysis_pipeline import generate_full_report as generate_full_report_response, with_print_graphs
 from app.services.report_generator import report_generator
-from app.utils.file_parser import parse_pdf_file, FileParserError
+from app.services.batch_store import batch_store
+from app.services.report_stream import SectionStreamParser, format_sse
+from app.services.llm_cache import llm_cache
+from app.services.prompt_builder import PromptTooLargeError
+from app.services.manual_cache import manual_cache
+from app.utils.executor import cpu_executor, ExecutorSaturatedError
+from app.utils.file_parser import read_pdf_upload, FileParserError
 from app.config import settings
 
 router = APIRouter(prefix="/api/generate", tags=["Generate"])
 
 
+def _timeout_exception(error: GeminiTimeoutError) -> HTTPException:
+    """Gemini 호출 시간 초과 → 504 응답"""
+    return HTTPException(
+        status_code=504,
+        detail={
+            "code": "GEMINI_TIMEOUT",
+            "message": error.message
+        }
+    )
+
+
+def _unavailable_exception(error: GeminiUnavailableError) -> HTTPException:
+    """Gemini 일시 장애 (재시도 후 요청 한도 초과/서버 오류, 서킷 열림) → 503 응답"""
+    headers = None
+    if error.retry_after is not None:
+        headers = {"Retry-After": str(max(1, math.ceil(error.retry_after)))}
+    return HTTPException(
+        status_code=503,
+        detail={
+            "code": error.code,
+            "message": error.message
+        },
+        headers=headers
+    )
+
+
+def _busy_exception(error: ExecutorSaturatedError) -> HTTPException:
+    """실행기 대기열 포화 → 503 응답"""
+    return HTTPException(
+        status_code=503,
+        detail={
+            "code": ErrorCode.SERVER_BUSY.value,
+            "message": error.message
+        },
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
+
+def _prompt_too_large_exception(error: PromptTooLargeError) -> HTTPException:
+    """프롬프트가 모델 입력 한도 초과 → 413 응답"""
+    return HTTPException(
+        status_code=413,
+        detail={
+            "code": "PROMPT_TOO_LARGE",
+            "message": error.message
+        }
+    )
+
+
+async def _resolve_report_inputs(
+    request: FullReportRequest
+) -> Tuple[str, List[SingleExperimentResult], Optional[ExperimentManualInfo]]:
+    """
+    리포트 제목, 실험 결과, 매뉴얼 정보 결정
+
+    실험 결과가 생략되면 서버에 저장된 배치 결과를 사용합니다.
+
+    Raises:
+        HTTPException: 저장된 배치 결과가 없거나 만료된 경우 (404)
+    """
+    report_title = request.report_title
+    experiments = request.experiments
+    manual_info = request.manual_info
+
+    if experiments is None:
+        batch = await cpu_executor.run(batch_store.get, request.batch_id)
+        if batch is None:
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "code": "BATCH_NOT_FOUND",
+                    "message": "배치 분석 결과를 찾을 수 없거나 만료되었습니다. 다시 분석해주세요."
+                }
+            )
+        experiments = batch.experiments
+        report_title = report_title or batch.report_title
+        manual_info = manual_info or batch.manual_info
+
+    report_title = report_title or "실험 보고서"
+    return report_title, experiments, manual_info
+
+
+def _sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    """SSE 응답 (프록시 버퍼링 비활성화)"""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+def _stream_error_event(error: Exception, code: str, message: str) -> str:
+    """스트림 도중 발생한 오류 이벤트 (응답 헤더가 이미 전송되었으므로 HTTP 상태 대신 사용)"""
+    if isinstance(error, GeminiTimeoutError):
+        return format_sse("error", {"code": "GEMINI_TIMEOUT", "message": error.message})
+    if isinstance(error, PromptTooLargeError):
+        return format_sse("error", {"code": "PROMPT_TOO_LARGE", "message": error.message})
+    if isinstance(error, GeminiUnavailableError):
+        return format_sse("error", {"code": error.code, "message": error.message, "retry_after": error.retry_after})
+    if isinstance(error, ExecutorSaturatedError):
+        return format_sse(
+            "error", {"code": ErrorCode.SERVER_BUSY.value, "message": error.message, "retry_after": error.retry_after}
+        )
+    return format_sse("error", {"code": code, "message": f"{message}: {str(error)}"})
+
+
 @router.post("/discussion", response_model=DiscussionResponse)
 async def generate_discussion(request: DiscussionRequest) -> DiscussionResponse:
     """
@@ -42,14 +166,21 @@ async def generate_discussion(request: DiscussionRequest) -> DiscussionResponse:
     try:
         gemini_service = get_gemini_service()
         
-        response = gemini_service.generate_discussion(
+        response = await gemini_service.generate_discussion_async(
             experiment_title=request.experiment_title,
             statistics=request.statistics,
-            context=request.context
+            context=request.context,
+            regenerate=request.regenerate
         )
         
         return response
         
+    except GeminiTimeoutError as e:
+        raise _timeout_exception(e)
+    except GeminiUnavailableError as e:
+        raise _unavailable_exception(e)
+    except PromptTooLargeError as e:
+        raise _prompt_too_large_exception(e)
     except ValueError as e:
         raise HTTPException(
             status_code=503,
@@ -68,6 +199,60 @@ async def generate_discussion(request: DiscussionRequest) -> DiscussionResponse:
         )
 
 
+@router.post("/discussion/stream")
+async def stream_discussion(request: DiscussionRequest) -> StreamingResponse:
+    """
+    실험 결과에 대한 AI 고찰을 Server-Sent Events로 스트리밍
+
+    이벤트:
+    - delta: {"section": null, "text": "..."} 생성된 텍스트 조각
+    - completed: DiscussionResponse 전체 고찰
+    - error: {"code", "message"} 생성 도중 오류
+    """
+    if not settings.gemini_api_key:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "GEMINI_API_NOT_CONFIGURED",
+                "message": "Gemini API 키가 설정되지 않았습니다. .env 파일에 GEMINI_API_KEY를 설정해주세요."
+            }
+        )
+
+    try:
+        gemini_service = get_gemini_service()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "GEMINI_INIT_ERROR",
+                "message": str(e)
+            }
+        )
+
+    async def events() -> AsyncIterator[str]:
+        chunks = []
+        try:
+            async for text in gemini_service.stream_discussion_async(
+                experiment_title=request.experiment_title,
+                statistics=request.statistics,
+                context=request.context,
+                regenerate=request.regenerate
+            ):
+                chunks.append(text)
+                yield format_sse("delta", {"section": None, "text": text})
+
+            response = gemini_service.build_discussion_response(
+                "".join(chunks),
+                gemini_service.discussion_prompt_tokens(request.experiment_title, request.statistics, request.context)
+            )
+            yield format_sse("completed", response.model_dump())
+
+        except Exception as e:
+            yield _stream_error_event(e, "GENERATION_FAILED", "고찰 생성 중 오류가 발생했습니다")
+
+    return _sse_response(events())
+
+
 @router.get("/status")
 async def generation_status():
     """AI 생성 서비스 상태 확인"""
@@ -75,7 +260,10 @@ async def generation_status():
         "service": "gemini",
         "model": "gemini-2.5-flash-preview-05-20",
         "configured": bool(settings.gemini_api_key),
-        "status": "ready" if settings.gemini_api_key else "not_configured"
+        "status": "ready" if settings.gemini_api_key else "not_configured",
+        "cache": llm_cache.get_stats() if settings.llm_cache_enabled else None,
+        "manual_cache": manual_cache.get_stats(),
+        "resilience": get_gemini_service().get_resilience_stats() if settings.gemini_api_key else None
     }
 
 
@@ -85,7 +273,8 @@ async def generation_status():
 
 @router.post("/extract-manual", response_model=PDFExtractionResponse)
 async def extract_manual(
-    file: UploadFile = File(..., description="PDF 매뉴얼 파일")
+    file: UploadFile = File(..., description="PDF 매뉴얼 파일"),
+    regenerate: bool = Form(False, description="True이면 캐시된 응답 대신 새로 추출")
 ):
     """
     PDF 매뉴얼에서 실험 정보를 추출합니다.
@@ -97,6 +286,9 @@ async def extract_manual(
     - 예상 결과
     - 실험 기구 목록
 
+    추출 결과는 PDF 내용 해시(pdf_sha256)별로 저장되므로, 같은 매뉴얼을 다시
+    올리면 모델을 호출하지 않습니다. regenerate=true이면 새로 추출합니다.
+
     Returns:
         추출된 매뉴얼 정보 (ExperimentManualInfo)
     """
@@ -111,18 +303,19 @@ async def extract_manual(
         )
 
     try:
-        # 1. PDF 파일 읽기
-        pdf_bytes = await parse_pdf_file(file)
+        # 1. PDF 파일 읽기 (크기 제한 + 내용 해시)
+        upload = await read_pdf_upload(file)
         filename = file.filename or "unknown.pdf"
 
-        # 2. Gemini로 매뉴얼 정보 추출
+        # 2. Gemini로 매뉴얼 정보 추출 (같은 PDF는 저장된 결과 재사용, 동시 요청은 병합)
         gemini_service = get_gemini_service()
-        manual_info = gemini_service.extract_manual_from_pdf(pdf_bytes, filename)
+        manual_info = await gemini_service.extract_manual_from_upload_async(upload, filename, regenerate)
 
         return PDFExtractionResponse(
             success=True,
             message="PDF 매뉴얼에서 정보를 성공적으로 추출했습니다.",
-            data=manual_info
+            data=manual_info,
+            pdf_sha256=upload.sha256
         )
 
     except FileParserError as e:
@@ -137,6 +330,12 @@ async def extract_manual(
             }
         )
 
+    except GeminiTimeoutError as e:
+        raise _timeout_exception(e)
+
+    except GeminiUnavailableError as e:
+        raise _unavailable_exception(e)
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -176,31 +375,29 @@ async def generate_full_report(request: FullReportRequest):
             }
         )
 
-    try:
-        gemini_service = get_gemini_service()
+    report_title, experiments, manual_info = await _resolve_report_inputs(request)
 
-        # 1. AI로 리포트 섹션 생성
-        ai_response = gemini_service.generate_full_report(
-            report_title=request.report_title,
-            experiments=request.experiments,
-            manual_info=request.manual_info,
-            options=request.options
+    try:
+        # AI로 리포트 섹션 생성 후 마크다운 리포트 조립 (데이터 테이블 + 그래프 이미지 포함)
+        return await generate_full_report_response(
+            report_title=report_title,
+            experiments=experiments,
+            manual_info=manual_info,
+            options=request.options,
+            regenerate=request.regenerate
         )
 
-        # 2. 마크다운 리포트 조립 (데이터 테이블 + 그래프 이미지 포함)
-        markdown_content = report_generator.generate_markdown_report(
-            report_title=request.report_title,
-            experiments=request.experiments,
-            generated_sections=ai_response.sections,
-            manual_info=request.manual_info
-        )
+    except GeminiTimeoutError as e:
+        raise _timeout_exception(e)
 
-        return FullReportResponse(
-            success=True,
-            message="전체 리포트가 성공적으로 생성되었습니다.",
-            markdown_content=markdown_content,
-            sections=ai_response.sections
-        )
+    except GeminiUnavailableError as e:
+        raise _unavailable_exception(e)
+
+    except PromptTooLargeError as e:
+        raise _prompt_too_large_exception(e)
+
+    except ExecutorSaturatedError as e:
+        raise _busy_exception(e)
 
     except Exception as e:
         raise HTTPException(
@@ -210,3 +407,91 @@ async def generate_full_report(request: FullReportRequest):
                 "message": f"리포트 생성 중 오류가 발생했습니다: {str(e)}"
             }
         )
+
+
+@router.post("/full-report/stream")
+async def stream_full_report(request: FullReportRequest) -> StreamingResponse:
+    """
+    전체 마크다운 리포트를 Server-Sent Events로 스트리밍
+
+    요청 형식과 검증은 /api/generate/full-report와 같으며, 생성된 텍스트를
+    모델 출력이 도착하는 대로 전달합니다.
+
+    이벤트:
+    - started: {"report_title", "experiment_count"} 요청 수락 즉시
+    - section: {"name"} 섹션 마커(<!-- SECTION: name -->) 감지
+    - delta: {"section", "text"} 생성된 텍스트 조각 (마커 제외)
+    - completed: FullReportResponse (데이터 테이블, 그래프가 포함된 완성 리포트)
+    - error: {"code", "message"} 생성 도중 오류
+    """
+    if not settings.gemini_api_key:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "GEMINI_API_NOT_CONFIGURED",
+                "message": "Gemini API 키가 설정되지 않았습니다."
+            }
+        )
+
+    report_title, experiments, manual_info = await _resolve_report_inputs(request)
+
+    try:
+        gemini_service = get_gemini_service()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "GEMINI_INIT_ERROR",
+                "message": str(e)
+            }
+        )
+
+    async def events() -> AsyncIterator[str]:
+        yield format_sse("started", {"report_title": report_title, "experiment_count": len(experiments)})
+
+        parser = SectionStreamParser()
+        chunks = []
+        # 스트리밍하는 동안 리포트용 print 해상도 그래프 렌더링
+        print_graphs = asyncio.ensure_future(with_print_graphs(experiments))
+        try:
+            async for text in gemini_service.stream_full_report_async(
+                report_title=report_title,
+                experiments=experiments,
+                manual_info=manual_info,
+                options=request.options,
+                regenerate=request.regenerate
+            ):
+                chunks.append(text)
+                for event, data in parser.feed(text):
+                    yield format_sse(event, data)
+
+            for event, data in parser.close():
+                yield format_sse(event, data)
+
+            # 마크다운 리포트 조립 (데이터 테이블 + 그래프 이미지 포함)
+            ai_response = gemini_service.build_full_report_response("".join(chunks))
+            markdown_content = await cpu_executor.run(
+                report_generator.generate_markdown_report,
+                report_title=report_title,
+                experiments=await print_graphs,
+                generated_sections=ai_response.sections,
+                manual_info=manual_info
+            )
+
+            response = FullReportResponse(
+                success=True,
+                message="전체 리포트가 성공적으로 생성되었습니다.",
+                markdown_content=markdown_content,
+                sections=ai_response.sections,
+                prompt_tokens=gemini_service.full_report_prompt_tokens(
+                    report_title, experiments, manual_info, request.options
+                )
+            )
+            yield format_sse("completed", response.model_dump())
+
+        except Exception as e:
+            yield _stream_error_event(e, "REPORT_GENERATION_FAILED", "리포트 생성 중 오류가 발생했습니다")
+        finally:
+            print_graphs.cancel()
+
+    return _sse_response(events())
@@ -0,0 +1,283 @@
+"""
+LabReportAI Jobs Router
+/api/jobs/* 엔드포인트 정의 (백그라운드 배치 분석, 리포트 생성)
+"""
+
+import json
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.models.schemas import (
+    BatchJobResult,
+    ErrorCode,
+    ExperimentConfig,
+    ExperimentManualInfo,
+    FullReportRequest,
+    GraphFormat,
+    GraphResolution,
+    ImageDelivery,
+    JobInfo,
+    JobResponse,
+    JobStatus,
+    JobSubmitResponse,
+    ReportOptions
+)
+from app.routers.generate import _resolve_report_inputs, _sse_response
+from app.services.analysis_pipeline import generate_full_report, run_batch_analysis
+from app.services.gemini_service import GeminiTimeoutError, GeminiUnavailableError
+from app.services.job_queue import FINISHED_STATUSES, JobContext, JobFailedError, JobRunner, job_queue
+from app.services.prompt_builder import PromptTooLargeError
+from app.services.report_stream import format_sse
+from app.utils.executor import cpu_executor, ExecutorSaturatedError
+from app.utils.file_parser import (
+    FileParserError,
+    get_cached_workbook,
+    parse_cached_sheets,
+    parse_excel_upload,
+    read_excel_upload,
+    required_sheet_columns
+)
+
+
+router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
+
+
+def _translate_errors(run: JobRunner) -> JobRunner:
+    """작업 실패를 API 에러 코드로 기록하도록 예외 변환"""
+    async def wrapped(context: JobContext):
+        try:
+            return await run(context)
+        except GeminiTimeoutError as e:
+            raise JobFailedError("GEMINI_TIMEOUT", e.message)
+        except GeminiUnavailableError as e:
+            raise JobFailedError(e.code, e.message)
+        except PromptTooLargeError as e:
+            raise JobFailedError("PROMPT_TOO_LARGE", e.message)
+        except ExecutorSaturatedError as e:
+            raise JobFailedError(ErrorCode.SERVER_BUSY.value, e.message)
+    return wrapped
+
+
+def _gemini_not_configured() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail={
+            "code": "GEMINI_API_NOT_CONFIGURED",
+            "message": "Gemini API 키가 설정되지 않았습니다."
+        }
+    )
+
+
+def _submitted(job: JobInfo) -> JobSubmitResponse:
+    return JobSubmitResponse(
+        success=True,
+        message="작업이 등록되었습니다. GET /api/jobs/{job_id}로 진행 상황을 확인하세요.",
+        job_id=job.job_id,
+        status=job.status
+    )
+
+
+async def _get_job(job_id: str) -> JobInfo:
+    """작업 조회 (없으면 404)"""
+    job = await cpu_executor.run(job_queue.get, job_id)
+    if job is None:
+        raise _job_not_found()
+    return job
+
+
+def _job_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail={
+            "code": "JOB_NOT_FOUND",
+            "message": "작업을 찾을 수 없거나 결과 보관 기간이 지났습니다."
+        }
+    )
+
+
+@router.post("/batch", response_model=JobSubmitResponse, status_code=202)
+async def submit_batch_job(
+    file: Optional[UploadFile] = File(None, description="Excel 파일 (.xlsx, .xls)"),
+    upload_id: Optional[str] = Form(None, description="detect-sheets에서 받은 업로드 ID (file 대신 사용)"),
+    experiments_json: str = Form(..., description="실험 설정 JSON (List[ExperimentConfig])"),
+    report_title: str = Form(..., description="리포트 제목"),
+    manual_info_json: Optional[str] = Form(None, description="매뉴얼 정보 JSON (ExperimentManualInfo)"),
+    image_mode: ImageDelivery = Form(ImageDelivery.INLINE, description="그래프 전달 방식 (inline: Base64, url: 에셋 URL)"),
+    resolution: GraphResolution = Form(GraphResolution.PREVIEW, description="그래프 해상도 (preview: 화면 미리보기, screen, print: 인쇄용)"),
+    image_format: GraphFormat = Form(GraphFormat.PNG, description="그래프 이미지 형식 (png, png_optimized, svg, webp)"),
+    generate_report: bool = Form(False, description="True이면 배치 분석 후 전체 리포트까지 생성"),
+    report_options_json: Optional[str] = Form(None, description="리포트 옵션 JSON (ReportOptions)")
+):
+    """
+    배치 분석(및 전체 리포트 생성)을 백그라운드 작업으로 등록합니다.
+
+    요청 형식은 /api/analyze/batch와 같으며, 입력 검증과 파일 업로드만
+    요청 안에서 처리하고 job_id를 바로 반환합니다.
+
+    단계: parse → analyze → render (→ report)
+
+    Returns:
+        job_id (결과는 GET /api/jobs/{job_id}의 result: BatchJobResult)
+    """
+    try:
+        experiments = [ExperimentConfig(**exp) for exp in json.loads(experiments_json)]
+        manual_info = ExperimentManualInfo(**json.loads(manual_info_json)) if manual_info_json else None
+        report_options = ReportOptions(**json.loads(report_options_json)) if report_options_json else None
+
+        if generate_report and not settings.gemini_api_key:
+            raise _gemini_not_configured()
+
+        # 파일은 요청이 끝나면 닫히므로 제출 전에 읽어 둠
+        required = required_sheet_columns(experiments)
+        if upload_id:
+            get_cached_workbook(upload_id)
+            load_sheets = lambda: parse_cached_sheets(upload_id, required)
+        elif file is not None:
+            upload, extension = await read_excel_upload(file)
+            load_sheets = lambda: parse_excel_upload(upload, extension, required)
+        else:
+            raise FileParserError(
+                code=ErrorCode.INVALID_FILE_FORMAT,
+                message="file 또는 upload_id 중 하나가 필요합니다."
+            )
+
+    except json.JSONDecodeError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "JSON_PARSE_ERROR",
+                    "message": f"JSON 파싱 오류: {str(e)}"
+                }
+            }
+        )
+
+    except FileParserError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "error": {
+                    "code": e.code.value,
+                    "message": e.message
+                }
+            }
+        )
+
+    async def run(context: JobContext) -> BatchJobResult:
+        batch = await run_batch_analysis(
+            load_sheets=load_sheets,
+            experiments=experiments,
+            report_title=report_title,
+            manual_info=manual_info,
+            image_mode=image_mode,
+            on_stage=context.stage,
+            resolution=resolution,
+            image_format=image_format
+        )
+
+        report = None
+        if generate_report:
+            await context.stage("report")
+            report = await generate_full_report(
+                report_title=report_title,
+                experiments=batch.experiments,
+                manual_info=manual_info,
+                options=report_options
+            )
+
+        return BatchJobResult(batch=batch, report=report)
+
+    stages: List[str] = ["parse", "analyze", "render"] + (["report"] if generate_report else [])
+    job = await job_queue.submit("batch", stages, _translate_errors(run))
+    return _submitted(job)
+
+
+@router.post("/full-report", response_model=JobSubmitResponse, status_code=202)
+async def submit_full_report_job(request: FullReportRequest):
+    """
+    전체 리포트 생성을 백그라운드 작업으로 등록합니다.
+
+    요청 형식은 /api/generate/full-report와 같습니다.
+
+    Returns:
+        job_id (결과는 GET /api/jobs/{job_id}의 result: FullReportResponse)
+    """
+    if not settings.gemini_api_key:
+        raise _gemini_not_configured()
+
+    report_title, experiments, manual_info = await _resolve_report_inputs(request)
+
+    async def run(context: JobContext):
+        await context.stage("report")
+        return await generate_full_report(
+            report_title=report_title,
+            experiments=experiments,
+            manual_info=manual_info,
+            options=request.options,
+            regenerate=request.regenerate
+        )
+
+    job = await job_queue.submit("full_report", ["report"], _translate_errors(run))
+    return _submitted(job)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """
+    작업 상태, 진행률, 결과를 조회합니다.
+
+    완료된 작업의 결과는 JOB_TTL_SECONDS 동안 보관됩니다.
+    """
+    job = await _get_job(job_id)
+    return JobResponse(success=True, message=f"작업 상태: {job.status.value}", data=job)
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str) -> StreamingResponse:
+    """
+    작업 진행 상황을 Server-Sent Events로 스트리밍
+
+    이벤트:
+    - progress: JobInfo (result 제외) 상태/단계가 바뀔 때마다
+    - completed / failed / cancelled: JobInfo 작업 종료 시 (completed에는 result 포함)
+    """
+    await _get_job(job_id)
+
+    async def events() -> AsyncIterator[str]:
+        async for job in job_queue.watch(job_id):
+            if job.status in FINISHED_STATUSES:
+                event = "completed" if job.status == JobStatus.SUCCEEDED else job.status.value
+                yield format_sse(event, job.model_dump(mode="json"))
+            else:
+                yield format_sse("progress", job.model_dump(mode="json", exclude={"result"}))
+
+    return _sse_response(events())
+
+
+@router.delete("/{job_id}", response_model=JobResponse)
+async def cancel_job(job_id: str):
+    """
+    작업을 취소합니다.
+
+    다른 워커 프로세스에서 실행 중인 작업은 다음 단계로 넘어갈 때 취소됩니다.
+    이미 끝난 작업은 409를 반환합니다.
+    """
+    job = await _get_job(job_id)
+    if job.status in FINISHED_STATUSES:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": "JOB_ALREADY_FINISHED",
+                "message": f"이미 종료된 작업입니다. (상태: {job.status.value})"
+            }
+        )
+
+    job = await job_queue.cancel(job_id)
+    if job is None:
+        raise _job_not_found()
+    return JobResponse(success=True, message="작업 취소를 요청했습니다.", data=job)
@@ -0,0 +1,217 @@
+"""
+LabReportAI Production Server
+사전 로딩한 앱을 여러 워커 프로세스로 실행하는 운영용 실행기
+
+    python -m app.server --workers 4 --port 8000
+
+- 부모 프로세스가 앱을 임포트하고 matplotlib 폰트 캐시/스타일을 미리 로딩한 뒤
+  포트를 열고 워커를 fork합니다 (워커는 임포트와 폰트 캐시 생성을 반복하지 않음).
+- 각 워커는 시작 이벤트에서 예열(렌더링 프로세스, Gemini 클라이언트, 합성 분석+렌더링
+  요청)을 마친 뒤에 연결을 받습니다.
+- SIGTERM/SIGINT를 받으면 워커에 전달합니다. 워커는 새 연결을 받지 않고 진행 중인
+  요청과 백그라운드 작업을 마무리한 뒤 종료하며, 제한 시간을 넘기면 강제 종료합니다.
+- 비정상 종료한 워커는 다시 기동합니다.
+
+os.fork가 없는 환경(Windows)에서는 uvicorn 멀티 워커 모드로 실행합니다 (사전 로딩 없음).
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import uvicorn
+
+from app.config import settings
+
+
+logger = logging.getLogger("uvicorn.error")
+
+# 기동 직후 이 시간 안에 종료한 워커는 설정 오류로 보고 다시 기동하지 않음
+_MIN_WORKER_UPTIME_SECONDS = 10.0
+
+# 강제 종료 전, 워커가 요청과 작업을 마무리하는 시간 외에 추가로 기다리는 시간
+_SHUTDOWN_GRACE_SECONDS = 5.0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자 파싱 (기본값은 설정값)"""
+    parser = argparse.ArgumentParser(prog="python -m app.server", description="LabReportAI 운영 서버")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument("--workers", type=int, default=settings.server_workers)
+    parser.add_argument(
+        "--graceful-timeout", type=float, default=settings.server_graceful_timeout_seconds,
+        help="종료 시 진행 중인 요청을 기다리는 시간(초)"
+    )
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--no-access-log", dest="access_log", action="store_false")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers는 1 이상이어야 합니다.")
+    return args
+
+
+def build_config(args: argparse.Namespace) -> uvicorn.Config:
+    """워커 공통 uvicorn 설정 (앱을 임포트하여 사전 로딩)"""
+    from app.main import app
+
+    config = uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        log_level=args.log_level,
+        access_log=args.access_log,
+        timeout_graceful_shutdown=args.graceful_timeout
+    )
+    config.load()
+    return config
+
+
+class Supervisor:
+    """
+    워커 프로세스 관리자
+
+    포트를 한 번 열고 모든 워커가 같은 소켓에서 연결을 받습니다.
+    """
+
+    def __init__(self, config: uvicorn.Config, workers: int, shutdown_timeout: float):
+        self.config = config
+        self.workers = workers
+        self.shutdown_timeout = shutdown_timeout
+
+        self._socket: Optional[socket.socket] = None
+        self._children: Dict[int, float] = {}  # pid -> 기동 시각
+        self._stop_signal: Optional[int] = None
+
+    def run(self) -> int:
+        """
+        워커를 기동하고 종료 신호를 받을 때까지 관리
+
+        Returns:
+            int: 종료 코드 (워커가 기동 직후 종료하면 1)
+        """
+        self._socket = self.config.bind_socket()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self._handle_signal)
+
+        logger.info("Starting %d worker(s) (supervisor pid %d)", self.workers, os.getpid())
+        exit_code = 0
+        for _ in range(self.workers):
+            self._spawn()
+
+        while self._stop_signal is None:
+            pid, status = self._reap()
+            if pid == 0:
+                time.sleep(0.2)
+                continue
+
+            started_at = self._children.pop(pid)
+            if self._stop_signal is not None:
+                break
+            code = os.waitstatus_to_exitcode(status)
+            logger.warning("Worker %d exited unexpectedly (code %d)", pid, code)
+            if time.monotonic() - started_at < _MIN_WORKER_UPTIME_SECONDS:
+                logger.error("Worker %d failed during startup; stopping server", pid)
+                self._stop_signal = signal.SIGTERM
+                exit_code = 1
+                break
+            self._spawn()
+
+        self._stop_workers()
+        self._socket.close()
+        return exit_code
+
+    def _handle_signal(self, signum: int, frame) -> None:
+        self._stop_signal = signum
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            # 워커: 관리자의 신호 처리를 해제하고 uvicorn이 직접 처리 (종료 시 요청/작업 마무리)
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, signal.SIG_DFL)
+            code = 0
+            try:
+                server = uvicorn.Server(self.config)
+                server.run(sockets=[self._socket])
+                if not server.started:
+                    code = 3  # 시작 이벤트(예열) 실패
+            except Exception:
+                logger.exception("Worker %d crashed", os.getpid())
+                code = 1
+            # 정상 종료 절차(atexit, 프로세스 풀 정리)를 거치도록 SystemExit으로 빠져나감
+            # (관리자 쪽 호출 경로에는 정리 코드가 없어 워커에서 실행되지 않음)
+            raise SystemExit(code)
+
+        self._children[pid] = time.monotonic()
+
+    def _reap(self) -> Tuple[int, int]:
+        """종료한 워커 하나를 회수 (없으면 (0, 0))"""
+        try:
+            return os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return 0, 0
+
+    def _stop_workers(self) -> None:
+        """워커에 종료 신호 전달 후 대기, 제한 시간을 넘기면 강제 종료"""
+        if not self._children:
+            return
+        logger.info("Stopping %d worker(s), waiting up to %.0fs", len(self._children), self.shutdown_timeout)
+        for pid in self._children:
+            self._signal_worker(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        while self._children and time.monotonic() < deadline:
+            pid, _ = self._reap()
+            if pid:
+                self._children.pop(pid, None)
+            else:
+                time.sleep(0.1)
+
+        for pid in list(self._children):
+            logger.warning("Worker %d did not stop in time; killing", pid)
+            self._signal_worker(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            self._children.pop(pid)
+
+    @staticmethod
+    def _signal_worker(pid: int, sig: int) -> None:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """운영 서버 실행"""
+    args = parse_args(argv)
+
+    if not hasattr(os, "fork"):
+        uvicorn.run(
+            "app.main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level=args.log_level,
+            access_log=args.access_log,
+            timeout_graceful_shutdown=args.graceful_timeout
+        )
+        return 0
+
+    config = build_config(args)
+
+    # 부모에서 한 번만 matplotlib 임포트, 스타일 적용, 폰트 캐시 생성 (워커가 fork로 물려받음)
+    from app.services.render_engine import warm_render_worker
+    warm_render_worker()
+
+    shutdown_timeout = args.graceful_timeout + settings.server_drain_timeout_seconds + _SHUTDOWN_GRACE_SECONDS
+    return Supervisor(config, args.workers, shutdown_timeout).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,14 @@
 # Services package
 from app.services.analysis_engine import analysis_service, AnalysisService, AnalysisError
 from app.services.graph_generator import graph_generator, GraphGenerator
+from app.services.render_engine import render_engine, GraphRenderEngine
 
 __all__ = [
     'analysis_service',
     'AnalysisService',
     'AnalysisError',
     'graph_generator',
-    'GraphGenerator'
+    'GraphGenerator',
+    'render_engine',
+    'GraphRenderEngine'
 ]
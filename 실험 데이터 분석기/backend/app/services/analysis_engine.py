@@ -1,14 +1,15 @@
 """
 LabReportAI Analysis Engine (핵심)
-Pandas + Scipy를 활용한 데이터 분석 로직
+Pandas + NumPy를 활용한 데이터 분석 로직
 """
 
 import pandas as pd
 import numpy as np
-from scipy import stats
+from pandas.api.types import is_numeric_dtype
 from typing import Optional, Tuple, Dict, List
 import uuid
 
+from app.config import settings
 from app.models.schemas import (
     StatisticsResult,
     DataSummary,
@@ -17,6 +18,14 @@ from app.models.schemas import (
     SingleExperimentResult,
     GraphResult
 )
+from app.services.regression import (
+    LinearFit,
+    RegressionError,
+    fit_line,
+    needs_residual_pass,
+    regression_from_moments,
+    t_critical
+)
 from app.utils.file_parser import FileParserError
 
 
@@ -61,66 +70,54 @@ class AnalysisService:
         Raises:
             AnalysisError: 분석 실패 시
         """
-        # 1. 데이터 전처리
-        cleaned_df, null_removed = self._preprocess_data(df, x_column, y_column)
+        # 1. 데이터 전처리 (두 열만 배열로 꺼내 결측치 제거)
+        x, y, null_removed = self._preprocess_arrays(df, x_column, y_column)
         
         # 2. 데이터 포인트 수 확인
-        if len(cleaned_df) < self.MIN_DATA_POINTS:
+        if len(x) < self.MIN_DATA_POINTS:
             raise AnalysisError(
                 code=ErrorCode.INSUFFICIENT_DATA,
-                message=f"최소 {self.MIN_DATA_POINTS}개 이상의 데이터 포인트가 필요합니다. 현재: {len(cleaned_df)}개"
+                message=f"최소 {self.MIN_DATA_POINTS}개 이상의 데이터 포인트가 필요합니다. 현재: {len(x)}개"
             )
         
         # 3. 통계 분석 수행
-        statistics = self._perform_regression(
-            cleaned_df[x_column].values,
-            cleaned_df[y_column].values,
-            theoretical_slope
-        )
+        statistics = self._perform_regression(x, y, theoretical_slope)
         
         # 4. 데이터 요약 생성
         data_summary = DataSummary(
             columns=df.columns.tolist(),
-            row_count=len(cleaned_df),
+            row_count=len(x),
             null_values_removed=null_removed
         )
+
+        # 5. 전처리된 DataFrame (그래프 렌더링용, 배열을 감싸기만 함)
+        cleaned_df = pd.DataFrame({x_column: x, y_column: y})
         
         return statistics, data_summary, cleaned_df
-    
-    def _preprocess_data(
-        self,
+
+    @staticmethod
+    def _preprocess_arrays(
         df: pd.DataFrame,
         x_column: str,
         y_column: str
-    ) -> Tuple[pd.DataFrame, int]:
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
         """
-        데이터 전처리: 결측치 제거, 숫자형 변환
-        
-        Args:
-            df: 원본 DataFrame
-            x_column: X축 열 이름
-            y_column: Y축 열 이름
-            
+        데이터 전처리: DataFrame 복사 없이 두 열을 배열로 꺼내 숫자형 변환, 결측치 제거
+
+        이미 숫자형인 열은 변환하지 않습니다.
+
         Returns:
-            Tuple[pd.DataFrame, int]: 전처리된 DataFrame, 제거된 결측치 수
+            Tuple[np.ndarray, np.ndarray, int]: X 배열, Y 배열, 제거된 결측치 수
         """
-        # 복사본 생성
-        df_copy = df[[x_column, y_column]].copy()
-        
-        # 숫자형 변환
-        df_copy[x_column] = pd.to_numeric(df_copy[x_column], errors='coerce')
-        df_copy[y_column] = pd.to_numeric(df_copy[y_column], errors='coerce')
-        
-        # 원본 행 수
-        original_count = len(df_copy)
-        
-        # 결측치 제거
-        df_copy = df_copy.dropna()
-        
-        # 제거된 행 수
-        null_removed = original_count - len(df_copy)
-        
-        return df_copy, null_removed
+        x = df[x_column]
+        y = df[y_column]
+        x = (x if is_numeric_dtype(x) else pd.to_numeric(x, errors='coerce')).to_numpy()
+        y = (y if is_numeric_dtype(y) else pd.to_numeric(y, errors='coerce')).to_numpy()
+
+        valid = ~(pd.isna(x) | pd.isna(y))
+        if valid.all():
+            return x, y, 0
+        return x[valid], y[valid], int(len(valid) - valid.sum())
     
     def _perform_regression(
         self,
@@ -129,7 +126,7 @@ class AnalysisService:
         theoretical_slope: Optional[float] = None
     ) -> StatisticsResult:
         """
-        선형 회귀 분석 수행
+        선형 회귀 분석 수행 (regression.fit_line)
         
         Args:
             x: X 데이터 배열
@@ -139,39 +136,168 @@ class AnalysisService:
         Returns:
             StatisticsResult: 통계 분석 결과
         """
+        fit = self._fit_line(x, y)
+        return self._statistics_from_fit(
+            fit, float(t_critical(fit.n - 2, settings.regression_confidence_level)), theoretical_slope
+        )
+
+    def _perform_regression_batch(
+        self,
+        xs: List[np.ndarray],
+        ys: List[np.ndarray],
+        theoretical_slopes: List[Optional[float]]
+    ) -> List[StatisticsResult]:
+        """
+        여러 (x, y) 계열의 선형 회귀를 한 번의 NumPy 연산으로 수행
+
+        계열을 하나의 배열로 이어 붙이고 np.add.reduceat으로 계열별 합을
+        구하므로, 길이가 서로 다른 계열도 패딩 없이 처리합니다.
+        중심화 적률은 regression.centered_moments와 같은 corrected two-pass로 계산하며
+        (reduceat은 구간마다 pairwise 합), 적률에서 계수/표준 오차를 구하는 식은
+        regression 모듈과 공유합니다.
+
+        1 - r²가 작아 (1 - r²)·Σdy²의 상쇄 오차가 커지는 계열(거의 완벽한 선형,
+        타임스탬프 X 등)만 regression.fit_line으로 잔차 제곱합을 직접 다시 계산하므로,
+        결과는 계열마다 _perform_regression을 호출한 것과 같습니다.
+
+        Args:
+            xs: 계열별 X 데이터 배열 (결측치 제거됨)
+            ys: 계열별 Y 데이터 배열
+            theoretical_slopes: 계열별 이론적 기울기 (옵션)
+
+        Returns:
+            List[StatisticsResult]: 계열별 통계 분석 결과
+
+        Raises:
+            AnalysisError: X 값이 모두 같은 계열이 있을 때
+        """
+        if not xs:
+            return []
+
+        counts = np.array([len(x) for x in xs])
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        x_all = np.concatenate(xs).astype(np.float64, copy=False)
+        y_all = np.concatenate(ys).astype(np.float64, copy=False)
+
+        # 계열별 평균을 빼서 중심화한 뒤 제곱합/곱합 계산 (평균의 반올림 오차 보정 포함)
+        x_mean = np.add.reduceat(x_all, starts) / counts
+        y_mean = np.add.reduceat(y_all, starts) / counts
+        dx = x_all - np.repeat(x_mean, counts)
+        dy = y_all - np.repeat(y_mean, counts)
+
+        sum_dx = np.add.reduceat(dx, starts)
+        sum_dy = np.add.reduceat(dy, starts)
+        ssxm = np.add.reduceat(dx * dx, starts) - sum_dx * sum_dx / counts
+        ssym = np.add.reduceat(dy * dy, starts) - sum_dy * sum_dy / counts
+        ssxym = np.add.reduceat(dx * dy, starts) - sum_dx * sum_dy / counts
+        x_mean += sum_dx / counts
+        y_mean += sum_dy / counts
+
+        x_min = np.minimum.reduceat(x_all, starts)
+        x_max = np.maximum.reduceat(x_all, starts)
+        y_min = np.minimum.reduceat(y_all, starts)
+        y_max = np.maximum.reduceat(y_all, starts)
+
+        slope, intercept, r_value, std_error, intercept_std_error = regression_from_moments(
+            counts, x_mean, y_mean, ssxm, ssym, ssxym
+        )
+        t_values = t_critical(counts - 2, settings.regression_confidence_level)
+
+        # X 값이 모두 같은 계열은 fit_line이 같은 오류를 발생시킴
+        refit = needs_residual_pass(counts, r_value) | (x_max == x_min)
+
+        results = []
+        for i in range(len(xs)):
+            if refit[i]:
+                fit = self._fit_line(xs[i], ys[i])
+                results.append(self._statistics_from_fit(fit, float(t_values[i]), theoretical_slopes[i]))
+                continue
+            results.append(self._build_statistics(
+                slope=float(slope[i]),
+                intercept=float(intercept[i]),
+                r_value=float(r_value[i]),
+                std_error=float(std_error[i]),
+                intercept_std_error=float(intercept_std_error[i]),
+                t_value=float(t_values[i]),
+                data_points=int(counts[i]),
+                x_range=(float(x_min[i]), float(x_max[i])),
+                y_range=(float(y_min[i]), float(y_max[i])),
+                theoretical_slope=theoretical_slopes[i]
+            ))
+        return results
+
+    @staticmethod
+    def _fit_line(x: np.ndarray, y: np.ndarray) -> LinearFit:
+        """regression.fit_line 호출 (입력 오류는 AnalysisError로 변환)"""
         try:
-            # scipy.stats.linregress 사용
-            result = stats.linregress(x, y)
-            
-            slope = result.slope
-            intercept = result.intercept
-            r_value = result.rvalue
-            std_error = result.stderr
-            
-            # R² (결정계수) 계산
-            r_squared = r_value ** 2
-            
-            # 오차율 계산 (이론값이 주어진 경우)
-            error_rate_percent = None
-            if theoretical_slope is not None and theoretical_slope != 0:
-                error_rate_percent = abs((slope - theoretical_slope) / theoretical_slope) * 100
-            
-            return StatisticsResult(
-                slope=round(slope, 6),
-                intercept=round(intercept, 6),
-                r_squared=round(r_squared, 6),
-                std_error=round(std_error, 6),
-                error_rate_percent=round(error_rate_percent, 2) if error_rate_percent else None,
-                data_points=len(x),
-                x_range=(round(float(x.min()), 4), round(float(x.max()), 4)),
-                y_range=(round(float(y.min()), 4), round(float(y.max()), 4))
-            )
-            
-        except Exception as e:
+            return fit_line(x, y)
+        except RegressionError as e:
             raise AnalysisError(
                 code=ErrorCode.ANALYSIS_FAILED,
-                message=f"회귀 분석 중 오류가 발생했습니다: {str(e)}"
+                message=f"회귀 분석 중 오류가 발생했습니다: {e.message}"
             )
+
+    def _statistics_from_fit(
+        self,
+        fit: LinearFit,
+        t_value: float,
+        theoretical_slope: Optional[float]
+    ) -> StatisticsResult:
+        """회귀 결과(LinearFit)로 StatisticsResult 생성"""
+        return self._build_statistics(
+            slope=fit.slope,
+            intercept=fit.intercept,
+            r_value=fit.r_value,
+            std_error=fit.slope_stderr,
+            intercept_std_error=fit.intercept_stderr,
+            t_value=t_value,
+            data_points=fit.n,
+            x_range=fit.x_range,
+            y_range=fit.y_range,
+            theoretical_slope=theoretical_slope
+        )
+
+    @staticmethod
+    def _build_statistics(
+        slope: float,
+        intercept: float,
+        r_value: float,
+        std_error: float,
+        intercept_std_error: float,
+        t_value: float,
+        data_points: int,
+        x_range: Tuple[float, float],
+        y_range: Tuple[float, float],
+        theoretical_slope: Optional[float] = None
+    ) -> StatisticsResult:
+        """회귀 결과로 StatisticsResult 생성 (반올림 규칙 공통 적용, t_value는 신뢰구간 임계값)"""
+        # R² (결정계수) 계산
+        r_squared = r_value ** 2
+
+        # 오차율 계산 (이론값이 주어진 경우)
+        error_rate_percent = None
+        if theoretical_slope is not None and theoretical_slope != 0:
+            error_rate_percent = abs((slope - theoretical_slope) / theoretical_slope) * 100
+
+        return StatisticsResult(
+            slope=round(slope, 6),
+            intercept=round(intercept, 6),
+            r_squared=round(r_squared, 6),
+            std_error=round(std_error, 6),
+            intercept_std_error=round(intercept_std_error, 6),
+            slope_confidence_interval=(
+                round(slope - t_value * std_error, 6), round(slope + t_value * std_error, 6)
+            ),
+            intercept_confidence_interval=(
+                round(intercept - t_value * intercept_std_error, 6),
+                round(intercept + t_value * intercept_std_error, 6)
+            ),
+            confidence_level=settings.regression_confidence_level,
+            error_rate_percent=round(error_rate_percent, 2) if error_rate_percent is not None else None,
+            data_points=data_points,
+            x_range=(round(x_range[0], 4), round(x_range[1], 4)),
+            y_range=(round(y_range[0], 4), round(y_range[1], 4))
+        )
     
     @staticmethod
     def generate_analysis_id() -> str:
@@ -197,8 +323,9 @@ class AnalysisService:
         Raises:
             AnalysisError: 분석 실패 시
         """
-        results = []
+        prepared = []
 
+        # 1. 실험별 전처리 (시트 확인, 결측치 제거, 데이터 수 확인)
         for exp_config in experiments:
             sheet_name = exp_config.sheet_name
 
@@ -210,26 +337,55 @@ class AnalysisService:
                 )
 
             df = sheets_data[sheet_name]
+            x, y, null_removed = self._preprocess_arrays(df, exp_config.x_column, exp_config.y_column)
 
-            # 개별 분석 수행
-            statistics, data_summary, cleaned_df = self.analyze_dataframe(
-                df=df,
-                x_column=exp_config.x_column,
-                y_column=exp_config.y_column,
-                theoretical_slope=exp_config.theoretical_slope
-            )
+            if len(x) < self.MIN_DATA_POINTS:
+                raise AnalysisError(
+                    code=ErrorCode.INSUFFICIENT_DATA,
+                    message=f"최소 {self.MIN_DATA_POINTS}개 이상의 데이터 포인트가 필요합니다. 현재: {len(x)}개"
+                )
 
-            # 데이터 테이블 생성
-            data_table = self.dataframe_to_table(
-                cleaned_df,
-                exp_config.x_column,
-                exp_config.y_column
+            data_summary = DataSummary(
+                columns=df.columns.tolist(),
+                row_count=len(x),
+                null_values_removed=null_removed
             )
+            prepared.append((exp_config, x, y, data_summary))
+
+        # 2. 모든 실험의 회귀 분석을 한 번에 수행
+        statistics_list = self._perform_regression_batch(
+            [x for _, x, _, _ in prepared],
+            [y for _, _, y, _ in prepared],
+            [exp_config.theoretical_slope for exp_config, _, _, _ in prepared]
+        )
+
+        # 3. 전처리된 DataFrame, 데이터 테이블 생성
+        results = []
+        for (exp_config, x, y, data_summary), statistics in zip(prepared, statistics_list):
+            cleaned_df = pd.DataFrame({exp_config.x_column: x, exp_config.y_column: y})
+            data_table = self._arrays_to_table(x, y, exp_config.x_column, exp_config.y_column)
 
             results.append((statistics, data_summary, cleaned_df, data_table))
 
         return results
 
+    @staticmethod
+    def _arrays_to_table(
+        x: np.ndarray,
+        y: np.ndarray,
+        x_col: str,
+        y_col: str,
+        max_rows: int = 50
+    ) -> List[dict]:
+        """결측치가 제거된 배열로 데이터 테이블 생성 (dataframe_to_table과 같은 형식)"""
+        def to_values(values: np.ndarray) -> list:
+            return [round(v, 6) if isinstance(v, float) else v for v in values[:max_rows].tolist()]
+
+        return [
+            {x_col: x_value, y_col: y_value}
+            for x_value, y_value in zip(to_values(x), to_values(y))
+        ]
+
     def dataframe_to_table(
         self,
         df: pd.DataFrame,
@@ -0,0 +1,199 @@
+"""
+LabReportAI Analysis Pipeline
+배치 분석(파싱 → 분석 → 렌더링)과 전체 리포트 생성(LLM) 단계
+
+/api/analyze/batch, /api/generate/full-report와 백그라운드 작업(/api/jobs)이
+같은 단계를 공유합니다.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from app.models.schemas import (
+    BatchAnalysisData,
+    ExperimentConfig,
+    ExperimentManualInfo,
+    FullReportResponse,
+    GraphFormat,
+    GraphResolution,
+    ImageDelivery,
+    ReportOptions,
+    SingleExperimentResult
+)
+from app.services.analysis_engine import analysis_service
+from app.services.batch_store import batch_store
+from app.services.gemini_service import get_gemini_service
+from app.services.render_engine import render_engine
+from app.services.report_generator import report_generator
+from app.utils.executor import ExecutorSaturatedError, cpu_executor
+
+
+# 단계 시작 알림 (작업 진행률 기록, 취소 확인용)
+StageCallback = Callable[[str], Awaitable[None]]
+
+
+async def _no_progress(stage: str) -> None:
+    pass
+
+
+async def run_batch_analysis(
+    load_sheets: Callable[[], Awaitable[Dict[str, pd.DataFrame]]],
+    experiments: List[ExperimentConfig],
+    report_title: str,
+    manual_info: Optional[ExperimentManualInfo] = None,
+    image_mode: ImageDelivery = ImageDelivery.INLINE,
+    on_stage: StageCallback = _no_progress,
+    resolution: GraphResolution = GraphResolution.PREVIEW,
+    image_format: GraphFormat = GraphFormat.PNG
+) -> BatchAnalysisData:
+    """
+    배치 분석 수행 후 결과를 batch_store에 저장
+
+    Args:
+        load_sheets: 실험에 쓰이는 {시트이름: DataFrame}을 읽는 코루틴 함수
+        experiments: 실험 설정 목록
+        report_title: 리포트 제목
+        manual_info: 매뉴얼 정보 (PDF에서 추출)
+        image_mode: 그래프 전달 방식
+        on_stage: 각 단계(parse, analyze, render) 시작 시 호출
+        resolution: 그래프 해상도 프로필 (리포트용 print 해상도는 리포트 생성 시 렌더링)
+        image_format: 그래프 이미지 형식
+
+    Returns:
+        BatchAnalysisData: 배치 분석 결과
+
+    Raises:
+        FileParserError: 파일 파싱 실패 시
+        AnalysisError: 분석 실패 시
+        ExecutorSaturatedError: 실행기 대기열이 가득 찬 경우
+    """
+    # 1. 실험에 쓰이는 시트와 열만 파싱
+    await on_stage("parse")
+    sheets_data = await load_sheets()
+
+    # 2. 배치 분석 수행
+    await on_stage("analyze")
+    analysis_results = await cpu_executor.run(
+        analysis_service.analyze_batch,
+        sheets_data=sheets_data,
+        experiments=experiments
+    )
+
+    # 3. 그래프 배치 생성 (워커 프로세스에서 병렬 렌더링)
+    await on_stage("render")
+    graph_input_data = [
+        (cleaned_df, exp_config.x_column, exp_config.y_column, stats, exp_config.experiment_name)
+        for exp_config, (stats, data_summary, cleaned_df, data_table) in zip(experiments, analysis_results)
+    ]
+    graph_results = await render_engine.render_batch(graph_input_data, image_mode, resolution, image_format)
+
+    # 4. 결과 조립
+    experiment_results: List[SingleExperimentResult] = []
+    for exp_config, graph_result, (stats, data_summary, cleaned_df, data_table) in zip(
+        experiments, graph_results, analysis_results
+    ):
+        experiment_results.append(SingleExperimentResult(
+            experiment_name=exp_config.experiment_name,
+            sheet_name=exp_config.sheet_name,
+            statistics=stats,
+            graph=graph_result,
+            data_summary=data_summary,
+            data_table=data_table
+        ))
+
+    batch_data = BatchAnalysisData(
+        batch_id=analysis_service.generate_analysis_id(),
+        report_title=report_title,
+        experiments=experiment_results,
+        total_experiments=len(experiments),
+        manual_info=manual_info
+    )
+
+    # 5. 서버에 배치 결과 저장 (full-report에서 batch_id만으로 재사용)
+    await cpu_executor.run(batch_store.save, batch_data)
+    return batch_data
+
+
+async def with_print_graphs(experiments: List[SingleExperimentResult]) -> List[SingleExperimentResult]:
+    """
+    리포트에 넣을 그래프를 print 해상도로 교체 (필요한 그래프만 렌더링, 결과는 캐시)
+
+    원본 데이터가 캐시에서 밀려났거나 실행기 대기열이 가득 차면 기존 그래프를 그대로 사용합니다.
+
+    Args:
+        experiments: 실험 결과 목록
+
+    Returns:
+        List[SingleExperimentResult]: 그래프를 교체한 실험 결과 목록 (입력 순서 유지)
+    """
+    async def upgrade(experiment: SingleExperimentResult) -> SingleExperimentResult:
+        try:
+            graph = await render_engine.render_at(experiment.graph, GraphResolution.PRINT)
+        except ExecutorSaturatedError:
+            graph = None
+        if graph is None or graph is experiment.graph:
+            return experiment
+        return experiment.model_copy(update={"graph": graph})
+
+    return list(await asyncio.gather(*(upgrade(experiment) for experiment in experiments)))
+
+
+async def generate_full_report(
+    report_title: str,
+    experiments: List[SingleExperimentResult],
+    manual_info: Optional[ExperimentManualInfo] = None,
+    options: Optional[ReportOptions] = None,
+    regenerate: bool = False
+) -> FullReportResponse:
+    """
+    AI 리포트 섹션 생성 후 마크다운 리포트 조립
+
+    Args:
+        report_title: 리포트 제목
+        experiments: 실험 결과 목록
+        manual_info: 매뉴얼 정보
+        options: 리포트 옵션
+        regenerate: True이면 캐시된 응답 대신 새로 생성
+
+    Returns:
+        FullReportResponse: 마크다운 리포트 및 섹션별 텍스트
+
+    Raises:
+        ValueError: Gemini API 키가 설정되지 않은 경우
+        GeminiTimeoutError: 모델 호출 시간 초과 시
+        GeminiUnavailableError: 재시도 후에도 모델 API 일시 오류가 계속되거나 서킷이 열린 경우
+        PromptTooLargeError: 프롬프트가 모델 입력 한도를 넘는 경우
+        ExecutorSaturatedError: 실행기 대기열이 가득 찬 경우
+    """
+    gemini_service = get_gemini_service()
+
+    # 1. AI로 리포트 섹션 생성 (그동안 리포트용 print 해상도 그래프 렌더링)
+    ai_response, report_experiments = await asyncio.gather(
+        gemini_service.generate_full_report_async(
+            report_title=report_title,
+            experiments=experiments,
+            manual_info=manual_info,
+            options=options,
+            regenerate=regenerate
+        ),
+        with_print_graphs(experiments)
+    )
+
+    # 2. 마크다운 리포트 조립 (데이터 테이블 + 그래프 이미지 포함, 에셋 읽기는 스레드 풀에서)
+    markdown_content = await cpu_executor.run(
+        report_generator.generate_markdown_report,
+        report_title=report_title,
+        experiments=report_experiments,
+        generated_sections=ai_response.sections,
+        manual_info=manual_info
+    )
+
+    return FullReportResponse(
+        success=True,
+        message="전체 리포트가 성공적으로 생성되었습니다.",
+        markdown_content=markdown_content,
+        sections=ai_response.sections,
+        prompt_tokens=ai_response.prompt_tokens
+    )
@@ -0,0 +1,181 @@
+"""
+LabReportAI Asset Store
+그래프 이미지 에셋 저장소 (로컬 파일시스템 / Supabase Storage)
+"""
+
+import hashlib
+import os
+import re
+import urllib.error
+import urllib.request
+from typing import Optional, Tuple
+
+from app.config import settings
+
+
+# 에셋 ID: {콘텐츠 SHA-256}.{확장자}
+ASSET_ID_PATTERN = re.compile(r"^[0-9a-f]{64}\.(png|svg|webp)$")
+
+CONTENT_TYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "webp": "image/webp",
+}
+
+
+class AssetStoreError(Exception):
+    """에셋 저장소 관련 커스텀 예외"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+def make_asset_id(data: bytes, extension: str) -> str:
+    """콘텐츠 해시 기반 에셋 ID 생성 (같은 이미지는 항상 같은 ID)"""
+    return f"{hashlib.sha256(data).hexdigest()}.{extension}"
+
+
+def content_type_for(asset_id: str) -> str:
+    """에셋 ID의 확장자로 Content-Type 결정"""
+    extension = asset_id.rsplit(".", 1)[-1]
+    return CONTENT_TYPES.get(extension, "application/octet-stream")
+
+
+class AssetStore:
+    """
+    그래프 에셋 저장소 인터페이스
+
+    에셋은 콘텐츠 주소 방식(ID = 해시)이므로 변경되지 않으며,
+    같은 이미지를 여러 번 저장해도 한 번만 기록됩니다.
+    """
+
+    def put(self, data: bytes, extension: str = "png") -> str:
+        """
+        에셋 저장
+
+        Args:
+            data: 이미지 바이트
+            extension: 파일 확장자 (png, svg, webp)
+
+        Returns:
+            str: 에셋 ID
+        """
+        raise NotImplementedError
+
+    def get(self, asset_id: str) -> Optional[bytes]:
+        """
+        에셋 조회
+
+        Args:
+            asset_id: 에셋 ID
+
+        Returns:
+            Optional[bytes]: 이미지 바이트 (없으면 None)
+        """
+        raise NotImplementedError
+
+    def url_for(self, asset_id: str) -> str:
+        """브라우저가 이미지를 가져올 URL 반환"""
+        return f"{settings.asset_public_base_url}/api/assets/{asset_id}"
+
+
+class LocalAssetStore(AssetStore):
+    """로컬 파일시스템 에셋 저장소: {base_dir}/{id[:2]}/{id}"""
+
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+
+    def _path(self, asset_id: str) -> str:
+        return os.path.join(self.base_dir, asset_id[:2], asset_id)
+
+    def put(self, data: bytes, extension: str = "png") -> str:
+        asset_id = make_asset_id(data, extension)
+        path = self._path(asset_id)
+        if os.path.exists(path):
+            return asset_id
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            raise AssetStoreError(f"에셋을 저장할 수 없습니다: {str(e)}")
+
+        return asset_id
+
+    def get(self, asset_id: str) -> Optional[bytes]:
+        if not ASSET_ID_PATTERN.match(asset_id):
+            return None
+        try:
+            with open(self._path(asset_id), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+
+class SupabaseAssetStore(AssetStore):
+    """
+    Supabase Storage 에셋 저장소
+
+    Storage REST API를 직접 호출합니다. 버킷이 public이면 브라우저는
+    Supabase CDN URL에서 이미지를 바로 가져갑니다.
+    """
+
+    def __init__(self, url: str, key: str, bucket: str, timeout: float = 10.0):
+        if not url or not key:
+            raise AssetStoreError("SUPABASE_URL / SUPABASE_KEY가 설정되지 않았습니다.")
+        self.url = url.rstrip("/")
+        self.key = key
+        self.bucket = bucket
+        self.timeout = timeout
+
+    def _object_url(self, asset_id: str) -> str:
+        return f"{self.url}/storage/v1/object/{self.bucket}/{asset_id[:2]}/{asset_id}"
+
+    def _request(self, method: str, url: str, data: Optional[bytes] = None, content_type: Optional[str] = None) -> Tuple[int, bytes]:
+        headers = {"Authorization": f"Bearer {self.key}", "apikey": self.key}
+        if content_type:
+            headers["Content-Type"] = content_type
+            headers["x-upsert"] = "true"
+            headers["Cache-Control"] = f"max-age={settings.asset_cache_max_age}"
+        request = urllib.request.Request(url, data=data, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+        except urllib.error.URLError as e:
+            raise AssetStoreError(f"Supabase Storage에 연결할 수 없습니다: {str(e)}")
+
+    def put(self, data: bytes, extension: str = "png") -> str:
+        asset_id = make_asset_id(data, extension)
+        status, body = self._request("POST", self._object_url(asset_id), data, content_type_for(asset_id))
+        if status >= 300:
+            raise AssetStoreError(f"Supabase 업로드 실패 ({status}): {body[:200]!r}")
+        return asset_id
+
+    def get(self, asset_id: str) -> Optional[bytes]:
+        if not ASSET_ID_PATTERN.match(asset_id):
+            return None
+        status, body = self._request("GET", self._object_url(asset_id))
+        return body if status == 200 else None
+
+    def url_for(self, asset_id: str) -> str:
+        return f"{self.url}/storage/v1/object/public/{self.bucket}/{asset_id[:2]}/{asset_id}"
+
+
+def create_asset_store() -> AssetStore:
+    """설정에 따라 에셋 저장소 생성"""
+    if settings.asset_store_backend == "supabase":
+        return SupabaseAssetStore(
+            url=settings.supabase_url,
+            key=settings.supabase_key,
+            bucket=settings.supabase_storage_bucket
+        )
+    return LocalAssetStore(settings.asset_store_dir)
+
+
+# 저장소 인스턴스 (싱글톤)
+asset_store = create_asset_store()
@@ -0,0 +1,172 @@
+"""
+LabReportAI Batch Session Store
+배치 분석 결과를 batch_id로 서버에 보관하는 세션 저장소
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.config import settings
+from app.models.schemas import BatchAnalysisData
+
+
+class BatchSessionStore:
+    """
+    배치 세션 저장소
+
+    - 메모리 계층: 항목 수 + 총 바이트 수(직렬화 JSON 크기, 인라인 base64 그래프 포함) 기준 LRU + TTL
+    - SQLite 계층 (db_path 지정 시): 같은 DB 파일을 쓰는 모든 워커 프로세스가
+      공유하며, 서버 재시작 후에도 TTL 동안 유지됩니다.
+
+    /api/analyze/batch가 결과를 저장하고, /api/generate/full-report는
+    batch_id만으로 결과를 다시 불러옵니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        db_path: Optional[str] = None,
+        max_memory_bytes: Optional[int] = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path or None
+        self.max_memory_bytes = max_memory_bytes
+
+        self._memory: "OrderedDict[str, Tuple[float, int, BatchAnalysisData]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        if self.db_path:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS batch_sessions ("
+                    "batch_id TEXT PRIMARY KEY, "
+                    "payload TEXT NOT NULL, "
+                    "expires_at REAL NOT NULL)"
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5.0)
+
+    def save(self, data: BatchAnalysisData) -> None:
+        """
+        배치 결과 저장
+
+        Args:
+            data: 배치 분석 결과
+        """
+        expires_at = time.time() + self.ttl_seconds
+        payload = data.model_dump_json()
+
+        with self._lock:
+            self._put_memory(data.batch_id, expires_at, len(payload), data)
+
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO batch_sessions (batch_id, payload, expires_at) VALUES (?, ?, ?)",
+                    (data.batch_id, payload, expires_at)
+                )
+                conn.execute("DELETE FROM batch_sessions WHERE expires_at < ?", (time.time(),))
+
+    def get(self, batch_id: str) -> Optional[BatchAnalysisData]:
+        """
+        배치 결과 조회 (메모리 → SQLite 순)
+
+        Args:
+            batch_id: 배치 분석 ID
+
+        Returns:
+            Optional[BatchAnalysisData]: 배치 결과 (없거나 만료되면 None)
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(batch_id)
+            if entry is not None:
+                expires_at, _, data = entry
+                if expires_at >= now:
+                    self._memory.move_to_end(batch_id)
+                    self.hits += 1
+                    return data
+                self._remove(batch_id)
+
+        data = None
+        if self.db_path:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT payload, expires_at FROM batch_sessions WHERE batch_id = ?",
+                    (batch_id,)
+                ).fetchone()
+            if row is not None and row[1] >= now:
+                data = BatchAnalysisData.model_validate_json(row[0])
+                with self._lock:
+                    self._put_memory(batch_id, row[1], len(row[0]), data)
+
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+    def delete(self, batch_id: str) -> None:
+        """배치 결과 삭제"""
+        with self._lock:
+            if batch_id in self._memory:
+                self._remove(batch_id)
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM batch_sessions WHERE batch_id = ?", (batch_id,))
+
+    def _put_memory(self, batch_id: str, expires_at: float, size: int, data: BatchAnalysisData) -> None:
+        """메모리 계층 저장 및 LRU 제거 (잠금 상태에서 호출)"""
+        if batch_id in self._memory:
+            self._remove(batch_id)
+
+        # 한도보다 큰 배치는 메모리에 두지 않음 (SQLite 계층에서만 조회)
+        if self.max_memory_bytes is not None and size > self.max_memory_bytes:
+            return
+
+        self._memory[batch_id] = (expires_at, size, data)
+        self._memory_bytes += size
+
+        while len(self._memory) > self.max_entries or (
+            self.max_memory_bytes is not None and self._memory_bytes > self.max_memory_bytes
+        ):
+            self._remove(next(iter(self._memory)))
+
+    def _remove(self, batch_id: str) -> None:
+        _, size, _ = self._memory.pop(batch_id)
+        self._memory_bytes -= size
+
+    def get_stats(self) -> Dict[str, int]:
+        """저장소 통계 반환"""
+        with self._lock:
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+# 저장소 인스턴스 (싱글톤)
+batch_store = BatchSessionStore(
+    max_entries=settings.batch_store_max_entries,
+    ttl_seconds=settings.batch_store_ttl_seconds,
+    db_path=settings.batch_store_db_path or None,
+    max_memory_bytes=settings.batch_store_memory_mb * 1024 * 1024
+)
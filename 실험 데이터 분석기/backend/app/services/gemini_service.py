@@ -3,12 +3,35 @@ Gemini AI Service
 Google Gemini 2.5 Flash를 사용한 AI 고찰 생성 서비스
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple, Any, AsyncIterator, Callable, Dict
+import asyncio
 import json
+import re
+import requests
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
 
 from app.config import settings
+from app.services.llm_cache import LLMResponseCache, llm_cache, make_cache_key
+from app.services.manual_cache import ManualExtractionCache, manual_cache
+from app.services.prompt_builder import (
+    build_within_budget,
+    estimate_tokens,
+    join_blocks,
+    manual_section,
+    statistics_table,
+    truncate_to_tokens
+)
+from app.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    RetriesExhaustedError,
+    RetryDecision,
+    RetryPolicy
+)
+from app.utils.upload_reader import SpooledUpload
 from app.models.schemas import (
     StatisticsResult,
     DiscussionRequest,
@@ -22,23 +45,407 @@ from app.models.schemas import (
 )
 
 
+class GeminiTimeoutError(Exception):
+    """Gemini 호출 시간 초과 예외"""
+    def __init__(self, timeout_seconds: float):
+        self.timeout_seconds = timeout_seconds
+        self.message = f"AI 응답이 {timeout_seconds:g}초 안에 도착하지 않았습니다. 잠시 후 다시 시도해주세요."
+        super().__init__(self.message)
+
+
+class GeminiUnavailableError(Exception):
+    """
+    Gemini API 일시 장애 예외 (재시도 후에도 요청 한도 초과/서버 오류, 또는 서킷 열림)
+
+    code: GEMINI_RATE_LIMITED, GEMINI_UNAVAILABLE, GEMINI_CIRCUIT_OPEN
+    retry_after: 다시 시도하기까지 권장 대기 시간(초), 알 수 없으면 None
+    """
+    def __init__(self, code: str, message: str, retry_after: Optional[float] = None):
+        self.code = code
+        self.message = message
+        self.retry_after = retry_after
+        super().__init__(self.message)
+
+
+class ConcurrencyWaitTimeoutError(DeadlineExceededError):
+    """동시 호출 자리(세마포어)를 기다리다 시간 예산을 다 쓴 경우 (모델 오류가 아니므로 서킷에 기록하지 않음)"""
+
+
+# 재시도하는 HTTP 상태 코드와 재시도 사유
+_RETRYABLE_STATUS: Dict[int, str] = {
+    429: "rate_limited",
+    500: "server_error",
+    502: "server_error",
+    503: "unavailable",
+    504: "server_error"
+}
+
+
+def _retry_after_seconds(error: genai_errors.APIError) -> Optional[float]:
+    """Retry-After 헤더 또는 응답의 RetryInfo.retryDelay("1.5s")에서 대기 시간 추출"""
+    headers = getattr(error.response, "headers", None) or {}
+    header = headers.get("Retry-After")
+    if header:
+        try:
+            return max(float(header), 0.0)
+        except ValueError:
+            pass  # HTTP 날짜 형식은 무시하고 백오프 사용
+
+    details = error.details.get("error", error.details) if isinstance(error.details, dict) else {}
+    for detail in details.get("details") or []:
+        delay = detail.get("retryDelay") if isinstance(detail, dict) else None
+        match = re.fullmatch(r"([0-9.]+)s", delay or "")
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def _classify_error(error: Exception) -> RetryDecision:
+    """재시도할 일시 오류이면 (사유, 대기 시간), 아니면 None"""
+    if isinstance(error, genai_errors.APIError) and error.code in _RETRYABLE_STATUS:
+        return _RETRYABLE_STATUS[error.code], _retry_after_seconds(error)
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return "connection_error", None
+    if isinstance(error, ConcurrencyWaitTimeoutError):
+        return None
+    if isinstance(error, DeadlineExceededError):
+        return "timeout", None
+    return None
+
+
+def _is_json(text: str) -> bool:
+    """JSON으로 파싱되는 응답인지 확인 (파싱 실패 응답은 캐시하지 않음)"""
+    try:
+        json.loads(text)
+        return True
+    except ValueError:
+        return False
+
+
 class GeminiService:
-    """Gemini AI 서비스"""
+    """
+    Gemini AI 서비스
+
+    동기 메서드(generate_discussion 등)와 함께 라우터에서 사용하는 async 변형
+    (*_async)을 제공합니다. async 변형은 하나의 공유 클라이언트(client.aio)를
+    사용하며, 호출마다 제한 시간을 두고 전역 세마포어로 동시에 진행 중인
+    모델 호출 수를 제한합니다.
+
+    모든 모델 호출은 재시도 정책(retry)을 거칩니다. 429/5xx/연결 오류는 제한
+    시간 안에서 지터 지수 백오프로 재시도하고(Retry-After 준수), 연속 실패가
+    쌓이면 서킷 브레이커가 업스트림이 회복될 때까지 호출 없이 바로 실패시킵니다.
+
+    모든 모델 호출은 응답 캐시(llm_cache)를 먼저 확인하며, regenerate=True이면
+    캐시를 건너뛰고 새로 생성한 응답으로 캐시를 갱신합니다.
+    """
     
     MODEL_NAME = "gemini-2.5-flash"
     
-    def __init__(self):
-        """Gemini 클라이언트 초기화"""
-        if not settings.gemini_api_key:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[LLMResponseCache] = None,
+        manual_extraction_cache: Optional[ManualExtractionCache] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Gemini 클라이언트 초기화
+
+        Args:
+            api_key: API 키 (기본: 설정값)
+            base_url: API 엔드포인트 (기본: 설정값, 비어 있으면 Google 기본 주소)
+            max_concurrency: 동시에 진행할 최대 모델 호출 수 (기본: 설정값)
+            cache: 응답 캐시 (기본: llm_cache, 설정에서 비활성화하면 사용 안 함)
+            manual_extraction_cache: PDF 해시별 매뉴얼 추출 캐시 (기본: manual_cache)
+            retry_policy: 재시도 정책 + 서킷 브레이커 (기본: 설정값으로 생성)
+        """
+        api_key = api_key or settings.gemini_api_key
+        if not api_key:
             raise ValueError("GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
-        
-        self.client = genai.Client(api_key=settings.gemini_api_key)
+
+        http_options = {"timeout": int(settings.gemini_report_timeout_seconds * 1000)}
+        base_url = base_url or settings.gemini_base_url
+        if base_url:
+            http_options["base_url"] = base_url
+
+        self.client = genai.Client(api_key=api_key, http_options=http_options)
+        self.max_concurrency = max_concurrency or settings.gemini_max_concurrency
+        if cache is None and settings.llm_cache_enabled:
+            cache = llm_cache
+        self.cache = cache
+        self.manual_cache = manual_extraction_cache or manual_cache
+        self.retry = retry_policy or RetryPolicy(
+            max_attempts=settings.gemini_retry_max_attempts,
+            base_delay=settings.gemini_retry_base_delay_seconds,
+            max_delay=settings.gemini_retry_max_delay_seconds,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.gemini_circuit_failure_threshold,
+                reset_seconds=settings.gemini_circuit_reset_seconds
+            )
+        )
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.in_flight = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프용 세마포어 반환 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _cache_lookup(
+        self,
+        kind: str,
+        contents: Any,
+        config: types.GenerateContentConfig,
+        regenerate: bool
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        응답 캐시 조회
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: (캐시 키, 캐시된 응답)
+                캐시를 사용하지 않으면 키가 None, regenerate이면 응답이 None
+        """
+        if self.cache is None:
+            return None, None
+        key = make_cache_key(self.MODEL_NAME, config, contents)
+        if regenerate:
+            return key, None
+        return key, self.cache.get(key, kind)
+
+    def _cache_store(
+        self,
+        key: Optional[str],
+        text: Optional[str],
+        is_valid: Optional[Callable[[str], bool]] = None
+    ) -> None:
+        """유효한 응답만 캐시에 저장 (빈 응답, 검증 실패 응답은 저장하지 않음)"""
+        if key is None or not text:
+            return
+        if is_valid is not None and not is_valid(text):
+            return
+        self.cache.put(key, text)
+
+    def _generate(
+        self,
+        kind: str,
+        contents: Any,
+        config: types.GenerateContentConfig,
+        regenerate: bool = False,
+        is_valid: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """
+        동기 클라이언트로 모델 호출 (응답 캐시 + 재시도 적용)
+
+        시도별 제한 시간은 클라이언트 HTTP 제한 시간(GEMINI_REPORT_TIMEOUT_SECONDS)이며,
+        재시도 대기를 포함한 전체 시간도 같은 값으로 제한합니다.
+
+        Raises:
+            GeminiTimeoutError: 제한 시간 안에 응답이 없을 때
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
+        """
+        key, cached = self._cache_lookup(kind, contents, config, regenerate)
+        if cached is not None:
+            return cached
+
+        def attempt(remaining: float):
+            return self.client.models.generate_content(
+                model=self.MODEL_NAME,
+                contents=contents,
+                config=config
+            )
+
+        budget = settings.gemini_report_timeout_seconds
+        try:
+            response = self.retry.call(attempt, _classify_error, budget)
+        except (DeadlineExceededError, CircuitOpenError, RetriesExhaustedError) as e:
+            raise self._resilience_error(e, budget) from e
+
+        self._cache_store(key, response.text, is_valid)
+        return response.text
+
+    async def _generate_async(
+        self,
+        kind: str,
+        contents: Any,
+        config: types.GenerateContentConfig,
+        timeout_seconds: float,
+        regenerate: bool = False,
+        is_valid: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """
+        async 클라이언트로 모델 호출 (응답 캐시 + 동시 호출 수 제한 + 재시도 + 제한 시간 적용)
+
+        제한 시간은 요청 하나의 전체 예산으로, 세마포어 대기와 재시도 대기를
+        모두 포함합니다. 재시도 전에는 세마포어를 놓고 대기하므로 백오프 중인
+        요청이 다른 호출의 자리를 차지하지 않습니다.
+        캐시 조회/저장(키 해시, SQLite)은 스레드에서 실행합니다.
+
+        Raises:
+            GeminiTimeoutError: 제한 시간 안에 응답이 없을 때
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
+        """
+        key, cached = await asyncio.to_thread(self._cache_lookup, kind, contents, config, regenerate)
+        if cached is not None:
+            return cached
+
+        async def attempt(remaining: float):
+            semaphore = self._get_semaphore()
+            remaining = await self._acquire_within(semaphore, remaining, timeout_seconds)
+            self.in_flight += 1
+            try:
+                return await asyncio.wait_for(
+                    self.client.aio.models.generate_content(
+                        model=self.MODEL_NAME,
+                        contents=contents,
+                        config=config
+                    ),
+                    timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError(timeout_seconds)
+            finally:
+                self.in_flight -= 1
+                semaphore.release()
+
+        try:
+            response = await self.retry.call_async(attempt, _classify_error, timeout_seconds)
+        except (DeadlineExceededError, CircuitOpenError, RetriesExhaustedError) as e:
+            raise self._resilience_error(e, timeout_seconds) from e
+
+        await asyncio.to_thread(self._cache_store, key, response.text, is_valid)
+        return response.text
+
+    async def _stream_async(
+        self,
+        kind: str,
+        contents: Any,
+        config: types.GenerateContentConfig,
+        timeout_seconds: float,
+        regenerate: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        모델 출력을 생성되는 대로 텍스트 조각으로 반환 (동시 호출 수 제한 + 재시도 + 제한 시간 적용)
+
+        SDK의 동기 스트림에서 조각을 하나씩 스레드로 읽어, 다음 조각을 기다리는
+        동안에도 이벤트 루프를 막지 않습니다. 제한 시간은 재시도 대기를 포함한
+        스트림 전체에 적용됩니다. 이미 보낸 조각은 되돌릴 수 없으므로 재시도는
+        첫 조각을 받기 전까지만 합니다.
+        캐시에 있으면 저장된 응답을 한 조각으로 반환하고, 스트림이 끝까지
+        완료된 경우에만 응답을 캐시에 저장합니다.
+
+        Raises:
+            GeminiTimeoutError: 제한 시간 안에 스트림이 끝나지 않을 때
+            GeminiUnavailableError: 첫 조각 전까지 일시 오류가 계속되거나 서킷이 열린 경우
+        """
+        key, cached = await asyncio.to_thread(self._cache_lookup, kind, contents, config, regenerate)
+        if cached is not None:
+            yield cached
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        semaphore = self._get_semaphore()
+
+        async def open_stream(remaining: float):
+            """세마포어를 얻고 첫 조각까지 읽기 (성공하면 세마포어를 쥔 채 반환)"""
+            remaining = await self._acquire_within(semaphore, remaining, timeout_seconds)
+            self.in_flight += 1
+            try:
+                stream = self.client.models.generate_content_stream(
+                    model=self.MODEL_NAME,
+                    contents=contents,
+                    config=config
+                )
+                first = await asyncio.wait_for(asyncio.to_thread(next, stream, None), timeout=remaining)
+                return stream, first
+            except BaseException as e:
+                self.in_flight -= 1
+                semaphore.release()
+                if isinstance(e, asyncio.TimeoutError):
+                    raise DeadlineExceededError(timeout_seconds)
+                raise
+
+        try:
+            stream, chunk = await self.retry.call_async(open_stream, _classify_error, timeout_seconds)
+        except (DeadlineExceededError, CircuitOpenError, RetriesExhaustedError) as e:
+            raise self._resilience_error(e, timeout_seconds) from e
+
+        chunks = []
+        try:
+            while chunk is not None:
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+                try:
+                    chunk = await asyncio.wait_for(
+                        asyncio.to_thread(next, stream, None),
+                        timeout=max(deadline - loop.time(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    raise GeminiTimeoutError(timeout_seconds)
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+
+        await asyncio.to_thread(self._cache_store, key, "".join(chunks))
+
+    @staticmethod
+    async def _acquire_within(semaphore: asyncio.Semaphore, remaining: float, timeout_seconds: float) -> float:
+        """
+        남은 예산 안에서 세마포어 획득
+
+        Returns:
+            float: 세마포어를 얻은 뒤 남은 시간 (초)
+
+        Raises:
+            ConcurrencyWaitTimeoutError: 예산 안에 자리가 나지 않을 때
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=remaining)
+        except asyncio.TimeoutError:
+            raise ConcurrencyWaitTimeoutError(timeout_seconds)
+        return max(remaining - (loop.time() - started), 0)
+
+    @staticmethod
+    def _resilience_error(error: Exception, timeout_seconds: float) -> Exception:
+        """재시도 정책의 실패를 서비스 예외(GeminiTimeoutError, GeminiUnavailableError)로 변환"""
+        if isinstance(error, DeadlineExceededError):
+            return GeminiTimeoutError(timeout_seconds)
+        if isinstance(error, CircuitOpenError):
+            return GeminiUnavailableError("GEMINI_CIRCUIT_OPEN", error.message, error.retry_after)
+        if error.reason == "timeout":
+            return GeminiTimeoutError(timeout_seconds)
+        if error.reason == "rate_limited":
+            return GeminiUnavailableError(
+                "GEMINI_RATE_LIMITED",
+                "AI 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
+                error.retry_after
+            )
+        return GeminiUnavailableError(
+            "GEMINI_UNAVAILABLE",
+            "AI 서비스가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해주세요.",
+            error.retry_after
+        )
+
+    def get_resilience_stats(self) -> Dict[str, Any]:
+        """재시도 횟수(사유별), 포기 횟수, 서킷 브레이커 상태 반환"""
+        return self.retry.get_stats()
     
     def generate_discussion(
         self,
         experiment_title: str,
         statistics: StatisticsResult,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        regenerate: bool = False
     ) -> DiscussionResponse:
         """
         실험 결과에 대한 AI 고찰 생성
@@ -47,6 +454,7 @@ class GeminiService:
             experiment_title: 실험 제목
             statistics: 통계 분석 결과
             context: 추가 맥락 정보 (선택)
+            regenerate: True이면 캐시된 응답 대신 새로 생성
             
         Returns:
             DiscussionResponse: 생성된 고찰 텍스트
@@ -54,32 +462,98 @@ class GeminiService:
         
         prompt = self._build_prompt(experiment_title, statistics, context)
         
-        response = self.client.models.generate_content(
-            model=self.MODEL_NAME,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.7,
-                max_output_tokens=4000,  # 더 긴 출력을 위해 증가
-            )
-        )
-        
-        generated_text = response.text
+        generated_text = self._generate("discussion", prompt, self._discussion_config(), regenerate)
         
+        return self.build_discussion_response(generated_text, estimate_tokens(prompt))
+
+    async def generate_discussion_async(
+        self,
+        experiment_title: str,
+        statistics: StatisticsResult,
+        context: Optional[str] = None,
+        regenerate: bool = False
+    ) -> DiscussionResponse:
+        """
+        실험 결과에 대한 AI 고찰 생성 (async)
+
+        Raises:
+            GeminiTimeoutError: 제한 시간 초과 시
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
+        """
+        prompt = self._build_prompt(experiment_title, statistics, context)
+
+        generated_text = await self._generate_async(
+            "discussion",
+            prompt,
+            self._discussion_config(),
+            settings.gemini_timeout_seconds,
+            regenerate
+        )
+
+        return self.build_discussion_response(generated_text, estimate_tokens(prompt))
+
+    async def stream_discussion_async(
+        self,
+        experiment_title: str,
+        statistics: StatisticsResult,
+        context: Optional[str] = None,
+        regenerate: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        실험 결과에 대한 AI 고찰을 생성되는 대로 스트리밍
+
+        Yields:
+            str: 생성된 텍스트 조각
+
+        Raises:
+            GeminiTimeoutError: 제한 시간 초과 시
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
+        """
+        prompt = self._build_prompt(experiment_title, statistics, context)
+
+        async for text in self._stream_async(
+            "discussion", prompt, self._discussion_config(), settings.gemini_timeout_seconds, regenerate
+        ):
+            yield text
+
+    @staticmethod
+    def _discussion_config() -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            temperature=0.7,
+            max_output_tokens=4000,  # 더 긴 출력을 위해 증가
+        )
+
+    def build_discussion_response(
+        self,
+        generated_text: str,
+        prompt_tokens: Optional[int] = None
+    ) -> DiscussionResponse:
+        """생성된 고찰 텍스트로 DiscussionResponse 생성"""
         return DiscussionResponse(
             success=True,
             message="고찰이 성공적으로 생성되었습니다.",
             discussion=generated_text,
-            model_used=self.MODEL_NAME
+            model_used=self.MODEL_NAME,
+            prompt_tokens=prompt_tokens
         )
+
+    def discussion_prompt_tokens(
+        self,
+        experiment_title: str,
+        statistics: StatisticsResult,
+        context: Optional[str] = None
+    ) -> int:
+        """고찰 프롬프트의 입력 토큰 수 (로컬 추정, 스트리밍 응답용)"""
+        return estimate_tokens(self._build_prompt(experiment_title, statistics, context))
     
     def _build_prompt(
-        self, 
-        experiment_title: str, 
+        self,
+        experiment_title: str,
         statistics: StatisticsResult,
         context: Optional[str] = None
     ) -> str:
-        """프롬프트 생성"""
-        
+        """고찰 프롬프트 생성 (추가 맥락은 토큰 예산에 맞춰 축약)"""
+
         # R² 값에 따른 해석 가이드
         r_squared = statistics.r_squared
         if r_squared >= 0.99:
@@ -92,7 +566,7 @@ class GeminiService:
             r_squared_interpretation = "중간 정도의 선형 상관관계"
         else:
             r_squared_interpretation = "약한 선형 상관관계 (비선형적 특성 가능)"
-        
+
         error_analysis = ""
         if statistics.error_rate_percent is not None:
             error_rate = statistics.error_rate_percent
@@ -104,147 +578,179 @@ class GeminiService:
                 error_level = "허용 가능 (10% 미만)"
             else:
                 error_level = "개선 필요 (10% 이상)"
-            
-            error_analysis = f"""
-- 오차율: {error_rate:.2f}% ({error_level})"""
-
-        prompt = f"""당신은 이공계 대학 실험 보고서 작성을 전문으로 하는 물리학/공학 박사급 조교입니다.
-다음 실험 결과 데이터를 바탕으로 **상세하고 학술적인** 실험 보고서의 '결과 및 고찰' 섹션을 작성해주세요.
-
-반드시 **최소 800자 이상**, 충분히 길고 상세하게 작성해야 합니다.
 
----
-
-## 📋 실험 정보
-- **실험 제목**: {experiment_title}
-
-## 📊 통계 분석 결과
-| 항목 | 값 | 의미 |
-|------|-----|------|
-| 기울기 (Slope) | {statistics.slope:.6f} | 독립 변수 1단위 증가 시 종속 변수 변화량 |
-| y절편 (Intercept) | {statistics.intercept:.6f} | X=0일 때의 Y 예측값 |
-| 결정계수 (R²) | {statistics.r_squared:.6f} | {r_squared_interpretation} |
-| 표준 오차 | {statistics.std_error:.6f} | 기울기 추정의 불확실성 |
-| 데이터 포인트 수 | {statistics.data_points}개 | 분석에 사용된 측정값 개수 |
-| X 범위 | {statistics.x_range[0]:.4f} ~ {statistics.x_range[1]:.4f} | 독립 변수 측정 범위 |
-| Y 범위 | {statistics.y_range[0]:.4f} ~ {statistics.y_range[1]:.4f} | 종속 변수 측정 범위 |
-{error_analysis}
-
-{f"## 📝 추가 맥락 정보{chr(10)}{context}" if context else ""}
-
----
+            error_analysis = f"\n| 오차율 | {error_rate:.2f}% ({error_level}) |"
+
+        def render(context_section: str) -> str:
+            return join_blocks(
+                f"""당신은 이공계 대학 실험 보고서 작성을 전문으로 하는 물리학/공학 박사급 조교입니다.
+다음 실험 결과로 실험 보고서의 '결과 및 고찰' 섹션을 학술적으로, 최소 800자 이상 상세하게 작성하세요.
+
+## 실험: {experiment_title}
+
+## 통계 분석 결과
+| 항목 | 값 |
+|---|---|
+| 기울기 | {statistics.slope:.6g} |
+| y절편 | {statistics.intercept:.6g} |
+| R² | {statistics.r_squared:.6f} ({r_squared_interpretation}) |
+| 기울기 표준 오차 | {statistics.std_error:.6g} |
+| 데이터 포인트 | {statistics.data_points} |
+| X 범위 | {statistics.x_range[0]:.6g} ~ {statistics.x_range[1]:.6g} |
+| Y 범위 | {statistics.y_range[0]:.6g} ~ {statistics.y_range[1]:.6g} |{error_analysis}""",
+                context_section,
+                f"""## 작성 지침
+다음 5개 섹션을 ## 제목으로 모두 포함하고, 섹션마다 2~3개 문단으로 작성하세요.
+1. 결과 분석: 회귀식 Y = {statistics.slope:.4g}X + {statistics.intercept:.4g}의 물리적 의미, 기울기가 나타내는 물리량, y절편이 0에서 벗어난 원인, 측정 범위 내 선형성
+2. 결정계수 분석: R² = {statistics.r_squared:.4f}의 통계적 의미, 실험 신뢰도와 모델 적합도, 잔차 관점의 해석
+3. 오차 원인 분석: 계통 오차, 우연 오차, 방법 오차에서 3가지 이상을 구체적으로 제시하고 각각이 기울기, 절편, R²에 미치는 영향 분석
+4. 개선 방안: 측정 정밀도 향상, 데이터 수집 절차 개선, 추가 실험이나 검증 방법
+5. 결론: 실험 목적 달성 여부, 주요 발견, 결과의 의의와 응용, 향후 연구 방향
+
+형식: 마크다운, 학술 논문 스타일의 객관적인 어조, 적절한 유효숫자, 필요시 수식($Y = aX + b$). 간략하게 줄이지 말고 모든 섹션을 작성하세요."""
+            )
 
-## ✍️ 작성 지침 (반드시 준수)
+        def context_section(max_tokens: int) -> str:
+            if not context:
+                return ""
+            return f"## 추가 맥락\n{truncate_to_tokens(context, max_tokens)}"
 
-다음 **5개 섹션**을 모두 포함하여 작성하세요. 각 섹션은 최소 2-3개의 문단으로 구성되어야 합니다.
+        return build_within_budget(render, context_section)
 
-### 1. 결과 분석 (Results Analysis)
-- 회귀 방정식 Y = {statistics.slope:.4f}X + {statistics.intercept:.4f}의 물리적/과학적 의미를 상세히 해석
-- 기울기가 의미하는 물리량 또는 관계성 설명
-- y절편의 물리적 의미와 0에서 벗어난 경우의 원인 분석
-- 데이터 범위 내에서의 선형성 평가
+    # ============================================================
+    # PDF Manual Extraction (매뉴얼 정보 추출)
+    # ============================================================
 
-### 2. 결정계수(R²) 분석 (Coefficient of Determination)
-- R² = {statistics.r_squared:.4f}가 의미하는 바를 통계학적으로 해석
-- 이 값이 실험의 신뢰도에 미치는 영향
-- 선형 모델의 적합도 평가
-- 잔차(residual) 분석 관점에서의 해석
+    def extract_manual_from_pdf(
+        self,
+        pdf_bytes: bytes,
+        filename: str,
+        regenerate: bool = False
+    ) -> ExperimentManualInfo:
+        """
+        PDF 파일에서 실험 매뉴얼 정보를 추출
 
-### 3. 오차 원인 분석 (Error Analysis)
-최소 3가지 이상의 가능한 오차 원인을 구체적으로 제시:
-- **계통 오차 (Systematic Error)**: 측정 장비의 영점 오차, 보정 문제, 환경 조건 등
-- **우연 오차 (Random Error)**: 측정자의 판독 오차, 환경 변동, 샘플링 오차 등
-- **방법 오차 (Procedural Error)**: 실험 방법론의 한계, 가정의 적절성 등
-- 각 오차 원인이 기울기, 절편, R² 값에 미치는 영향 분석
+        Args:
+            pdf_bytes: PDF 파일 바이트 데이터
+            filename: 원본 파일명
+            regenerate: True이면 캐시된 응답 대신 새로 추출
 
-### 4. 개선 방안 (Improvements)
-- 오차를 줄이기 위한 구체적인 개선 방안 제시
-- 측정 정밀도 향상 방법
-- 데이터 수집 절차 개선안
-- 추가 실험 또는 검증 방법 제안
+        Returns:
+            ExperimentManualInfo: 추출된 매뉴얼 정보 (응답 JSON 파싱 실패 시 기본값)
 
-### 5. 결론 (Conclusion)
-- 실험 목적 달성 여부 평가
-- 주요 발견 사항 요약
-- 실험 결과의 의의와 응용 가능성
-- 향후 연구 방향 제안
+        Raises:
+            GeminiTimeoutError: 제한 시간 초과 시
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
+        """
+        contents, config = self._manual_request(pdf_bytes, filename)
 
----
+        # PDF를 Gemini에 전송 (inline_data 사용)
+        print(f"DEBUG: Processing PDF with {self.MODEL_NAME}")
+        generated_text = self._generate("manual", contents, config, regenerate, is_valid=_is_json)
+        try:
+            return self._parse_manual_response(generated_text)
 
-## 📝 형식 요구사항
-- 마크다운 형식으로 작성
-- 각 섹션에 ## 또는 ### 제목 사용
-- 학술 논문 스타일의 객관적이고 전문적인 어조 유지
-- 수치는 적절한 유효숫자로 표기
-- 필요시 수식 사용 (예: $Y = aX + b$ 형태)
+        except ValueError as e:
+            return self._manual_fallback(e)
 
-**중요: 반드시 모든 섹션을 포함하여 상세하게 작성하세요. 간략하게 작성하지 마세요!**"""
+    async def extract_manual_from_pdf_async(
+        self,
+        pdf_bytes: bytes,
+        filename: str,
+        regenerate: bool = False
+    ) -> ExperimentManualInfo:
+        """
+        PDF 파일에서 실험 매뉴얼 정보를 추출 (async)
 
-        return prompt
+        extract_manual_from_upload_async와 같이 PDF 해시별 캐시를 사용합니다.
 
-    # ============================================================
-    # PDF Manual Extraction (매뉴얼 정보 추출)
-    # ============================================================
+        Raises:
+            GeminiTimeoutError: 제한 시간 초과 시
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
+        """
+        upload = await asyncio.to_thread(SpooledUpload.from_bytes, pdf_bytes)
+        return await self.extract_manual_from_upload_async(upload, filename, regenerate)
 
-    def extract_manual_from_pdf(
+    async def extract_manual_from_upload_async(
         self,
-        pdf_bytes: bytes,
-        filename: str
+        upload: SpooledUpload,
+        filename: str,
+        regenerate: bool = False
     ) -> ExperimentManualInfo:
         """
-        PDF 파일에서 실험 매뉴얼 정보를 추출
+        업로드된 PDF에서 실험 매뉴얼 정보를 추출 (async)
+
+        - 같은 PDF(SHA-256)의 추출 결과가 있으면 PDF를 읽지 않고 바로 반환합니다.
+        - 같은 PDF의 추출이 진행 중이면 모델을 다시 호출하지 않고 그 결과를 기다립니다.
+        - 응답 JSON 파싱 실패는 동기 버전과 같이 기본값을 반환하고 (저장하지 않음),
+          제한 시간 초과와 API 오류는 예외로 전달합니다.
 
         Args:
-            pdf_bytes: PDF 파일 바이트 데이터
+            upload: 크기 제한을 통과한 PDF 업로드 (sha256 포함)
             filename: 원본 파일명
+            regenerate: True이면 저장된 결과 대신 새로 추출
 
         Returns:
             ExperimentManualInfo: 추출된 매뉴얼 정보
+
+        Raises:
+            GeminiTimeoutError: 제한 시간 초과 시
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
         """
-        prompt = self._build_pdf_extraction_prompt(filename)
+        async def extract() -> ExperimentManualInfo:
+            pdf_bytes = await asyncio.to_thread(upload.read_bytes)
+            contents, config = self._manual_request(pdf_bytes, filename)
+            generated_text = await self._generate_async(
+                "manual", contents, config, settings.gemini_timeout_seconds, regenerate, is_valid=_is_json
+            )
+            return self._parse_manual_response(generated_text)
 
-        # PDF를 Gemini에 전송 (inline_data 사용)
         try:
-            print(f"DEBUG: Processing PDF with {self.MODEL_NAME}")
-            response = self.client.models.generate_content(
-                model=self.MODEL_NAME,
-                contents=[
-                    types.Content(
-                        parts=[
-                            types.Part(
-                                inline_data=types.Blob(
-                                    mime_type="application/pdf",
-                                    data=pdf_bytes
-                                )
-                            ),
-                            types.Part(text=prompt)
-                        ]
-                    )
-                ],
-                config=types.GenerateContentConfig(
-                    temperature=0.1,  # 더 낮춤
-                    max_output_tokens=4000,
-                    response_mime_type="application/json"
-                )
+            return await self.manual_cache.get_or_extract(upload.sha256, extract, regenerate)
+
+        except ValueError as e:
+            return self._manual_fallback(e)
+
+    def _manual_request(
+        self,
+        pdf_bytes: bytes,
+        filename: str
+    ) -> Tuple[List[types.Content], types.GenerateContentConfig]:
+        """PDF 추출 요청 내용과 설정 생성"""
+        prompt = self._build_pdf_extraction_prompt(filename)
+
+        contents = [
+            types.Content(
+                parts=[
+                    types.Part(
+                        inline_data=types.Blob(
+                            mime_type="application/pdf",
+                            data=pdf_bytes
+                        )
+                    ),
+                    types.Part(text=prompt)
+                ]
             )
+        ]
+        config = types.GenerateContentConfig(
+            temperature=0.1,  # 더 낮춤
+            max_output_tokens=4000,
+            response_mime_type="application/json"
+        )
+        return contents, config
 
-            # JSON 파싱
-            raw_text = response.text.strip()
-            print(f"DEBUG: Gemini Response: {raw_text[:200]}...")
+    @staticmethod
+    def _parse_manual_response(response_text: str) -> ExperimentManualInfo:
+        """Gemini JSON 응답을 ExperimentManualInfo로 변환"""
+        # JSON 파싱
+        raw_text = response_text.strip()
+        print(f"DEBUG: Gemini Response: {raw_text[:200]}...")
 
+        try:
             data = json.loads(raw_text)
-            
-        except Exception as e:
-            print(f"ERROR in PDF extraction: {str(e)}")
-            if 'response' in locals():
-                print(f"Response text was: {response.text}")
-            
-            # 실패 시 기본값 반환
-            return ExperimentManualInfo(
-                experiment_purpose=f"PDF 분석 실패: {str(e)}",
-                theory="PDF에서 내용을 추출하지 못했습니다.",
-                error_guides=[]
-            )
+        except json.JSONDecodeError:
+            print(f"Response text was: {response_text}")
+            raise
 
         # ErrorGuideItem 리스트 변환
         error_guides = []
@@ -263,6 +769,16 @@ class GeminiService:
             equipment_list=data.get("equipment_list")
         )
 
+    @staticmethod
+    def _manual_fallback(error: Exception) -> ExperimentManualInfo:
+        """PDF 추출 실패 시 기본값"""
+        print(f"ERROR in PDF extraction: {str(error)}")
+        return ExperimentManualInfo(
+            experiment_purpose=f"PDF 분석 실패: {str(error)}",
+            theory="PDF에서 내용을 추출하지 못했습니다.",
+            error_guides=[]
+        )
+
     def _build_pdf_extraction_prompt(self, filename: str) -> str:
         """PDF 매뉴얼 추출 프롬프트 생성"""
         return f"""당신은 이공계 실험 매뉴얼 분석 전문가입니다.
@@ -309,7 +825,8 @@ class GeminiService:
         report_title: str,
         experiments: List[SingleExperimentResult],
         manual_info: Optional[ExperimentManualInfo] = None,
-        options: Optional[ReportOptions] = None
+        options: Optional[ReportOptions] = None,
+        regenerate: bool = False
     ) -> FullReportResponse:
         """
         전체 실험 리포트의 텍스트 섹션 생성
@@ -319,31 +836,237 @@ class GeminiService:
             experiments: 실험 결과 목록
             manual_info: 매뉴얼 정보 (PDF에서 추출, 선택)
             options: 리포트 옵션
+            regenerate: True이면 캐시된 응답 대신 새로 생성
 
         Returns:
             FullReportResponse: 생성된 리포트 섹션들
+
+        동기 버전은 generation_mode와 관계없이 한 번의 호출로 생성합니다.
+        """
+        prompt = self._full_report_prompt(report_title, experiments, manual_info, options)
+
+        generated_text = self._generate("full_report", prompt, self._full_report_config(), regenerate)
+
+        return self.build_full_report_response(generated_text, estimate_tokens(prompt))
+
+    async def generate_full_report_async(
+        self,
+        report_title: str,
+        experiments: List[SingleExperimentResult],
+        manual_info: Optional[ExperimentManualInfo] = None,
+        options: Optional[ReportOptions] = None,
+        regenerate: bool = False
+    ) -> FullReportResponse:
+        """
+        전체 실험 리포트의 텍스트 섹션 생성 (async)
+
+        options.generation_mode에 따라 한 번의 호출로 생성하거나, 실험별
+        섹션을 병렬로 생성한 뒤 종합합니다 (_stream_parallel_report 참고).
+
+        Raises:
+            GeminiTimeoutError: 제한 시간 초과 시
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
+        """
+        if self._use_parallel_report(experiments, options):
+            chunks = [
+                text async for text in self._stream_parallel_report(
+                    report_title, experiments, manual_info, options, regenerate
+                )
+            ]
+            return self.build_full_report_response(
+                "".join(chunks),
+                self.full_report_prompt_tokens(report_title, experiments, manual_info, options)
+            )
+
+        prompt = self._full_report_prompt(report_title, experiments, manual_info, options)
+
+        generated_text = await self._generate_async(
+            "full_report",
+            prompt,
+            self._full_report_config(),
+            settings.gemini_report_timeout_seconds,
+            regenerate
+        )
+
+        return self.build_full_report_response(generated_text, estimate_tokens(prompt))
+
+    async def stream_full_report_async(
+        self,
+        report_title: str,
+        experiments: List[SingleExperimentResult],
+        manual_info: Optional[ExperimentManualInfo] = None,
+        options: Optional[ReportOptions] = None,
+        regenerate: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        전체 실험 리포트의 텍스트 섹션을 생성되는 대로 스트리밍
+
+        조각에는 섹션 마커(<!-- SECTION: ... -->)가 그대로 포함되며,
+        마커 감지는 report_stream.SectionStreamParser가 담당합니다.
+
+        Yields:
+            str: 생성된 텍스트 조각
+
+        Raises:
+            GeminiTimeoutError: 제한 시간 초과 시
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
+        """
+        if self._use_parallel_report(experiments, options):
+            async for text in self._stream_parallel_report(
+                report_title, experiments, manual_info, options, regenerate
+            ):
+                yield text
+            return
+
+        prompt = self._full_report_prompt(report_title, experiments, manual_info, options)
+
+        async for text in self._stream_async(
+            "full_report", prompt, self._full_report_config(), settings.gemini_report_timeout_seconds, regenerate
+        ):
+            yield text
+
+    @staticmethod
+    def _use_parallel_report(
+        experiments: List[SingleExperimentResult],
+        options: Optional[ReportOptions]
+    ) -> bool:
+        """실험별 병렬 생성(map-reduce) 사용 여부"""
+        mode = (options or ReportOptions()).generation_mode
+        if not experiments or mode == "single":
+            return False
+        if mode == "parallel":
+            return True
+        return len(experiments) >= settings.report_parallel_min_experiments
+
+    async def _stream_parallel_report(
+        self,
+        report_title: str,
+        experiments: List[SingleExperimentResult],
+        manual_info: Optional[ExperimentManualInfo],
+        options: Optional[ReportOptions],
+        regenerate: bool
+    ) -> AsyncIterator[str]:
+        """
+        실험별 섹션을 병렬로 생성하고 종합 섹션과 함께 조립 (map-reduce)
+
+        - map: 실험마다 실험 결과/결과 분석 섹션을 생성 (리포트당 동시 호출 수는
+          report_parallel_max_concurrency로 제한, 전역 제한은 세마포어가 적용)
+        - reduce: 실험 간 비교와 토의를 생성하는 종합 호출. 개별 분석과 같은 통계
+          요약을 입력으로 쓰므로 map 호출과 동시에 진행합니다.
+
+        전체 소요 시간은 실험 수의 합이 아니라 가장 느린 호출에 비례하며, 호출마다
+        출력 길이가 짧아 한 번의 호출로 생성할 때처럼 출력이 잘리지 않습니다.
+        조립된 텍스트는 단일 호출과 같은 섹션 마커 형식이며, 앞 실험부터
+        완료되는 대로 반환합니다.
+
+        Yields:
+            str: 조립된 리포트 텍스트 조각
+
+        Raises:
+            GeminiTimeoutError: 제한 시간 초과 시 (나머지 호출은 취소)
+            GeminiUnavailableError: 재시도 후에도 일시 오류가 계속되거나 서킷이 열린 경우
         """
+        options = options or ReportOptions()
+        limit = asyncio.Semaphore(settings.report_parallel_max_concurrency)
+
+        async def experiment_sections(index: int, exp: SingleExperimentResult) -> ReportSections:
+            prompt = self._build_experiment_section_prompt(
+                report_title, index, len(experiments), exp, manual_info, options
+            )
+            async with limit:
+                text = await self._generate_async(
+                    "report_experiment",
+                    prompt,
+                    self._experiment_section_config(),
+                    settings.gemini_report_timeout_seconds,
+                    regenerate
+                )
+            return self._parse_report_sections(text)
+
+        async def synthesis_sections() -> ReportSections:
+            text = await self._generate_async(
+                "report_synthesis",
+                self._build_report_synthesis_prompt(report_title, experiments, manual_info, options),
+                self._report_synthesis_config(),
+                settings.gemini_report_timeout_seconds,
+                regenerate
+            )
+            return self._parse_report_sections(text)
+
+        tasks = [
+            asyncio.ensure_future(experiment_sections(i, exp))
+            for i, exp in enumerate(experiments, 1)
+        ]
+        synthesis_task = asyncio.ensure_future(synthesis_sections())
+
+        try:
+            yield "<!-- SECTION: experiment_results -->\n"
+            for i, (exp, task) in enumerate(zip(experiments, tasks), 1):
+                sections = await task
+                yield f"\n#### 실험 {i}: {exp.experiment_name}\n\n{sections.experiment_results}\n"
+
+            yield "\n<!-- SECTION: result_analysis -->\n"
+            for i, (exp, task) in enumerate(zip(experiments, tasks), 1):
+                yield f"\n#### 실험 {i}: {exp.experiment_name}\n\n{task.result().result_analysis}\n"
+
+            synthesis = await synthesis_task
+            if synthesis.result_analysis:
+                yield f"\n#### 실험 간 비교\n\n{synthesis.result_analysis}\n"
+
+            yield f"\n<!-- SECTION: discussion -->\n{synthesis.discussion}\n"
+
+        finally:
+            for task in [*tasks, synthesis_task]:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # 먼저 실패한 호출 외의 예외가 처리되지 않았다는 경고를 남기지 않음
+                    task.exception()
+
+    def _full_report_prompt(
+        self,
+        report_title: str,
+        experiments: List[SingleExperimentResult],
+        manual_info: Optional[ExperimentManualInfo],
+        options: Optional[ReportOptions]
+    ) -> str:
         if options is None:
             options = ReportOptions()
 
-        prompt = self._build_full_report_prompt(
+        return self._build_full_report_prompt(
             report_title=report_title,
             experiments=experiments,
             manual_info=manual_info,
             options=options
         )
 
-        response = self.client.models.generate_content(
-            model=self.MODEL_NAME,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.7,
-                max_output_tokens=8000,  # 긴 리포트를 위해 증가
-            )
+    @staticmethod
+    def _full_report_config() -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            temperature=0.7,
+            max_output_tokens=8000,  # 긴 리포트를 위해 증가
         )
 
-        generated_text = response.text
+    @staticmethod
+    def _experiment_section_config() -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            temperature=0.7,
+            max_output_tokens=2000,  # 실험 하나의 결과/분석
+        )
 
+    @staticmethod
+    def _report_synthesis_config() -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            temperature=0.7,
+            max_output_tokens=3000,  # 실험 간 비교 + 토의
+        )
+
+    def build_full_report_response(
+        self,
+        generated_text: str,
+        prompt_tokens: Optional[int] = None
+    ) -> FullReportResponse:
+        """생성된 리포트 텍스트를 섹션으로 나누어 FullReportResponse 생성"""
         # 섹션 분리 (마커 기반)
         sections = self._parse_report_sections(generated_text)
 
@@ -351,9 +1074,33 @@ class GeminiService:
             success=True,
             message="전체 리포트가 성공적으로 생성되었습니다.",
             markdown_content=generated_text,
-            sections=sections
+            sections=sections,
+            prompt_tokens=prompt_tokens
         )
 
+    def full_report_prompt_tokens(
+        self,
+        report_title: str,
+        experiments: List[SingleExperimentResult],
+        manual_info: Optional[ExperimentManualInfo] = None,
+        options: Optional[ReportOptions] = None
+    ) -> int:
+        """
+        전체 리포트 프롬프트의 입력 토큰 수 (로컬 추정)
+
+        병렬 생성이면 실험별 호출과 종합 호출 프롬프트의 합입니다.
+        """
+        if not self._use_parallel_report(experiments, options):
+            return estimate_tokens(self._full_report_prompt(report_title, experiments, manual_info, options))
+
+        options = options or ReportOptions()
+        prompts = [
+            self._build_experiment_section_prompt(report_title, i, len(experiments), exp, manual_info, options)
+            for i, exp in enumerate(experiments, 1)
+        ]
+        prompts.append(self._build_report_synthesis_prompt(report_title, experiments, manual_info, options))
+        return sum(estimate_tokens(prompt) for prompt in prompts)
+
     def _build_full_report_prompt(
         self,
         report_title: str,
@@ -361,101 +1108,108 @@ class GeminiService:
         manual_info: Optional[ExperimentManualInfo],
         options: ReportOptions
     ) -> str:
-        """전체 리포트 생성 프롬프트"""
-
-        # 실험 데이터 요약 생성
-        experiments_summary = ""
-        for i, exp in enumerate(experiments, 1):
-            stats = exp.statistics
-            experiments_summary += f"""
-### 실험 {i}: {exp.experiment_name}
-- **시트명**: {exp.sheet_name}
-- **데이터 포인트**: {stats.data_points}개
-- **기울기**: {stats.slope:.6f}
-- **y절편**: {stats.intercept:.6f}
-- **R²**: {stats.r_squared:.6f}
-- **표준 오차**: {stats.std_error:.6f}
-- **X 범위**: {stats.x_range[0]:.4f} ~ {stats.x_range[1]:.4f}
-- **Y 범위**: {stats.y_range[0]:.4f} ~ {stats.y_range[1]:.4f}
-{f"- **오차율**: {stats.error_rate_percent:.2f}%" if stats.error_rate_percent else ""}
-"""
-
-        # 매뉴얼 정보 섹션
-        manual_section = ""
-        if manual_info:
-            error_guide_text = ""
-            if manual_info.error_guides:
-                for eg in manual_info.error_guides:
-                    error_guide_text += f"  - {eg.cause}: {eg.description}\n"
+        """전체 리포트 생성 프롬프트 (매뉴얼은 토큰 예산에 맞춰 축약)"""
+        experiments_table = statistics_table(list(enumerate(experiments, 1)))
+        language_instruction, tone_instruction = self._style_instructions(options)
+
+        def render(manual: str) -> str:
+            return join_blocks(
+                f"""당신은 이공계 실험 보고서 작성 전문가입니다.
+다음 실험 데이터와 매뉴얼 정보로 실험 보고서 "{report_title}"(실험 {len(experiments)}개)의 본문을 작성하세요.""",
+                manual,
+                f"## 실험 결과 데이터\n{experiments_table}",
+                f"""## 작성 지침
+{language_instruction} 작성하되, {tone_instruction}를 유지하세요. 다음 3개 섹션을 작성하세요.
 
-            manual_section = f"""
-## 📖 실험 매뉴얼 정보 (PDF에서 추출)
+### 섹션 1: 실험 결과 (<!-- SECTION: experiment_results -->)
+각 실험의 데이터와 그래프 분석, 측정값의 특징과 경향, 데이터 품질 평가
 
-### 실험 목적
-{manual_info.experiment_purpose}
+### 섹션 2: 결과 분석 (<!-- SECTION: result_analysis -->)
+각 실험의 R² 해석, 기울기와 절편의 물리적 의미, 실험 간 비교(여러 실험인 경우), 이론값과의 비교(매뉴얼 정보가 있을 경우)
 
-### 이론 및 원리
-{manual_info.theory}
+### 섹션 3: 토의 (<!-- SECTION: discussion -->)
+종합 고찰, 오차 원인 분석(매뉴얼의 오차 가이드 참고), 개선 방안, 결론 및 향후 연구 방향
 
-### 오차 원인 가이드
-{error_guide_text if error_guide_text else "N/A"}
+형식: 각 섹션 시작 전에 마커 주석 `<!-- SECTION: section_name -->`을 쓰고, 마크다운으로 섹션마다 300자 이상 상세하게 작성하세요. 수치는 적절한 유효숫자로, 필요시 수식을 사용하세요."""
+            )
 
-{f"### 예상 결과{chr(10)}{manual_info.expected_results}" if manual_info.expected_results else ""}
-"""
+        return build_within_budget(render, lambda max_tokens: manual_section(manual_info, max_tokens))
 
+    @staticmethod
+    def _style_instructions(options: ReportOptions) -> Tuple[str, str]:
+        """(언어 지시, 어조 지시)"""
         language_instruction = "한국어로" if options.language == "ko" else "in English"
         tone_instruction = "학술 논문 스타일의 객관적이고 전문적인 어조" if options.tone == "academic" else "이해하기 쉬운 일반적인 어조"
+        return language_instruction, tone_instruction
 
-        return f"""당신은 이공계 실험 보고서 작성 전문가입니다.
+    def _build_experiment_section_prompt(
+        self,
+        report_title: str,
+        index: int,
+        total: int,
+        exp: SingleExperimentResult,
+        manual_info: Optional[ExperimentManualInfo],
+        options: ReportOptions
+    ) -> str:
+        """병렬 리포트: 실험 하나의 결과/분석 섹션 생성 프롬프트"""
+        language_instruction, tone_instruction = self._style_instructions(options)
+
+        def render(manual: str) -> str:
+            return join_blocks(
+                f"""당신은 이공계 실험 보고서 작성 전문가입니다.
+리포트 "{report_title}"의 실험 {total}개 중 실험 {index}의 결과를 분석하세요.
+다른 실험과의 비교와 종합 토의는 별도로 작성하므로 이 실험만 다룹니다.""",
+                manual,
+                f"## 실험 결과 데이터\n{statistics_table([(index, exp)])}",
+                f"""## 작성 지침
+{language_instruction} 작성하되, {tone_instruction}를 유지하세요. 다음 2개 섹션을 작성하세요.
 
-다음 실험 데이터와 매뉴얼 정보를 바탕으로 **완전한 실험 보고서**를 작성해주세요.
+### 섹션 1: 실험 결과 (<!-- SECTION: experiment_results -->)
+데이터와 그래프의 특징과 경향, 데이터 품질 평가
 
----
+### 섹션 2: 결과 분석 (<!-- SECTION: result_analysis -->)
+R² 해석, 기울기와 절편의 물리적 의미, 이론값과의 비교(매뉴얼 정보 또는 오차율이 있을 경우)
 
-# 📋 리포트 정보
-- **제목**: {report_title}
-- **총 실험 수**: {len(experiments)}개
+형식: 각 섹션 시작 전에 마커 주석 `<!-- SECTION: section_name -->`을 쓰고, 제목 없이 본문만 마크다운으로 섹션마다 150~400자 작성하세요. 수치는 적절한 유효숫자로 표기하세요."""
+            )
 
-{manual_section}
+        return build_within_budget(render, lambda max_tokens: manual_section(manual_info, max_tokens))
 
-## 📊 실험 결과 데이터
-{experiments_summary}
+    def _build_report_synthesis_prompt(
+        self,
+        report_title: str,
+        experiments: List[SingleExperimentResult],
+        manual_info: Optional[ExperimentManualInfo],
+        options: ReportOptions
+    ) -> str:
+        """병렬 리포트: 실험 간 비교와 토의를 생성하는 종합 프롬프트"""
+        experiments_table = statistics_table(list(enumerate(experiments, 1)))
+        language_instruction, tone_instruction = self._style_instructions(options)
 
----
+        comparison_section = ""
+        if len(experiments) > 1:
+            comparison_section = """### 섹션 1: 실험 간 비교 (<!-- SECTION: result_analysis -->)
+실험 간 기울기, R², 오차율 비교와 실험 조건에 따른 경향
 
-## ✍️ 작성 지침
+"""
 
+        def render(manual: str) -> str:
+            return join_blocks(
+                f"""당신은 이공계 실험 보고서 작성 전문가입니다.
+다음 실험 결과를 종합하여 실험 보고서 "{report_title}"(실험 {len(experiments)}개)의 마무리 섹션을 작성하세요.
+각 실험의 개별 결과와 분석은 이미 작성되어 있으므로 반복하지 마세요.""",
+                manual,
+                f"## 실험 결과 요약\n{experiments_table}",
+                f"""## 작성 지침
 {language_instruction} 작성하되, {tone_instruction}를 유지하세요.
 
-다음 **3개 섹션**을 작성해주세요:
+{comparison_section}### 토의 (<!-- SECTION: discussion -->)
+종합 고찰, 오차 원인 분석(매뉴얼의 오차 가이드 참고), 개선 방안, 결론 및 향후 연구 방향
 
-### 섹션 1: 실험 결과 (<!-- SECTION: experiment_results -->)
-- 각 실험의 데이터와 그래프 분석
-- 측정된 값들의 특징과 경향
-- 데이터의 품질 평가
-
-### 섹션 2: 결과 분석 (<!-- SECTION: result_analysis -->)
-- 각 실험의 R² 값 해석
-- 기울기와 절편의 물리적 의미
-- 실험 간 비교 분석 (여러 실험인 경우)
-- 이론값과의 비교 (매뉴얼 정보 있을 경우)
-
-### 섹션 3: 토의 (<!-- SECTION: discussion -->)
-- 종합적인 고찰
-- 오차 원인 분석 (매뉴얼의 오차 가이드 참고)
-- 개선 방안 제시
-- 결론 및 향후 연구 방향
-
----
-
-## 📝 형식 요구사항
-- 각 섹션 시작 전에 마커 주석 포함: `<!-- SECTION: section_name -->`
-- 마크다운 형식 사용
-- 각 섹션은 최소 300자 이상 상세하게 작성
-- 수치는 적절한 유효숫자로 표기
-- 필요시 수식 사용
+형식: 각 섹션 시작 전에 마커 주석 `<!-- SECTION: section_name -->`을 쓰고, 제목 없이 본문만 마크다운으로 작성하세요. 토의는 300자 이상 상세하게, 수치는 적절한 유효숫자로 표기하세요."""
+            )
 
-**모든 섹션을 빠짐없이 상세하게 작성해주세요.**"""
+        return build_within_budget(render, lambda max_tokens: manual_section(manual_info, max_tokens))
 
     def _parse_report_sections(self, text: str) -> ReportSections:
         """리포트 텍스트에서 섹션 분리"""
@@ -0,0 +1,216 @@
+"""
+LabReportAI Graph Cache
+콘텐츠 주소 기반 그래프 이미지 캐시 (메모리 LRU + 선택적 디스크 계층)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from app.config import settings
+
+
+class GraphCache:
+    """
+    그래프 이미지 캐시
+
+    키는 데이터/통계/스타일/해상도의 해시(GraphGenerator.compute_cache_key)이며,
+    값은 인코딩된 이미지 바이트입니다. 다른 해상도로 다시 렌더링할 수 있도록
+    graph_id 키에는 그래프 원본 데이터(render_engine.encode_graph_source)를 저장합니다.
+
+    - 메모리 계층: 총 바이트 수 기준 LRU
+    - 디스크 계층 (disk_dir 지정 시): {disk_dir}/{key[:2]}/{key}.bin,
+      총 용량 초과 시 접근 시각(mtime)이 오래된 파일부터 삭제
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        disk_dir: Optional[str] = None,
+        max_disk_bytes: int = 0
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = disk_dir or None
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        캐시 조회 (메모리 → 디스크 순)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[bytes]: 이미지 바이트 (없으면 None)
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return data
+
+        data = self._read_disk(key)
+
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._put_memory(key, data)
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        캐시 저장 (메모리 + 디스크)
+
+        Args:
+            key: 캐시 키
+            data: 이미지 바이트
+        """
+        with self._lock:
+            self._put_memory(key, data)
+        self._write_disk(key, data)
+
+    def clear(self) -> None:
+        """메모리 계층 비우기 (디스크 계층은 유지)"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 적중/실패 통계 반환"""
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes
+            }
+
+    # ------------------------------------------------------------
+    # 메모리 계층
+    # ------------------------------------------------------------
+
+    def _put_memory(self, key: str, data: bytes) -> None:
+        """메모리 계층 저장 및 LRU 제거 (잠금 상태에서 호출)"""
+        if len(data) > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    # ------------------------------------------------------------
+    # 디스크 계층
+    # ------------------------------------------------------------
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.bin")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # LRU 판단을 위해 접근 시각 갱신
+            os.utime(path, None)
+            return data
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        if os.path.exists(path):
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 다른 프로세스가 읽는 중에 부분 파일이 보이지 않도록 원자적 교체
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        with self._lock:
+            self._disk_bytes += len(data)
+            over_limit = self.max_disk_bytes and self._disk_bytes > self.max_disk_bytes
+        if over_limit:
+            self._evict_disk()
+
+    def _scan_disk(self):
+        """디스크 캐시 파일 목록: (경로, 크기, mtime)"""
+        entries = []
+        for root, _, files in os.walk(self.disk_dir):
+            for name in files:
+                if not name.endswith(".bin"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict_disk(self) -> None:
+        """용량 한도의 80%까지 오래된 파일부터 삭제"""
+        entries = sorted(self._scan_disk(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_disk_bytes * 0.8)
+
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                with self._lock:
+                    self.evictions += 1
+            except OSError:
+                continue
+
+        with self._lock:
+            self._disk_bytes = total
+
+
+# 캐시 인스턴스 (싱글톤, 비활성화 시 None)
+graph_cache: Optional[GraphCache] = (
+    GraphCache(
+        max_memory_bytes=settings.graph_cache_memory_mb * 1024 * 1024,
+        disk_dir=settings.graph_cache_dir or None,
+        max_disk_bytes=settings.graph_cache_disk_mb * 1024 * 1024
+    )
+    if settings.graph_cache_enabled else None
+)
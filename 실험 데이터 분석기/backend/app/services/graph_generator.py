@@ -6,16 +6,84 @@ Matplotlib을 활용한 논문용 그래프 생성
 import matplotlib
 matplotlib.use('Agg')  # GUI 없이 사용하기 위한 백엔드 설정
 
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
+import matplotlib.style as mstyle
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 import pandas as pd
+from PIL import Image
 import base64
+import hashlib
 import io
-from typing import Optional, List, Tuple
+import struct
+import threading
+import zlib
+from typing import Callable, Optional, List, Tuple, TypeVar
 
 from app.config import settings
-from app.models.schemas import GraphResult, StatisticsResult, ExperimentConfig
+from app.models.schemas import GraphFormat, GraphResolution, GraphResult, StatisticsResult, ExperimentConfig
+from app.services.asset_store import CONTENT_TYPES
+from app.services.graph_cache import GraphCache, graph_cache
+
+
+def decimate_min_max(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    산점도 LOD 축소: X축을 구간으로 나눠 구간마다 Y 최솟값/최댓값 점만 선택
+
+    구간마다 위/아래 경계점과 X 양 끝 점을 남기므로 축 범위, 데이터 외곽선,
+    이상치가 그대로 보입니다. 정렬 없이 O(n)으로 계산합니다.
+
+    Args:
+        x: X 데이터 배열 (결측치 없음)
+        y: Y 데이터 배열 (결측치 없음)
+        max_points: 선택할 최대 점 수 (1 이상, 4 미만이면 X 양 끝 → Y 최솟값/최댓값 순으로 선택)
+
+    Returns:
+        np.ndarray: 선택한 점의 인덱스 (원래 순서, 최대 max_points개)
+
+    Raises:
+        ValueError: max_points가 1 미만인 경우
+    """
+    if max_points < 1:
+        raise ValueError("max_points must be at least 1")
+    if max_points < 4:
+        # 구간 하나도 (최솟값, 최댓값) + X 양 끝을 담을 수 없으므로 우선순위대로 자름
+        extremes = [np.argmin(x), np.argmax(x), np.argmin(y), np.argmax(y)]
+        return np.sort(list(dict.fromkeys(int(index) for index in extremes))[:max_points])
+
+    n = len(x)
+    bin_count = max(1, (max_points - 2) // 2)
+    x_min, x_max = x.min(), x.max()
+    span = x_max - x_min
+    if span > 0:
+        bins = np.minimum(((x - x_min) * (bin_count / span)).astype(np.intp), bin_count - 1)
+    else:
+        bins = np.zeros(n, dtype=np.intp)
+
+    y_low = np.full(bin_count, np.inf)
+    y_high = np.full(bin_count, -np.inf)
+    np.minimum.at(y_low, bins, y)
+    np.maximum.at(y_high, bins, y)
+
+    # 같은 값이 여러 개면 구간마다 첫 번째 점만 선택
+    selected = [np.argmin(x), np.argmax(x)]
+    for extreme in (y_low, y_high):
+        candidates = np.flatnonzero(y == extreme[bins])
+        first = np.full(bin_count, n)
+        np.minimum.at(first, bins[candidates], candidates)
+        selected.append(first[first < n])
+    return np.unique(np.concatenate([np.atleast_1d(index) for index in selected]))
+
+
+# 이미지 형식별 파일 확장자
+FORMAT_EXTENSIONS = {
+    GraphFormat.PNG: "png",
+    GraphFormat.PNG_OPTIMIZED: "png",
+    GraphFormat.SVG: "svg",
+    GraphFormat.WEBP: "webp",
+}
+
+T = TypeVar("T")
 
 
 class GraphGenerator:
@@ -23,7 +91,10 @@ class GraphGenerator:
     고품질 그래프 생성기
     
     산점도 + 추세선 그래프를 생성하고
-    Base64 인코딩된 PNG 이미지를 반환합니다.
+    Base64 인코딩된 이미지(PNG, 최적화 PNG, SVG, WebP)를 반환합니다.
+
+    pyplot 전역 상태 대신 Figure/FigureCanvasAgg 객체 API를 사용하므로
+    렌더링 워커 프로세스에서 병렬로 호출해도 안전합니다.
     """
     
     # 그래프 스타일 설정
@@ -31,11 +102,23 @@ class GraphGenerator:
     LINE_COLOR = '#EF4444'        # 추세선 색상 (빨간색)
     SCATTER_SIZE = 60             # 산점도 점 크기
     LINE_WIDTH = 2                # 추세선 두께
+
+    # 렌더링 결과가 바뀌는 코드 변경 시 올려서 기존 캐시를 무효화
+    CACHE_VERSION = "scatter-v6"
+
+    # 그래프 위쪽 제목 띠 높이 (인치): 본문은 이 띠를 비워 두고 그리며 제목은 띠에만 그림
+    TITLE_BAND_INCHES = 0.5
     
-    def __init__(self):
+    def __init__(self, cache: Optional[GraphCache] = None):
         """그래프 스타일 초기화"""
+        self.cache = cache
+
+        # 워커(프로세스)당 하나의 그래프 템플릿 (첫 렌더링 시 생성)
+        self._template: Optional["_ScatterTemplate"] = None
+        self._template_lock = threading.Lock()
+
         # 스타일 설정
-        plt.style.use('seaborn-v0_8-whitegrid')
+        mstyle.use('seaborn-v0_8-whitegrid')
         
         # 한글 폰트 설정 시도
         self._setup_korean_font()
@@ -44,8 +127,8 @@ class GraphGenerator:
         """한글 폰트 설정"""
         try:
             # Windows 기본 한글 폰트
-            plt.rcParams['font.family'] = 'Malgun Gothic'
-            plt.rcParams['axes.unicode_minus'] = False
+            matplotlib.rcParams['font.family'] = 'Malgun Gothic'
+            matplotlib.rcParams['axes.unicode_minus'] = False
         except:
             # 실패 시 기본 폰트 사용
             pass
@@ -56,7 +139,9 @@ class GraphGenerator:
         x_column: str,
         y_column: str,
         statistics: StatisticsResult,
-        title: str = ""
+        title: str = "",
+        resolution: GraphResolution = GraphResolution.PRINT,
+        image_format: GraphFormat = GraphFormat.PNG
     ) -> GraphResult:
         """
         산점도 + 추세선 그래프 생성
@@ -67,96 +152,428 @@ class GraphGenerator:
             y_column: Y축 열 이름
             statistics: 통계 분석 결과
             title: 그래프 제목
+            resolution: 해상도 프로필
+            image_format: 이미지 형식
             
         Returns:
             GraphResult: Base64 인코딩된 그래프 이미지
         """
-        # Figure 생성
-        fig, ax = plt.subplots(figsize=settings.graph_figsize, dpi=settings.graph_dpi)
-        
-        x = df[x_column].values
-        y = df[y_column].values
-        
-        # 1. 산점도 그리기
-        ax.scatter(
-            x, y,
-            c=self.SCATTER_COLOR,
-            s=self.SCATTER_SIZE,
-            alpha=0.7,
-            edgecolors='white',
-            linewidths=0.5,
-            label='측정 데이터',
-            zorder=2
+        return self.render_scatter(
+            x=df[x_column].to_numpy(dtype=float),
+            y=df[y_column].to_numpy(dtype=float),
+            x_label=x_column,
+            y_label=y_column,
+            statistics=statistics,
+            title=title,
+            resolution=resolution,
+            image_format=image_format
         )
-        
-        # 2. 추세선 그리기
-        x_line = np.linspace(x.min(), x.max(), 100)
-        y_line = statistics.slope * x_line + statistics.intercept
-        
-        ax.plot(
-            x_line, y_line,
-            color=self.LINE_COLOR,
-            linewidth=self.LINE_WIDTH,
-            linestyle='--',
-            label=f'추세선: y = {statistics.slope:.4f}x + {statistics.intercept:.4f}',
-            zorder=1
-        )
-        
-        # 3. 그래프 꾸미기
-        ax.set_xlabel(x_column, fontsize=12, fontweight='bold')
-        ax.set_ylabel(y_column, fontsize=12, fontweight='bold')
-        
+
+    def render_scatter(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult,
+        title: str = "",
+        resolution: GraphResolution = GraphResolution.PRINT,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> GraphResult:
+        """
+        NumPy 배열로부터 산점도 + 추세선 그래프 생성 (캐시 사용)
+
+        DataFrame 대신 배열만 받으므로 워커 프로세스로 전달하는 비용이 작습니다.
+
+        Args:
+            x: X 데이터 배열
+            y: Y 데이터 배열
+            x_label: X축 라벨
+            y_label: Y축 라벨
+            statistics: 통계 분석 결과
+            title: 그래프 제목
+            resolution: 해상도 프로필
+            image_format: 이미지 형식
+
+        Returns:
+            GraphResult: Base64 인코딩된 그래프 이미지
+        """
+        x, y = self.level_of_detail(x, y)
+        body_id = self.compute_body_id(x, y, x_label, y_label, statistics)
+        graph_id = self.graph_id_for(body_id, title)
+        dpi = self.dpi_for(resolution)
+        if self.cache is None:
+            image_bytes = self.render_image(x, y, x_label, y_label, statistics, title, dpi, image_format)
+            return self.to_graph_result(image_bytes, resolution, graph_id, image_format, len(x))
+
+        cache_key = self.cache_key_for(graph_id, resolution, image_format)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self.to_graph_result(cached, resolution, graph_id, image_format, len(x))
+
+        if image_format == GraphFormat.SVG:
+            image_bytes = self.render_image(x, y, x_label, y_label, statistics, title, dpi, image_format)
+        else:
+            # 제목만 바뀐 그래프는 캐시된 본문에 제목 띠만 다시 그림
+            body_key = self.body_cache_key(body_id, resolution)
+            body = self.cache.get(body_key)
+            if body is not None:
+                image_bytes = self.relabel(body, title, dpi, image_format)
+            else:
+                body, image_bytes = self.render_layers(
+                    x, y, x_label, y_label, statistics, title, dpi, image_format
+                )
+                self.cache.put(body_key, body)
+
+        self.cache.put(cache_key, image_bytes)
+        return self.to_graph_result(image_bytes, resolution, graph_id, image_format, len(x))
+
+    @staticmethod
+    def needs_level_of_detail(point_count: int) -> bool:
+        """점 수가 그래프 한도(MAX_DATA_POINTS_PER_SHEET)를 넘는지 여부"""
+        max_points = settings.max_data_points_per_sheet
+        return 0 < max_points < point_count
+
+    def level_of_detail(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        그래프에 그릴 점 선택
+
+        점 수가 MAX_DATA_POINTS_PER_SHEET를 넘으면 decimate_min_max로 줄입니다.
+        회귀 분석은 전체 데이터로 이미 끝났으므로 통계 값은 바뀌지 않으며,
+        그래프에는 축소했다는 표시가 들어갑니다 (그린 점 수 < statistics.data_points).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 그릴 X, Y 배열
+        """
+        if not self.needs_level_of_detail(len(x)):
+            return x, y
+        index = decimate_min_max(x, y, settings.max_data_points_per_sheet)
+        return x[index], y[index]
+
+    @staticmethod
+    def dpi_for(resolution: GraphResolution) -> int:
+        """해상도 프로필의 DPI (Figure 크기는 같고 픽셀 수만 달라짐)"""
+        return {
+            GraphResolution.PREVIEW: settings.graph_preview_dpi,
+            GraphResolution.SCREEN: settings.graph_screen_dpi,
+            GraphResolution.PRINT: settings.graph_dpi
+        }[resolution]
+
+    @staticmethod
+    def extension_for(image_format: GraphFormat) -> str:
+        """이미지 형식의 파일 확장자 (에셋 저장용)"""
+        return FORMAT_EXTENSIONS[image_format]
+
+    def compute_cache_key(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult,
+        title: str = "",
+        resolution: GraphResolution = GraphResolution.PRINT,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> str:
+        """
+        그래프 캐시 키 계산
+
+        전처리된 x/y 배열, 통계 결과, 축 라벨, 제목, figsize, 해상도(dpi), 이미지 형식에
+        대한 SHA-256 해시입니다. 같은 입력이면 프로세스와 무관하게 같은 키가 나옵니다.
+
+        Returns:
+            str: 16진수 해시 문자열
+        """
+        graph_id = self.compute_graph_id(x, y, x_label, y_label, statistics, title)
+        return self.cache_key_for(graph_id, resolution, image_format)
+
+    def compute_graph_id(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult,
+        title: str = ""
+    ) -> str:
+        """해상도와 무관한 그래프 원본 ID (그래프 입력과 figsize의 SHA-256 해시)"""
+        return self.graph_id_for(self.compute_body_id(x, y, x_label, y_label, statistics), title)
+
+    def compute_body_id(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult
+    ) -> str:
+        """제목을 제외한 그래프 본문 ID (제목만 다른 그래프는 같은 본문 ID)"""
+        digest = hashlib.sha256()
+        digest.update(self.CACHE_VERSION.encode("utf-8"))
+        digest.update(repr(tuple(settings.graph_figsize)).encode("utf-8"))
+        digest.update(f"{len(x)}:{len(y)}".encode("utf-8"))
+        digest.update(np.ascontiguousarray(x, dtype="<f8").tobytes())
+        digest.update(np.ascontiguousarray(y, dtype="<f8").tobytes())
+        digest.update(statistics.model_dump_json().encode("utf-8"))
+        digest.update(x_label.encode("utf-8") + b"\0" + y_label.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def graph_id_for(body_id: str, title: str) -> str:
+        """본문 ID와 제목으로 그래프 원본 ID 계산 (데이터를 다시 해시하지 않음)"""
+        digest = hashlib.sha256()
+        digest.update(body_id.encode("utf-8"))
+        digest.update(b"title\0")
+        digest.update(title.encode("utf-8"))
+        return digest.hexdigest()
+
+    def cache_key_for(
+        self,
+        graph_id: str,
+        resolution: GraphResolution,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> str:
+        """그래프 원본 ID, 해상도 프로필, 이미지 형식의 캐시 키 (SVG는 해상도와 무관)"""
+        dpi = 0 if image_format == GraphFormat.SVG else self.dpi_for(resolution)
+        return hashlib.sha256(f"{graph_id}:{dpi}:{image_format.value}".encode("utf-8")).hexdigest()
+
+    def body_cache_key(self, body_id: str, resolution: GraphResolution) -> str:
+        """제목 없는 래스터 본문의 캐시 키 (형식과 무관, 해상도별)"""
+        return hashlib.sha256(f"{body_id}:{self.dpi_for(resolution)}:body".encode("utf-8")).hexdigest()
+
+    def render_png(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult,
+        title: str = "",
+        dpi: Optional[int] = None
+    ) -> bytes:
+        """
+        그래프를 PNG 바이트로 렌더링 (캐시 미사용)
+
+        Args:
+            dpi: 출력 DPI (기본: GRAPH_DPI)
+
+        Returns:
+            bytes: PNG 이미지 바이트
+        """
+        return self.render_image(x, y, x_label, y_label, statistics, title, dpi, GraphFormat.PNG)
+
+    def render_image(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult,
+        title: str = "",
+        dpi: Optional[int] = None,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> bytes:
+        """
+        그래프를 이미지 바이트로 렌더링 (캐시 미사용)
+
+        워커마다 한 번 만든 그래프 템플릿에 데이터, 라벨, 추세선, R² 값만 바꿔
+        그리므로 Figure/Axes 생성과 스타일 적용 비용이 들지 않습니다. 다른 스레드가
+        템플릿을 사용 중이면 임시 템플릿을 새로 만듭니다.
+
+        래스터 형식은 제목 띠를 비운 본문을 그린 뒤 제목 띠만 덧그립니다 (relabel과 같은 결과).
+
+        Args:
+            dpi: 출력 DPI (기본: GRAPH_DPI, SVG에는 영향 없음)
+            image_format: 이미지 형식
+
+        Returns:
+            bytes: 이미지 바이트
+        """
+        if image_format == GraphFormat.SVG:
+            return self._use_template(
+                lambda template: template.render(x, y, x_label, y_label, statistics, title, dpi, image_format)
+            )
+
+        body = self._use_template(lambda template: template.draw_body(x, y, x_label, y_label, statistics, dpi))
+        return self._relabel_image(body, title, dpi, image_format)
+
+    def render_layers(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult,
+        title: str = "",
+        dpi: Optional[int] = None,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> Tuple[bytes, bytes]:
+        """
+        래스터 그래프를 렌더링하고 제목 없는 본문도 함께 반환 (캐시 미사용)
+
+        본문 바이트를 캐시해 두면 제목만 바뀐 그래프는 relabel로 만들 수 있습니다.
+
+        Returns:
+            Tuple[bytes, bytes]: (본문 바이트, 이미지 바이트)
+        """
+        body = self._use_template(lambda template: template.draw_body(x, y, x_label, y_label, statistics, dpi))
+        # 본문은 캐시 내부용이므로 PNG 대신 가장 빠른 zlib 수준의 원시 RGB로 저장 (복원이 PNG 디코딩보다 빠름)
+        header = struct.pack("<II", *body.size)
+        return header + zlib.compress(body.tobytes(), 1), self._relabel_image(body, title, dpi, image_format)
+
+    def relabel(
+        self,
+        body: bytes,
+        title: str = "",
+        dpi: Optional[int] = None,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> bytes:
+        """
+        render_layers가 만든 본문에 제목 띠만 그려 이미지 바이트로 인코딩
+
+        산점도, 추세선, 축, 레이아웃은 다시 그리지 않습니다.
+
+        Args:
+            body: render_layers가 반환한 본문 바이트 (같은 dpi로 렌더링한 것)
+            title: 그래프 제목
+            dpi: 출력 DPI (기본: GRAPH_DPI)
+            image_format: 래스터 이미지 형식
+
+        Returns:
+            bytes: 이미지 바이트
+        """
+        width, height = struct.unpack_from("<II", body)
+        image = Image.frombytes('RGB', (width, height), zlib.decompress(body[8:]))
+        return self._relabel_image(image, title, dpi, image_format)
+
+    def _relabel_image(
+        self,
+        body: Image.Image,
+        title: str,
+        dpi: Optional[int],
+        image_format: GraphFormat
+    ) -> bytes:
+        """본문 픽셀 위쪽 제목 띠에 제목을 붙여 인코딩"""
+        image = body
         if title:
-            ax.set_title(title, fontsize=14, fontweight='bold', pad=15)
-        
-        # 4. R² 값 표시 (텍스트 박스)
-        textstr = f'$R^2$ = {statistics.r_squared:.4f}'
-        props = dict(boxstyle='round', facecolor='white', alpha=0.8, edgecolor='gray')
-        ax.text(
-            0.05, 0.95, textstr,
-            transform=ax.transAxes,
-            fontsize=11,
-            verticalalignment='top',
-            bbox=props
-        )
-        
-        # 5. 범례
-        ax.legend(loc='lower right', fontsize=10)
-        
-        # 6. 그리드 스타일
-        ax.grid(True, linestyle='--', alpha=0.7)
-        
-        # 레이아웃 조정
-        plt.tight_layout()
-        
-        # 7. Base64 인코딩
-        image_base64 = self._fig_to_base64(fig)
-        
-        # Figure 닫기 (메모리 해제)
-        plt.close(fig)
-        
-        return GraphResult(
-            image_base64=image_base64,
-            image_url=None  # Storage 업로드는 나중에 구현
-        )
-    
-    def _fig_to_base64(self, fig: plt.Figure) -> str:
+            band = self._use_template(lambda template: template.draw_title(title, dpi))
+            image = body.copy()
+            image.paste(band, (0, 0))
+        return self._encode_image(image, image_format)
+
+    def _use_template(self, func: Callable[["_ScatterTemplate"], T]) -> T:
+        """워커의 그래프 템플릿으로 func 실행 (사용 중이면 임시 템플릿 사용)"""
+        if self._template_lock.acquire(blocking=False):
+            try:
+                if self._template is None:
+                    self._template = _ScatterTemplate(self)
+                return func(self._template)
+            finally:
+                self._template_lock.release()
+
+        return func(_ScatterTemplate(self))
+
+    def _encode_figure(
+        self,
+        fig: Figure,
+        dpi: Optional[int] = None,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> bytes:
         """
-        Matplotlib Figure를 Base64 문자열로 변환
+        Matplotlib Figure를 이미지 바이트로 변환
+
+        tight_layout으로 여백을 이미 맞췄으므로 bbox_inches='tight'(전체를 한 번 더
+        그려 경계를 계산)를 사용하지 않습니다.
+
+        - PNG: matplotlib 기본 RGBA PNG
+        - PNG_OPTIMIZED: 256색 팔레트로 양자화 후 GRAPH_PNG_COMPRESS_LEVEL로 압축
+        - SVG: 벡터 (점 수가 적은 산점도에서 가장 작음, 같은 입력이면 같은 바이트)
+        - WEBP: GRAPH_WEBP_LOSSLESS / GRAPH_WEBP_METHOD 설정으로 인코딩
 
         Args:
             fig: Matplotlib Figure 객체
+            dpi: 출력 DPI (기본: Figure의 DPI)
+            image_format: 이미지 형식
 
         Returns:
-            str: data:image/png;base64,... 형식의 문자열
+            bytes: 이미지 바이트
         """
         buffer = io.BytesIO()
-        fig.savefig(buffer, format='png', bbox_inches='tight', facecolor='white')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        buffer.close()
+        if image_format == GraphFormat.PNG:
+            fig.savefig(buffer, format='png', dpi=dpi or 'figure', facecolor='white')
+            return buffer.getvalue()
+
+        if image_format == GraphFormat.SVG:
+            # 같은 그래프는 같은 바이트가 되도록 (콘텐츠 주소 에셋/캐시) 날짜와 무작위 요소 ID를 쓰지 않음
+            with matplotlib.rc_context({'svg.hashsalt': self.CACHE_VERSION}):
+                fig.savefig(buffer, format='svg', facecolor='white', metadata={'Date': None})
+            return buffer.getvalue()
+
+        # 래스터 형식은 Agg 픽셀을 한 번 그린 뒤 Pillow로 인코딩
+        return self._encode_image(self._figure_pixels(fig, dpi), image_format)
+
+    @staticmethod
+    def _figure_pixels(fig: Figure, dpi: Optional[int] = None) -> Image.Image:
+        """Figure를 Agg로 그린 RGB 픽셀"""
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='rgba', dpi=dpi or fig.dpi, facecolor='white')
+        # 버퍼를 채운 Agg 렌더러(FigureCanvasAgg의 마지막 렌더러)의 픽셀 크기 사용
+        # (figsize × dpi로 다시 계산하면 버퍼 크기와 어긋날 수 있음)
+        renderer = fig.canvas.renderer
+        width, height = int(renderer.width), int(renderer.height)
+        return Image.frombuffer('RGBA', (width, height), buffer.getbuffer(), 'raw', 'RGBA', 0, 1).convert('RGB')
 
-        return f"data:image/png;base64,{image_base64}"
+    @staticmethod
+    def _encode_image(image: Image.Image, image_format: GraphFormat) -> bytes:
+        """RGB 픽셀을 래스터 형식으로 인코딩"""
+        output = io.BytesIO()
+        if image_format == GraphFormat.PNG:
+            image.save(output, format='PNG')
+        elif image_format == GraphFormat.PNG_OPTIMIZED:
+            image.quantize(256, method=Image.Quantize.FASTOCTREE).save(
+                output, format='PNG', compress_level=settings.graph_png_compress_level
+            )
+        else:
+            image.save(
+                output,
+                format='WEBP',
+                lossless=settings.graph_webp_lossless,
+                method=settings.graph_webp_method
+            )
+        return output.getvalue()
+
+    def to_graph_result(
+        self,
+        image_bytes: bytes,
+        resolution: Optional[GraphResolution] = None,
+        graph_id: Optional[str] = None,
+        image_format: GraphFormat = GraphFormat.PNG,
+        plotted_points: Optional[int] = None
+    ) -> GraphResult:
+        """
+        이미지 바이트를 GraphResult로 변환
+
+        Args:
+            image_bytes: 이미지 바이트
+            resolution: 해상도 프로필
+            graph_id: 그래프 원본 ID
+            image_format: 이미지 형식
+            plotted_points: 그래프에 그린 점 수
+
+        Returns:
+            GraphResult: data:{Content-Type};base64,... 형식의 이미지를 담은 결과
+        """
+        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
+        content_type = CONTENT_TYPES[self.extension_for(image_format)]
+
+        return GraphResult(
+            image_base64=f"data:{content_type};base64,{image_base64}",
+            image_url=None,  # URL 모드는 render_engine이 자산 저장소에 올린 뒤 채움
+            resolution=resolution,
+            graph_id=graph_id,
+            format=image_format,
+            plotted_points=plotted_points
+        )
 
     def generate_batch_graphs(
         self,
@@ -187,7 +604,7 @@ class GraphGenerator:
 
     def get_base64_without_prefix(self, graph_result: GraphResult) -> str:
         """
-        GraphResult에서 'data:image/png;base64,' 접두사를 제거한 Base64 문자열 반환
+        GraphResult에서 'data:image/...;base64,' 접두사를 제거한 Base64 문자열 반환
 
         Args:
             graph_result: 그래프 결과
@@ -195,11 +612,155 @@ class GraphGenerator:
         Returns:
             str: 순수 Base64 문자열
         """
-        prefix = "data:image/png;base64,"
-        if graph_result.image_base64.startswith(prefix):
-            return graph_result.image_base64[len(prefix):]
+        if graph_result.image_base64 is None:
+            return ""
+        if graph_result.image_base64.startswith("data:"):
+            return graph_result.image_base64.split(",", 1)[1]
         return graph_result.image_base64
 
 
+class _ScatterTemplate:
+    """
+    산점도 + 추세선 그래프 템플릿
+
+    Figure, Axes, 그리드, 폰트, 범례, R² 텍스트 박스를 한 번만 구성하고
+    렌더링마다 산점도 좌표, 추세선 데이터, 라벨, 텍스트만 교체합니다.
+
+    제목은 Figure 위쪽의 고정 높이 띠에 그리므로 제목이 바뀌어도 본문 레이아웃은
+    그대로입니다. 래스터 제목은 같은 너비의 작은 띠 Figure로 따로 그립니다.
+    """
+
+    def __init__(self, generator: GraphGenerator):
+        width, height = settings.graph_figsize
+        band = generator.TITLE_BAND_INCHES
+        fig = Figure(figsize=(width, height), dpi=settings.graph_dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(1, 1, 1)
+
+        # 1. 산점도 (좌표는 렌더링마다 교체)
+        self.scatter = ax.scatter(
+            [], [],
+            c=generator.SCATTER_COLOR,
+            s=generator.SCATTER_SIZE,
+            alpha=0.7,
+            edgecolors='white',
+            linewidths=0.5,
+            label='측정 데이터',
+            zorder=2
+        )
+
+        # 2. 추세선
+        (self.line,) = ax.plot(
+            [], [],
+            color=generator.LINE_COLOR,
+            linewidth=generator.LINE_WIDTH,
+            linestyle='--',
+            label='추세선',
+            zorder=1
+        )
+
+        # 3. R² 값 표시 (텍스트 박스)
+        props = dict(boxstyle='round', facecolor='white', alpha=0.8, edgecolor='gray')
+        self.r_squared_text = ax.text(
+            0.05, 0.95, '',
+            transform=ax.transAxes,
+            fontsize=11,
+            verticalalignment='top',
+            bbox=props
+        )
+
+        # 4. 범례 (두 번째 항목이 추세선 식)
+        self.legend = ax.legend(loc='lower right', fontsize=10)
+
+        # 5. 그리드 스타일
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+        # 6. 제목 (위쪽 띠 가운데)
+        title_props = dict(ha='center', va='center', fontsize=14, fontweight='bold')
+        self.title_text = fig.text(0.5, 1 - band / height / 2, '', **title_props)
+
+        # 래스터 제목 띠 (본문과 같은 너비)
+        band_fig = Figure(figsize=(width, band), dpi=settings.graph_dpi)
+        FigureCanvasAgg(band_fig)
+        self.band_text = band_fig.text(0.5, 0.5, '', **title_props)
+
+        self.generator = generator
+        self.fig = fig
+        self.ax = ax
+        self.band_fig = band_fig
+        self.layout_rect = (0, 0, 1, 1 - band / height)
+
+    def render(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult,
+        title: str,
+        dpi: Optional[int] = None,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> bytes:
+        """데이터, 라벨, 통계 값을 교체하고 이미지로 저장"""
+        self.update(x, y, x_label, y_label, statistics, title)
+        return self.generator._encode_figure(self.fig, dpi, image_format)
+
+    def draw_body(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult,
+        dpi: Optional[int] = None
+    ) -> Image.Image:
+        """제목 띠를 비운 본문을 RGB 픽셀로 그림"""
+        self.update(x, y, x_label, y_label, statistics, '')
+        return self.generator._figure_pixels(self.fig, dpi)
+
+    def draw_title(self, title: str, dpi: Optional[int] = None) -> Image.Image:
+        """제목 띠만 RGB 픽셀로 그림 (본문 위쪽에 붙임)"""
+        self.band_text.set_text(title)
+        return self.generator._figure_pixels(self.band_fig, dpi)
+
+    def update(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        statistics: StatisticsResult,
+        title: str
+    ) -> None:
+        """데이터, 라벨, 통계 값 교체 후 레이아웃 계산"""
+        ax = self.ax
+
+        self.scatter.set_offsets(np.column_stack((x, y)))
+
+        x_line = np.linspace(x.min(), x.max(), 100)
+        self.line.set_data(x_line, statistics.slope * x_line + statistics.intercept)
+        equation = f'추세선: y = {statistics.slope:.4f}x + {statistics.intercept:.4f}'
+        self.line.set_label(equation)
+        self.legend.get_texts()[1].set_text(equation)
+
+        r_squared_text = f'$R^2$ = {statistics.r_squared:.4f}'
+        if len(x) < statistics.data_points:
+            # LOD 축소: 통계는 전체 데이터 기준
+            r_squared_text += f'\n{len(x):,} / {statistics.data_points:,}점 표시 (LOD)'
+        self.r_squared_text.set_text(r_squared_text)
+
+        ax.set_xlabel(x_label, fontsize=12, fontweight='bold')
+        ax.set_ylabel(y_label, fontsize=12, fontweight='bold')
+        self.title_text.set_text(title)
+
+        # 축 범위: 추세선(relim) + 산점도 좌표 (relim은 컬렉션을 포함하지 않음)
+        ax.relim()
+        ax.update_datalim(self.scatter.get_offsets())
+        ax.autoscale_view()
+
+        # 라벨/눈금 길이가 바뀌므로 레이아웃은 매번 한 번 계산 (제목 띠는 비워 둠)
+        self.fig.tight_layout(rect=self.layout_rect)
+
+
 # 서비스 인스턴스 (싱글톤)
-graph_generator = GraphGenerator()
+graph_generator = GraphGenerator(cache=graph_cache)
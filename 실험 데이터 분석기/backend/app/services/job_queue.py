@@ -0,0 +1,435 @@
+"""
+LabReportAI Job Queue
+큰 배치 분석과 리포트 생성을 HTTP 요청 밖에서 실행하는 백그라운드 작업 큐
+
+외부 브로커 없이 SQLite 작업 테이블에 상태/진행률/결과를 기록하므로,
+작업을 실행하지 않는 다른 워커 프로세스도 같은 DB로 상태를 조회하고
+취소를 요청할 수 있습니다.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.models.schemas import ErrorCode, JobError, JobInfo, JobStatus
+
+
+FINISHED_STATUSES = {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+class JobFailedError(Exception):
+    """작업 실패 예외 (작업 결과의 error로 기록할 코드와 메시지)"""
+    def __init__(self, code: str, message: str):
+        self.code = code
+        self.message = message
+        super().__init__(message)
+
+
+class JobContext:
+    """
+    실행 중인 작업의 진행률 기록용 컨텍스트
+
+    stage()는 단계가 바뀔 때마다 진행률을 기록하고, 다른 워커에서 취소를
+    요청했는지 확인합니다 (같은 워커의 취소는 태스크를 바로 취소).
+    """
+
+    def __init__(self, queue: "JobQueue", job_id: str, stages: List[str]):
+        self.queue = queue
+        self.job_id = job_id
+        self.stages = stages
+
+    async def stage(self, name: str) -> None:
+        """
+        단계 시작 기록
+
+        Args:
+            name: 단계 이름 (stages에 없으면 진행률은 그대로)
+
+        Raises:
+            asyncio.CancelledError: 취소가 요청된 경우
+        """
+        if await asyncio.to_thread(self.queue._cancel_requested, self.job_id):
+            raise asyncio.CancelledError()
+
+        fields: Dict[str, Any] = {"stage": name}
+        if name in self.stages:
+            fields["progress"] = self.stages.index(name) / len(self.stages)
+        await asyncio.to_thread(self.queue._update, self.job_id, **fields)
+        self.queue._notify(self.job_id)
+
+
+JobRunner = Callable[[JobContext], Awaitable[BaseModel]]
+
+
+class JobQueue:
+    """
+    SQLite 기반 작업 큐
+
+    - 작업은 제출한 워커 프로세스의 이벤트 루프에서 실행되며, 동시에 실행하는
+      작업 수는 max_workers로 제한합니다 (나머지는 queued 상태로 대기).
+      CPU 작업은 각 단계가 cpu_executor / render_engine으로 넘깁니다.
+    - 완료된 작업의 결과는 ttl_seconds 동안 보관한 뒤 삭제합니다.
+    - 작업을 실행하던 프로세스가 종료되어 남은 작업은 다음 기동 시 실패로 표시합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_workers: int,
+        ttl_seconds: int,
+        poll_interval: float = 0.5
+    ):
+        self.db_path = db_path
+        self.max_workers = max_workers
+        self.ttl_seconds = ttl_seconds
+        self.poll_interval = poll_interval
+
+        self._hostname = socket.gethostname()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._watchers: Dict[str, Set[asyncio.Event]] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self._finished: Dict[str, int] = {status.value: 0 for status in FINISHED_STATUSES}
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, "
+                "kind TEXT NOT NULL, "
+                "status TEXT NOT NULL, "
+                "stages TEXT NOT NULL, "
+                "stage TEXT, "
+                "progress REAL NOT NULL DEFAULT 0, "
+                "cancel_requested INTEGER NOT NULL DEFAULT 0, "
+                "owner TEXT NOT NULL, "
+                "result TEXT, "
+                "error TEXT, "
+                "created_at REAL NOT NULL, "
+                "updated_at REAL NOT NULL, "
+                "expires_at REAL)"
+            )
+        self.fail_orphaned_jobs()
+
+    @property
+    def _owner(self) -> str:
+        """작업 소유자 (호스트:PID) - 사전 로딩 후 fork한 워커마다 달라지도록 매번 계산"""
+        return f"{self._hostname}:{os.getpid()}"
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5.0)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프용 세마포어 반환 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    # ------------------------------------------------------------
+    # 작업 제출 / 조회 / 취소
+    # ------------------------------------------------------------
+
+    async def submit(self, kind: str, stages: List[str], run: JobRunner) -> JobInfo:
+        """
+        작업 제출 (즉시 반환, 실행은 백그라운드)
+
+        Args:
+            kind: 작업 종류 (batch, full_report)
+            stages: 작업 단계 목록 (진행률 계산용)
+            run: JobContext를 받아 결과 모델을 반환하는 코루틴 함수
+
+        Returns:
+            JobInfo: queued 상태의 작업 정보
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+
+        def insert() -> None:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at < ?", (now,))
+                conn.execute(
+                    "INSERT INTO jobs (job_id, kind, status, stages, owner, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, kind, JobStatus.QUEUED.value, json.dumps(stages), self._owner, now, now)
+                )
+
+        await asyncio.to_thread(insert)
+        with self._lock:
+            self.submitted += 1
+
+        task = asyncio.ensure_future(self._execute(job_id, stages, run))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda done: self._tasks.pop(job_id, None))
+
+        return await asyncio.to_thread(self.get, job_id)
+
+    def get(self, job_id: str) -> Optional[JobInfo]:
+        """
+        작업 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Optional[JobInfo]: 작업 정보 (없거나 결과 보관 기간이 지나면 None)
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+
+        if row is None or (row["expires_at"] is not None and row["expires_at"] < time.time()):
+            return None
+
+        return JobInfo(
+            job_id=row["job_id"],
+            kind=row["kind"],
+            status=JobStatus(row["status"]),
+            stages=json.loads(row["stages"]),
+            stage=row["stage"],
+            progress=row["progress"],
+            error=JobError(**json.loads(row["error"])) if row["error"] else None,
+            result=json.loads(row["result"]) if row["result"] else None,
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            expires_at=row["expires_at"]
+        )
+
+    async def cancel(self, job_id: str) -> Optional[JobInfo]:
+        """
+        작업 취소 요청
+
+        이 워커에서 실행 중인 작업은 바로 취소하고, 다른 워커의 작업은
+        그 워커가 다음 단계로 넘어갈 때 취소됩니다. 이미 끝난 작업은 그대로 둡니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Optional[JobInfo]: 취소 요청 후 작업 정보 (없으면 None)
+        """
+        info = await asyncio.to_thread(self.get, job_id)
+        if info is None or info.status in FINISHED_STATUSES:
+            return info
+
+        await asyncio.to_thread(self._update, job_id, cancel_requested=1)
+
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+            await asyncio.wait({task})
+
+        return await asyncio.to_thread(self.get, job_id)
+
+    async def watch(self, job_id: str) -> AsyncIterator[JobInfo]:
+        """
+        작업 상태가 바뀔 때마다 작업 정보를 전달 (완료되면 종료)
+
+        이 워커에서 실행 중인 작업은 갱신 즉시, 다른 워커의 작업은
+        poll_interval 간격으로 DB를 확인해 전달합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Yields:
+            JobInfo: 바뀐 작업 정보 (첫 번째는 현재 상태)
+        """
+        event = asyncio.Event()
+        self._watchers.setdefault(job_id, set()).add(event)
+        try:
+            last: Optional[JobInfo] = None
+            while True:
+                info = await asyncio.to_thread(self.get, job_id)
+                if info is None:
+                    return
+                if info != last:
+                    yield info
+                    last = info
+                if info.status in FINISHED_STATUSES:
+                    return
+
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                event.clear()
+        finally:
+            watchers = self._watchers.get(job_id)
+            if watchers is not None:
+                watchers.discard(event)
+                if not watchers:
+                    self._watchers.pop(job_id, None)
+
+    async def drain(self, timeout: float) -> int:
+        """
+        이 워커에서 실행 중인 작업이 끝나기를 기다림 (서버 종료 시)
+
+        새 연결을 받지 않는 상태에서 호출되므로 새 작업은 들어오지 않습니다.
+        timeout 안에 끝나지 않은 작업은 취소합니다.
+
+        Args:
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            int: 제한 시간 안에 끝나지 않아 취소한 작업 수
+        """
+        tasks = list(self._tasks.values())
+        if tasks and timeout > 0:
+            _, tasks = await asyncio.wait(tasks, timeout=timeout)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+        return len(tasks)
+
+    def shutdown(self) -> None:
+        """이 워커에서 실행 중인 작업 취소 (서버 종료 시)"""
+        for task in list(self._tasks.values()):
+            task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업 큐 통계 반환"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "active": len(self._tasks),
+                "submitted": self.submitted,
+                **{status: count for status, count in self._finished.items()}
+            }
+
+    # ------------------------------------------------------------
+    # 작업 실행
+    # ------------------------------------------------------------
+
+    async def _execute(self, job_id: str, stages: List[str], run: JobRunner) -> None:
+        context = JobContext(self, job_id, stages)
+        try:
+            async with self._get_semaphore():
+                if await asyncio.to_thread(self._cancel_requested, job_id):
+                    raise asyncio.CancelledError()
+                await asyncio.to_thread(self._update, job_id, status=JobStatus.RUNNING.value)
+                self._notify(job_id)
+
+                result = await run(context)
+
+            await asyncio.to_thread(
+                self._finish, job_id, JobStatus.SUCCEEDED,
+                result=result.model_dump(mode="json")
+            )
+
+        except asyncio.CancelledError:
+            # 취소된 태스크에서는 다시 await하지 않고 바로 기록
+            self._finish(job_id, JobStatus.CANCELLED, error=JobError(
+                code="JOB_CANCELLED",
+                message="작업이 취소되었습니다."
+            ))
+
+        except Exception as e:
+            code = getattr(e, "code", None)
+            message = getattr(e, "message", None)
+            if code is None or message is None:
+                code, message = ErrorCode.INTERNAL_ERROR, f"작업 실행 중 오류가 발생했습니다: {str(e)}"
+            await asyncio.to_thread(self._finish, job_id, JobStatus.FAILED, error=JobError(
+                code=getattr(code, "value", code),
+                message=message
+            ))
+
+        finally:
+            self._notify(job_id)
+
+    def _finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result: Optional[dict] = None,
+        error: Optional[JobError] = None
+    ) -> None:
+        fields: Dict[str, Any] = {
+            "status": status.value,
+            "result": json.dumps(result, ensure_ascii=False) if result is not None else None,
+            "error": error.model_dump_json() if error is not None else None,
+            "expires_at": time.time() + self.ttl_seconds
+        }
+        if status == JobStatus.SUCCEEDED:
+            fields["progress"] = 1.0
+            fields["stage"] = None
+        self._update(job_id, **fields)
+        with self._lock:
+            self._finished[status.value] += 1
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE job_id = ?",
+                (*fields.values(), job_id)
+            )
+
+    def _cancel_requested(self, job_id: str) -> bool:
+        with self._connect() as conn:
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return bool(row and row[0])
+
+    def _notify(self, job_id: str) -> None:
+        for event in list(self._watchers.get(job_id, ())):
+            event.set()
+
+    def fail_orphaned_jobs(self) -> None:
+        """
+        이 호스트에서 종료된 프로세스가 남긴 미완료 작업을 실패로 표시
+
+        생성 시 한 번 실행하며, 비정상 종료한 워커를 대신해 새로 기동한 워커도
+        시작 시 호출합니다.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT job_id, owner FROM jobs WHERE status IN (?, ?)",
+                (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+            ).fetchall()
+
+        error = JobError(
+            code="JOB_INTERRUPTED",
+            message="작업을 실행하던 서버 프로세스가 종료되었습니다. 다시 요청해주세요."
+        )
+        for job_id, owner in rows:
+            host, _, pid = owner.rpartition(":")
+            if host == self._hostname and not _process_alive(int(pid)):
+                self._finish(job_id, JobStatus.FAILED, error=error)
+
+
+def _process_alive(pid: int) -> bool:
+    """같은 호스트의 프로세스가 살아 있는지 확인 (현재 프로세스는 새로 기동했으므로 제외)"""
+    if pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# 작업 큐 인스턴스 (싱글톤)
+job_queue = JobQueue(
+    db_path=settings.job_db_path,
+    max_workers=settings.job_max_workers,
+    ttl_seconds=settings.job_ttl_seconds,
+    poll_interval=settings.job_poll_interval_seconds
+)
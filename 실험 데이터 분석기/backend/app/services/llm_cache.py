@@ -0,0 +1,204 @@
+"""
+LabReportAI LLM Response Cache
+같은 모델/생성 설정/프롬프트의 Gemini 응답을 재사용하는 캐시
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.config import settings
+
+
+def make_cache_key(model: str, config: Any, contents: Any) -> str:
+    """
+    캐시 키 생성 (모델 이름 + 생성 설정 + 정규화된 프롬프트의 SHA-256)
+
+    프롬프트 문자열은 줄 끝 공백과 앞뒤 공백을 제거해 비교하고,
+    PDF 같은 바이너리 데이터는 내용 해시로 대체합니다.
+
+    Args:
+        model: 모델 이름
+        config: 생성 설정 (GenerateContentConfig)
+        contents: 프롬프트 문자열 또는 Content 목록
+
+    Returns:
+        str: 64자리 16진수 키
+    """
+    payload = json.dumps(
+        [model, _canonical(config), _canonical(contents)],
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    """JSON으로 직렬화할 수 있는 정규화된 값으로 변환"""
+    if isinstance(value, BaseModel):
+        return _canonical(value.model_dump(exclude_none=True))
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, bytes):
+        return {"sha256": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, str):
+        return "\n".join(line.rstrip() for line in value.strip().splitlines())
+    return value
+
+
+class LLMResponseCache:
+    """
+    LLM 응답 캐시
+
+    - 메모리 계층: 항목 수 기준 LRU + TTL
+    - SQLite 계층 (db_path 지정 시): 같은 DB 파일을 쓰는 모든 워커 프로세스가
+      공유하며, 서버 재시작 후에도 TTL 동안 유지됩니다.
+
+    응답 텍스트만 저장하며, 요청 종류(kind)별 적중률을 기록합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        db_path: Optional[str] = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path or None
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._by_kind: Dict[str, Dict[str, int]] = {}
+
+        if self.db_path:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_responses ("
+                    "cache_key TEXT PRIMARY KEY, "
+                    "response TEXT NOT NULL, "
+                    "expires_at REAL NOT NULL)"
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5.0)
+
+    def get(self, key: str, kind: str = "default") -> Optional[str]:
+        """
+        응답 조회 (메모리 → SQLite 순)
+
+        Args:
+            key: make_cache_key로 만든 키
+            kind: 통계용 요청 종류 (discussion, manual, full_report)
+
+        Returns:
+            Optional[str]: 캐시된 응답 텍스트 (없거나 만료되면 None)
+        """
+        now = time.time()
+        text = None
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] >= now:
+                    self._memory.move_to_end(key)
+                    text = entry[1]
+                else:
+                    del self._memory[key]
+
+        if text is None and self.db_path:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT response, expires_at FROM llm_responses WHERE cache_key = ?",
+                    (key,)
+                ).fetchone()
+            if row is not None and row[1] >= now:
+                text = row[0]
+                with self._lock:
+                    self._memory_put(key, row[1], text)
+
+        self._record(kind, hit=text is not None)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """
+        응답 저장
+
+        Args:
+            key: make_cache_key로 만든 키
+            text: 모델 응답 텍스트
+        """
+        expires_at = time.time() + self.ttl_seconds
+
+        with self._lock:
+            self._memory_put(key, expires_at, text)
+            self.stores += 1
+
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (cache_key, response, expires_at) VALUES (?, ?, ?)",
+                    (key, text, expires_at)
+                )
+                conn.execute("DELETE FROM llm_responses WHERE expires_at < ?", (time.time(),))
+
+    def _memory_put(self, key: str, expires_at: float, text: str) -> None:
+        self._memory.pop(key, None)
+        self._memory[key] = (expires_at, text)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _record(self, kind: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._by_kind.setdefault(kind, {"hits": 0, "misses": 0})
+            if hit:
+                self.hits += 1
+                counts["hits"] += 1
+            else:
+                self.misses += 1
+                counts["misses"] += 1
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._memory.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_responses")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환 (적중률 포함)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "memory_entries": len(self._memory),
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "by_kind": {kind: dict(counts) for kind, counts in self._by_kind.items()}
+            }
+
+
+# 캐시 인스턴스 (싱글톤)
+llm_cache = LLMResponseCache(
+    max_entries=settings.llm_cache_max_entries,
+    ttl_seconds=settings.llm_cache_ttl_seconds,
+    db_path=settings.llm_cache_db_path or None
+)
@@ -0,0 +1,208 @@
+"""
+LabReportAI Manual Extraction Cache
+PDF 내용 해시(SHA-256)별로 추출한 실험 매뉴얼 정보를 보관하고,
+같은 PDF의 동시 추출 요청을 하나의 모델 호출로 병합하는 캐시
+"""
+
+import asyncio
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config import settings
+from app.models.schemas import ExperimentManualInfo
+
+
+PDF_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class ManualExtractionCache:
+    """
+    매뉴얼 추출 결과 캐시
+
+    - 메모리 계층: 항목 수 기준 LRU
+    - 디스크 계층 (cache_dir 지정 시): {cache_dir}/{sha[:2]}/{sha}.json
+      PDF 내용이 같으면 결과도 같으므로 TTL 없이 보관하며, 관리자 API로 삭제합니다.
+    - 진행 중 병합: 같은 PDF의 추출이 진행 중이면 새 모델 호출 없이 그 결과를 기다립니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str], max_memory_entries: int):
+        self.cache_dir = cache_dir or None
+        self.max_memory_entries = max_memory_entries
+
+        self._memory: "OrderedDict[str, ExperimentManualInfo]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.extractions = 0
+        self.invalidations = 0
+
+    def _path(self, pdf_sha256: str) -> str:
+        return os.path.join(self.cache_dir, pdf_sha256[:2], f"{pdf_sha256}.json")
+
+    def get(self, pdf_sha256: str) -> Optional[ExperimentManualInfo]:
+        """
+        추출 결과 조회 (메모리 → 디스크 순)
+
+        Args:
+            pdf_sha256: PDF 내용의 SHA-256
+
+        Returns:
+            Optional[ExperimentManualInfo]: 캐시된 매뉴얼 정보 (없으면 None)
+        """
+        if not PDF_SHA256_PATTERN.match(pdf_sha256):
+            return None
+
+        with self._lock:
+            info = self._memory.get(pdf_sha256)
+            if info is not None:
+                self._memory.move_to_end(pdf_sha256)
+                return info
+
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(pdf_sha256), "r", encoding="utf-8") as f:
+                info = ExperimentManualInfo.model_validate_json(f.read())
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            self._memory_put(pdf_sha256, info)
+        return info
+
+    def put(self, pdf_sha256: str, info: ExperimentManualInfo) -> None:
+        """
+        추출 결과 저장
+
+        Args:
+            pdf_sha256: PDF 내용의 SHA-256
+            info: 추출된 매뉴얼 정보
+        """
+        with self._lock:
+            self._memory_put(pdf_sha256, info)
+
+        if self.cache_dir:
+            path = self._path(pdf_sha256)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(info.model_dump_json())
+            os.replace(tmp_path, path)
+
+    def _memory_put(self, pdf_sha256: str, info: ExperimentManualInfo) -> None:
+        self._memory.pop(pdf_sha256, None)
+        self._memory[pdf_sha256] = info
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def invalidate(self, pdf_sha256: str) -> bool:
+        """
+        추출 결과 삭제 (매뉴얼이 잘못 추출된 경우 관리자가 다시 추출하도록)
+
+        Returns:
+            bool: 삭제한 항목이 있으면 True
+        """
+        if not PDF_SHA256_PATTERN.match(pdf_sha256):
+            return False
+
+        with self._lock:
+            removed = self._memory.pop(pdf_sha256, None) is not None
+
+        if self.cache_dir:
+            try:
+                os.unlink(self._path(pdf_sha256))
+                removed = True
+            except OSError:
+                pass
+
+        if removed:
+            with self._lock:
+                self.invalidations += 1
+        return removed
+
+    async def get_or_extract(
+        self,
+        pdf_sha256: str,
+        extract: Callable[[], Awaitable[ExperimentManualInfo]],
+        regenerate: bool = False
+    ) -> ExperimentManualInfo:
+        """
+        캐시된 결과를 반환하거나, 없으면 추출 후 저장
+
+        같은 PDF의 추출이 이미 진행 중이면 그 결과를 함께 기다립니다.
+        추출은 shield로 보호되므로 먼저 요청한 클라이언트가 연결을 끊어도
+        기다리는 다른 요청에는 영향이 없습니다. 추출이 실패하면 기다리던
+        모든 요청에 같은 예외가 전달되며 결과는 저장하지 않습니다.
+
+        Args:
+            pdf_sha256: PDF 내용의 SHA-256
+            extract: 모델로 매뉴얼 정보를 추출하는 코루틴 함수
+            regenerate: True이면 캐시된 결과를 무시하고 새로 추출
+
+        Returns:
+            ExperimentManualInfo: 매뉴얼 정보
+        """
+        if not regenerate:
+            cached = await asyncio.to_thread(self.get, pdf_sha256)
+            if cached is not None:
+                with self._lock:
+                    self.hits += 1
+                return cached
+
+        task = self._in_flight.get(pdf_sha256)
+        if task is None:
+            with self._lock:
+                self.misses += 1
+            task = asyncio.ensure_future(self._extract_and_store(pdf_sha256, extract))
+            self._in_flight[pdf_sha256] = task
+            task.add_done_callback(lambda done: self._finish(pdf_sha256, done))
+        else:
+            with self._lock:
+                self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    async def _extract_and_store(
+        self,
+        pdf_sha256: str,
+        extract: Callable[[], Awaitable[ExperimentManualInfo]]
+    ) -> ExperimentManualInfo:
+        with self._lock:
+            self.extractions += 1
+        info = await extract()
+        await asyncio.to_thread(self.put, pdf_sha256, info)
+        return info
+
+    def _finish(self, pdf_sha256: str, task: asyncio.Future) -> None:
+        self._in_flight.pop(pdf_sha256, None)
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 처리되지 않았다는 경고를 남기지 않음
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "memory_entries": len(self._memory),
+                "in_flight": len(self._in_flight),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "extractions": self.extractions,
+                "invalidations": self.invalidations,
+                "hit_rate": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0
+            }
+
+
+# 캐시 인스턴스 (싱글톤)
+manual_cache = ManualExtractionCache(
+    cache_dir=settings.manual_cache_dir or None,
+    max_memory_entries=settings.manual_cache_memory_entries
+)
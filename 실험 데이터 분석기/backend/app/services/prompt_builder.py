@@ -0,0 +1,196 @@
+"""
+LabReportAI Prompt Builder
+토큰 예산에 맞춘 프롬프트 조립
+
+- estimate_tokens: 네트워크 호출 없이 입력 토큰 수를 추정 (실제보다 약간 많게)
+- statistics_table: 실험별 통계를 한 줄짜리 표 행으로 압축
+- manual_section: 매뉴얼 정보를 남은 예산에 맞게 축약
+- build_within_budget: 고정 부분을 먼저 계산하고 남은 예산을 축약 가능한 부분에 배분
+"""
+
+import math
+import re
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from app.config import settings
+from app.models.schemas import ExperimentManualInfo, SingleExperimentResult
+
+
+# 영문 단어, 숫자, 그 외 공백이 아닌 문자 하나
+_PIECE_PATTERN = re.compile(r"[A-Za-z]+|[0-9]|\S")
+
+# 축약 표시 (예산에서 미리 빼 둠)
+_TRUNCATION_MARK = " …(생략)"
+
+# 고정 부분이 예산을 다 써도 축약 가능한 부분에 남겨 둘 최소 토큰 수
+_MIN_FLEXIBLE_TOKENS = 200
+
+
+class PromptTooLargeError(Exception):
+    """프롬프트가 모델 입력 한도를 넘는 경우"""
+    def __init__(self, tokens: int, limit: int):
+        self.tokens = tokens
+        self.limit = limit
+        self.message = f"입력이 너무 큽니다. (추정 {tokens:,} 토큰, 한도 {limit:,} 토큰) 실험 수를 줄여 다시 시도해주세요."
+        super().__init__(self.message)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    입력 토큰 수 추정 (로컬 계산)
+
+    SentencePiece 계열 토크나이저 기준으로 영문 단어는 4자당 1토큰,
+    숫자와 한글 음절, 기호는 1자당 1토큰으로 셉니다. 한글과 숫자는 실제로
+    더 적게 나뉘는 경우가 많아 실제 토큰 수보다 약간 크게 추정됩니다.
+    """
+    tokens = 0
+    for match in _PIECE_PATTERN.finditer(text):
+        piece = match.group()
+        tokens += math.ceil(len(piece) / 4) if len(piece) > 1 else 1
+    return tokens
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    추정 토큰 수가 max_tokens 이하가 되도록 뒷부분을 잘라냄
+
+    가능하면 문장(마침표, 줄바꿈) 경계에서 자르고 축약 표시를 붙입니다.
+    """
+    text = text.strip()
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    limit = max_tokens - estimate_tokens(_TRUNCATION_MARK)
+    if limit <= 0:
+        return ""
+
+    tokens = 0
+    cut = 0
+    for match in _PIECE_PATTERN.finditer(text):
+        piece = match.group()
+        tokens += math.ceil(len(piece) / 4) if len(piece) > 1 else 1
+        if tokens > limit:
+            break
+        cut = match.end()
+
+    head = text[:cut]
+    boundary = max(head.rfind(". "), head.rfind(".\n"), head.rfind("\n"))
+    if boundary >= len(head) // 2:
+        head = head[:boundary + 1]
+    return head.rstrip() + _TRUNCATION_MARK
+
+
+def join_blocks(*blocks: str) -> str:
+    """빈 블록을 건너뛰고 빈 줄 하나로 이어 붙임"""
+    return "\n\n".join(block.strip() for block in blocks if block and block.strip())
+
+
+def _number(value: float) -> str:
+    return f"{value:.6g}"
+
+
+def _cell(text: str) -> str:
+    return text.replace("|", "/").replace("\n", " ").strip()
+
+
+def statistics_table(experiments: Sequence[Tuple[int, SingleExperimentResult]]) -> str:
+    """
+    실험별 통계 요약 표 (실험 하나당 한 행)
+
+    Args:
+        experiments: (실험 번호, 실험 결과) 목록
+
+    Returns:
+        str: 마크다운 표 (수치는 유효숫자 6자리)
+    """
+    rows = [
+        "| 실험 | 이름 | n | 기울기 | y절편 | R² | 표준오차 | X 범위 | Y 범위 | 오차율(%) |",
+        "|---|---|---|---|---|---|---|---|---|---|"
+    ]
+    for index, exp in experiments:
+        stats = exp.statistics
+        error_rate = f"{stats.error_rate_percent:.2f}" if stats.error_rate_percent is not None else "-"
+        rows.append(
+            f"| {index} | {_cell(exp.experiment_name)} | {stats.data_points} | {_number(stats.slope)} | "
+            f"{_number(stats.intercept)} | {stats.r_squared:.6f} | {_number(stats.std_error)} | "
+            f"{_number(stats.x_range[0])}~{_number(stats.x_range[1])} | "
+            f"{_number(stats.y_range[0])}~{_number(stats.y_range[1])} | {error_rate} |"
+        )
+    return "\n".join(rows)
+
+
+def manual_section(manual_info: Optional[ExperimentManualInfo], max_tokens: int) -> str:
+    """
+    프롬프트용 매뉴얼 정보 섹션 (없으면 빈 문자열)
+
+    전체가 max_tokens를 넘으면 짧은 항목은 그대로 두고 남은 예산을 긴
+    항목(주로 이론)에 고르게 나누어 축약합니다.
+    """
+    if not manual_info:
+        return ""
+
+    error_guides = "\n".join(
+        f"- {_cell(eg.cause)}: {_cell(eg.description)}" for eg in manual_info.error_guides
+    )
+    fields: List[Tuple[str, str]] = [
+        (title, body.strip())
+        for title, body in [
+            ("목적", manual_info.experiment_purpose),
+            ("이론", manual_info.theory),
+            ("오차 원인", error_guides),
+            ("예상 결과", manual_info.expected_results or "")
+        ]
+        if body and body.strip()
+    ]
+    if not fields:
+        return ""
+
+    def render(bodies: List[str]) -> str:
+        return "## 실험 매뉴얼 (PDF 추출)\n" + "\n".join(
+            f"### {title}\n{body}" for (title, _), body in zip(fields, bodies) if body
+        )
+
+    bodies = [body for _, body in fields]
+    if estimate_tokens(render(bodies)) <= max_tokens:
+        return render(bodies)
+
+    # 짧은 항목부터 남은 예산의 균등 몫 안에 들면 그대로, 넘으면 몫만큼 축약
+    remaining = max_tokens - estimate_tokens(render(["."] * len(fields)))
+    order = sorted(range(len(fields)), key=lambda i: estimate_tokens(bodies[i]))
+    fitted = list(bodies)
+    for position, i in enumerate(order):
+        share = max(remaining // (len(order) - position), 0)
+        fitted[i] = truncate_to_tokens(bodies[i], share)
+        remaining -= estimate_tokens(fitted[i])
+    return render(fitted)
+
+
+def build_within_budget(
+    render: Callable[[str], str],
+    flexible: Callable[[int], str],
+    token_budget: Optional[int] = None
+) -> str:
+    """
+    토큰 예산 안에서 프롬프트 조립
+
+    Args:
+        render: 축약 가능한 부분(문자열)을 받아 전체 프롬프트를 만드는 함수
+        flexible: 허용 토큰 수를 받아 축약 가능한 부분(매뉴얼, 추가 맥락)을 만드는 함수
+        token_budget: 프롬프트 토큰 예산 (기본: PROMPT_TOKEN_BUDGET)
+
+    Returns:
+        str: 조립된 프롬프트
+
+    Raises:
+        PromptTooLargeError: 축약 후에도 모델 입력 한도(GEMINI_MAX_INPUT_TOKENS)를 넘는 경우
+    """
+    if token_budget is None:
+        token_budget = settings.prompt_token_budget
+
+    fixed_tokens = estimate_tokens(render(""))
+    prompt = render(flexible(max(token_budget - fixed_tokens, _MIN_FLEXIBLE_TOKENS)))
+
+    tokens = estimate_tokens(prompt)
+    if tokens > settings.gemini_max_input_tokens:
+        raise PromptTooLargeError(tokens, settings.gemini_max_input_tokens)
+    return prompt
@@ -0,0 +1,256 @@
+"""
+LabReportAI Regression Core
+NumPy 배열 기반 단순 선형 회귀 (scipy.stats.linregress 대체)
+
+- 연속 float64 배열을 그대로 사용하며 DataFrame이나 (2, n) 복사본을 만들지 않습니다.
+- 중심화 적률을 두 번 읽기로 계산합니다: 평균(pairwise 합) → 평균을 뺀 제곱합/곱합.
+  타임스탬프처럼 값의 크기에 비해 분산이 작은 데이터에서도 상쇄 오차가 생기지 않습니다.
+- 2차 합은 블록 단위로 계산하고 블록 부분합을 math.fsum으로 보정 합산하며,
+  평균의 반올림 오차는 보정 항(corrected two-pass)으로 제거합니다.
+  추가 메모리는 블록 크기의 임시 배열 두 개뿐입니다 (입력 크기와 무관).
+- R²가 1에 가까우면 (1 - r²) 계산의 상쇄 오차를 피하려고 잔차 제곱합을 직접 다시 계산합니다.
+"""
+
+import math
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from scipy import stats as scipy_stats
+
+
+# 2차 합을 계산하는 블록 크기 (임시 배열 2개 × 512KB)
+_BLOCK_SIZE = 1 << 16
+
+# 1 - r²가 이보다 작으면 잔차 제곱합을 직접 계산
+_RESIDUAL_PASS_THRESHOLD = 1e-6
+
+ArrayLike = Union[float, np.ndarray]
+
+
+class RegressionError(Exception):
+    """회귀 분석 입력 오류"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+class LinearFit:
+    """
+    단순 선형 회귀 결과
+
+    Attributes:
+        slope: 기울기
+        intercept: y절편
+        r_value: 상관계수
+        slope_stderr: 기울기 표준 오차
+        intercept_stderr: y절편 표준 오차
+        n: 데이터 포인트 수
+        x_range: X 범위 (min, max)
+        y_range: Y 범위 (min, max)
+    """
+
+    def __init__(
+        self,
+        slope: float,
+        intercept: float,
+        r_value: float,
+        slope_stderr: float,
+        intercept_stderr: float,
+        n: int,
+        x_range: Tuple[float, float],
+        y_range: Tuple[float, float]
+    ):
+        self.slope = slope
+        self.intercept = intercept
+        self.r_value = r_value
+        self.slope_stderr = slope_stderr
+        self.intercept_stderr = intercept_stderr
+        self.n = n
+        self.x_range = x_range
+        self.y_range = y_range
+
+    def confidence_intervals(self, level: float = 0.95) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """
+        기울기와 y절편의 신뢰구간
+
+        Args:
+            level: 신뢰수준 (0~1)
+
+        Returns:
+            Tuple: ((기울기 하한, 상한), (y절편 하한, 상한))
+        """
+        t_value = float(t_critical(self.n - 2, level))
+        return (
+            (self.slope - t_value * self.slope_stderr, self.slope + t_value * self.slope_stderr),
+            (self.intercept - t_value * self.intercept_stderr, self.intercept + t_value * self.intercept_stderr)
+        )
+
+
+def t_critical(dof: ArrayLike, level: float) -> ArrayLike:
+    """
+    양측 신뢰구간의 Student t 임계값 (배열이면 원소별)
+
+    자유도가 0 이하이면 (점 2개) 표준 오차도 0이므로 0을 반환합니다.
+    """
+    dof = np.asarray(dof, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        t_value = scipy_stats.t.ppf(0.5 + level / 2, np.maximum(dof, 1))
+    return np.where(dof > 0, t_value, 0.0)
+
+
+def regression_from_moments(
+    n: ArrayLike,
+    x_mean: ArrayLike,
+    y_mean: ArrayLike,
+    ssxm: ArrayLike,
+    ssym: ArrayLike,
+    ssxym: ArrayLike,
+    sse: Optional[ArrayLike] = None
+) -> Tuple[ArrayLike, ArrayLike, ArrayLike, ArrayLike, ArrayLike]:
+    """
+    중심화 적률로부터 회귀 계수와 표준 오차 계산 (스칼라 또는 계열별 배열)
+
+    Args:
+        n: 데이터 포인트 수
+        x_mean, y_mean: 평균
+        ssxm, ssym, ssxym: 평균을 뺀 제곱합 Σdx², Σdy², 곱합 Σdxdy
+        sse: 잔차 제곱합 (없으면 (1 - r²)·Σdy²로 계산, linregress와 같음)
+
+    Returns:
+        Tuple: (기울기, y절편, 상관계수, 기울기 표준 오차, y절편 표준 오차)
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = ssxym / ssxm
+        intercept = y_mean - slope * x_mean
+        r_den = np.sqrt(ssxm * ssym)
+        r_value = np.where(r_den == 0, 0.0, np.clip(ssxym / r_den, -1.0, 1.0))
+        if sse is None:
+            sse = (1 - r_value ** 2) * ssym
+        dof = np.asarray(n) - 2
+        slope_stderr = np.where(dof > 0, np.sqrt(np.maximum(sse, 0.0) / ssxm / np.maximum(dof, 1)), 0.0)
+        # Var(b) = Var(m) · Σx² / n = Var(m) · (Σdx² / n + x̄²)
+        intercept_stderr = slope_stderr * np.sqrt(ssxm / n + x_mean ** 2)
+    return slope, intercept, r_value, slope_stderr, intercept_stderr
+
+
+def needs_residual_pass(n: ArrayLike, r_value: ArrayLike) -> ArrayLike:
+    """
+    (1 - r²)·Σdy²로 구한 잔차 제곱합이 상쇄 오차로 부정확한지 여부 (배열이면 원소별)
+
+    참이면 residual_sum_of_squares로 잔차 제곱합을 직접 다시 계산해야 합니다.
+    """
+    r_value = np.asarray(r_value, dtype=np.float64)
+    return (np.asarray(n) > 2) & (1 - r_value ** 2 < _RESIDUAL_PASS_THRESHOLD)
+
+
+def centered_moments(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """
+    평균과 중심화 제곱합/곱합 계산 (corrected two-pass, 블록 단위)
+
+    Args:
+        x, y: 같은 길이의 연속 float64 배열
+
+    Returns:
+        Tuple[float, float, float, float, float]: (x̄, ȳ, Σdx², Σdy², Σdxdy)
+    """
+    n = len(x)
+    x_mean = float(np.mean(x))
+    y_mean = float(np.mean(y))
+
+    partials = ([], [], [], [], [])  # Σdx, Σdy, Σdx², Σdy², Σdxdy
+    dx_buffer = np.empty(min(n, _BLOCK_SIZE))
+    dy_buffer = np.empty(min(n, _BLOCK_SIZE))
+    for start in range(0, n, _BLOCK_SIZE):
+        stop = min(start + _BLOCK_SIZE, n)
+        dx = np.subtract(x[start:stop], x_mean, out=dx_buffer[:stop - start])
+        dy = np.subtract(y[start:stop], y_mean, out=dy_buffer[:stop - start])
+        for partial, value in zip(partials, (dx.sum(), dy.sum(), dx @ dx, dy @ dy, dx @ dy)):
+            partial.append(float(value))
+
+    sum_dx, sum_dy, sum_dx2, sum_dy2, sum_dxdy = (math.fsum(partial) for partial in partials)
+
+    # 평균의 반올림 오차 보정: Σ(d - d̄)² = Σd² - (Σd)²/n
+    ssxm = sum_dx2 - sum_dx * sum_dx / n
+    ssym = sum_dy2 - sum_dy * sum_dy / n
+    ssxym = sum_dxdy - sum_dx * sum_dy / n
+    return x_mean + sum_dx / n, y_mean + sum_dy / n, ssxm, ssym, ssxym
+
+
+def residual_sum_of_squares(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_mean: float,
+    y_mean: float,
+    slope: float
+) -> float:
+    """
+    잔차 제곱합 Σ((y - ȳ) - m(x - x̄))² 직접 계산 (블록 단위)
+
+    float64로 표현한 평균은 참 평균과 조금 다르고 (타임스탬프에서는 최대 ulp/2),
+    그만큼 모든 잔차가 같은 값만큼 밀립니다. 잔차의 합은 0이어야 하므로
+    Σr² - (Σr)²/n으로 보정합니다.
+    """
+    n = len(x)
+    sums, squares = [], []
+    dx_buffer = np.empty(min(n, _BLOCK_SIZE))
+    residual_buffer = np.empty(min(n, _BLOCK_SIZE))
+    for start in range(0, n, _BLOCK_SIZE):
+        stop = min(start + _BLOCK_SIZE, n)
+        # (y - ȳ)를 먼저 계산해야 큰 y 값에 작은 잔차를 더하는 반올림이 생기지 않음
+        dx = np.subtract(x[start:stop], x_mean, out=dx_buffer[:stop - start])
+        dx *= slope
+        residual = np.subtract(y[start:stop], y_mean, out=residual_buffer[:stop - start])
+        residual -= dx
+        sums.append(float(residual.sum()))
+        squares.append(float(residual @ residual))
+    total = math.fsum(sums)
+    return math.fsum(squares) - total * total / n
+
+
+def fit_line(x: np.ndarray, y: np.ndarray) -> LinearFit:
+    """
+    단순 선형 회귀 (최소제곱)
+
+    Args:
+        x: X 데이터 배열 (결측치 없음)
+        y: Y 데이터 배열 (결측치 없음)
+
+    Returns:
+        LinearFit: 회귀 결과
+
+    Raises:
+        RegressionError: 길이가 다르거나, 점이 2개 미만이거나, X 값이 모두 같은 경우
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    n = len(x)
+    if len(y) != n:
+        raise RegressionError("x and y must have the same length")
+    if n < 2:
+        raise RegressionError("At least 2 data points are required")
+
+    x_range = (float(x.min()), float(x.max()))
+    y_range = (float(y.min()), float(y.max()))
+    if x_range[0] == x_range[1]:
+        raise RegressionError("Cannot calculate a linear regression if all x values are identical")
+
+    x_mean, y_mean, ssxm, ssym, ssxym = centered_moments(x, y)
+    slope, intercept, r_value, slope_stderr, intercept_stderr = regression_from_moments(
+        n, x_mean, y_mean, ssxm, ssym, ssxym
+    )
+    if needs_residual_pass(n, r_value):
+        sse = residual_sum_of_squares(x, y, x_mean, y_mean, float(slope))
+        slope, intercept, r_value, slope_stderr, intercept_stderr = regression_from_moments(
+            n, x_mean, y_mean, ssxm, ssym, ssxym, sse
+        )
+
+    return LinearFit(
+        slope=float(slope),
+        intercept=float(intercept),
+        r_value=float(r_value),
+        slope_stderr=float(slope_stderr),
+        intercept_stderr=float(intercept_stderr),
+        n=n,
+        x_range=x_range,
+        y_range=y_range
+    )
@@ -0,0 +1,351 @@
+"""
+LabReportAI Graph Render Engine
+프로세스 풀 기반 병렬 그래프 렌더링 엔진
+"""
+
+import asyncio
+import io
+import json
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.models.schemas import GraphFormat, GraphResolution, GraphResult, StatisticsResult, ImageDelivery
+from app.services.asset_store import AssetStore, asset_store
+from app.services.graph_cache import GraphCache
+from app.services.graph_generator import GraphGenerator, graph_generator
+from app.utils.executor import CPUExecutor, cpu_executor
+
+
+def warm_render_worker() -> None:
+    """
+    렌더링 워커 프로세스 초기화 함수
+
+    matplotlib 임포트, 스타일/폰트 설정, 폰트 캐시 로딩을 미리 수행하여
+    첫 번째 렌더링 요청의 지연을 없앱니다.
+    """
+    from app.services.graph_generator import graph_generator
+
+    stats = StatisticsResult(
+        slope=1.0,
+        intercept=0.0,
+        r_squared=1.0,
+        std_error=0.0,
+        data_points=2,
+        x_range=(0.0, 1.0),
+        y_range=(0.0, 1.0)
+    )
+    graph_generator.render_png(
+        x=np.array([0.0, 1.0]),
+        y=np.array([0.0, 1.0]),
+        x_label="x",
+        y_label="y",
+        statistics=stats,
+        title="warmup"
+    )
+
+
+def _render_in_worker(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_label: str,
+    y_label: str,
+    statistics: StatisticsResult,
+    title: str,
+    dpi: int,
+    image_format: GraphFormat
+) -> bytes:
+    """워커 프로세스에서 단일 그래프를 이미지 바이트로 렌더링"""
+    from app.services.graph_generator import graph_generator
+
+    return graph_generator.render_image(
+        x=x,
+        y=y,
+        x_label=x_label,
+        y_label=y_label,
+        statistics=statistics,
+        title=title,
+        dpi=dpi,
+        image_format=image_format
+    )
+
+
+def _render_layers_in_worker(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_label: str,
+    y_label: str,
+    statistics: StatisticsResult,
+    title: str,
+    dpi: int,
+    image_format: GraphFormat
+) -> Tuple[bytes, bytes]:
+    """워커 프로세스에서 래스터 그래프를 렌더링하고 (본문, 이미지) 바이트 반환"""
+    from app.services.graph_generator import graph_generator
+
+    return graph_generator.render_layers(x, y, x_label, y_label, statistics, title, dpi, image_format)
+
+
+def _relabel_in_worker(body: bytes, title: str, dpi: int, image_format: GraphFormat) -> bytes:
+    """워커 프로세스에서 캐시된 본문에 제목만 그려 인코딩"""
+    from app.services.graph_generator import graph_generator
+
+    return graph_generator.relabel(body, title, dpi, image_format)
+
+
+# 그래프 원본: 다른 해상도로 다시 렌더링하기 위한 입력 (x, y, x_label, y_label, statistics, title)
+GraphSource = Tuple[np.ndarray, np.ndarray, str, str, StatisticsResult, str]
+
+
+def encode_graph_source(source: GraphSource) -> bytes:
+    """그래프 원본을 캐시에 저장할 바이트로 변환 (.npz, pickle 미사용)"""
+    x, y, x_label, y_label, statistics, title = source
+    meta = json.dumps({
+        "x_label": x_label,
+        "y_label": y_label,
+        "statistics": statistics.model_dump(mode="json"),
+        "title": title
+    })
+    buffer = io.BytesIO()
+    np.savez(buffer, x=np.asarray(x, dtype=float), y=np.asarray(y, dtype=float), meta=np.array(meta))
+    return buffer.getvalue()
+
+
+def decode_graph_source(data: bytes) -> GraphSource:
+    """encode_graph_source의 역변환"""
+    with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+        meta = json.loads(str(archive["meta"]))
+        return (
+            archive["x"],
+            archive["y"],
+            meta["x_label"],
+            meta["y_label"],
+            StatisticsResult.model_validate(meta["statistics"]),
+            meta["title"]
+        )
+
+
+def _put_graph_source(cache: GraphCache, graph_id: str, source: GraphSource) -> None:
+    """그래프 원본을 인코딩해 graph_id로 캐시에 저장 (스레드 풀에서 실행)"""
+    cache.put(graph_id, encode_graph_source(source))
+
+
+def _noop() -> None:
+    """워커 프로세스 기동용 빈 작업"""
+    return None
+
+
+class GraphRenderEngine:
+    """
+    병렬 그래프 렌더링 엔진
+
+    각 그래프를 CPUExecutor의 프로세스 풀에 개별 작업으로 제출하여
+    여러 시트의 그래프를 코어 수만큼 동시에 렌더링합니다.
+    워커로는 DataFrame 대신 x/y 배열만 전달합니다.
+
+    캐시 조회/저장은 부모 프로세스에서 수행하므로 캐시에 있는 그래프는
+    워커로 전달되지 않으며, 모든 워커가 같은 메모리 캐시를 공유합니다.
+
+    url 모드에서는 이미지를 에셋 저장소에 저장하고 URL만 반환합니다.
+
+    분석 API는 작은 preview 해상도로 렌더링하고, 리포트처럼 print 해상도가
+    필요할 때 render_at으로 다시 렌더링합니다. 이를 위해 새로 렌더링한 그래프의
+    원본 데이터를 graph_id로 그래프 캐시에 함께 저장합니다.
+
+    래스터 그래프는 제목 없는 본문도 본문 ID(제목을 뺀 그래프 입력의 해시)로
+    캐시하므로, 제목만 바뀐 그래프는 워커에서 제목 띠만 다시 그립니다.
+    """
+
+    def __init__(self, executor: CPUExecutor, generator: GraphGenerator, assets: AssetStore):
+        self.executor = executor
+        self.generator = generator
+        self.assets = assets
+
+    async def render(
+        self,
+        df: pd.DataFrame,
+        x_column: str,
+        y_column: str,
+        statistics: StatisticsResult,
+        title: str = "",
+        image_mode: ImageDelivery = ImageDelivery.INLINE,
+        resolution: GraphResolution = GraphResolution.PRINT,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> GraphResult:
+        """
+        단일 그래프 렌더링
+
+        Args:
+            df: 전처리된 DataFrame
+            x_column: X축 열 이름
+            y_column: Y축 열 이름
+            statistics: 통계 분석 결과
+            title: 그래프 제목
+            image_mode: 이미지 전달 방식 (inline / url)
+            resolution: 해상도 프로필
+            image_format: 이미지 형식
+
+        Returns:
+            GraphResult: 그래프 결과
+        """
+        x = df[x_column].to_numpy(dtype=float)
+        y = df[y_column].to_numpy(dtype=float)
+        if self.generator.needs_level_of_detail(len(x)):
+            # 큰 데이터는 그릴 점만 골라 워커로 전달 (회귀는 전체 데이터로 완료됨)
+            x, y = await self.executor.run(self.generator.level_of_detail, x, y)
+
+        source = (x, y, x_column, y_column, statistics, title)
+        # 배열 해시는 데이터 크기에 비례하므로 스레드 풀에서 계산
+        body_id = await self.executor.run(self.generator.compute_body_id, x, y, x_column, y_column, statistics)
+        graph_id = self.generator.graph_id_for(body_id, title)
+        return await self._render_source(graph_id, body_id, source, resolution, image_mode, image_format)
+
+    async def render_at(
+        self,
+        graph: GraphResult,
+        resolution: GraphResolution,
+        image_mode: Optional[ImageDelivery] = None
+    ) -> Optional[GraphResult]:
+        """
+        이미 렌더링한 그래프를 다른 해상도로 다시 렌더링 (결과는 캐시)
+
+        Args:
+            graph: 기존 그래프 결과 (graph_id 필요)
+            resolution: 해상도 프로필
+            image_mode: 이미지 전달 방식 (기본: 기존 그래프와 같은 방식)
+
+        Returns:
+            Optional[GraphResult]: 기존 그래프와 같은 형식의 그래프 결과 (이미 그 해상도이거나
+                해상도와 무관한 SVG이면 graph 그대로, 원본 데이터가 캐시에 없으면 None)
+        """
+        if graph.resolution == resolution or graph.format == GraphFormat.SVG:
+            return graph
+
+        cache = self.generator.cache
+        if graph.graph_id is None or cache is None:
+            return None
+        if image_mode is None:
+            image_mode = ImageDelivery.URL if graph.asset_id else ImageDelivery.INLINE
+
+        data = await self.executor.run(cache.get, graph.graph_id)
+        if data is None:
+            return None
+        source = await self.executor.run(decode_graph_source, data)
+        body_id = await self.executor.run(self.generator.compute_body_id, *source[:5])
+        return await self._render_source(
+            graph.graph_id, body_id, source, resolution, image_mode, graph.format or GraphFormat.PNG,
+            store_source=False
+        )
+
+    async def _render_source(
+        self,
+        graph_id: str,
+        body_id: str,
+        source: GraphSource,
+        resolution: GraphResolution,
+        image_mode: ImageDelivery,
+        image_format: GraphFormat,
+        store_source: bool = True
+    ) -> GraphResult:
+        """
+        캐시 조회 → 워커 렌더링 (본문이 캐시에 있으면 제목만) → 캐시 저장 (새로 렌더링하면 원본도 저장)
+
+        캐시 조회/저장은 디스크 계층의 파일 I/O와 정리(os.walk)를 포함하므로 스레드 풀에서 수행합니다.
+        """
+        cache = self.generator.cache
+        dpi = self.generator.dpi_for(resolution)
+        if cache is None:
+            image_bytes = await self.executor.run_in_process(_render_in_worker, *source, dpi, image_format)
+            return await self._to_graph_result(
+                image_bytes, image_mode, resolution, graph_id, image_format, len(source[0])
+            )
+
+        cache_key = self.generator.cache_key_for(graph_id, resolution, image_format)
+        cached = await self.executor.run(cache.get, cache_key)
+        if cached is not None:
+            return await self._to_graph_result(
+                cached, image_mode, resolution, graph_id, image_format, len(source[0])
+            )
+
+        if image_format == GraphFormat.SVG:
+            image_bytes = await self.executor.run_in_process(_render_in_worker, *source, dpi, image_format)
+        else:
+            body_key = self.generator.body_cache_key(body_id, resolution)
+            body = await self.executor.run(cache.get, body_key)
+            if body is not None:
+                title = source[5]
+                image_bytes = await self.executor.run_in_process(_relabel_in_worker, body, title, dpi, image_format)
+            else:
+                body, image_bytes = await self.executor.run_in_process(
+                    _render_layers_in_worker, *source, dpi, image_format
+                )
+                await self.executor.run(cache.put, body_key, body)
+
+        await self.executor.run(cache.put, cache_key, image_bytes)
+        if store_source:
+            await self.executor.run(_put_graph_source, cache, graph_id, source)
+
+        return await self._to_graph_result(
+            image_bytes, image_mode, resolution, graph_id, image_format, len(source[0])
+        )
+
+    async def _to_graph_result(
+        self,
+        image_bytes: bytes,
+        image_mode: ImageDelivery,
+        resolution: GraphResolution,
+        graph_id: str,
+        image_format: GraphFormat,
+        plotted_points: int
+    ) -> GraphResult:
+        """이미지 전달 방식에 맞게 GraphResult 생성"""
+        if image_mode == ImageDelivery.URL:
+            # 저장소 I/O (로컬 디스크 / Supabase 네트워크)는 스레드 풀에서 수행
+            extension = self.generator.extension_for(image_format)
+            asset_id = await self.executor.run(self.assets.put, image_bytes, extension)
+            return GraphResult(
+                image_base64=None,
+                image_url=self.assets.url_for(asset_id),
+                asset_id=asset_id,
+                resolution=resolution,
+                graph_id=graph_id,
+                format=image_format,
+                plotted_points=plotted_points
+            )
+        return self.generator.to_graph_result(image_bytes, resolution, graph_id, image_format, plotted_points)
+
+    async def render_batch(
+        self,
+        experiments_data: List[Tuple[pd.DataFrame, str, str, StatisticsResult, str]],
+        image_mode: ImageDelivery = ImageDelivery.INLINE,
+        resolution: GraphResolution = GraphResolution.PRINT,
+        image_format: GraphFormat = GraphFormat.PNG
+    ) -> List[GraphResult]:
+        """
+        여러 그래프를 병렬로 렌더링 (입력 순서 유지)
+
+        Args:
+            experiments_data: 리스트 of (DataFrame, x_column, y_column, statistics, experiment_name) 튜플
+            image_mode: 이미지 전달 방식 (inline / url)
+            resolution: 해상도 프로필
+            image_format: 이미지 형식
+
+        Returns:
+            List[GraphResult]: 생성된 그래프 결과 리스트
+        """
+        return list(await asyncio.gather(*[
+            self.render(df, x_column, y_column, statistics, experiment_name, image_mode, resolution, image_format)
+            for df, x_column, y_column, statistics, experiment_name in experiments_data
+        ]))
+
+    async def warm_up(self) -> None:
+        """모든 워커 프로세스를 미리 기동 (초기화 함수가 각 워커에서 실행됨)"""
+        await asyncio.gather(*[
+            self.executor.run_in_process(_noop)
+            for _ in range(self.executor.process_workers)
+        ])
+
+
+# 렌더링 엔진 인스턴스 (싱글톤)
+render_engine = GraphRenderEngine(cpu_executor, graph_generator, asset_store)
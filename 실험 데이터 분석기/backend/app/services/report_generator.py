@@ -3,6 +3,7 @@ LabReportAI Report Generator
 마크다운 리포트 조립 서비스
 """
 
+import base64
 from typing import Optional, List
 
 from app.models.schemas import (
@@ -10,6 +11,7 @@ from app.models.schemas import (
     ExperimentManualInfo,
     ReportSections
 )
+from app.services.asset_store import asset_store, content_type_for
 
 
 class ReportGenerator:
@@ -30,6 +32,9 @@ class ReportGenerator:
         """
         완전한 마크다운 리포트 생성
 
+        url 모드 그래프는 에셋 저장소(로컬 디스크 / Supabase 네트워크)에서 읽으므로
+        비동기 코드에서는 cpu_executor.run으로 호출합니다.
+
         Args:
             report_title: 리포트 제목
             experiments: 실험 결과 목록
@@ -115,10 +120,12 @@ class ReportGenerator:
 
         # 그래프 이미지 (Base64 임베딩)
         lines.append("#### 그래프\n")
-        lines.append(self._embed_base64_image(
-            exp.graph.image_base64,
-            f"그림 {index}: {exp.experiment_name} - 산점도 및 추세선"
-        ))
+        caption = f"그림 {index}: {exp.experiment_name} - 산점도 및 추세선"
+        image_base64 = self._resolve_graph_base64(exp)
+        if image_base64:
+            lines.append(self._embed_base64_image(image_base64, caption))
+        elif exp.graph.image_url:
+            lines.append(f"![{caption}]({exp.graph.image_url})\n\n*{caption}*\n")
 
         return "\n".join(lines) + "\n"
 
@@ -167,16 +174,46 @@ class ReportGenerator:
             f"| y절편 (Intercept) | {stats.intercept:.6f} |",
             f"| 결정계수 (R²) | {stats.r_squared:.6f} |",
             f"| 표준 오차 | {stats.std_error:.6f} |",
+        ]
+
+        if stats.intercept_std_error is not None:
+            lines.append(f"| y절편 표준 오차 | {stats.intercept_std_error:.6f} |")
+        if stats.slope_confidence_interval is not None and stats.intercept_confidence_interval is not None:
+            level = f"{stats.confidence_level * 100:g}% " if stats.confidence_level else ""
+            slope_ci = stats.slope_confidence_interval
+            intercept_ci = stats.intercept_confidence_interval
+            lines.append(f"| 기울기 {level}신뢰구간 | {slope_ci[0]:.6f} ~ {slope_ci[1]:.6f} |")
+            lines.append(f"| y절편 {level}신뢰구간 | {intercept_ci[0]:.6f} ~ {intercept_ci[1]:.6f} |")
+
+        lines.extend([
             f"| 데이터 포인트 | {stats.data_points}개 |",
             f"| X 범위 | {stats.x_range[0]:.4f} ~ {stats.x_range[1]:.4f} |",
             f"| Y 범위 | {stats.y_range[0]:.4f} ~ {stats.y_range[1]:.4f} |",
-        ]
+        ])
 
         if stats.error_rate_percent is not None:
             lines.append(f"| 오차율 | {stats.error_rate_percent:.2f}% |")
 
         return "\n".join(lines) + "\n"
 
+    def _resolve_graph_base64(self, exp: SingleExperimentResult) -> Optional[str]:
+        """
+        그래프의 Base64 데이터 URI 반환
+
+        url 모드로 받은 그래프는 에셋 저장소에서 읽어 임베딩하므로
+        다운로드한 리포트가 서버 없이도 이미지를 포함합니다.
+        """
+        if exp.graph.image_base64:
+            return exp.graph.image_base64
+
+        if exp.graph.asset_id:
+            data = asset_store.get(exp.graph.asset_id)
+            if data is not None:
+                encoded = base64.b64encode(data).decode("utf-8")
+                return f"data:{content_type_for(exp.graph.asset_id)};base64,{encoded}"
+
+        return None
+
     def _embed_base64_image(self, image_base64: str, caption: str) -> str:
         """Base64 이미지를 마크다운에 임베딩"""
         # 이미 data:image/png;base64, 접두사가 있으면 그대로 사용
@@ -0,0 +1,96 @@
+"""
+LabReportAI Report Stream
+Gemini 스트리밍 출력을 Server-Sent Events로 전달하기 위한 섹션 파서와 이벤트 포맷
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+SECTION_MARKER_PREFIX = "<!-- SECTION:"
+SECTION_MARKER_PATTERN = re.compile(r"<!-- SECTION: (\w+) -->")
+
+# 마커 하나의 최대 길이 (이보다 긴 미완성 "<!--"는 마커가 아니라고 봄)
+_MAX_MARKER_LENGTH = 64
+
+StreamEvent = Tuple[str, Dict[str, Any]]
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """
+    SSE 이벤트 문자열 생성
+
+    Args:
+        event: 이벤트 이름 (started, section, delta, completed, error)
+        data: JSON으로 직렬화할 데이터
+
+    Returns:
+        str: "event: ...\\ndata: ...\\n\\n" 형식 문자열
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class SectionStreamParser:
+    """
+    스트리밍 텍스트에서 <!-- SECTION: name --> 마커를 감지하는 파서
+
+    청크 경계에서 잘린 마커를 놓치지 않도록 마커의 앞부분일 수 있는
+    끝부분은 다음 청크가 올 때까지 보류합니다. 마커 자체는 delta 텍스트에
+    포함하지 않으며, 섹션 구분은 GeminiService._parse_report_sections와 같습니다.
+    """
+
+    def __init__(self):
+        self.section: Optional[str] = None
+        self._pending = ""
+
+    def feed(self, chunk: str) -> List[StreamEvent]:
+        """
+        청크를 처리하고 발생한 이벤트 반환
+
+        Args:
+            chunk: 모델이 생성한 텍스트 조각
+
+        Returns:
+            List[StreamEvent]: ("section", {"name"}) 또는 ("delta", {"section", "text"}) 목록
+        """
+        buffer = self._pending + chunk
+        events: List[StreamEvent] = []
+
+        position = 0
+        for match in SECTION_MARKER_PATTERN.finditer(buffer):
+            self._append_delta(events, buffer[position:match.start()])
+            self.section = match.group(1)
+            events.append(("section", {"name": self.section}))
+            position = match.end()
+
+        rest = buffer[position:]
+        hold_from = self._partial_marker_start(rest)
+        self._append_delta(events, rest[:hold_from])
+        self._pending = rest[hold_from:]
+        return events
+
+    def close(self) -> List[StreamEvent]:
+        """스트림 종료 시 보류 중인 텍스트 반환"""
+        events: List[StreamEvent] = []
+        self._append_delta(events, self._pending)
+        self._pending = ""
+        return events
+
+    def _append_delta(self, events: List[StreamEvent], text: str) -> None:
+        if text:
+            events.append(("delta", {"section": self.section, "text": text}))
+
+    @staticmethod
+    def _partial_marker_start(text: str) -> int:
+        """마커의 앞부분일 수 있는 끝부분의 시작 위치 (없으면 len(text))"""
+        index = text.rfind("<")
+        if index == -1 or len(text) - index > _MAX_MARKER_LENGTH:
+            return len(text)
+
+        tail = text[index:]
+        if SECTION_MARKER_PREFIX.startswith(tail) or (
+            tail.startswith(SECTION_MARKER_PREFIX) and "-->" not in tail
+        ):
+            return index
+        return len(text)
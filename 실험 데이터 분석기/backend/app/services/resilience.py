@@ -0,0 +1,298 @@
+"""
+LabReportAI Resilience
+외부 API 호출용 재시도(지수 백오프 + 지터), 서킷 브레이커, 시간 예산
+
+호출 대상에 의존하지 않으며, 어떤 오류를 재시도할지는 호출하는 쪽
+(GeminiService)이 classify 함수로 결정합니다.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+# 오류 분류 결과: (재시도 사유, 서버가 알려준 대기 시간) - 재시도하지 않을 오류는 None
+RetryDecision = Optional[Tuple[str, Optional[float]]]
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출하지 않고 바로 실패한 경우"""
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        self.message = f"외부 서비스 장애로 호출을 일시 중단했습니다. {retry_after:.0f}초 후 다시 시도해주세요."
+        super().__init__(self.message)
+
+
+class RetriesExhaustedError(Exception):
+    """재시도 가능한 오류가 계속되어 포기한 경우 (마지막 오류 포함)"""
+    def __init__(self, reason: str, retry_after: Optional[float], last_error: Exception):
+        self.reason = reason
+        self.retry_after = retry_after
+        self.last_error = last_error
+        super().__init__(f"{reason}: {last_error}")
+
+
+class DeadlineExceededError(Exception):
+    """시간 예산 안에 호출을 끝내지 못한 경우"""
+    def __init__(self, budget_seconds: float):
+        self.budget_seconds = budget_seconds
+        super().__init__(f"deadline of {budget_seconds:g}s exceeded")
+
+
+class CircuitBreaker:
+    """
+    프로세스별 서킷 브레이커
+
+    - closed: 정상 호출. 연속 실패가 failure_threshold에 도달하면 open
+    - open: reset_seconds 동안 호출하지 않고 CircuitOpenError로 바로 실패
+    - half_open: reset_seconds가 지나면 시험 호출 하나만 허용하고,
+      성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+        self.opened = 0
+        self.rejected = 0
+
+    def before_call(self) -> None:
+        """
+        호출 허용 여부 확인
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있거나 시험 호출이 진행 중인 경우
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+
+            remaining = self._opened_at + self.reset_seconds - time.monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+
+            self.rejected += 1
+            raise CircuitOpenError(max(remaining, 1.0))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.opened += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def record_ignored(self) -> None:
+        """업스트림 상태와 무관한 결과 (잘못된 요청 등) - 시험 호출만 해제"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected
+            }
+
+
+class RetryPolicy:
+    """
+    재시도 정책 (full jitter 지수 백오프)
+
+    n번째 재시도 대기 시간은 0 ~ min(max_delay, base_delay * 2^n) 사이의 난수이며,
+    서버가 대기 시간(Retry-After)을 알려주면 그보다 먼저 재시도하지 않습니다.
+    남은 시간 예산 안에 대기 후 다시 호출할 수 없으면 재시도하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker
+
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.deadline_exceeded = 0
+        self._retries_by_reason: Dict[str, int] = {}
+
+    def backoff(self, retry_index: int, retry_after: Optional[float]) -> float:
+        """retry_index번째 재시도 전 대기 시간 (초)"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry_index)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    async def call_async(
+        self,
+        operation: Callable[[float], Awaitable[T]],
+        classify: Callable[[Exception], RetryDecision],
+        budget_seconds: float
+    ) -> T:
+        """
+        시간 예산 안에서 재시도하며 async 호출
+
+        Args:
+            operation: 이번 시도에 쓸 수 있는 시간(초)을 받아 호출하는 코루틴 함수
+            classify: 오류를 (재시도 사유, 대기 시간) 또는 None(재시도 안 함)으로 분류
+            budget_seconds: 대기 시간을 포함한 전체 시간 예산
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우
+            RetriesExhaustedError: 재시도 가능한 오류가 계속된 경우
+            DeadlineExceededError: 시간 예산을 모두 쓴 경우
+            Exception: 재시도하지 않는 오류는 그대로 전달
+        """
+        deadline = time.monotonic() + budget_seconds
+        self._record("calls")
+        retry_index = 0
+        while True:
+            if self.breaker is not None:
+                self.breaker.before_call()
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._give_up_on_deadline(budget_seconds)
+            self._record("attempts")
+            try:
+                result = await operation(remaining)
+            except Exception as error:
+                delay = self._after_failure(error, classify, retry_index, deadline, budget_seconds)
+                await asyncio.sleep(delay)
+                retry_index += 1
+                continue
+            except BaseException:
+                # 취소 등으로 결과를 알 수 없으면 시험 호출 자리만 반납
+                if self.breaker is not None:
+                    self.breaker.record_ignored()
+                raise
+
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return result
+
+    def call(
+        self,
+        operation: Callable[[float], T],
+        classify: Callable[[Exception], RetryDecision],
+        budget_seconds: float
+    ) -> T:
+        """시간 예산 안에서 재시도하며 동기 호출 (call_async와 같은 규칙)"""
+        deadline = time.monotonic() + budget_seconds
+        self._record("calls")
+        retry_index = 0
+        while True:
+            if self.breaker is not None:
+                self.breaker.before_call()
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._give_up_on_deadline(budget_seconds)
+            self._record("attempts")
+            try:
+                result = operation(remaining)
+            except Exception as error:
+                delay = self._after_failure(error, classify, retry_index, deadline, budget_seconds)
+                time.sleep(delay)
+                retry_index += 1
+                continue
+            except BaseException:
+                # 취소 등으로 결과를 알 수 없으면 시험 호출 자리만 반납
+                if self.breaker is not None:
+                    self.breaker.record_ignored()
+                raise
+
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return result
+
+    def _after_failure(
+        self,
+        error: Exception,
+        classify: Callable[[Exception], RetryDecision],
+        retry_index: int,
+        deadline: float,
+        budget_seconds: float
+    ) -> float:
+        """실패한 시도 처리 후 재시도 전 대기 시간 반환 (재시도하지 않으면 예외)"""
+        decision = classify(error)
+        if decision is None:
+            if self.breaker is not None:
+                self.breaker.record_ignored()
+            raise error
+
+        reason, retry_after = decision
+        if self.breaker is not None:
+            self.breaker.record_failure()
+
+        if isinstance(error, DeadlineExceededError):
+            self._give_up_on_deadline(budget_seconds)
+
+        delay = self.backoff(retry_index, retry_after)
+        if retry_index + 1 >= self.max_attempts or time.monotonic() + delay >= deadline:
+            with self._lock:
+                self.exhausted += 1
+            raise RetriesExhaustedError(reason, retry_after, error) from error
+
+        with self._lock:
+            self.retries += 1
+            self._retries_by_reason[reason] = self._retries_by_reason.get(reason, 0) + 1
+        return delay
+
+    def _give_up_on_deadline(self, budget_seconds: float) -> None:
+        with self._lock:
+            self.deadline_exceeded += 1
+        raise DeadlineExceededError(budget_seconds)
+
+    def _record(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """재시도 통계 반환 (서킷 브레이커 상태 포함)"""
+        with self._lock:
+            stats = {
+                "calls": self.calls,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "retries_by_reason": dict(self._retries_by_reason),
+                "exhausted": self.exhausted,
+                "deadline_exceeded": self.deadline_exceeded
+            }
+        stats["circuit"] = self.breaker.get_stats() if self.breaker is not None else None
+        return stats
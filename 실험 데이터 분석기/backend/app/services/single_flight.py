@@ -0,0 +1,127 @@
+"""
+LabReportAI Single Flight
+같은 입력(파일 해시 + 정규화된 파라미터)으로 동시에 들어온 분석 요청을
+하나의 계산으로 병합하는 요청 병합 계층
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from pydantic import BaseModel
+
+
+T = TypeVar("T")
+
+
+def make_request_key(name: str, content_hash: str, params: Dict[str, Any]) -> str:
+    """
+    요청 병합 키 생성 (엔드포인트 이름 + 파일 해시 + 정규화된 파라미터의 SHA-256)
+
+    pydantic 모델은 필드 값으로 바꾸고 dict 키는 정렬하므로, JSON 문자열의
+    공백이나 키 순서만 다른 요청은 같은 키가 됩니다.
+
+    Args:
+        name: 엔드포인트 이름 (예: "analyze_batch")
+        content_hash: 업로드 파일 내용의 SHA-256 (upload_id)
+        params: 결과에 영향을 주는 요청 파라미터
+
+    Returns:
+        str: 64자리 16진수 키
+    """
+    payload = json.dumps(
+        [name, content_hash, _normalize(params)],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _normalize(value: Any) -> Any:
+    """JSON으로 직렬화할 수 있는 값으로 변환"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+class SingleFlight:
+    """
+    진행 중인 계산 공유 (single-flight)
+
+    같은 키의 계산이 진행 중이면 새로 계산하지 않고 그 결과를 함께 기다립니다.
+    계산이 끝나면 키를 바로 제거하므로 결과를 보관하지 않으며(캐시가 아님),
+    이후 요청은 다시 계산합니다. 계산은 shield로 보호되므로 먼저 요청한
+    클라이언트가 연결을 끊어도 기다리는 다른 요청에는 영향이 없고, 계산이
+    실패하면 기다리던 모든 요청에 같은 예외가 전달됩니다.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+        self.executions = 0
+        self.deduplicated = 0
+        self._by_name: Dict[str, Dict[str, int]] = {}
+
+    async def do(self, name: str, key: str, compute: Callable[[], Awaitable[T]]) -> T:
+        """
+        같은 키의 계산이 진행 중이면 그 결과를, 아니면 새로 계산한 결과를 반환
+
+        Args:
+            name: 통계용 엔드포인트 이름
+            key: make_request_key로 만든 키
+            compute: 결과를 계산하는 코루틴 함수
+
+        Returns:
+            계산 결과 (병합된 요청은 같은 객체를 공유하므로 수정하지 말 것)
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self._record(name, deduplicated=False)
+            task = asyncio.ensure_future(compute())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._record(name, deduplicated=True)
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        self._in_flight.pop(key, None)
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 처리되지 않았다는 경고를 남기지 않음
+        if not task.cancelled():
+            task.exception()
+
+    def _record(self, name: str, deduplicated: bool) -> None:
+        with self._lock:
+            counts = self._by_name.setdefault(name, {"executions": 0, "deduplicated": 0})
+            if deduplicated:
+                self.deduplicated += 1
+                counts["deduplicated"] += 1
+            else:
+                self.executions += 1
+                counts["executions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요청 병합 통계 반환 (병합된 요청 수 포함)"""
+        with self._lock:
+            requests = self.executions + self.deduplicated
+            return {
+                "in_flight": len(self._in_flight),
+                "requests": requests,
+                "executions": self.executions,
+                "deduplicated": self.deduplicated,
+                "dedup_rate": round(self.deduplicated / requests, 4) if requests else 0.0,
+                "by_name": {name: dict(counts) for name, counts in self._by_name.items()}
+            }
+
+
+# 분석 요청 병합 인스턴스 (싱글톤)
+analysis_flight = SingleFlight()
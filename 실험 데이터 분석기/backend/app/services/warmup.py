@@ -0,0 +1,77 @@
+"""
+LabReportAI Warm-up
+워커가 요청을 받기 전에 첫 요청에서 생기는 지연을 미리 없애는 예열 단계
+
+- 렌더링 워커 프로세스 기동 (matplotlib 임포트, 스타일/폰트 캐시 로딩)
+- Gemini 클라이언트 생성 (API 키가 설정된 경우)
+- 작은 합성 CSV로 /api/analyze/data와 같은 파싱 → 분석 → 렌더링 경로 실행
+"""
+
+import time
+from typing import Dict
+
+from app.config import settings
+from app.models.schemas import GraphResolution, ImageDelivery
+from app.services.analysis_engine import analysis_service
+from app.services.gemini_service import get_gemini_service
+from app.services.render_engine import render_engine
+from app.utils.executor import cpu_executor
+from app.utils.file_parser import parse_tabular_upload, validate_columns
+from app.utils.upload_reader import SpooledUpload
+
+
+# 합성 요청 데이터 (옴의 법칙 형태의 작은 CSV)
+_SYNTHETIC_CSV = b"voltage,current\n" + b"".join(
+    f"{v},{v / 100 + (0.001 if v % 2 else -0.001):.4f}\n".encode() for v in range(1, 11)
+)
+
+
+async def run_synthetic_analysis() -> None:
+    """합성 CSV로 파싱 → 열 검증 → 통계 분석 → 그래프 렌더링 한 번 실행"""
+    upload = SpooledUpload.from_bytes(_SYNTHETIC_CSV)
+    df = await parse_tabular_upload(upload, ".csv", ["voltage", "current"])
+    await cpu_executor.run(validate_columns, df, "voltage", "current")
+    statistics, _, cleaned_df = await cpu_executor.run(
+        analysis_service.analyze_dataframe,
+        df=df,
+        x_column="voltage",
+        y_column="current",
+        theoretical_slope=0.01
+    )
+    await render_engine.render(
+        df=cleaned_df,
+        x_column="voltage",
+        y_column="current",
+        statistics=statistics,
+        title="warmup",
+        image_mode=ImageDelivery.INLINE,
+        resolution=GraphResolution.PREVIEW
+    )
+
+
+async def warm_up_application() -> Dict[str, float]:
+    """
+    워커 예열 (서버 시작 이벤트에서 호출)
+
+    Returns:
+        Dict[str, float]: 단계별 소요 시간(초) - render_workers, gemini_client, synthetic_request
+
+    Raises:
+        Exception: 합성 요청이 실패한 경우 (분석/렌더링 경로 오류를 기동 단계에서 드러냄)
+    """
+    timings: Dict[str, float] = {}
+
+    started = time.perf_counter()
+    await render_engine.warm_up()
+    timings["render_workers"] = time.perf_counter() - started
+
+    if settings.gemini_api_key:
+        started = time.perf_counter()
+        get_gemini_service()
+        timings["gemini_client"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await run_synthetic_analysis()
+    timings["synthetic_request"] = time.perf_counter() - started
+
+    return timings
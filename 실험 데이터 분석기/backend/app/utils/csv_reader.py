@@ -0,0 +1,216 @@
+"""
+LabReportAI CSV Reader
+실험 장비 CSV 내보내기 파일용 읽기 엔진 (인코딩/구분자/헤더 행 감지, 필요한 열만 읽기)
+"""
+
+import codecs
+import csv
+import io
+import re
+from typing import BinaryIO, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from app.config import settings
+
+try:
+    import pyarrow  # noqa: F401 - 설치되어 있으면 pandas의 pyarrow 엔진 사용
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+SNIFF_BYTES = 64 * 1024
+CANDIDATE_DELIMITERS = [",", ";", "\t", "|"]
+
+# 셀 앞부분의 숫자 (예: "12.5 V", "3.2e-3s" → 12.5, 0.0032)
+_LEADING_NUMBER = r"^\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)"
+_STARTS_WITH_NUMBER = re.compile(r"^\s*[-+]?(?:\d|[.,]\d)")
+_DECIMAL_COMMA_PATTERN = re.compile(r"^\s*[-+]?\d+,\d+\s*$")
+
+
+class CsvFormat:
+    """
+    감지된 CSV 형식
+
+    Attributes:
+        encoding: 문자 인코딩 (utf-8-sig, utf-8, cp949)
+        delimiter: 구분자
+        decimal: 소수점 문자 ("." 또는 ",")
+        header_row: 헤더 행 번호 (앞쪽 설명 행 수)
+        columns: 열 이름 목록 (pandas 규칙으로 정규화)
+    """
+
+    def __init__(self, encoding: str, delimiter: str, decimal: str, header_row: int, columns: List[str]):
+        self.encoding = encoding
+        self.delimiter = delimiter
+        self.decimal = decimal
+        self.header_row = header_row
+        self.columns = columns
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    인코딩 감지 (UTF-8 BOM → UTF-8 → CP949)
+
+    CP949는 EUC-KR의 상위 집합이므로 한국어 장비/엑셀 내보내기 파일을 모두 읽습니다.
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # 샘플 끝에서 잘린 멀티바이트 문자는 무시
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def detect_delimiter(lines: List[str]) -> str:
+    """줄마다 같은 개수로 나타나는 후보 구분자 선택 (없으면 가장 많이 나타나는 후보)"""
+    text = "\n".join(lines)
+    try:
+        return csv.Sniffer().sniff(text, delimiters="".join(CANDIDATE_DELIMITERS)).delimiter
+    except csv.Error:
+        counts = {d: text.count(d) for d in CANDIDATE_DELIMITERS}
+        return max(counts, key=counts.get) if max(counts.values()) > 0 else ","
+
+
+def detect_header_row(rows: List[List[str]]) -> int:
+    """
+    헤더 행 감지
+
+    장비 내보내기 파일은 데이터 위에 장비명, 측정 일시 같은 설명 행이
+    있는 경우가 많습니다. 가장 흔한 열 개수를 가진 행 중, 숫자로 시작하는
+    칸이 절반 미만이고 다음 행보다 적은 첫 행을 헤더로 봅니다.
+    """
+    field_counts = [len(row) for row in rows]
+    if not field_counts:
+        return 0
+    # 가장 흔한 열 개수 (같으면 더 많은 쪽 - 설명 행은 보통 열이 적음)
+    common = max(set(field_counts), key=lambda count: (field_counts.count(count), count))
+    if common < 2:
+        return 0
+
+    for i in range(len(rows) - 1):
+        if field_counts[i] != common:
+            continue
+        header_ratio = _numeric_ratio(rows[i])
+        if header_ratio < 0.5 and _numeric_ratio(rows[i + 1]) > header_ratio:
+            return i
+    return next(i for i, count in enumerate(field_counts) if count == common)
+
+
+def _numeric_ratio(row: List[str]) -> float:
+    fields = [f for f in row if f.strip()]
+    if not fields:
+        return 0.0
+    return sum(1 for f in fields if _STARTS_WITH_NUMBER.match(f)) / len(fields)
+
+
+def sniff_csv_format(source: BinaryIO) -> CsvFormat:
+    """
+    파일 앞부분(64KB)으로 CSV 형식 감지 (읽은 뒤 파일 위치는 처음으로 되돌림)
+
+    Args:
+        source: CSV 파일 객체
+
+    Returns:
+        CsvFormat: 감지된 형식
+    """
+    sample = source.read(SNIFF_BYTES)
+    source.seek(0)
+
+    encoding = detect_encoding(sample)
+    text = sample.decode(encoding, errors="replace")
+    lines = text.splitlines()
+    if len(sample) == SNIFF_BYTES and len(lines) > 1:
+        lines = lines[:-1]  # 잘렸을 수 있는 마지막 줄 제외
+
+    delimiter = detect_delimiter(lines[:20])
+    rows = list(csv.reader(lines[:50], delimiter=delimiter))
+    header_row = detect_header_row(rows)
+
+    data_fields = [f for row in rows[header_row + 1:] for f in row]
+    decimal = "," if delimiter != "," and any(_DECIMAL_COMMA_PATTERN.match(f) for f in data_fields) else "."
+
+    columns = pd.read_csv(
+        io.StringIO("\n".join(lines[header_row:header_row + 1])),
+        sep=delimiter,
+        nrows=0
+    ).columns.tolist()
+
+    return CsvFormat(encoding, delimiter, decimal, header_row, [str(c) for c in columns])
+
+
+def read_csv_columns(
+    source: BinaryIO,
+    csv_format: CsvFormat,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    감지된 형식으로 CSV 읽기 (columns를 지정하면 해당 열만 읽고 숫자로 변환)
+
+    pyarrow가 설치되어 있고 설정이 허용하면 pyarrow 엔진을 사용하며,
+    실패하면 기본 C 엔진으로 다시 읽습니다.
+
+    Args:
+        source: CSV 파일 객체
+        csv_format: sniff_csv_format 결과
+        columns: 읽을 열 목록 (None이면 전체 열, 숫자 변환 없음)
+
+    Returns:
+        pd.DataFrame: 읽은 데이터
+    """
+    options = dict(
+        sep=csv_format.delimiter,
+        encoding=csv_format.encoding,
+        decimal=csv_format.decimal,
+        skiprows=csv_format.header_row,
+        usecols=columns
+    )
+
+    df = None
+    if PYARROW_AVAILABLE and settings.csv_engine in ("auto", "pyarrow"):
+        try:
+            df = pd.read_csv(source, engine="pyarrow", **options)
+        except Exception:
+            source.seek(0)
+    if df is None:
+        df = pd.read_csv(source, engine="c", **options)
+
+    if columns:
+        # usecols는 파일 순서로 반환하므로 요청 순서로 정렬 후 한 번만 숫자 변환
+        df = df[columns]
+        for column in columns:
+            df[column] = coerce_numeric(df[column], csv_format.decimal)
+    return df
+
+
+def coerce_numeric(series: pd.Series, decimal: str = ".") -> pd.Series:
+    """
+    열을 숫자형으로 변환 (이미 숫자형이면 그대로 반환)
+
+    단위가 붙은 값("12.5 V")은 앞부분의 숫자를 사용하고, 숫자가 없는 값은 NaN이 됩니다.
+    """
+    if is_numeric_dtype(series):
+        return series
+
+    values = series.astype(object)
+    if decimal == ",":
+        values = values.str.replace(",", ".", regex=False)
+
+    numeric = pd.Series(_to_float(values), index=series.index, name=series.name)
+
+    # 숫자로 바로 변환되지 않은 값만 앞부분 숫자 추출 (대부분의 행은 건너뜀)
+    unparsed = numeric.isna() & values.notna()
+    if unparsed.any():
+        extracted = values[unparsed].astype(str).str.extract(_LEADING_NUMBER, expand=False)
+        numeric[unparsed] = _to_float(extracted)
+    return numeric
+
+
+def _to_float(values: pd.Series) -> np.ndarray:
+    """object 열을 float64 배열로 변환 (변환할 수 없는 값은 NaN)"""
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
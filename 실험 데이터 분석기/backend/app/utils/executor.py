@@ -0,0 +1,171 @@
+"""
+LabReportAI CPU Executor
+CPU 집약 작업(파싱, 분석, 그래프 렌더링)을 이벤트 루프 밖에서 실행하는 실행기 계층
+"""
+
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.config import settings
+
+
+class ExecutorSaturatedError(Exception):
+    """실행기 대기열이 가득 찼을 때 발생하는 예외"""
+    def __init__(self, retry_after: int, message: str = "서버가 혼잡합니다. 잠시 후 다시 시도해주세요."):
+        self.retry_after = retry_after
+        self.message = message
+        super().__init__(message)
+
+
+class CPUExecutor:
+    """
+    제한된 크기의 CPU 작업 실행기
+
+    - 스레드 풀: pandas 파싱, 통계 분석 등 (numpy가 GIL을 일부 해제)
+    - 프로세스 풀: matplotlib 렌더링 등 GIL을 오래 잡는 작업
+
+    대기 중 + 실행 중인 작업 수가 max_pending_tasks를 넘으면
+    ExecutorSaturatedError를 발생시켜 요청을 즉시 거절합니다.
+    """
+
+    def __init__(
+        self,
+        thread_workers: int,
+        process_workers: int,
+        max_pending_tasks: int,
+        retry_after_seconds: int
+    ):
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self.max_pending_tasks = max_pending_tasks
+        self.retry_after_seconds = retry_after_seconds
+
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_initializer: Optional[Callable[[], None]] = None
+
+        # 이벤트 루프 스레드에서만 변경되므로 별도 잠금이 필요 없음
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """스레드 풀 반환 (지연 생성)"""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers,
+                thread_name_prefix="cpu-worker"
+            )
+        return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """프로세스 풀 반환 (지연 생성)"""
+        if self._process_pool is None:
+            # fork는 스레드가 있는 프로세스에서 안전하지 않으므로 spawn 사용
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self._process_initializer
+            )
+        return self._process_pool
+
+    def set_process_initializer(self, initializer: Optional[Callable[[], None]]) -> None:
+        """
+        프로세스 풀 워커 초기화 함수 지정 (모듈 수준 함수여야 함)
+
+        이미 생성된 풀에는 적용되지 않으므로 풀 생성 전에 호출해야 합니다.
+        """
+        if self._process_pool is not None:
+            raise RuntimeError("프로세스 풀이 이미 생성되어 초기화 함수를 변경할 수 없습니다.")
+        self._process_initializer = initializer
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        함수를 스레드 풀에서 실행
+
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            ExecutorSaturatedError: 대기열이 가득 찬 경우
+        """
+        return await self._submit(self._get_thread_pool(), func, *args, **kwargs)
+
+    async def run_in_process(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        함수를 프로세스 풀에서 실행 (함수와 인자는 pickle 가능해야 함)
+
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            ExecutorSaturatedError: 대기열이 가득 찬 경우
+        """
+        return await self._submit(self._get_process_pool(), func, *args, **kwargs)
+
+    async def _submit(self, pool: Executor, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """대기열 한도를 확인한 뒤 작업 제출"""
+        if self._pending >= self.max_pending_tasks:
+            self._rejected += 1
+            raise ExecutorSaturatedError(retry_after=self.retry_after_seconds)
+
+        loop = asyncio.get_running_loop()
+        future = pool.submit(functools.partial(func, *args, **kwargs))
+        self._pending += 1
+        # 대기 중인 코루틴이 취소되어도 풀의 작업은 계속 실행되므로
+        # 작업이 실제로 끝났을 때(풀 future 완료) 카운트를 줄임
+        future.add_done_callback(lambda _: self._schedule_task_done(loop))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _schedule_task_done(self, loop: asyncio.AbstractEventLoop) -> None:
+        """풀 future 완료 콜백 (워커 스레드에서 호출될 수 있으므로 이벤트 루프로 넘김)"""
+        try:
+            loop.call_soon_threadsafe(self._task_done)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힌 경우 (종료 중)
+            self._task_done()
+
+    def _task_done(self) -> None:
+        """작업 완료 처리"""
+        self._pending -= 1
+        self._completed += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """실행기 상태 반환"""
+        return {
+            "pending": self._pending,
+            "max_pending": self.max_pending_tasks,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "thread_workers": self.thread_workers,
+            "process_workers": self.process_workers
+        }
+
+    def shutdown(self) -> None:
+        """풀 종료"""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+
+# 실행기 인스턴스 (싱글톤)
+cpu_executor = CPUExecutor(
+    thread_workers=settings.cpu_thread_workers,
+    process_workers=settings.cpu_process_workers,
+    max_pending_tasks=settings.cpu_max_pending_tasks,
+    retry_after_seconds=settings.cpu_retry_after_seconds
+)
@@ -4,12 +4,18 @@ CSV/Excel/PDF 파일 파싱 유틸리티
 """
 
 import pandas as pd
+import openpyxl
+from pandas.api.types import is_numeric_dtype
 from fastapi import UploadFile
-from typing import List, Dict
+from typing import BinaryIO, List, Dict, Optional, Tuple, Union
 import io
 
 from app.config import settings
-from app.models.schemas import ErrorCode, SheetInfo
+from app.models.schemas import ErrorCode, SheetInfo, ExperimentConfig
+from app.utils.executor import cpu_executor, ExecutorSaturatedError
+from app.utils.workbook_cache import workbook_cache, CachedWorkbook
+from app.utils.upload_reader import read_upload, SpooledUpload, UploadTooLargeError
+from app.utils.csv_reader import sniff_csv_format, read_csv_columns
 
 
 class FileParserError(Exception):
@@ -20,12 +26,13 @@ class FileParserError(Exception):
         super().__init__(message)
 
 
-async def parse_uploaded_file(file: UploadFile) -> pd.DataFrame:
+async def parse_uploaded_file(file: UploadFile, columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     업로드된 파일을 DataFrame으로 변환
     
     Args:
         file: FastAPI UploadFile 객체
+        columns: (CSV) 읽을 열 목록 - 지정하면 해당 열만 읽고 숫자로 변환
         
     Returns:
         pd.DataFrame: 파싱된 데이터
@@ -33,6 +40,23 @@ async def parse_uploaded_file(file: UploadFile) -> pd.DataFrame:
     Raises:
         FileParserError: 파일 파싱 실패 시
     """
+    upload, extension = await read_tabular_upload(file)
+    return await parse_tabular_upload(upload, extension, columns)
+
+
+async def read_tabular_upload(file: UploadFile) -> Tuple[SpooledUpload, str]:
+    """
+    CSV/Excel 업로드를 확장자 확인 후 크기 제한을 적용하며 읽기 (파싱은 하지 않음)
+
+    Args:
+        file: FastAPI UploadFile 객체
+
+    Returns:
+        Tuple[SpooledUpload, str]: (읽은 업로드 (sha256 포함), 확장자)
+
+    Raises:
+        FileParserError: 파일 형식/크기 오류 시
+    """
     # 파일 확장자 확인
     filename = file.filename or ""
     extension = "." + filename.split(".")[-1].lower() if "." in filename else ""
@@ -43,27 +67,37 @@ async def parse_uploaded_file(file: UploadFile) -> pd.DataFrame:
             message=f"지원하지 않는 파일 형식입니다. 허용 형식: {', '.join(settings.allowed_extensions)}"
         )
     
-    # 파일 크기 확인
-    content = await file.read()
-    file_size_mb = len(content) / (1024 * 1024)
-    
-    if file_size_mb > settings.max_file_size_mb:
-        raise FileParserError(
-            code=ErrorCode.FILE_TOO_LARGE,
-            message=f"파일 크기가 너무 큽니다. 최대 {settings.max_file_size_mb}MB까지 허용됩니다."
-        )
-    
-    # 파일 파싱
+    # 파일 크기를 확인하며 읽기
+    upload = await read_upload_limited(file, settings.max_file_size_mb)
+    return upload, extension
+
+
+async def parse_tabular_upload(
+    upload: SpooledUpload,
+    extension: str,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    read_tabular_upload로 읽은 업로드를 DataFrame으로 변환
+
+    Args:
+        upload: 읽은 업로드
+        extension: 파일 확장자 (.csv, .xlsx, .xls)
+        columns: (CSV) 읽을 열 목록 - 지정하면 해당 열만 읽고 숫자로 변환
+
+    Returns:
+        pd.DataFrame: 파싱된 데이터
+
+    Raises:
+        FileParserError: 파일 파싱 실패 시
+    """
+    # 파일 파싱 (CPU 작업이므로 실행기에서 수행)
     try:
-        if extension == ".csv":
-            # CSV 파일
-            df = pd.read_csv(io.BytesIO(content))
-        else:
-            # Excel 파일 (.xlsx, .xls)
-            df = pd.read_excel(io.BytesIO(content))
-        
-        return df
-        
+        return await cpu_executor.run(_read_tabular, upload, extension, columns)
+
+    except (ExecutorSaturatedError, FileParserError):
+        raise
+
     except Exception as e:
         raise FileParserError(
             code=ErrorCode.INVALID_FILE_FORMAT,
@@ -71,6 +105,50 @@ async def parse_uploaded_file(file: UploadFile) -> pd.DataFrame:
         )
 
 
+def _read_tabular(upload: SpooledUpload, extension: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """업로드 데이터를 확장자에 맞게 DataFrame으로 변환 (동기)"""
+    with upload.open() as source:
+        if extension == ".csv":
+            # CSV 파일 (인코딩/구분자/헤더 행 감지 후 필요한 열만 읽기)
+            csv_format = sniff_csv_format(source)
+            for column in columns or []:
+                if column not in csv_format.columns:
+                    raise FileParserError(
+                        code=ErrorCode.COLUMN_NOT_FOUND,
+                        message=f"'{column}' 열을 찾을 수 없습니다. 사용 가능한 열: {csv_format.columns}"
+                    )
+            return read_csv_columns(source, csv_format, columns)
+        # Excel 파일 (.xlsx, .xls)
+        return pd.read_excel(source)
+
+
+async def read_upload_limited(file: UploadFile, max_size_mb: float, label: str = "파일") -> SpooledUpload:
+    """
+    크기 제한을 적용하며 업로드 파일 읽기
+
+    전체를 메모리에 올린 뒤 확인하지 않고, 청크 단위로 읽다가 제한을
+    넘는 순간 중단합니다. 큰 파일은 임시 파일로 spool됩니다.
+
+    Args:
+        file: FastAPI UploadFile 객체
+        max_size_mb: 최대 허용 크기 (MB)
+        label: 에러 메시지에 쓸 파일 종류 (예: "PDF 파일")
+
+    Returns:
+        SpooledUpload: 읽은 업로드 데이터
+
+    Raises:
+        FileParserError: 크기 제한 초과 시 (FILE_TOO_LARGE)
+    """
+    try:
+        return await read_upload(file, max_size_mb)
+    except UploadTooLargeError:
+        raise FileParserError(
+            code=ErrorCode.FILE_TOO_LARGE,
+            message=f"{label} 크기가 너무 큽니다. 최대 {max_size_mb}MB까지 허용됩니다."
+        )
+
+
 def get_numeric_columns(df: pd.DataFrame) -> List[str]:
     """
     DataFrame에서 숫자형 열 목록 반환
@@ -110,10 +188,11 @@ def validate_columns(df: pd.DataFrame, x_column: str, y_column: str) -> None:
             message=f"'{y_column}' 열을 찾을 수 없습니다. 사용 가능한 열: {available_columns}"
         )
     
-    # 숫자형 변환 시도
+    # 숫자형 변환 시도 (CSV 엔진에서 이미 변환된 열은 건너뜀)
     try:
-        df[x_column] = pd.to_numeric(df[x_column], errors='coerce')
-        df[y_column] = pd.to_numeric(df[y_column], errors='coerce')
+        for column in (x_column, y_column):
+            if not is_numeric_dtype(df[column]):
+                df[column] = pd.to_numeric(df[column], errors='coerce')
     except Exception as e:
         raise FileParserError(
             code=ErrorCode.INVALID_FILE_FORMAT,
@@ -125,18 +204,37 @@ def validate_columns(df: pd.DataFrame, x_column: str, y_column: str) -> None:
 # Multi-Sheet Excel Parsing (멀티시트 지원)
 # ============================================================
 
-async def parse_excel_all_sheets(file: UploadFile) -> Dict[str, pd.DataFrame]:
+async def load_excel_workbook(file: UploadFile) -> Tuple[str, CachedWorkbook]:
     """
-    Excel 파일의 모든 시트를 파싱하여 Dict로 반환
+    업로드된 Excel 파일을 upload_id와 함께 반환 (시트는 아직 읽지 않음)
+
+    같은 내용의 파일이 이미 캐시에 있으면 그 워크북(이미 읽은 시트 포함)을 반환합니다.
 
     Args:
         file: FastAPI UploadFile 객체 (Excel 파일)
 
     Returns:
-        Dict[str, pd.DataFrame]: {시트이름: DataFrame} 형태
+        Tuple[str, CachedWorkbook]: (upload_id, 워크북)
 
     Raises:
-        FileParserError: 파일 파싱 실패 시
+        FileParserError: 파일 형식/크기 오류 시
+    """
+    upload, extension = await read_excel_upload(file)
+    return upload.sha256, cache_excel_upload(upload, extension)
+
+
+async def read_excel_upload(file: UploadFile) -> Tuple[SpooledUpload, str]:
+    """
+    Excel 업로드를 확장자 확인 후 크기 제한을 적용하며 읽기 (캐시/파싱은 하지 않음)
+
+    Args:
+        file: FastAPI UploadFile 객체 (Excel 파일)
+
+    Returns:
+        Tuple[SpooledUpload, str]: (읽은 업로드 (sha256 = upload_id), 확장자)
+
+    Raises:
+        FileParserError: 파일 형식/크기 오류 시
     """
     filename = file.filename or ""
     extension = "." + filename.split(".")[-1].lower() if "." in filename else ""
@@ -147,28 +245,213 @@ async def parse_excel_all_sheets(file: UploadFile) -> Dict[str, pd.DataFrame]:
             message="멀티시트 파싱은 Excel 파일(.xlsx, .xls)만 지원합니다."
         )
 
-    content = await file.read()
-    await file.seek(0)  # 파일 포인터 초기화
+    # 크기 확인과 해시 계산을 읽으면서 함께 수행
+    upload = await read_upload_limited(file, settings.max_file_size_mb)
+    return upload, extension
+
+
+def cache_excel_upload(upload: SpooledUpload, extension: str) -> CachedWorkbook:
+    """
+    읽은 Excel 업로드를 워크북 캐시에 등록 (같은 내용이 이미 있으면 그 워크북 반환)
+
+    Args:
+        upload: read_excel_upload로 읽은 업로드
+        extension: 파일 확장자 (.xlsx, .xls)
+
+    Returns:
+        CachedWorkbook: 워크북
+    """
+    upload_id = upload.sha256
+    workbook = workbook_cache.get(upload_id)
+    if workbook is None:
+        workbook = CachedWorkbook(upload, extension)
+        workbook_cache.put(upload_id, workbook)
+    return workbook
+
+
+async def parse_excel_all_sheets(
+    file: UploadFile,
+    required: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Excel 파일의 시트를 파싱하여 Dict로 반환
+
+    Args:
+        file: FastAPI UploadFile 객체 (Excel 파일)
+        required: {시트이름: 열 목록} - 지정하면 해당 시트와 열만 읽음 (None이면 전체)
+
+    Returns:
+        Dict[str, pd.DataFrame]: {시트이름: DataFrame} 형태
+
+    Raises:
+        FileParserError: 파일 파싱 실패 시
+    """
+    upload, extension = await read_excel_upload(file)
+    return await parse_excel_upload(upload, extension, required)
+
+
+async def parse_excel_upload(
+    upload: SpooledUpload,
+    extension: str,
+    required: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    read_excel_upload로 읽은 업로드의 시트를 파싱 (워크북 캐시에 등록)
+
+    Args:
+        upload: 읽은 업로드
+        extension: 파일 확장자 (.xlsx, .xls)
+        required: {시트이름: 열 목록} - 지정하면 해당 시트와 열만 읽음 (None이면 전체)
+
+    Returns:
+        Dict[str, pd.DataFrame]: {시트이름: DataFrame} 형태
+
+    Raises:
+        FileParserError: 파일 파싱 실패 시
+    """
+    workbook = cache_excel_upload(upload, extension)
+    sheets_data = await cpu_executor.run(load_selected_sheets, workbook, required)
+    workbook_cache.put(upload.sha256, workbook)
+    return sheets_data
+
+
+def get_cached_workbook(upload_id: str) -> CachedWorkbook:
+    """
+    upload_id로 캐시된 워크북 조회
+
+    Args:
+        upload_id: detect-sheets 응답의 업로드 ID
 
-    file_size_mb = len(content) / (1024 * 1024)
-    if file_size_mb > settings.max_file_size_mb:
+    Returns:
+        CachedWorkbook: 워크북
+
+    Raises:
+        FileParserError: 캐시에 없거나 만료된 경우 (UPLOAD_NOT_FOUND)
+    """
+    workbook = workbook_cache.get(upload_id)
+    if workbook is None:
         raise FileParserError(
-            code=ErrorCode.FILE_TOO_LARGE,
-            message=f"파일 크기가 너무 큽니다. 최대 {settings.max_file_size_mb}MB까지 허용됩니다."
+            code=ErrorCode.UPLOAD_NOT_FOUND,
+            message="업로드된 파일을 찾을 수 없거나 만료되었습니다. 파일을 다시 업로드해주세요."
         )
+    return workbook
 
-    try:
-        # 모든 시트를 Dict로 읽기
-        excel_file = pd.ExcelFile(io.BytesIO(content))
-        sheets_data: Dict[str, pd.DataFrame] = {}
 
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
-            # 빈 시트 제외
-            if not df.empty:
-                sheets_data[sheet_name] = df
+async def parse_cached_sheets(
+    upload_id: str,
+    required: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    upload_id로 캐시된 워크북에서 시트를 파싱 (파일 재업로드 불필요)
 
-        return sheets_data
+    Args:
+        upload_id: detect-sheets 응답의 업로드 ID
+        required: {시트이름: 열 목록} - 지정하면 해당 시트와 열만 읽음 (None이면 전체)
+
+    Returns:
+        Dict[str, pd.DataFrame]: {시트이름: DataFrame} 형태
+
+    Raises:
+        FileParserError: upload_id가 없거나 파싱 실패 시
+    """
+    workbook = get_cached_workbook(upload_id)
+    sheets_data = await cpu_executor.run(load_selected_sheets, workbook, required)
+    workbook_cache.put(upload_id, workbook)
+    return sheets_data
+
+
+async def parse_cached_first_sheet(upload_id: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    upload_id로 캐시된 워크북의 첫 번째 시트를 파싱 (/api/analyze/data용)
+
+    Args:
+        upload_id: detect-sheets 응답의 업로드 ID
+        columns: 읽을 열 목록 (None이면 전체)
+
+    Returns:
+        pd.DataFrame: 첫 번째 시트 데이터
+
+    Raises:
+        FileParserError: upload_id가 없거나 파싱 실패 시
+    """
+    workbook = get_cached_workbook(upload_id)
+    df = await cpu_executor.run(load_first_sheet, workbook, columns)
+    workbook_cache.put(upload_id, workbook)
+    return df
+
+
+def required_sheet_columns(experiments: List[ExperimentConfig]) -> Dict[str, List[str]]:
+    """
+    실험 설정 목록에서 읽어야 할 {시트이름: 열 목록} 추출
+
+    Args:
+        experiments: 실험 설정 목록
+
+    Returns:
+        Dict[str, List[str]]: 시트별 필요한 열 (x_column, y_column)
+    """
+    required: Dict[str, List[str]] = {}
+    for exp in experiments:
+        columns = required.setdefault(exp.sheet_name, [])
+        for column in (exp.x_column, exp.y_column):
+            if column not in columns:
+                columns.append(column)
+    return required
+
+
+def load_first_sheet(workbook: CachedWorkbook, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    워크북의 첫 번째 시트 반환 (pd.read_excel 기본 동작과 동일, 동기)
+
+    캐시된 DataFrame을 여러 요청이 공유하므로 얕은 복사본을 반환합니다.
+
+    Args:
+        workbook: 워크북
+        columns: 읽을 열 목록 (None이면 전체)
+
+    Returns:
+        pd.DataFrame: 첫 번째 시트 데이터 (빈 시트면 빈 DataFrame)
+    """
+    read_workbook_metadata(workbook)
+    first_sheet = workbook.sheet_names[0] if workbook.sheet_names else None
+    if first_sheet is None or first_sheet not in {info.sheet_name for info in workbook.sheet_infos}:
+        return pd.DataFrame()
+
+    sheets_data = load_selected_sheets(workbook, {first_sheet: columns} if columns else [first_sheet])
+    return sheets_data[first_sheet].copy(deep=False)
+
+
+def read_workbook_metadata(workbook: CachedWorkbook) -> List[SheetInfo]:
+    """
+    시트별 열 이름, 행 수, 샘플 5행만 읽기 (동기)
+
+    .xlsx는 openpyxl read-only 모드로 행을 스트리밍하며 헤더, 샘플, 행 수만 계산하고
+    DataFrame은 만들지 않습니다. 행 수는 pandas와 같게 끝의 빈 행을 제외합니다.
+    결과는 워크북에 저장되어 재사용됩니다.
+
+    Args:
+        workbook: 워크북
+
+    Returns:
+        List[SheetInfo]: 시트 정보 목록 (빈 시트 제외)
+
+    Raises:
+        FileParserError: 파일을 읽을 수 없을 때
+    """
+    if workbook.sheet_infos is not None:
+        return workbook.sheet_infos
+
+    try:
+        if workbook.extension == ".xlsx":
+            with workbook.upload.open() as source:
+                sheet_names, sheet_infos = _read_xlsx_metadata(source)
+        else:
+            # .xls는 스트리밍 리더가 없으므로 전체 파싱
+            with workbook.upload.open() as source:
+                sheet_names, sheets_data = _read_all_sheets(source)
+            for sheet_name, df in sheets_data.items():
+                workbook.frames[(sheet_name, None)] = df
+            sheet_infos = _build_sheet_info_list(sheets_data)
 
     except Exception as e:
         raise FileParserError(
@@ -176,22 +459,233 @@ async def parse_excel_all_sheets(file: UploadFile) -> Dict[str, pd.DataFrame]:
             message=f"Excel 파일을 읽을 수 없습니다: {str(e)}"
         )
 
+    workbook.sheet_names = sheet_names
+    workbook.sheet_infos = sheet_infos
+    return sheet_infos
+
+
+def load_selected_sheets(
+    workbook: CachedWorkbook,
+    required: Optional[Union[Dict[str, Optional[List[str]]], List[str]]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    필요한 시트와 열만 읽기 (동기)
+
+    한 번 읽은 (시트, 열) 조합은 워크북에 저장되어 다시 읽지 않습니다.
+
+    Args:
+        workbook: 워크북
+        required: {시트이름: 열 목록(None이면 전체 열)} 또는 시트이름 목록
+            (None이면 비어 있지 않은 모든 시트의 전체 열)
+
+    Returns:
+        Dict[str, pd.DataFrame]: {시트이름: DataFrame}
+
+    Raises:
+        FileParserError: 시트나 열이 없거나 파일을 읽을 수 없을 때
+    """
+    sheet_infos = {info.sheet_name: info for info in read_workbook_metadata(workbook)}
+
+    if required is None:
+        required = {sheet_name: None for sheet_name in sheet_infos}
+    elif isinstance(required, list):
+        required = {sheet_name: None for sheet_name in required}
+
+    sheets_data: Dict[str, pd.DataFrame] = {}
+    to_read: Dict[str, Optional[List[str]]] = {}
+
+    for sheet_name, columns in required.items():
+        info = sheet_infos.get(sheet_name)
+        if info is None:
+            raise FileParserError(
+                code=ErrorCode.COLUMN_NOT_FOUND,
+                message=f"'{sheet_name}' 시트를 찾을 수 없습니다. 사용 가능한 시트: {list(sheet_infos.keys())}"
+            )
+
+        for column in columns or []:
+            if column not in info.columns:
+                raise FileParserError(
+                    code=ErrorCode.COLUMN_NOT_FOUND,
+                    message=f"'{sheet_name}' 시트에서 '{column}' 열을 찾을 수 없습니다. 사용 가능한 열: {info.columns}"
+                )
+
+        key = (sheet_name, tuple(columns) if columns else None)
+        cached = workbook.frames.get(key)
+        if cached is None:
+            # 전체 열을 이미 읽었다면 그 중 일부만 사용
+            full = workbook.frames.get((sheet_name, None))
+            if full is not None and columns:
+                cached = full[columns]
+        if cached is not None:
+            sheets_data[sheet_name] = cached
+        else:
+            to_read[sheet_name] = columns
+
+    if to_read:
+        try:
+            with workbook.upload.open() as source:
+                if workbook.extension == ".xlsx":
+                    loaded = _read_xlsx_sheets(source, to_read)
+                else:
+                    excel_file = pd.ExcelFile(source)
+                    loaded = {
+                        sheet_name: pd.read_excel(excel_file, sheet_name=sheet_name, usecols=columns)
+                        for sheet_name, columns in to_read.items()
+                    }
+        except Exception as e:
+            raise FileParserError(
+                code=ErrorCode.INVALID_FILE_FORMAT,
+                message=f"Excel 파일을 읽을 수 없습니다: {str(e)}"
+            )
+
+        for sheet_name, df in loaded.items():
+            columns = to_read[sheet_name]
+            workbook.frames[(sheet_name, tuple(columns) if columns else None)] = df
+            sheets_data[sheet_name] = df
+
+    return sheets_data
+
+
+def _normalize_headers(header_row: Tuple) -> List[str]:
+    """헤더 행을 pandas와 같은 규칙의 열 이름으로 변환 (빈 칸: 'Unnamed: n', 중복: 'x.1')"""
+    values = list(header_row)
+    while values and values[-1] is None:
+        values.pop()
+
+    headers: List[str] = []
+    seen: Dict[str, int] = {}
+    for i, value in enumerate(values):
+        name = f"Unnamed: {i}" if value is None else str(value)
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        headers.append(f"{name}.{count}" if count else name)
+    return headers
+
+
+def _is_empty_cell(value) -> bool:
+    """빈 셀 여부 (pandas와 같게 빈 문자열도 빈 셀로 취급)"""
+    return value is None or value == ""
+
+
+def _read_xlsx_metadata(source: BinaryIO) -> Tuple[List[str], List[SheetInfo]]:
+    """openpyxl read-only 모드로 시트별 헤더, 행 수, 샘플 5행 읽기"""
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        sheet_infos: List[SheetInfo] = []
+        for worksheet in workbook.worksheets:
+            rows = worksheet.iter_rows(values_only=True)
+            headers = _normalize_headers(next(rows, ()))
+            if not headers:
+                continue
+
+            sample_data = []
+            row_count = 0
+            # pandas와 같게 중간의 빈 행은 세고 끝의 빈 행(서식만 있는 행 포함)은 제외
+            # (시트 dimension의 max_row는 서식만 있는 행까지 포함하므로 사용하지 않음)
+            for index, row in enumerate(rows, start=1):
+                if len(sample_data) < 5:
+                    sample_data.append({
+                        header: (row[i] if i < len(row) else None)
+                        for i, header in enumerate(headers)
+                    })
+                if not all(_is_empty_cell(value) for value in row):
+                    row_count = index
+            del sample_data[row_count:]
+
+            if row_count <= 0:
+                continue
+
+            sheet_infos.append(SheetInfo(
+                sheet_name=worksheet.title,
+                columns=headers,
+                row_count=row_count,
+                sample_data=sample_data
+            ))
+
+        return list(workbook.sheetnames), sheet_infos
+    finally:
+        workbook.close()
+
+
+def _read_xlsx_sheets(source: BinaryIO, required: Dict[str, Optional[List[str]]]) -> Dict[str, pd.DataFrame]:
+    """openpyxl read-only 모드로 지정된 시트의 지정된 열만 스트리밍으로 읽기"""
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        sheets_data: Dict[str, pd.DataFrame] = {}
+        for sheet_name, columns in required.items():
+            worksheet = workbook[sheet_name]
+            headers = _normalize_headers(next(worksheet.iter_rows(max_row=1, values_only=True), ()))
+            columns = columns or headers
+            indices = [headers.index(column) for column in columns]
+
+            # 필요한 열 범위만 읽음
+            min_col, max_col = min(indices), max(indices)
+            offsets = [i - min_col for i in indices]
+            values: List[List] = [[] for _ in columns]
+            last_non_empty = 0
+
+            for row_number, row in enumerate(
+                worksheet.iter_rows(min_row=2, min_col=min_col + 1, max_col=max_col + 1, values_only=True),
+                start=1
+            ):
+                empty = True
+                for target, offset in zip(values, offsets):
+                    value = row[offset] if offset < len(row) else None
+                    target.append(value)
+                    if not _is_empty_cell(value):
+                        empty = False
+                if not empty:
+                    last_non_empty = row_number
+
+            # 끝쪽 빈 행 제거 (pandas와 동일)
+            sheets_data[sheet_name] = pd.DataFrame({
+                column: column_values[:last_non_empty]
+                for column, column_values in zip(columns, values)
+            })
+
+        return sheets_data
+    finally:
+        workbook.close()
+
+
+def _read_all_sheets(source: BinaryIO) -> Tuple[List[str], Dict[str, pd.DataFrame]]:
+    """Excel 파일의 모든 시트를 Dict로 읽기 (동기)"""
+    excel_file = pd.ExcelFile(source)
+    sheets_data: Dict[str, pd.DataFrame] = {}
+
+    for sheet_name in excel_file.sheet_names:
+        df = pd.read_excel(excel_file, sheet_name=sheet_name)
+        # 빈 시트 제외
+        if not df.empty:
+            sheets_data[sheet_name] = df
+
+    return list(excel_file.sheet_names), sheets_data
 
-async def detect_multi_sheets(file: UploadFile) -> List[SheetInfo]:
+
+async def detect_multi_sheets(file: UploadFile) -> Tuple[str, List[SheetInfo]]:
     """
     Excel 파일의 시트 정보를 감지하여 반환
 
+    시트 전체를 읽지 않고 헤더, 행 수, 샘플 5행만 읽습니다.
+    워크북은 upload_id로 캐시되어 이후 batch/data 요청에서 재사용됩니다.
+
     Args:
         file: FastAPI UploadFile 객체 (Excel 파일)
 
     Returns:
-        List[SheetInfo]: 시트 정보 목록
+        Tuple[str, List[SheetInfo]]: (upload_id, 시트 정보 목록)
 
     Raises:
         FileParserError: 파일 파싱 실패 시
     """
-    sheets_data = await parse_excel_all_sheets(file)
+    upload_id, workbook = await load_excel_workbook(file)
+
+    sheet_info_list = await cpu_executor.run(read_workbook_metadata, workbook)
+    return upload_id, sheet_info_list
 
+
+def _build_sheet_info_list(sheets_data: Dict[str, pd.DataFrame]) -> List[SheetInfo]:
+    """시트별 DataFrame에서 SheetInfo 목록 생성 (동기)"""
     sheet_info_list: List[SheetInfo] = []
 
     for sheet_name, df in sheets_data.items():
@@ -231,6 +725,25 @@ async def parse_pdf_file(file: UploadFile) -> bytes:
     Raises:
         FileParserError: 파일 파싱 실패 시
     """
+    upload = await read_pdf_upload(file)
+
+    # Gemini API는 bytes를 받으므로 여기서만 전체 내용을 메모리에 올림
+    return upload.read_bytes()
+
+
+async def read_pdf_upload(file: UploadFile) -> SpooledUpload:
+    """
+    PDF 업로드를 크기 제한을 적용해 읽기 (내용은 필요할 때 read_bytes로 로드)
+
+    Args:
+        file: FastAPI UploadFile 객체 (PDF 파일)
+
+    Returns:
+        SpooledUpload: 읽은 업로드 (sha256 포함)
+
+    Raises:
+        FileParserError: PDF가 아니거나 크기 제한 초과 시
+    """
     filename = file.filename or ""
     extension = "." + filename.split(".")[-1].lower() if "." in filename else ""
 
@@ -240,17 +753,7 @@ async def parse_pdf_file(file: UploadFile) -> bytes:
             message="PDF 파일(.pdf)만 지원합니다."
         )
 
-    content = await file.read()
-    await file.seek(0)  # 파일 포인터 초기화
-
-    file_size_mb = len(content) / (1024 * 1024)
-    if file_size_mb > settings.max_pdf_size_mb:
-        raise FileParserError(
-            code=ErrorCode.FILE_TOO_LARGE,
-            message=f"PDF 파일 크기가 너무 큽니다. 최대 {settings.max_pdf_size_mb}MB까지 허용됩니다."
-        )
-
-    return content
+    return await read_upload_limited(file, settings.max_pdf_size_mb, label="PDF 파일")
 
 
 async def get_pdf_info(file: UploadFile) -> dict:
@@ -263,10 +766,19 @@ async def get_pdf_info(file: UploadFile) -> dict:
     Returns:
         dict: PDF 파일 정보 (filename, size_mb)
     """
-    content = await file.read()
-    await file.seek(0)
+    if file.size is not None:
+        size = file.size
+    else:
+        # 크기 정보가 없으면 내용을 보관하지 않고 청크 단위로 세기
+        size = 0
+        while True:
+            chunk = await file.read(settings.upload_chunk_size_kb * 1024)
+            if not chunk:
+                break
+            size += len(chunk)
+        await file.seek(0)
 
     return {
         "filename": file.filename,
-        "size_mb": round(len(content) / (1024 * 1024), 2)
+        "size_mb": round(size / (1024 * 1024), 2)
     }
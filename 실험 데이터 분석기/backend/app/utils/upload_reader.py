@@ -0,0 +1,165 @@
+"""
+LabReportAI Upload Reader
+업로드 파일을 크기 제한을 적용하며 청크 단위로 읽는 리더
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import weakref
+from typing import BinaryIO, Optional
+
+from fastapi import UploadFile
+
+from app.config import settings
+
+
+class UploadTooLargeError(Exception):
+    """업로드 크기 제한 초과 예외"""
+    def __init__(self, max_size_mb: float):
+        self.max_size_mb = max_size_mb
+        self.message = f"파일 크기가 너무 큽니다. 최대 {max_size_mb}MB까지 허용됩니다."
+        super().__init__(self.message)
+
+
+class SpooledUpload:
+    """
+    크기 제한을 통과한 업로드 데이터
+
+    작은 파일은 메모리(bytes)에, spool 임계값을 넘는 파일은 임시 파일에
+    보관합니다. 임시 파일은 객체가 더 이상 참조되지 않을 때 삭제됩니다.
+
+    Attributes:
+        size: 파일 크기 (바이트)
+        sha256: 파일 내용 해시 (읽으면서 계산)
+        path: 임시 파일 경로 (메모리에 보관된 경우 None)
+    """
+
+    def __init__(self, size: int, sha256: str, data: Optional[bytes] = None, path: Optional[str] = None):
+        self.size = size
+        self.sha256 = sha256
+        self.path = path
+        self._data = data
+
+        if path is not None:
+            weakref.finalize(self, _remove_file, path)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SpooledUpload":
+        """이미 메모리에 있는 바이트로 생성"""
+        return cls(len(data), hashlib.sha256(data).hexdigest(), data=data)
+
+    @property
+    def in_memory_bytes(self) -> int:
+        """메모리에 보관 중인 바이트 수 (임시 파일이면 0)"""
+        return len(self._data) if self._data is not None else 0
+
+    def open(self) -> BinaryIO:
+        """
+        읽기용 파일 객체 반환
+
+        메모리 데이터는 복사 없이 BytesIO로 감싸고, 임시 파일은 새 핸들로
+        열어 여러 요청이 동시에 읽을 수 있습니다.
+        """
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        return open(self.path, "rb")
+
+    def read_bytes(self) -> bytes:
+        """전체 내용을 bytes로 반환 (Gemini API 전달 등 bytes가 필요한 경우)"""
+        if self._data is not None:
+            return self._data
+        with open(self.path, "rb") as f:
+            return f.read()
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+async def read_upload(
+    file: UploadFile,
+    max_size_mb: float,
+    spool_threshold_bytes: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> SpooledUpload:
+    """
+    업로드 파일을 청크 단위로 읽으며 크기 제한 적용
+
+    - 업로드 크기를 미리 알 수 있으면 읽기 전에 바로 거부합니다.
+    - 읽는 도중 제한을 넘으면 즉시 중단하고 거부합니다 (전체를 버퍼링하지 않음).
+    - spool 임계값을 넘으면 메모리 대신 임시 파일에 기록합니다.
+
+    Args:
+        file: FastAPI UploadFile 객체
+        max_size_mb: 최대 허용 크기 (MB)
+        spool_threshold_bytes: 임시 파일로 전환할 크기 (기본: 설정값)
+        chunk_size: 청크 크기 (기본: 설정값)
+
+    Returns:
+        SpooledUpload: 읽은 업로드 데이터
+
+    Raises:
+        UploadTooLargeError: 크기 제한 초과 시
+    """
+    max_bytes = int(max_size_mb * 1024 * 1024)
+    if spool_threshold_bytes is None:
+        spool_threshold_bytes = settings.upload_spool_threshold_mb * 1024 * 1024
+    if chunk_size is None:
+        chunk_size = settings.upload_chunk_size_kb * 1024
+
+    if file.size is not None and file.size > max_bytes:
+        raise UploadTooLargeError(max_size_mb)
+
+    await file.seek(0)
+
+    digest = hashlib.sha256()
+    size = 0
+    chunks = []
+    spool = None
+
+    try:
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLargeError(max_size_mb)
+
+            digest.update(chunk)
+
+            if spool is None and size > spool_threshold_bytes:
+                spool = tempfile.NamedTemporaryFile(
+                    prefix="upload-",
+                    dir=settings.upload_spool_dir or None,
+                    delete=False
+                )
+                for buffered in chunks:
+                    spool.write(buffered)
+                chunks = []
+
+            if spool is not None:
+                spool.write(chunk)
+            else:
+                chunks.append(chunk)
+
+    except BaseException:
+        if spool is not None:
+            spool.close()
+            _remove_file(spool.name)
+        raise
+
+    finally:
+        await file.seek(0)  # 파일 포인터 초기화
+
+    if spool is not None:
+        spool.close()
+        return SpooledUpload(size, digest.hexdigest(), path=spool.name)
+
+    return SpooledUpload(size, digest.hexdigest(), data=b"".join(chunks))
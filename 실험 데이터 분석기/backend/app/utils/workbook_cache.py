@@ -0,0 +1,154 @@
+"""
+LabReportAI Workbook Cache
+업로드된 Excel 워크북과 읽어 둔 시트를 콘텐츠 해시(upload_id)로 보관하는 캐시
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from app.config import settings
+from app.models.schemas import SheetInfo
+from app.utils.upload_reader import SpooledUpload
+
+
+class CachedWorkbook:
+    """
+    캐시된 워크북
+
+    원본 업로드만 보관하고, 시트 메타데이터와 DataFrame은 필요할 때
+    읽어서 채웁니다 (file_parser의 read_workbook_metadata / load_selected_sheets).
+
+    Attributes:
+        upload: 원본 업로드 (작은 파일은 메모리, 큰 파일은 임시 파일)
+        extension: 파일 확장자 (.xlsx, .xls)
+        sheet_names: 워크북의 전체 시트 이름 (원본 순서, 메타데이터를 읽은 뒤 설정)
+        sheet_infos: 시트 정보 목록 (빈 시트 제외, 메타데이터를 읽은 뒤 설정)
+        frames: {(시트이름, 열 목록): DataFrame} 선택적으로 읽은 시트
+    """
+
+    def __init__(self, upload: SpooledUpload, extension: str):
+        self.upload = upload
+        self.extension = extension
+        self.sheet_names: Optional[List[str]] = None
+        self.sheet_infos: Optional[List[SheetInfo]] = None
+        self.frames: Dict[Tuple[str, Optional[Tuple[str, ...]]], pd.DataFrame] = {}
+
+    def size_bytes(self) -> int:
+        """캐시 용량 계산용 메모리 사용량 추정치"""
+        frames_size = sum(df.memory_usage(deep=True).sum() for df in list(self.frames.values()))
+        return int(self.upload.in_memory_bytes + frames_size)
+
+
+class WorkbookCache:
+    """
+    업로드 워크북 캐시 (메모리 LRU + TTL)
+
+    /api/analyze/detect-sheets에서 업로드된 워크북을 저장해 두고, 이후
+    /api/analyze/batch, /api/analyze/data가 upload_id 또는 같은 파일로
+    요청하면 다시 업로드하거나 이미 읽은 시트를 다시 파싱하지 않고 재사용합니다.
+    캐시는 프로세스별이므로 여러 워커 환경에서는 캐시 미스가 날 수 있으며,
+    이때 클라이언트는 파일을 다시 업로드합니다.
+    """
+
+    def __init__(self, max_entries: int, max_memory_bytes: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[str, Tuple[float, int, CachedWorkbook]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, upload_id: str) -> Optional[CachedWorkbook]:
+        """
+        워크북 조회
+
+        Args:
+            upload_id: 업로드 ID (파일 내용 해시)
+
+        Returns:
+            Optional[CachedWorkbook]: 캐시된 워크북 (없거나 만료되면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(upload_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, size, workbook = entry
+            if expires_at < time.time():
+                self._remove(upload_id)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(upload_id)
+            self.hits += 1
+            return workbook
+
+    def put(self, upload_id: str, workbook: CachedWorkbook) -> None:
+        """
+        워크북 저장 (용량 초과 시 가장 오래 사용되지 않은 항목부터 제거)
+
+        시트를 추가로 읽은 뒤 다시 호출하면 용량이 갱신됩니다.
+
+        Args:
+            upload_id: 업로드 ID
+            workbook: 파싱된 워크북
+        """
+        size = workbook.size_bytes()
+
+        with self._lock:
+            if upload_id in self._entries:
+                self._remove(upload_id)
+
+            # 한도보다 크면 저장하지 않음 (이전 항목도 제거해 용량 계산을 실제와 맞춤)
+            if size > self.max_memory_bytes:
+                return
+
+            self._entries[upload_id] = (time.time() + self.ttl_seconds, size, workbook)
+            self._memory_bytes += size
+
+            while (
+                len(self._entries) > self.max_entries
+                or self._memory_bytes > self.max_memory_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, upload_id: str) -> None:
+        _, size, _ = self._entries.pop(upload_id)
+        self._memory_bytes -= size
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 통계 반환"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+
+# 캐시 인스턴스 (싱글톤)
+workbook_cache = WorkbookCache(
+    max_entries=settings.workbook_cache_max_entries,
+    max_memory_bytes=settings.workbook_cache_memory_mb * 1024 * 1024,
+    ttl_seconds=settings.workbook_cache_ttl_seconds
+)
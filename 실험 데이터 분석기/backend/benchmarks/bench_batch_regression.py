@@ -0,0 +1,83 @@
+"""
+배치 회귀 분석 벤치마크
+실험별 _perform_regression 반복 호출과 배치 회귀 커널(_perform_regression_batch),
+그리고 analyze_batch 전체(기존 실험별 analyze_dataframe 반복 대비)를 비교합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_batch_regression
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from app.models.schemas import ExperimentConfig
+from app.services.analysis_engine import analysis_service
+
+
+def build_series(count: int, points: int):
+    rng = np.random.default_rng(42)
+    xs = [np.linspace(0.1, 10.0, points) for _ in range(count)]
+    ys = [(i % 7 + 1) * x + rng.normal(0, 0.5, points) for i, x in enumerate(xs)]
+    return xs, ys
+
+
+def legacy_analyze_batch(sheets_data, experiments: List[ExperimentConfig]):
+    """기존 analyze_batch: 실험마다 analyze_dataframe 호출"""
+    results = []
+    for exp in experiments:
+        stats, summary, cleaned_df = analysis_service.analyze_dataframe(
+            sheets_data[exp.sheet_name], exp.x_column, exp.y_column, exp.theoretical_slope
+        )
+        table = analysis_service.dataframe_to_table(cleaned_df, exp.x_column, exp.y_column)
+        results.append((stats, summary, cleaned_df, table))
+    return results
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="배치 회귀 분석 벤치마크")
+    parser.add_argument("--experiments", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--points", type=int, nargs="+", default=[50, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("| 실험 수 | 포인트 | 실험별 회귀 반복 | 배치 커널 | analyze_batch 기존 | analyze_batch 배치 |")
+    print("| --- | --- | --- | --- | --- | --- |")
+
+    for points in args.points:
+        for count in args.experiments:
+            xs, ys = build_series(count, points)
+            slopes = [None] * count
+
+            loop = measure(
+                lambda: [analysis_service._perform_regression(x, y) for x, y in zip(xs, ys)],
+                args.repeat
+            )
+            kernel = measure(lambda: analysis_service._perform_regression_batch(xs, ys, slopes), args.repeat)
+
+            sheets_data = {f"s{i}": pd.DataFrame({"x": x, "y": y}) for i, (x, y) in enumerate(zip(xs, ys))}
+            experiments = [
+                ExperimentConfig(sheet_name=f"s{i}", experiment_name=f"실험 {i}", x_column="x", y_column="y")
+                for i in range(count)
+            ]
+            legacy = measure(lambda: legacy_analyze_batch(sheets_data, experiments), args.repeat)
+            batched = measure(lambda: analysis_service.analyze_batch(sheets_data, experiments), args.repeat)
+
+            print(
+                f"| {count} | {points} | {loop * 1000:.1f}ms | {kernel * 1000:.1f}ms ({loop / kernel:.0f}x) | "
+                f"{legacy * 1000:.0f}ms | {batched * 1000:.0f}ms ({legacy / batched:.2f}x) |"
+            )
+
+
+if __name__ == "__main__":
+    main()
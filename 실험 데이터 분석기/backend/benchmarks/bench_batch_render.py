@@ -0,0 +1,86 @@
+"""
+배치 그래프 렌더링 벤치마크
+워커 프로세스 수(1, 2, 4, 8)별로 시트 수에 따른 배치 렌더링 시간을 측정합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_batch_render
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.models.schemas import StatisticsResult
+from app.services.analysis_engine import analysis_service
+from app.services.asset_store import asset_store
+from app.services.graph_generator import GraphGenerator
+from app.services.render_engine import GraphRenderEngine, warm_render_worker
+from app.utils.executor import CPUExecutor
+
+
+def build_experiments(
+    sheet_count: int,
+    points: int
+) -> List[Tuple[pd.DataFrame, str, str, StatisticsResult, str]]:
+    """합성 실험 데이터 생성"""
+    rng = np.random.default_rng(42)
+    experiments = []
+    for i in range(sheet_count):
+        x = np.linspace(0.1, 10.0, points)
+        y = (i + 1) * x + rng.normal(0, 0.5, points)
+        df = pd.DataFrame({"x": x, "y": y})
+        stats, _, cleaned_df = analysis_service.analyze_dataframe(df, "x", "y")
+        experiments.append((cleaned_df, "x", "y", stats, f"실험 {i + 1}"))
+    return experiments
+
+
+async def measure(workers: int, sheet_counts: List[int], points: int, repeat: int) -> List[float]:
+    """워커 수 하나에 대해 시트 수별 평균 배치 렌더링 시간(초) 측정"""
+    executor = CPUExecutor(
+        thread_workers=1,
+        process_workers=workers,
+        max_pending_tasks=max(sheet_counts) * 2,
+        retry_after_seconds=1
+    )
+    executor.set_process_initializer(warm_render_worker)
+    engine = GraphRenderEngine(executor, GraphGenerator(), asset_store)
+
+    try:
+        await engine.warm_up()
+        timings = []
+        for sheet_count in sheet_counts:
+            experiments = build_experiments(sheet_count, points)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                await engine.render_batch(experiments)
+            timings.append((time.perf_counter() - start) / repeat)
+        return timings
+    finally:
+        executor.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="배치 그래프 렌더링 벤치마크")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--sheets", type=int, nargs="+", default=[1, 2, 4, 8, 10])
+    parser.add_argument("--points", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"CPU 코어 수: {os.cpu_count()}, 시트당 데이터 포인트: {args.points}")
+    print()
+    print("| workers | " + " | ".join(f"{n} sheets" for n in args.sheets) + " |")
+    print("| --- | " + " | ".join("---" for _ in args.sheets) + " |")
+
+    for workers in args.workers:
+        timings = asyncio.run(measure(workers, args.sheets, args.points, args.repeat))
+        print(f"| {workers} | " + " | ".join(f"{t:.2f}s" for t in timings) + " |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+CSV 읽기 벤치마크
+기존 경로(pd.read_csv 전체 열 → validate_columns → 전처리)와 CSV 엔진
+(형식 감지 → 필요한 열만 읽기 → 한 번의 숫자 변환 → 전처리)을 비교합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_csv_ingestion
+"""
+
+import argparse
+import io
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.services.analysis_engine import analysis_service
+from app.utils.csv_reader import PYARROW_AVAILABLE, sniff_csv_format, read_csv_columns
+from app.utils.file_parser import validate_columns
+
+
+def build_csv(rows: int) -> bytes:
+    """합성 실험 CSV (측정 열 2개 + 사용하지 않는 열 4개, 일부 값에 단위 포함)"""
+    rng = np.random.default_rng(42)
+    x = np.arange(rows, dtype=float) * 0.01
+    y = 2.0 * x + rng.normal(0, 0.1, rows)
+    df = pd.DataFrame({
+        "time": x,
+        "voltage": y.round(6).astype(str),
+        "current": rng.normal(0, 1, rows),
+        "temperature": rng.normal(25, 0.5, rows),
+        "status": np.where(rng.random(rows) < 0.5, "OK", "CHECK"),
+        "memo": "측정값",
+    })
+    # 장비 내보내기처럼 일부 값에 단위가 붙어 있음
+    df.loc[::100, "voltage"] = df.loc[::100, "voltage"] + " V"
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def legacy_path(content: bytes) -> np.ndarray:
+    df = pd.read_csv(io.BytesIO(content))
+    validate_columns(df, "time", "voltage")
+    return analysis_service._preprocess_arrays(df, "time", "voltage")[0]
+
+
+def engine_path(content: bytes) -> np.ndarray:
+    source = io.BytesIO(content)
+    df = read_csv_columns(source, sniff_csv_format(source), ["time", "voltage"])
+    validate_columns(df, "time", "voltage")
+    return analysis_service._preprocess_arrays(df, "time", "voltage")[0]
+
+
+def measure(func: Callable[[bytes], np.ndarray], content: bytes, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(content)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CSV 읽기 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engines = ["c"] + (["pyarrow"] if PYARROW_AVAILABLE else [])
+    print(f"pyarrow 설치: {PYARROW_AVAILABLE}")
+    print()
+    print("| 행 수 | 파일 크기 | 기존 경로 | " + " | ".join(f"CSV 엔진 ({e})" for e in engines) + " | 기존 경로 유지 행 |")
+    print("| --- | --- | --- | " + " | ".join("---" for _ in engines) + " | --- |")
+
+    for rows in args.rows:
+        content = build_csv(rows)
+        legacy = measure(legacy_path, content, args.repeat)
+
+        timings = []
+        for engine in engines:
+            settings.csv_engine = engine
+            timings.append(measure(engine_path, content, args.repeat))
+        settings.csv_engine = "auto"
+
+        kept_legacy = len(legacy_path(content))
+        kept_engine = len(engine_path(content))
+        print(
+            f"| {rows:,} | {len(content) / 1024 / 1024:.1f}MB | {legacy * 1000:.0f}ms | "
+            + " | ".join(f"{t * 1000:.0f}ms ({legacy / t:.1f}x)" for t in timings)
+            + f" | {kept_legacy:,} / {kept_engine:,} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Excel 시트 로딩 벤치마크
+시트 감지(detect-sheets)와 배치 분석용 시트 파싱을 기존 전체 파싱 방식과
+메타데이터 fast path / 선택적 로딩 방식으로 비교합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_excel_loading
+"""
+
+import argparse
+import io
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from app.utils.file_parser import (
+    load_selected_sheets,
+    read_workbook_metadata,
+    _build_sheet_info_list,
+    _read_all_sheets
+)
+from app.utils.upload_reader import SpooledUpload
+from app.utils.workbook_cache import CachedWorkbook
+
+
+def build_workbook(sheet_count: int, rows_per_sheet: int, columns: int) -> bytes:
+    """합성 멀티시트 워크북 생성"""
+    rng = np.random.default_rng(42)
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        for i in range(sheet_count):
+            data = {"x": np.arange(rows_per_sheet, dtype=float)}
+            for c in range(1, columns):
+                data[f"col{c}"] = rng.normal(0, 1, rows_per_sheet)
+            pd.DataFrame(data).to_excel(writer, sheet_name=f"실험{i + 1}", index=False)
+    return buffer.getvalue()
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """평균 실행 시간(초)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Excel 시트 로딩 벤치마크")
+    parser.add_argument("--sheets", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=50_000, help="워크북 전체 행 수")
+    parser.add_argument("--columns", type=int, default=6)
+    parser.add_argument("--selected-sheets", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    rows_per_sheet = args.rows // args.sheets
+    content = build_workbook(args.sheets, rows_per_sheet, args.columns)
+    required = {f"실험{i + 1}": ["x", "col1"] for i in range(args.selected_sheets)}
+
+    print(
+        f"{args.sheets}개 시트 x {rows_per_sheet}행 x {args.columns}열 "
+        f"(총 {rows_per_sheet * args.sheets}행, {len(content) / 1024 / 1024:.1f}MB), "
+        f"배치 분석은 {args.selected_sheets}개 시트 x 2열 사용"
+    )
+    print()
+
+    detect_full = measure(lambda: _build_sheet_info_list(_read_all_sheets(io.BytesIO(content))[1]), args.repeat)
+    detect_fast = measure(lambda: read_workbook_metadata(CachedWorkbook(SpooledUpload.from_bytes(content), ".xlsx")), args.repeat)
+    batch_full = measure(lambda: _read_all_sheets(io.BytesIO(content)), args.repeat)
+    batch_selective = measure(lambda: load_selected_sheets(CachedWorkbook(SpooledUpload.from_bytes(content), ".xlsx"), required), args.repeat)
+
+    print("| 단계 | 전체 파싱 | 선택적 로딩 | 속도 향상 |")
+    print("| --- | --- | --- | --- |")
+    print(f"| detect-sheets | {detect_full:.2f}s | {detect_fast:.3f}s | {detect_full / detect_fast:.0f}x |")
+    print(f"| batch 시트 파싱 | {batch_full:.2f}s | {batch_selective:.2f}s | {batch_full / batch_selective:.1f}x |")
+    print(
+        f"| detect + batch 합계 | {detect_full + batch_full:.2f}s | {detect_fast + batch_selective:.2f}s | "
+        f"{(detect_full + batch_full) / (detect_fast + batch_selective):.1f}x |"
+    )
+
+
+if __name__ == "__main__":
+    main()
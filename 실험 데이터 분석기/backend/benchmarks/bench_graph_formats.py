@@ -0,0 +1,112 @@
+"""
+그래프 이미지 형식별 크기/지연 벤치마크
+backend/test_data 워크북의 각 시트(첫 두 숫자 열)와 합성 시트로 형식(png, png_optimized, svg, webp)과
+해상도 프로필별 이미지 크기와 렌더링 CPU 시간(중앙값)을 측정합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_graph_formats
+    python -m benchmarks.bench_graph_formats test_data/multi_experiment.xlsx --resolutions print
+"""
+
+import argparse
+import glob
+import logging
+import os
+import statistics
+import time
+import warnings
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.models.schemas import GraphFormat, GraphResolution, StatisticsResult
+from app.services.analysis_engine import analysis_service
+from app.services.graph_generator import GraphGenerator
+
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "test_data")
+
+# (이름, x, y, x 라벨, y 라벨, 통계)
+Sheet = Tuple[str, np.ndarray, np.ndarray, str, str, StatisticsResult]
+
+
+def load_sheets(paths: List[str], synthetic_points: List[int]) -> List[Sheet]:
+    """워크북 시트와 합성 시트 로딩 (시트마다 첫 두 숫자 열을 x, y로 사용)"""
+    sheets = []
+    for path in paths:
+        for sheet_name, df in pd.read_excel(path, sheet_name=None).items():
+            numeric = df.select_dtypes("number").dropna()
+            if numeric.shape[1] < 2 or len(numeric) < 3:
+                continue
+            x_column, y_column = numeric.columns[:2]
+            stats, _, cleaned = analysis_service.analyze_dataframe(numeric, x_column, y_column)
+            sheets.append((
+                f"{os.path.basename(path)}:{sheet_name}",
+                cleaned[x_column].to_numpy(dtype=float),
+                cleaned[y_column].to_numpy(dtype=float),
+                str(x_column),
+                str(y_column),
+                stats
+            ))
+
+    rng = np.random.default_rng(42)
+    for points in synthetic_points:
+        x = np.linspace(0.1, 10.0, points)
+        y = 2.0 * x + rng.normal(0, 0.5, points)
+        stats, _, _ = analysis_service.analyze_dataframe(pd.DataFrame({"x": x, "y": y}), "x", "y")
+        sheets.append((f"synthetic:{points}", x, y, "전압 (V)", "전류 (A)", stats))
+    return sheets
+
+
+def measure(
+    generator: GraphGenerator,
+    sheet: Sheet,
+    dpi: int,
+    image_format: GraphFormat,
+    repeat: int
+) -> Tuple[float, int]:
+    """렌더링 CPU 시간 중앙값(초)과 이미지 크기(바이트)"""
+    _, x, y, x_label, y_label, stats = sheet
+    timings = []
+    image = b""
+    for _ in range(repeat):
+        start = time.process_time()
+        image = generator.render_image(x, y, x_label, y_label, stats, "벤치마크", dpi, image_format)
+        timings.append(time.process_time() - start)
+    return statistics.median(timings), len(image)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="그래프 이미지 형식별 크기/지연 벤치마크")
+    parser.add_argument("files", nargs="*", default=sorted(glob.glob(os.path.join(TEST_DATA_DIR, "*.xlsx"))))
+    parser.add_argument("--synthetic-points", type=int, nargs="*", default=[1000])
+    parser.add_argument(
+        "--resolutions", nargs="+", default=[r.value for r in GraphResolution],
+        choices=[r.value for r in GraphResolution]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # 한글 폰트가 없는 환경의 경고 출력 억제
+    warnings.filterwarnings("ignore")
+    logging.getLogger("matplotlib").setLevel(logging.ERROR)
+
+    sheets = load_sheets(args.files, args.synthetic_points)
+    generator = GraphGenerator()
+    generator.render_png(*sheets[0][1:])  # 폰트 캐시 로딩과 템플릿 생성은 측정에서 제외
+
+    print("| sheet | points | resolution | " + " | ".join(f.value for f in GraphFormat) + " |")
+    print("| --- | --- | --- | " + " | ".join("---" for _ in GraphFormat) + " |")
+    for sheet in sheets:
+        for resolution in args.resolutions:
+            dpi = generator.dpi_for(GraphResolution(resolution))
+            cells = []
+            for image_format in GraphFormat:
+                timing, size = measure(generator, sheet, dpi, image_format, args.repeat)
+                cells.append(f"{size / 1024:.0f}KB / {timing * 1000:.0f}ms")
+            print(f"| {sheet[0]} | {len(sheet[1])} | {resolution} | " + " | ".join(cells) + " |")
+
+
+if __name__ == "__main__":
+    main()
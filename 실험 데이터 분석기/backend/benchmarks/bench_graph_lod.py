@@ -0,0 +1,76 @@
+"""
+큰 산점도 LOD 축소 벤치마크
+데이터 포인트 수별로 전체 점을 그릴 때와 LOD 축소(MAX_DATA_POINTS_PER_SHEET) 후 그릴 때의
+그래프당 렌더링 CPU 시간(중앙값)을 측정합니다. LOD 시간에는 점 선택 시간이 포함됩니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_graph_lod
+    python -m benchmarks.bench_graph_lod --points 1000 100000 1000000 --full-max 100000
+"""
+
+import argparse
+import logging
+import statistics
+import time
+import warnings
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.models.schemas import StatisticsResult
+from app.services.analysis_engine import analysis_service
+from app.services.graph_generator import GraphGenerator
+
+
+def build_sensor_log(points: int) -> Tuple[np.ndarray, np.ndarray, StatisticsResult]:
+    """합성 센서 로그 (양자화된 측정값 + 잡음)"""
+    rng = np.random.default_rng(42)
+    x = np.linspace(0.0, 100.0, points)
+    y = np.round(0.5 * x + rng.normal(0, 2.0, points), 2)
+    stats, _, _ = analysis_service.analyze_dataframe(pd.DataFrame({"x": x, "y": y}), "x", "y")
+    return x, y, stats
+
+
+def measure(generator: GraphGenerator, x: np.ndarray, y: np.ndarray, stats: StatisticsResult,
+            lod: bool, repeat: int) -> float:
+    """그래프당 렌더링 CPU 시간 중앙값(초)"""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.process_time()
+        plot_x, plot_y = generator.level_of_detail(x, y) if lod else (x, y)
+        generator.render_png(plot_x, plot_y, "시간 (s)", "전압 (V)", stats, "센서 로그",
+                             dpi=settings.graph_preview_dpi)
+        timings.append(time.process_time() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="큰 산점도 LOD 축소 벤치마크")
+    parser.add_argument("--points", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--full-max", type=int, default=100_000, help="전체 점 렌더링을 측정할 최대 점 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # 한글 폰트가 없는 환경의 경고 출력 억제
+    warnings.filterwarnings("ignore")
+    logging.getLogger("matplotlib").setLevel(logging.ERROR)
+
+    generator = GraphGenerator()
+    warm_x, warm_y, warm_stats = build_sensor_log(10)
+    generator.render_png(warm_x, warm_y, "x", "y", warm_stats)  # 폰트 캐시 로딩은 측정에서 제외
+
+    print(f"LOD 한도: {settings.max_data_points_per_sheet}점")
+    print("| points | plotted | full | lod |")
+    print("| --- | --- | --- | --- |")
+    for points in args.points:
+        x, y, stats = build_sensor_log(points)
+        plotted = len(generator.level_of_detail(x, y)[0])
+        full = f"{measure(generator, x, y, stats, False, args.repeat) * 1000:.0f}ms" if points <= args.full_max else "-"
+        lod = measure(generator, x, y, stats, True, args.repeat)
+        print(f"| {points} | {plotted} | {full} | {lod * 1000:.0f}ms |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+그래프 1개 렌더링 지연 벤치마크
+데이터 포인트 수별로 렌더링 방식에 따른 그래프당 렌더링 CPU 시간(중앙값)을 측정합니다.
+
+- legacy: 그래프마다 Figure 생성 + tight_layout + savefig(bbox_inches='tight') (이전 방식)
+- fresh: 그래프마다 템플릿 생성 + tight_layout + savefig
+- template: 워커당 템플릿 하나를 재사용 (현재 방식)
+
+이어서 해상도 프로필(preview / screen / print)별 렌더링 시간과 PNG 크기를 측정합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_graph_render
+"""
+
+import argparse
+import io
+import logging
+import statistics
+import time
+import warnings
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.models.schemas import GraphResolution, StatisticsResult
+from app.services.analysis_engine import analysis_service
+from app.services.graph_generator import GraphGenerator, _ScatterTemplate
+
+
+Graph = Tuple[np.ndarray, np.ndarray, StatisticsResult, str]
+
+
+def build_graphs(count: int, points: int) -> List[Graph]:
+    """합성 실험 데이터 생성 (그래프마다 데이터와 제목이 다름)"""
+    rng = np.random.default_rng(42)
+    graphs = []
+    for i in range(count):
+        x = np.linspace(0.1, 10.0, points)
+        y = (i + 1) * x + rng.normal(0, 0.5, points)
+        stats, _, _ = analysis_service.analyze_dataframe(pd.DataFrame({"x": x, "y": y}), "x", "y")
+        graphs.append((x, y, stats, f"실험 {i + 1}"))
+    return graphs
+
+
+def render_legacy(generator: GraphGenerator, graph: Graph) -> bytes:
+    x, y, stats, title = graph
+    template = _ScatterTemplate(generator)
+    template.update(x, y, "전압 (V)", "전류 (A)", stats, title)
+    buffer = io.BytesIO()
+    template.fig.savefig(buffer, format="png", bbox_inches="tight", facecolor="white")
+    return buffer.getvalue()
+
+
+def render_fresh(generator: GraphGenerator, graph: Graph) -> bytes:
+    x, y, stats, title = graph
+    return _ScatterTemplate(generator).render(x, y, "전압 (V)", "전류 (A)", stats, title)
+
+
+def render_template(generator: GraphGenerator, graph: Graph) -> bytes:
+    x, y, stats, title = graph
+    return generator.render_png(x, y, "전압 (V)", "전류 (A)", stats, title)
+
+
+def render_at(resolution: GraphResolution) -> Callable[[GraphGenerator, Graph], bytes]:
+    def render(generator: GraphGenerator, graph: Graph) -> bytes:
+        x, y, stats, title = graph
+        return generator.render_png(x, y, "전압 (V)", "전류 (A)", stats, title, dpi=generator.dpi_for(resolution))
+    return render
+
+
+def measure(render: Callable[[GraphGenerator, Graph], bytes], graphs: List[Graph]) -> Tuple[float, int]:
+    """그래프당 렌더링 CPU 시간 중앙값(초)과 PNG 크기 중앙값(바이트) - 첫 렌더링(폰트 캐시 로딩)은 제외"""
+    generator = GraphGenerator()
+    render(generator, graphs[0])
+    timings = []
+    sizes = []
+    for graph in graphs[1:]:
+        start = time.process_time()
+        image = render(generator, graph)
+        timings.append(time.process_time() - start)
+        sizes.append(len(image))
+    return statistics.median(timings), int(statistics.median(sizes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="그래프 1개 렌더링 지연 벤치마크")
+    parser.add_argument("--points", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--graphs", type=int, default=11)
+    args = parser.parse_args()
+
+    # 한글 폰트가 없는 환경의 경고 출력 억제
+    warnings.filterwarnings("ignore")
+    logging.getLogger("matplotlib").setLevel(logging.ERROR)
+
+    modes = [("legacy", render_legacy), ("fresh", render_fresh), ("template", render_template)]
+    print("| points | " + " | ".join(name for name, _ in modes) + " |")
+    print("| --- | " + " | ".join("---" for _ in modes) + " |")
+    for points in args.points:
+        graphs = build_graphs(args.graphs, points)
+        timings = [measure(render, graphs)[0] for _, render in modes]
+        print(f"| {points} | " + " | ".join(f"{t * 1000:.0f}ms" for t in timings) + " |")
+
+    print()
+    print("| resolution | dpi | render | png size |")
+    print("| --- | --- | --- | --- |")
+    graphs = build_graphs(args.graphs, args.points[-1])
+    for resolution in GraphResolution:
+        timing, size = measure(render_at(resolution), graphs)
+        dpi = GraphGenerator.dpi_for(resolution)
+        print(f"| {resolution.value} | {dpi} | {timing * 1000:.0f}ms | {size / 1024:.0f}KB |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+단일 회귀 분석 벤치마크
+기존 경로(DataFrame 복사 → to_numeric → dropna → scipy.stats.linregress)와
+회귀 코어(두 열을 배열로 꺼내 regression.fit_line)의 지연 시간과 최대 추가 메모리를 비교합니다.
+
+- 회귀만: linregress vs fit_line (같은 float64 배열)
+- 전처리 + 회귀: 기존 analyze_dataframe 경로 vs 현재 경로 (결측치가 일부 있는 DataFrame)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_regression
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from app.services.analysis_engine import analysis_service
+from app.services.regression import fit_line
+
+
+def build_dataframe(rows: int) -> pd.DataFrame:
+    """합성 센서 로그 (타임스탬프 X, 0.1%는 결측치)"""
+    rng = np.random.default_rng(42)
+    x = 1.7e9 + np.arange(rows) * 0.01
+    y = 0.5 * (x - x[0]) + rng.normal(0, 1.0, rows)
+    y[rng.random(rows) < 0.001] = np.nan
+    return pd.DataFrame({"time": x, "voltage": y, "current": rng.normal(0, 1, rows)})
+
+
+def legacy_analyze(df: pd.DataFrame) -> object:
+    """기존 경로: 두 열 복사 → 숫자 변환 → dropna → linregress"""
+    df_copy = df[["time", "voltage"]].copy()
+    df_copy["time"] = pd.to_numeric(df_copy["time"], errors="coerce")
+    df_copy["voltage"] = pd.to_numeric(df_copy["voltage"], errors="coerce")
+    df_copy = df_copy.dropna()
+    return stats.linregress(df_copy["time"].values, df_copy["voltage"].values)
+
+
+def core_analyze(df: pd.DataFrame) -> object:
+    """현재 경로: 두 열을 배열로 꺼내 결측치 제거 → fit_line"""
+    x, y, _ = analysis_service._preprocess_arrays(df, "time", "voltage")
+    return fit_line(x, y)
+
+
+def measure(func: Callable[[], object], repeat: int) -> Tuple[float, float]:
+    """지연 시간 중앙값(초)과 최대 추가 메모리(MB)"""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="단일 회귀 분석 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("| 행 수 | 단계 | 기존 | 회귀 코어 |")
+    print("| --- | --- | --- | --- |")
+    for rows in args.rows:
+        df = build_dataframe(rows)
+        x, y, _ = analysis_service._preprocess_arrays(df, "time", "voltage")
+        cases = [
+            ("회귀만", lambda: stats.linregress(x, y), lambda: fit_line(x, y)),
+            ("전처리 + 회귀", lambda: legacy_analyze(df), lambda: core_analyze(df)),
+        ]
+        for name, legacy, core in cases:
+            legacy_time, legacy_memory = measure(legacy, args.repeat)
+            core_time, core_memory = measure(core, args.repeat)
+            print(
+                f"| {rows:,} | {name} | {legacy_time * 1000:.1f}ms / {legacy_memory:.1f}MB | "
+                f"{core_time * 1000:.1f}ms / {core_memory:.1f}MB ({legacy_time / core_time:.1f}x) |"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+리포트 스트리밍 첫 응답 지연 벤치마크
+일정 간격으로 조각을 내보내는 로컬 스텁 모델 서버를 두고,
+/api/generate/full-report(전체 응답)와 /api/generate/full-report/stream(SSE)의
+첫 바이트/첫 텍스트/완료 시간을 비교합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_report_streaming
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from app.config import settings
+from app.routers.generate import router as generate_router
+from app.models.schemas import DataSummary, GraphResult, SingleExperimentResult, StatisticsResult
+
+
+def start_stub_model(chunk_count: int, interval: float) -> ThreadingHTTPServer:
+    """chunk_count개의 조각을 interval초 간격으로 내보내는 스텁 모델 서버"""
+    sections = ["experiment_results", "result_analysis", "discussion"]
+    chunks = []
+    for i in range(chunk_count):
+        prefix = f"<!-- SECTION: {sections[i * 3 // chunk_count]} -->\n" if i % max(chunk_count // 3, 1) == 0 else ""
+        chunks.append(prefix + f"문장 {i}. " * 5)
+
+    def candidate(text: str) -> str:
+        return json.dumps({"candidates": [{"content": {"role": "model", "parts": [{"text": text}]}}]})
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(200)
+            if "streamGenerateContent" in self.path:
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                for chunk in chunks:
+                    time.sleep(interval)
+                    self.wfile.write(f"data: {candidate(chunk)}\r\n\r\n".encode())
+                    self.wfile.flush()
+            else:
+                time.sleep(interval * chunk_count)
+                payload = candidate("".join(chunks)).encode()
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_app(port: int) -> uvicorn.Server:
+    app = FastAPI()
+    app.include_router(generate_router)
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def build_request() -> dict:
+    experiment = SingleExperimentResult(
+        experiment_name="실험 1",
+        sheet_name="Sheet1",
+        statistics=StatisticsResult(
+            slope=2.0, intercept=0.0, r_squared=0.99, std_error=0.01,
+            data_points=5, x_range=(0.0, 4.0), y_range=(0.0, 8.0)
+        ),
+        graph=GraphResult(),
+        data_summary=DataSummary(columns=["x", "y"], row_count=5),
+        data_table=[{"x": 0, "y": 0}]
+    )
+    return {"batch_id": "bench", "report_title": "벤치마크", "experiments": [experiment.model_dump()]}
+
+
+def measure(client: httpx.Client, path: str, body: dict) -> dict:
+    start = time.perf_counter()
+    first_byte = first_text = None
+    with client.stream("POST", path, json=body) as response:
+        for line in response.iter_lines():
+            now = time.perf_counter() - start
+            if first_byte is None:
+                first_byte = now
+            if first_text is None and (line.startswith("event: delta") or path.endswith("full-report")):
+                first_text = now
+    return {"first_byte": first_byte, "first_text": first_text, "total": time.perf_counter() - start}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리포트 스트리밍 첫 응답 지연 벤치마크")
+    parser.add_argument("--chunks", type=int, default=60)
+    parser.add_argument("--interval", type=float, default=0.05, help="조각 간격 (초)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    stub = start_stub_model(args.chunks, args.interval)
+    settings.gemini_api_key = "bench-key"
+    settings.gemini_base_url = f"http://127.0.0.1:{stub.server_address[1]}"
+    server = start_app(args.port)
+
+    body = build_request()
+    with httpx.Client(base_url=f"http://127.0.0.1:{args.port}", timeout=120) as client:
+        results = {
+            "full-report": measure(client, "/api/generate/full-report", body),
+            "full-report/stream": measure(client, "/api/generate/full-report/stream", body),
+        }
+
+    print(f"모델 생성 시간: {args.chunks} 조각 x {args.interval * 1000:.0f}ms")
+    print("| 엔드포인트 | 첫 바이트 | 첫 텍스트 | 완료 |")
+    print("| --- | --- | --- | --- |")
+    for name, r in results.items():
+        print(f"| {name} | {r['first_byte'] * 1000:.0f}ms | {r['first_text'] * 1000:.0f}ms | {r['total'] * 1000:.0f}ms |")
+
+    server.should_exit = True
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
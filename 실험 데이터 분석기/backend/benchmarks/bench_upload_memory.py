@@ -0,0 +1,130 @@
+"""
+업로드 읽기 메모리 벤치마크
+기존 방식(await file.read() 후 크기 확인, io.BytesIO 복사)과 청크 리더의
+업로드 1건당 최대 RSS 증가량을 비교합니다. 각 경우는 별도 프로세스에서 실행하며,
+Linux의 /proc/self/clear_refs로 최대 RSS(VmHWM)를 초기화한 뒤 측정합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_upload_memory
+"""
+
+import argparse
+import asyncio
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+def build_csv(path: str, size_mb: int) -> None:
+    """지정 크기 이상의 CSV 파일 생성"""
+    rng = np.random.default_rng(42)
+    rows = size_mb * 1024 * 1024 // 40 + 1
+    pd.DataFrame({
+        "x": np.arange(rows, dtype=float),
+        "y": rng.normal(0, 1, rows),
+    }).to_csv(path, index=False)
+
+
+def make_upload_file(path: str):
+    """Starlette가 만드는 것과 같이 1MB 초과분은 디스크로 spool된 UploadFile 생성"""
+    from fastapi import UploadFile
+
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    with open(path, "rb") as f:
+        shutil.copyfileobj(f, spooled)
+    spooled.seek(0)
+    return UploadFile(spooled, filename="data.csv")
+
+
+async def legacy_read(path: str, max_size_mb: int, parse: bool) -> None:
+    """기존 방식: 전체를 읽은 뒤 크기 확인"""
+    file = make_upload_file(path)
+    content = await file.read()
+    if len(content) / (1024 * 1024) > max_size_mb:
+        return
+    if parse:
+        pd.read_csv(io.BytesIO(content))
+
+
+async def streaming_read(path: str, max_size_mb: int, parse: bool) -> None:
+    """청크 리더: 읽는 도중 크기 확인, 큰 파일은 임시 파일로 spool"""
+    from app.utils.file_parser import _read_tabular
+    from app.utils.upload_reader import read_upload, UploadTooLargeError
+
+    file = make_upload_file(path)
+    try:
+        upload = await read_upload(file, max_size_mb)
+    except UploadTooLargeError:
+        return
+    if parse:
+        _read_tabular(upload, ".csv")
+
+
+def run_case(mode: str, path: str, max_size_mb: int, parse: bool, queue) -> None:
+    """별도 프로세스에서 한 경우를 실행하고 최대 RSS 증가량(MB)을 보고"""
+    import app.utils.file_parser  # noqa: F401 - 임포트 비용을 기준선에 포함
+
+    # 임포트 중의 일시적인 최대치를 지우고 현재 RSS를 기준선으로 사용
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+    baseline = read_status_kb("VmRSS")
+
+    func = legacy_read if mode == "legacy" else streaming_read
+    asyncio.run(func(path, max_size_mb, parse))
+
+    queue.put((read_status_kb("VmHWM") - baseline) / 1024)
+
+
+def read_status_kb(field: str) -> int:
+    """/proc/self/status의 메모리 항목(kB) 읽기"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise RuntimeError(f"{field} not found")
+
+
+def measure(mode: str, path: str, max_size_mb: int, parse: bool) -> float:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=run_case, args=(mode, path, max_size_mb, parse, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="업로드 읽기 메모리 벤치마크")
+    parser.add_argument("--accepted-mb", type=int, default=8)
+    parser.add_argument("--oversized-mb", type=int, default=50)
+    parser.add_argument("--limit-mb", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        accepted = os.path.join(directory, "accepted.csv")
+        oversized = os.path.join(directory, "oversized.csv")
+        build_csv(accepted, args.accepted_mb)
+        build_csv(oversized, args.oversized_mb)
+
+        cases = [
+            (f"{args.oversized_mb}MB 업로드 거부 (제한 {args.limit_mb}MB)", oversized, False),
+            (f"{args.accepted_mb}MB CSV 읽기만", accepted, False),
+            (f"{args.accepted_mb}MB CSV 읽기 + 파싱", accepted, True),
+        ]
+
+        print("| 경우 | 기존 최대 RSS 증가 | 청크 리더 최대 RSS 증가 |")
+        print("| --- | --- | --- |")
+        for label, path, parse in cases:
+            legacy = measure("legacy", path, args.limit_mb, parse)
+            streaming = measure("streaming", path, args.limit_mb, parse)
+            print(f"| {label} | {legacy:.1f}MB | {streaming:.1f}MB |")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,16 @@ LabReportAI Analysis Engine Tests
 분석 엔진 단위 테스트
 """
 
+import base64
 import pytest
 import pandas as pd
 import numpy as np
 from io import BytesIO
 
+from app.config import settings
 from app.services.analysis_engine import AnalysisService, AnalysisError
 from app.services.graph_generator import GraphGenerator
-from app.models.schemas import ErrorCode
+from app.models.schemas import ErrorCode, ExperimentConfig
 
 
 class TestAnalysisService:
@@ -109,6 +111,120 @@ class TestAnalysisService:
         assert summary.null_values_removed > 0
         assert stats.data_points < 10
 
+    def test_batch_regression_matches_linregress(self, service):
+        """배치 회귀 커널 결과가 실험별 linregress 결과와 동일"""
+        rng = np.random.default_rng(0)
+        xs, ys, slopes = [], [], []
+        for i, n in enumerate([5, 37, 200, 1000]):
+            x = np.linspace(-3.0, 50.0, n) + i
+            xs.append(x)
+            ys.append((i - 1.5) * x + 4.0 + rng.normal(0, 2.0, n))
+            slopes.append(None if i % 2 else 1.0)
+
+        batch = service._perform_regression_batch(xs, ys, slopes)
+        single = [service._perform_regression(x, y, t) for x, y, t in zip(xs, ys, slopes)]
+
+        for b, s in zip(batch, single):
+            assert b.slope == pytest.approx(s.slope, abs=1e-6)
+            assert b.intercept == pytest.approx(s.intercept, abs=1e-6)
+            assert b.r_squared == pytest.approx(s.r_squared, abs=1e-6)
+            assert b.std_error == pytest.approx(s.std_error, abs=1e-6)
+            assert b.data_points == s.data_points
+            assert b.x_range == s.x_range and b.y_range == s.y_range
+            assert b.error_rate_percent == s.error_rate_percent
+
+    def test_batch_regression_is_identical_on_large_offset_x(self, service):
+        """타임스탬프처럼 오프셋이 큰 X에서도 배치 결과가 실험별 결과와 정확히 같음"""
+        rng = np.random.default_rng(5)
+        xs, ys = [], []
+        for i, n in enumerate([40, 500, 3000]):
+            x = 1.7e9 + i * 86400 + np.arange(n) * 60.0  # 1분 간격 타임스탬프
+            xs.append(x)
+            ys.append(0.003 * (x - x[0]) + 20.0 + rng.normal(0, 1e-5, n))  # 거의 완벽한 선형 (R² ≈ 1)
+
+        batch = service._perform_regression_batch(xs, ys, [None, 0.003, None])
+        single = [service._perform_regression(x, y, t) for x, y, t in zip(xs, ys, [None, 0.003, None])]
+
+        assert batch == single
+
+    def test_batch_regression_refits_only_ill_conditioned_series(self, service, monkeypatch):
+        """R² ≈ 1인 계열만 fit_line으로 다시 계산하고, 모든 계열이 fit_line 결과와 같음"""
+        from app.services.regression import fit_line
+
+        rng = np.random.default_rng(11)
+        t = 1.7e9 + np.arange(800) * 60.0
+        series = [
+            (np.linspace(0.0, 10.0, 50), lambda x: 3.0 * x - 2.0 + rng.normal(0, 0.5, len(x)), False),
+            (t, lambda x: 0.003 * (x - x[0]) + 20.0 + rng.normal(0, 1e-5, len(x)), True),
+            (t + 86400, lambda x: 0.003 * (x - x[0]) + 20.0 + rng.normal(0, 5.0, len(x)), False),
+            (np.linspace(0.0, 100.0, 300), lambda x: 5.0 * x + 1.0 + rng.normal(0, 1e-9, len(x)), True),
+            (np.linspace(-5.0, 5.0, 7), lambda x: -x + rng.normal(0, 1.0, len(x)), False),
+        ]
+        xs = [x for x, _, _ in series]
+        ys = [make_y(x) for x, make_y, _ in series]
+        slopes = [None, 0.003, None, 5.0, None]
+
+        refits = []
+        original_fit_line = AnalysisService._fit_line
+
+        def counting_fit_line(x, y):
+            refits.append(len(x))
+            return original_fit_line(x, y)
+
+        monkeypatch.setattr(AnalysisService, '_fit_line', staticmethod(counting_fit_line))
+        batch = service._perform_regression_batch(xs, ys, slopes)
+
+        assert refits == [len(x) for x, _, ill in series if ill]
+        for (x, _, ill), y, b, theoretical_slope in zip(series, ys, batch, slopes):
+            single = service._perform_regression(x, y, theoretical_slope)
+            if ill:
+                assert b == single
+                continue
+            fit = fit_line(x, y)
+            assert b.slope == pytest.approx(fit.slope, abs=1e-6)
+            assert b.intercept == pytest.approx(fit.intercept, abs=1e-6)
+            assert b.r_squared == pytest.approx(fit.r_value ** 2, abs=1e-6)
+            assert b.std_error == pytest.approx(fit.slope_stderr, abs=1e-6)
+            assert b.intercept_std_error == pytest.approx(fit.intercept_stderr, abs=1e-6)
+            assert b.x_range == single.x_range and b.y_range == single.y_range
+
+    def test_batch_regression_rejects_identical_x(self, service):
+        """X 값이 모두 같은 계열은 분석 실패"""
+        with pytest.raises(AnalysisError) as exc_info:
+            service._perform_regression_batch(
+                [np.arange(5.0), np.full(5, 2.0)],
+                [np.arange(5.0), np.arange(5.0)],
+                [None, None]
+            )
+
+        assert exc_info.value.code == ErrorCode.ANALYSIS_FAILED
+
+    def test_analyze_batch_matches_single_analysis(self, service):
+        """analyze_batch 결과가 실험별 analyze_dataframe + dataframe_to_table과 동일"""
+        sheets_data = {
+            "정수": pd.DataFrame({"t": [1, 2, 3, 4, 5], "v": [2, 4, 7, 8, 10], "memo": list("abcde")}),
+            "문자/결측": pd.DataFrame({
+                "t": ["0.5", "1.0", "x", "2.0", "2.5", None, "3.0", "3.5", "4.0"],
+                "v": [1.1, 2.0, 3.0, np.nan, 5.2, 6.0, 6.1, 7.2, 7.9]
+            })
+        }
+        experiments = [
+            ExperimentConfig(sheet_name="정수", experiment_name="A", x_column="t", y_column="v", theoretical_slope=2.0),
+            ExperimentConfig(sheet_name="문자/결측", experiment_name="B", x_column="t", y_column="v")
+        ]
+
+        batch = service.analyze_batch(sheets_data, experiments)
+
+        for exp, (stats, summary, cleaned_df, table) in zip(experiments, batch):
+            s_stats, s_summary, s_df = service.analyze_dataframe(
+                sheets_data[exp.sheet_name], exp.x_column, exp.y_column, exp.theoretical_slope
+            )
+            assert stats.slope == pytest.approx(s_stats.slope, abs=1e-6)
+            assert stats.error_rate_percent == s_stats.error_rate_percent
+            assert summary == s_summary
+            assert cleaned_df.values.tolist() == s_df.values.tolist()
+            assert table == service.dataframe_to_table(s_df, exp.x_column, exp.y_column)
+
 
 class TestGraphGenerator:
     """GraphGenerator 테스트"""
@@ -163,6 +279,444 @@ class TestGraphGenerator:
         decoded = base64.b64decode(image_data)
         assert len(decoded) > 0
 
+    def test_template_reuse_matches_fresh_render(self, generator, sample_data):
+        """재사용한 템플릿은 이전 데이터/라벨/축 범위를 남기지 않음"""
+        from PIL import Image
+
+        df, stats = sample_data
+        x = df['time'].to_numpy(dtype=float)
+        y = df['voltage'].to_numpy(dtype=float)
+        generator.render_png(x * 1000, y - 50, 'other x', 'other y', stats.model_copy(update={'slope': -3.0}), 'First')
+        template = generator._template
+
+        reused = generator.render_png(x, y, 'time', 'voltage', stats, 'Second')
+        fresh = GraphGenerator().render_png(x, y, 'time', 'voltage', stats, 'Second')
+
+        assert generator._template is template
+        reused_pixels = np.asarray(Image.open(BytesIO(reused)).convert('RGB'), dtype=int)
+        fresh_pixels = np.asarray(Image.open(BytesIO(fresh)).convert('RGB'), dtype=int)
+        assert reused_pixels.shape == fresh_pixels.shape
+        assert np.abs(reused_pixels - fresh_pixels).max() <= 2
+
+    @pytest.mark.asyncio
+    async def test_render_engine_batch_preserves_order(self, sample_data, tmp_path):
+        """프로세스 풀 배치 렌더링 결과 순서 테스트"""
+        from app.services.asset_store import LocalAssetStore
+        from app.services.render_engine import GraphRenderEngine, warm_render_worker
+        from app.utils.executor import CPUExecutor
+
+        df, stats = sample_data
+        executor = CPUExecutor(
+            thread_workers=1,
+            process_workers=2,
+            max_pending_tasks=8,
+            retry_after_seconds=1
+        )
+        executor.set_process_initializer(warm_render_worker)
+        engine = GraphRenderEngine(executor, GraphGenerator(), LocalAssetStore(str(tmp_path)))
+
+        try:
+            results = await engine.render_batch([
+                (df, 'time', 'voltage', stats, 'A'),
+                (df.head(3), 'time', 'voltage', stats, 'B'),
+            ])
+        finally:
+            executor.shutdown()
+
+        assert len(results) == 2
+        assert all(r.image_base64.startswith('data:image/png;base64,') for r in results)
+        assert results[0].image_base64 != results[1].image_base64
+
+
+
+class TestGraphCache:
+    """GraphCache 및 캐시 키 테스트"""
+
+    @pytest.fixture
+    def sample_stats(self):
+        from app.models.schemas import StatisticsResult
+
+        return StatisticsResult(
+            slope=2.0,
+            intercept=1.0,
+            r_squared=0.99,
+            std_error=0.01,
+            data_points=5,
+            x_range=(1.0, 5.0),
+            y_range=(3.0, 11.0)
+        )
+
+    def test_cache_key_is_stable_and_content_addressed(self, sample_stats):
+        """같은 입력은 같은 키, 제목/데이터 변경 시 다른 키"""
+        generator = GraphGenerator()
+        x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        y = 2 * x + 1
+
+        key = generator.compute_cache_key(x, y, 'x', 'y', sample_stats, 'A')
+
+        assert key == generator.compute_cache_key(x.copy(), y.copy(), 'x', 'y', sample_stats, 'A')
+        assert key != generator.compute_cache_key(x, y, 'x', 'y', sample_stats, 'B')
+        assert key != generator.compute_cache_key(x, y + 0.1, 'x', 'y', sample_stats, 'A')
+
+    def test_render_scatter_hits_cache(self, sample_stats):
+        """두 번째 렌더링은 캐시에서 반환"""
+        from app.services.graph_cache import GraphCache
+
+        cache = GraphCache(max_memory_bytes=10 * 1024 * 1024)
+        generator = GraphGenerator(cache=cache)
+        x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        y = 2 * x + 1
+
+        first = generator.render_scatter(x, y, 'x', 'y', sample_stats, 'A')
+        second = generator.render_scatter(x, y, 'x', 'y', sample_stats, 'A')
+
+        assert first.image_base64 == second.image_base64
+        stats = cache.get_stats()
+        assert stats["misses"] == 2  # 이미지 + 제목 없는 본문
+        assert stats["memory_hits"] == 1
+
+    def test_title_only_change_does_not_redraw_body(self, sample_stats, monkeypatch):
+        """제목만 바뀌면 캐시된 본문에 제목 띠만 다시 그림"""
+        from PIL import Image
+        from app.services.graph_cache import GraphCache
+        from app.services.graph_generator import _ScatterTemplate
+
+        draws = []
+        draw_body = _ScatterTemplate.draw_body
+
+        def counting_draw_body(template, *args, **kwargs):
+            draws.append(args)
+            return draw_body(template, *args, **kwargs)
+
+        monkeypatch.setattr(_ScatterTemplate, 'draw_body', counting_draw_body)
+        generator = GraphGenerator(cache=GraphCache(max_memory_bytes=10 * 1024 * 1024))
+        x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        y = 2 * x + 1
+
+        first = generator.render_scatter(x, y, 'x', 'y', sample_stats, 'A')
+        second = generator.render_scatter(x, y, 'x', 'y', sample_stats, 'Another title')
+        fresh = GraphGenerator().render_scatter(x, y, 'x', 'y', sample_stats, 'Another title')
+
+        assert len(draws) == 2  # 첫 렌더링 + 캐시 없는 생성기의 렌더링
+        assert first.graph_id != second.graph_id
+        assert second.image_base64 == fresh.image_base64
+
+        first_pixels = np.asarray(Image.open(BytesIO(base64.b64decode(first.image_base64.split(',')[1]))))
+        second_pixels = np.asarray(Image.open(BytesIO(base64.b64decode(second.image_base64.split(',')[1]))))
+        band = int(GraphGenerator.TITLE_BAND_INCHES * settings.graph_dpi)
+        assert first_pixels.shape == second_pixels.shape
+        assert not np.array_equal(first_pixels[:band], second_pixels[:band])
+        assert np.array_equal(first_pixels[band:], second_pixels[band:])
+
+    def test_memory_lru_eviction_and_disk_tier(self, tmp_path):
+        """메모리 한도 초과 시 LRU 제거, 디스크 계층에서 복구"""
+        from app.services.graph_cache import GraphCache
+
+        cache = GraphCache(
+            max_memory_bytes=10,
+            disk_dir=str(tmp_path),
+            max_disk_bytes=1024 * 1024
+        )
+        cache.put("a" * 64, b"123456")
+        cache.put("b" * 64, b"abcdef")
+
+        assert cache.get_stats()["memory_entries"] == 1
+        assert cache.get("a" * 64) == b"123456"
+        assert cache.get_stats()["disk_hits"] == 1
+
+
+class TestGraphResolution:
+    """해상도 프로필 및 지연 print 렌더링 테스트"""
+
+    @pytest.fixture
+    def sample_data(self):
+        from app.models.schemas import StatisticsResult
+
+        df = pd.DataFrame({'x': [1.0, 2.0, 3.0, 4.0, 5.0], 'y': [3.0, 5.1, 6.9, 9.0, 11.0]})
+        stats = StatisticsResult(
+            slope=2.0,
+            intercept=1.0,
+            r_squared=0.99,
+            std_error=0.01,
+            data_points=5,
+            x_range=(1.0, 5.0),
+            y_range=(3.0, 11.0)
+        )
+        return df, stats
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        from app.services.asset_store import LocalAssetStore
+        from app.services.graph_cache import GraphCache
+        from app.services.render_engine import GraphRenderEngine
+        from app.utils.executor import CPUExecutor
+
+        executor = CPUExecutor(thread_workers=1, process_workers=1, max_pending_tasks=8, retry_after_seconds=1)
+        generator = GraphGenerator(cache=GraphCache(max_memory_bytes=10 * 1024 * 1024))
+        yield GraphRenderEngine(executor, generator, LocalAssetStore(str(tmp_path)))
+        executor.shutdown()
+
+    def test_preview_is_smaller_than_print(self, sample_data):
+        """preview 프로필은 print보다 훨씬 작은 이미지, graph_id는 해상도와 무관"""
+        from app.models.schemas import GraphResolution
+
+        df, stats = sample_data
+        generator = GraphGenerator()
+        x = df['x'].to_numpy(dtype=float)
+        y = df['y'].to_numpy(dtype=float)
+
+        preview = generator.render_scatter(x, y, 'x', 'y', stats, 'A', GraphResolution.PREVIEW)
+        printed = generator.render_scatter(x, y, 'x', 'y', stats, 'A', GraphResolution.PRINT)
+
+        assert preview.resolution == GraphResolution.PREVIEW
+        assert preview.graph_id == printed.graph_id
+        assert len(preview.image_base64) * 2 < len(printed.image_base64)
+        assert generator.compute_cache_key(x, y, 'x', 'y', stats, 'A', GraphResolution.PREVIEW) != \
+            generator.compute_cache_key(x, y, 'x', 'y', stats, 'A', GraphResolution.PRINT)
+
+    @pytest.mark.asyncio
+    async def test_render_at_upgrades_to_print_and_caches(self, engine, sample_data):
+        """preview 렌더링 후 print 해상도는 요청 시 한 번만 렌더링"""
+        from app.models.schemas import GraphResolution
+
+        df, stats = sample_data
+        preview = await engine.render(df, 'x', 'y', stats, 'A', resolution=GraphResolution.PREVIEW)
+
+        printed = await engine.render_at(preview, GraphResolution.PRINT)
+        misses = engine.generator.cache.get_stats()["misses"]
+        again = await engine.render_at(preview, GraphResolution.PRINT)
+        direct = await engine.render(df, 'x', 'y', stats, 'A', resolution=GraphResolution.PRINT)
+
+        assert printed.resolution == GraphResolution.PRINT
+        assert printed.graph_id == preview.graph_id
+        assert again.image_base64 == printed.image_base64 == direct.image_base64
+        assert engine.generator.cache.get_stats()["misses"] == misses
+        assert await engine.render_at(printed, GraphResolution.PRINT) is printed
+
+    @pytest.mark.asyncio
+    async def test_title_only_change_reuses_cached_body(self, engine, sample_data):
+        """렌더링 엔진도 제목만 바뀐 그래프는 캐시된 본문을 사용"""
+        from app.models.schemas import GraphResolution
+
+        df, stats = sample_data
+        first = await engine.render(df, 'x', 'y', stats, 'A', resolution=GraphResolution.PREVIEW)
+        before = engine.generator.cache.get_stats()
+        second = await engine.render(df, 'x', 'y', stats, 'B', resolution=GraphResolution.PREVIEW)
+        after = engine.generator.cache.get_stats()
+
+        assert after["memory_hits"] == before["memory_hits"] + 1  # 본문
+        assert after["misses"] == before["misses"] + 1  # 새 제목의 이미지
+        assert second.graph_id != first.graph_id
+        assert second.image_base64 != first.image_base64
+
+    @pytest.mark.asyncio
+    async def test_cache_io_and_hashing_run_off_event_loop(self, engine, sample_data, monkeypatch):
+        """캐시 조회/저장과 그래프 ID 해시는 이벤트 루프 스레드에서 실행되지 않음"""
+        import threading
+        from app.models.schemas import GraphResolution
+
+        df, stats = sample_data
+        cache = engine.generator.cache
+        loop_thread = threading.current_thread()
+        threads = []
+
+        def recording(func):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return func(*args, **kwargs)
+            return wrapper
+
+        monkeypatch.setattr(cache, 'get', recording(cache.get))
+        monkeypatch.setattr(cache, 'put', recording(cache.put))
+        monkeypatch.setattr(engine.generator, 'compute_body_id', recording(engine.generator.compute_body_id))
+
+        preview = await engine.render(df, 'x', 'y', stats, 'A', resolution=GraphResolution.PREVIEW)
+        await engine.render_at(preview, GraphResolution.PRINT)
+
+        assert threads
+        assert loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_render_at_without_source_returns_none(self, engine, sample_data, monkeypatch):
+        """원본 데이터가 캐시에 없으면 None (리포트는 기존 그래프 사용)"""
+        from app.models.schemas import GraphResolution, GraphResult, SingleExperimentResult, DataSummary
+        from app.services import analysis_pipeline
+
+        df, stats = sample_data
+        preview = await engine.render(df, 'x', 'y', stats, 'A', resolution=GraphResolution.PREVIEW)
+        engine.generator.cache.clear()
+
+        assert await engine.render_at(preview, GraphResolution.PRINT) is None
+        assert await engine.render_at(GraphResult(image_base64="x"), GraphResolution.PRINT) is None
+
+        experiment = SingleExperimentResult(
+            experiment_name='A',
+            sheet_name='Sheet1',
+            statistics=stats,
+            graph=preview,
+            data_summary=DataSummary(columns=['x', 'y'], row_count=5)
+        )
+        monkeypatch.setattr(analysis_pipeline, 'render_engine', engine)
+        assert await analysis_pipeline.with_print_graphs([experiment]) == [experiment]
+
+
+
+class TestGraphFormat:
+    """그래프 이미지 형식 테스트"""
+
+    @pytest.fixture
+    def sample_data(self):
+        from app.models.schemas import StatisticsResult
+
+        x = np.linspace(0.1, 10.0, 50)
+        stats = StatisticsResult(
+            slope=2.0,
+            intercept=1.0,
+            r_squared=0.99,
+            std_error=0.01,
+            data_points=50,
+            x_range=(0.1, 10.0),
+            y_range=(1.2, 21.0)
+        )
+        return x, 2 * x + 1, stats
+
+    @pytest.mark.parametrize("image_format, content_type, magic", [
+        ("png", "image/png", b"\x89PNG"),
+        ("png_optimized", "image/png", b"\x89PNG"),
+        ("svg", "image/svg+xml", b"<?xml"),
+        ("webp", "image/webp", b"RIFF"),
+    ])
+    def test_format_is_encoded_and_recorded(self, sample_data, image_format, content_type, magic):
+        import base64
+        from app.models.schemas import GraphFormat, GraphResolution
+
+        x, y, stats = sample_data
+        result = GraphGenerator().render_scatter(
+            x, y, 'x', 'y', stats, 'A', GraphResolution.PREVIEW, GraphFormat(image_format)
+        )
+
+        assert result.format == GraphFormat(image_format)
+        prefix, encoded = result.image_base64.split(',', 1)
+        assert prefix == f'data:{content_type};base64'
+        assert base64.b64decode(encoded).startswith(magic)
+
+    def test_optimized_png_is_smaller_and_svg_is_deterministic(self, sample_data):
+        """팔레트 PNG는 기본 PNG보다 작고, SVG는 같은 입력에 같은 바이트"""
+        from PIL import Image
+        from app.models.schemas import GraphFormat
+
+        x, y, stats = sample_data
+        generator = GraphGenerator()
+        png = generator.render_image(x, y, 'x', 'y', stats, 'A', 96, GraphFormat.PNG)
+        optimized = generator.render_image(x, y, 'x', 'y', stats, 'A', 96, GraphFormat.PNG_OPTIMIZED)
+
+        assert len(optimized) < len(png)
+        assert Image.open(BytesIO(optimized)).size == Image.open(BytesIO(png)).size
+        assert Image.open(BytesIO(optimized)).mode == 'P'
+        assert generator.render_image(x, y, 'x', 'y', stats, 'A', None, GraphFormat.SVG) == \
+            generator.render_image(x, y, 'x', 'y', stats, 'A', None, GraphFormat.SVG)
+
+    @pytest.mark.parametrize("image_format", ["png_optimized", "webp"])
+    def test_raster_size_matches_png_for_fractional_pixel_size(self, image_format):
+        """figsize × dpi가 정수가 아니어도 래스터 형식 크기가 matplotlib PNG와 같음"""
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from PIL import Image
+        from app.models.schemas import GraphFormat
+
+        fig = Figure(figsize=(6.37, 4.13), dpi=100)
+        FigureCanvasAgg(fig)
+        fig.add_subplot().plot([0, 1], [0, 1])
+        generator = GraphGenerator()
+
+        png = generator._encode_figure(fig, 97, GraphFormat.PNG)
+        encoded = generator._encode_figure(fig, 97, GraphFormat(image_format))
+
+        assert Image.open(BytesIO(encoded)).size == Image.open(BytesIO(png)).size
+
+    @pytest.mark.asyncio
+    async def test_url_mode_stores_asset_with_format_extension(self, sample_data, tmp_path):
+        """url 모드 에셋 확장자는 형식을 따르고, SVG는 print 해상도로 다시 렌더링하지 않음"""
+        from app.models.schemas import GraphFormat, GraphResolution, ImageDelivery
+        from app.services.asset_store import LocalAssetStore
+        from app.services.graph_cache import GraphCache
+        from app.services.render_engine import GraphRenderEngine
+        from app.utils.executor import CPUExecutor
+
+        x, y, stats = sample_data
+        df = pd.DataFrame({'x': x, 'y': y})
+        executor = CPUExecutor(thread_workers=1, process_workers=1, max_pending_tasks=8, retry_after_seconds=1)
+        generator = GraphGenerator(cache=GraphCache(max_memory_bytes=10 * 1024 * 1024))
+        engine = GraphRenderEngine(executor, generator, LocalAssetStore(str(tmp_path)))
+        try:
+            svg = await engine.render(
+                df, 'x', 'y', stats, 'A', ImageDelivery.URL, GraphResolution.PREVIEW, GraphFormat.SVG
+            )
+            webp = await engine.render(
+                df, 'x', 'y', stats, 'A', ImageDelivery.URL, GraphResolution.PREVIEW, GraphFormat.WEBP
+            )
+            printed = await engine.render_at(webp, GraphResolution.PRINT)
+        finally:
+            executor.shutdown()
+
+        assert svg.asset_id.endswith('.svg')
+        assert webp.asset_id.endswith('.webp')
+        assert await engine.render_at(svg, GraphResolution.PRINT) is svg
+        assert printed.format == GraphFormat.WEBP
+        assert printed.asset_id.endswith('.webp') and printed.asset_id != webp.asset_id
+
+
+class TestLevelOfDetail:
+    """큰 산점도 LOD 축소 테스트"""
+
+    def test_decimation_keeps_extremes_within_budget(self):
+        from app.services.graph_generator import decimate_min_max
+
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0, 100, 200_000)
+        y = np.round(rng.normal(0, 1, 200_000), 1)  # 양자화된 센서 값 (같은 값이 많음)
+        y[12345] = 50.0  # 이상치
+
+        index = decimate_min_max(x, y, 1000)
+
+        assert len(index) <= 1000
+        assert np.all(np.diff(index) > 0)
+        assert 12345 in index
+        assert x[index].min() == x.min() and x[index].max() == x.max()
+        assert y[index].min() == y.min()
+
+        constant = decimate_min_max(np.ones(5000), np.arange(5000.0), 100)
+        assert set(constant.tolist()) == {0, 4999}
+
+    @pytest.mark.parametrize("max_points", [1, 2, 3, 4, 5])
+    def test_decimation_never_exceeds_small_budget(self, max_points):
+        """4 미만 한도에서도 선택한 점 수가 한도를 넘지 않음"""
+        from app.services.graph_generator import decimate_min_max
+
+        rng = np.random.default_rng(2)
+        x = rng.uniform(0, 100, 1000)
+        y = rng.normal(0, 1, 1000)
+
+        index = decimate_min_max(x, y, max_points)
+
+        assert 1 <= len(index) <= max_points
+        assert np.all(np.diff(index) > 0)
+        assert np.argmin(x) in index
+
+    def test_large_scatter_is_decimated_but_statistics_use_full_data(self, monkeypatch):
+        """그래프는 한도까지만 그리고, 통계는 전체 데이터 기준"""
+        monkeypatch.setattr(settings, 'max_data_points_per_sheet', 500)
+        rng = np.random.default_rng(1)
+        x = np.linspace(0, 10, 20_000)
+        df = pd.DataFrame({'x': x, 'y': 3 * x + rng.normal(0, 0.1, len(x))})
+        stats, _, cleaned = AnalysisService().analyze_dataframe(df, 'x', 'y')
+
+        result = GraphGenerator().generate_scatter_with_trendline(cleaned, 'x', 'y', stats, 'LOD')
+
+        assert stats.data_points == 20_000
+        assert result.plotted_points <= 500
+        small = GraphGenerator().generate_scatter_with_trendline(cleaned.head(100), 'x', 'y', stats, 'LOD')
+        assert small.plotted_points == 100
 
 # pytest 실행
 if __name__ == "__main__":
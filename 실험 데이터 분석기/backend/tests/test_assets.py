@@ -0,0 +1,72 @@
+"""
+LabReportAI Asset Store Tests
+그래프 에셋 저장소 및 /api/assets 엔드포인트 테스트
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import assets as assets_router_module
+from app.services.asset_store import LocalAssetStore, ASSET_ID_PATTERN
+
+
+class TestLocalAssetStore:
+    """LocalAssetStore 테스트"""
+
+    def test_put_is_content_addressed(self, tmp_path):
+        """같은 내용은 같은 ID로 한 번만 저장"""
+        store = LocalAssetStore(str(tmp_path))
+
+        first = store.put(b"png-bytes")
+        second = store.put(b"png-bytes")
+
+        assert first == second
+        assert ASSET_ID_PATTERN.match(first)
+        assert store.get(first) == b"png-bytes"
+        assert store.url_for(first).endswith(f"/api/assets/{first}")
+
+    def test_get_rejects_invalid_id(self, tmp_path):
+        """경로 조작 ID는 조회하지 않음"""
+        store = LocalAssetStore(str(tmp_path))
+
+        assert store.get("../../etc/passwd") is None
+
+
+class TestAssetsEndpoint:
+    """GET /api/assets/{id} 테스트"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        store = LocalAssetStore(str(tmp_path))
+        monkeypatch.setattr(assets_router_module, "asset_store", store)
+
+        app = FastAPI()
+        app.include_router(assets_router_module.router)
+        return TestClient(app), store
+
+    def test_returns_image_with_cache_headers(self, client):
+        """이미지와 ETag/Cache-Control 반환, If-None-Match 시 304"""
+        test_client, store = client
+        asset_id = store.put(b"\x89PNG fake")
+
+        response = test_client.get(f"/api/assets/{asset_id}")
+
+        assert response.status_code == 200
+        assert response.content == b"\x89PNG fake"
+        assert response.headers["content-type"] == "image/png"
+        assert "immutable" in response.headers["cache-control"]
+
+        cached = test_client.get(
+            f"/api/assets/{asset_id}",
+            headers={"If-None-Match": response.headers["etag"]}
+        )
+        assert cached.status_code == 304
+
+    def test_unknown_asset_returns_404(self, client):
+        """없는 에셋은 404"""
+        test_client, _ = client
+
+        response = test_client.get(f"/api/assets/{'0' * 64}.png")
+
+        assert response.status_code == 404
@@ -0,0 +1,104 @@
+"""
+LabReportAI Batch Session Store Tests
+배치 세션 저장소 및 full-report batch_id 조회 테스트
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.models.schemas import BatchAnalysisData
+from app.routers import generate as generate_router_module
+from app.services.batch_store import BatchSessionStore
+
+
+def make_batch(batch_id: str) -> BatchAnalysisData:
+    return BatchAnalysisData(
+        batch_id=batch_id,
+        report_title="진자 실험",
+        experiments=[],
+        total_experiments=0
+    )
+
+
+class TestBatchSessionStore:
+    """BatchSessionStore 테스트"""
+
+    def test_memory_lru_evicts_oldest(self):
+        """최대 항목 수를 넘으면 가장 오래된 배치 제거"""
+        store = BatchSessionStore(max_entries=2, ttl_seconds=60)
+
+        store.save(make_batch("a"))
+        store.save(make_batch("b"))
+        store.get("a")
+        store.save(make_batch("c"))
+
+        assert store.get("a") is not None
+        assert store.get("b") is None
+        assert store.get("c") is not None
+
+    def test_memory_tier_is_bounded_by_bytes(self):
+        """총 바이트 수 한도를 넘으면 가장 오래된 배치 제거"""
+        size = len(make_batch("a").model_dump_json())
+        store = BatchSessionStore(max_entries=8, ttl_seconds=60, max_memory_bytes=size * 2)
+
+        store.save(make_batch("a"))
+        store.save(make_batch("b"))
+        store.save(make_batch("c"))
+
+        assert store.get("a") is None
+        assert store.get("c") is not None
+        assert store.get_stats()["memory_bytes"] <= size * 2
+
+    def test_oversized_batch_replaces_cached_entry(self):
+        """한도보다 큰 배치로 덮어쓰면 이전 항목도 메모리에서 제거"""
+        size = len(make_batch("a").model_dump_json())
+        store = BatchSessionStore(max_entries=8, ttl_seconds=60, max_memory_bytes=size)
+
+        store.save(make_batch("a"))
+        large = make_batch("a")
+        large.report_title = "진자 실험" * 100
+        store.save(large)
+
+        assert store.get("a") is None
+        assert store.get_stats()["memory_bytes"] == 0
+
+    def test_expired_batch_is_not_returned(self):
+        """TTL이 지난 배치는 조회되지 않음"""
+        store = BatchSessionStore(max_entries=8, ttl_seconds=-1)
+
+        store.save(make_batch("a"))
+
+        assert store.get("a") is None
+
+    def test_sqlite_tier_is_shared(self, tmp_path):
+        """같은 DB를 쓰는 다른 인스턴스(다른 워커)에서도 조회 가능"""
+        db_path = str(tmp_path / "batches.sqlite3")
+        BatchSessionStore(max_entries=8, ttl_seconds=60, db_path=db_path).save(make_batch("a"))
+
+        loaded = BatchSessionStore(max_entries=8, ttl_seconds=60, db_path=db_path).get("a")
+
+        assert loaded is not None
+        assert loaded.report_title == "진자 실험"
+
+
+class TestFullReportBatchLookup:
+    """POST /api/generate/full-report batch_id 조회 테스트"""
+
+    def test_unknown_batch_returns_404(self, monkeypatch):
+        """experiments 없이 알 수 없는 batch_id를 보내면 404"""
+        monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+        monkeypatch.setattr(
+            generate_router_module, "batch_store",
+            BatchSessionStore(max_entries=8, ttl_seconds=60)
+        )
+
+        app = FastAPI()
+        app.include_router(generate_router_module.router)
+        response = TestClient(app).post(
+            "/api/generate/full-report",
+            json={"batch_id": "missing"}
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["code"] == "BATCH_NOT_FOUND"
@@ -0,0 +1,55 @@
+"""
+LabReportAI CSV Reader Tests
+CSV 형식 감지 및 열 선택 읽기 테스트
+"""
+
+import io
+
+import pandas as pd
+
+from app.utils.csv_reader import sniff_csv_format, read_csv_columns, coerce_numeric
+
+
+class TestCsvFormatDetection:
+    """인코딩/구분자/헤더 행 감지 테스트"""
+
+    def test_korean_instrument_export(self):
+        """CP949 + 세미콜론 + 소수점 쉼표 + 설명 행이 있는 장비 내보내기 파일"""
+        text = "장비;XYZ-100\n측정일;2024-03-01\n\n시간(s);전압(V);비고\n0,1;1,5;a\n0,2;2,5;\n0,3;3,5;b\n"
+        source = io.BytesIO(text.encode("cp949"))
+
+        csv_format = sniff_csv_format(source)
+
+        assert csv_format.encoding == "cp949"
+        assert csv_format.delimiter == ";"
+        assert csv_format.decimal == ","
+        assert csv_format.header_row == 3
+        assert csv_format.columns == ["시간(s)", "전압(V)", "비고"]
+
+        df = read_csv_columns(source, csv_format, ["전압(V)", "시간(s)"])
+        assert df.columns.tolist() == ["전압(V)", "시간(s)"]
+        assert df["시간(s)"].tolist() == [0.1, 0.2, 0.3]
+
+    def test_plain_csv_matches_pandas_default(self):
+        """일반 UTF-8 CSV는 pd.read_csv 기본 동작과 동일"""
+        content = b"x,y,label\n1,2.5,a\n2,3.5,b\n"
+        source = io.BytesIO(content)
+
+        df = read_csv_columns(source, sniff_csv_format(source))
+
+        pd.testing.assert_frame_equal(df, pd.read_csv(io.BytesIO(content)))
+
+
+class TestCoerceNumeric:
+    """숫자 변환 테스트"""
+
+    def test_strips_units_and_keeps_numeric_columns(self):
+        """단위가 붙은 값은 앞부분 숫자 사용, 숫자 없는 값은 NaN"""
+        result = coerce_numeric(pd.Series(["1.5 V", "2", "n/a", None]))
+
+        assert result.dtype == "float64"
+        assert result.tolist()[:2] == [1.5, 2.0]
+        assert result.isna().tolist()[2:] == [True, True]
+
+        numeric = pd.Series([1.0, 2.0])
+        assert coerce_numeric(numeric) is numeric
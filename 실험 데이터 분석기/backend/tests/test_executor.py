@@ -0,0 +1,118 @@
+"""
+LabReportAI CPU Executor Tests
+CPU 실행기 단위 테스트
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import analyze as analyze_router_module
+from app.utils.executor import CPUExecutor, ExecutorSaturatedError
+
+
+class TestCPUExecutor:
+    """CPUExecutor 테스트"""
+
+    @pytest.fixture
+    def executor(self):
+        """대기열 한도가 1인 실행기"""
+        executor = CPUExecutor(
+            thread_workers=1,
+            process_workers=1,
+            max_pending_tasks=1,
+            retry_after_seconds=7
+        )
+        yield executor
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_off_loop_thread(self, executor):
+        """스레드 풀 실행 및 결과 반환 테스트"""
+        loop_thread = threading.get_ident()
+
+        result, worker_thread = await executor.run(
+            lambda a, b: (a + b, threading.get_ident()), 1, b=2
+        )
+
+        assert result == 3
+        assert worker_thread != loop_thread
+        assert executor.get_stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_saturated_executor_rejects(self, executor):
+        """대기열이 가득 찼을 때 거절 테스트"""
+        release = threading.Event()
+        blocking = asyncio.ensure_future(executor.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(ExecutorSaturatedError) as exc_info:
+            await executor.run(lambda: None)
+
+        assert exc_info.value.retry_after == 7
+        assert executor.get_stats()["rejected"] == 1
+
+        release.set()
+        await blocking
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_slot_until_work_finishes(self, executor):
+        """호출자가 취소되어도 풀 작업이 끝날 때까지 대기열 자리를 차지"""
+        release = threading.Event()
+        started = threading.Event()
+
+        def work():
+            started.set()
+            release.wait(5)
+
+        task = asyncio.ensure_future(executor.run(work))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert executor.get_stats()["pending"] == 1
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(lambda: None)
+
+        release.set()
+        for _ in range(100):
+            if executor.get_stats()["pending"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.get_stats()["pending"] == 0
+        assert await executor.run(lambda: 42) == 42
+
+
+class TestDetectColumnsOffload:
+    """POST /api/analyze/detect-columns 실행기 사용 테스트"""
+
+    def post_csv(self):
+        app = FastAPI()
+        app.include_router(analyze_router_module.router)
+        return TestClient(app).post(
+            "/api/analyze/detect-columns",
+            files={"file": ("data.csv", b"t,v,memo\n1,2,a\n2,4,b\n", "text/csv")}
+        )
+
+    def test_columns_are_detected(self):
+        """열 정보와 숫자형 열 수 반환"""
+        response = self.post_csv()
+
+        assert response.status_code == 200
+        assert [column["name"] for column in response.json()["columns"]] == ["t", "v", "memo"]
+        assert "숫자형: 2개" in response.json()["message"]
+
+    def test_saturated_executor_returns_503(self, monkeypatch):
+        """실행기가 가득 차면 503 + Retry-After"""
+        saturated = CPUExecutor(thread_workers=1, process_workers=1, max_pending_tasks=0, retry_after_seconds=3)
+        monkeypatch.setattr(analyze_router_module, "cpu_executor", saturated)
+
+        response = self.post_csv()
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert response.json()["detail"]["error"]["code"] == "SERVER_BUSY"
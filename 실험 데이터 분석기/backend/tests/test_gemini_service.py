@@ -0,0 +1,290 @@
+"""
+LabReportAI Gemini Service Tests
+로컬 스텁 모델 서버를 사용한 async Gemini 호출 테스트
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.config import settings
+from app.models.schemas import DataSummary, GraphResult, ReportOptions, SingleExperimentResult, StatisticsResult
+from app.services.report_stream import SectionStreamParser
+from app.services.gemini_service import GeminiService, GeminiTimeoutError
+
+
+class StubModelServer:
+    """
+    generateContent 요청에 고정 응답을 돌려주는 스텁 서버 (동시 요청 수 기록)
+
+    streamGenerateContent 요청에는 chunks를 하나씩 SSE로 보냅니다.
+    failures가 있으면 처음 요청들에 그 상태 코드를 차례로 반환합니다 (Retry-After: retry_after).
+    """
+
+    def __init__(self, text: str = "스텁 고찰", delay: float = 0.0, chunks=None, failures=None, retry_after=None):
+        self.text = text
+        self.delay = delay
+        self.chunks = chunks or [text]
+        self.failures = list(failures or [])
+        self.retry_after = retry_after
+        self.active = 0
+        self.max_active = 0
+        self.requests = []
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with stub._lock:
+                    stub.requests.append((self.path, json.loads(body)))
+                    stub.active += 1
+                    stub.max_active = max(stub.max_active, stub.active)
+                    failure = stub.failures.pop(0) if stub.failures else None
+                try:
+                    time.sleep(stub.delay)
+                    if failure is not None:
+                        payload = json.dumps({"error": {"code": failure, "message": "stub failure"}}).encode()
+                        self.send_response(failure)
+                        if stub.retry_after is not None:
+                            self.send_header("Retry-After", str(stub.retry_after))
+                        self.send_header("Content-Type", "application/json")
+                        self.send_header("Content-Length", str(len(payload)))
+                        self.end_headers()
+                        self.wfile.write(payload)
+                        return
+                    if "streamGenerateContent" in self.path:
+                        self.send_response(200)
+                        self.send_header("Content-Type", "text/event-stream")
+                        self.end_headers()
+                        for chunk in stub.chunks:
+                            event = json.dumps({
+                                "candidates": [{"content": {"role": "model", "parts": [{"text": chunk}]}}]
+                            })
+                            self.wfile.write(f"data: {event}\r\n\r\n".encode())
+                            self.wfile.flush()
+                        return
+                    payload = json.dumps({
+                        "candidates": [{"content": {"role": "model", "parts": [{"text": stub.text}]}}]
+                    }).encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    with stub._lock:
+                        stub.active -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def statistics():
+    return StatisticsResult(
+        slope=2.0, intercept=0.1, r_squared=0.99, std_error=0.01,
+        data_points=10, x_range=(0.0, 9.0), y_range=(0.1, 18.1)
+    )
+
+
+class TestGeminiServiceAsync:
+    """GeminiService async 변형 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_generate_discussion_async_uses_stub_server(self, statistics):
+        """async 고찰 생성이 설정된 엔드포인트를 호출하고 응답을 변환"""
+        server = StubModelServer(text="## 결과 분석\n선형성이 우수합니다.")
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url)
+
+            response = await service.generate_discussion_async("옴의 법칙", statistics)
+        finally:
+            server.close()
+
+        assert response.discussion.startswith("## 결과 분석")
+        path, body = server.requests[0]
+        assert path.endswith(f"models/{GeminiService.MODEL_NAME}:generateContent")
+        assert "옴의 법칙" in body["contents"][0]["parts"][0]["text"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_capped(self, statistics):
+        """동시에 진행 중인 모델 호출 수가 max_concurrency를 넘지 않음"""
+        server = StubModelServer(delay=0.2)
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url, max_concurrency=2)
+
+            responses = await asyncio.gather(*[
+                service.generate_discussion_async(f"실험 {i}", statistics) for i in range(6)
+            ])
+        finally:
+            server.close()
+
+        assert len(responses) == 6
+        assert server.max_active == 2
+        assert service.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_call_raises_timeout(self, statistics, monkeypatch):
+        """제한 시간을 넘으면 GeminiTimeoutError"""
+        monkeypatch.setattr(settings, "gemini_timeout_seconds", 0.2)
+        server = StubModelServer(delay=1.0)
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url)
+
+            with pytest.raises(GeminiTimeoutError):
+                await service.generate_discussion_async("느린 실험", statistics)
+        finally:
+            server.close()
+
+        assert service.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_semaphore_wait_counts_toward_deadline(self, statistics, monkeypatch):
+        """동시 호출 자리를 기다리는 시간도 제한 시간에 포함 (자리가 안 나면 제한 시간 안에 GeminiTimeoutError)"""
+        monkeypatch.setattr(settings, "gemini_timeout_seconds", 0.2)
+        monkeypatch.setattr(settings, "gemini_report_timeout_seconds", 0.2)
+        server = StubModelServer()
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url, max_concurrency=1)
+            semaphore = service._get_semaphore()
+            await semaphore.acquire()
+
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            with pytest.raises(GeminiTimeoutError):
+                await service.generate_discussion_async("대기 실험", statistics)
+            assert loop.time() - started < 1.0
+
+            started = loop.time()
+            with pytest.raises(GeminiTimeoutError):
+                async for _ in service.stream_full_report_async("대기 보고서", []):
+                    pass
+            assert loop.time() - started < 1.0
+            semaphore.release()
+        finally:
+            server.close()
+
+        assert server.requests == []
+        assert service.in_flight == 0
+        assert service.get_resilience_stats()["circuit"]["consecutive_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_full_report_relays_chunks(self, statistics):
+        """스트리밍 리포트가 모델 조각을 도착 순서대로 전달"""
+        chunks = [
+            "<!-- SECTION: experiment_results -->\n결과", " 요약<!-- SECT",
+            "ION: result_analysis -->분석<!-- SECTION: discussion -->\n토의"
+        ]
+        server = StubModelServer(chunks=chunks)
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url)
+
+            received = [text async for text in service.stream_full_report_async("보고서", [])]
+        finally:
+            server.close()
+
+        assert received == chunks
+        assert "streamGenerateContent" in server.requests[0][0]
+
+        parser = SectionStreamParser()
+        events = [event for text in received for event in parser.feed(text)] + parser.close()
+        assert [data["name"] for event, data in events if event == "section"] == [
+            "experiment_results", "result_analysis", "discussion"
+        ]
+        sections = service.build_full_report_response("".join(received)).sections
+        assert sections.experiment_results == "결과 요약"
+        assert sections.result_analysis == "분석"
+        assert sections.discussion == "토의"
+
+
+class TestParallelFullReport:
+    """실험별 병렬 리포트 생성 (map-reduce) 테스트"""
+
+    SECTIONS_TEXT = (
+        "<!-- SECTION: experiment_results -->\n결과\n"
+        "<!-- SECTION: result_analysis -->\n분석\n"
+        "<!-- SECTION: discussion -->\n토의"
+    )
+
+    def make_experiments(self, statistics, count):
+        return [
+            SingleExperimentResult(
+                experiment_name=f"실험{i}",
+                sheet_name=f"Sheet{i}",
+                statistics=statistics,
+                graph=GraphResult(),
+                data_summary=DataSummary(columns=["x", "y"], row_count=10)
+            )
+            for i in range(1, count + 1)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_parallel_mode_scales_with_slowest_call(self, statistics, monkeypatch):
+        """실험 6개를 병렬로 생성하면 소요 시간은 호출 하나 수준, 섹션은 실험 순서대로 조립"""
+        monkeypatch.setattr(settings, "report_parallel_max_concurrency", 8)
+        server = StubModelServer(text=self.SECTIONS_TEXT, delay=0.3)
+        experiments = self.make_experiments(statistics, 6)
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url)
+
+            started = time.perf_counter()
+            response = await service.generate_full_report_async(
+                "물리 실험", experiments, options=ReportOptions(generation_mode="parallel")
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            server.close()
+
+        # 순차 생성이면 0.3초 x 7회, 병렬이면 호출 몇 번 수준 (기본 스레드 풀 크기에 따라)
+        assert len(server.requests) == 7
+        assert server.max_active > 1
+        assert elapsed < 0.3 * 4
+
+        sections = response.sections
+        assert [line for line in sections.experiment_results.splitlines() if line.startswith("####")] == [
+            f"#### 실험 {i}: 실험{i}" for i in range(1, 7)
+        ]
+        assert "#### 실험 간 비교" in sections.result_analysis
+        assert sections.discussion == "토의"
+
+        prompts = [body["contents"][0]["parts"][0]["text"] for _, body in server.requests]
+        single_experiment_prompts = [p for p in prompts if "실험 3" in p and "실험 4" not in p]
+        assert len(single_experiment_prompts) == 1
+
+    @pytest.mark.asyncio
+    async def test_mode_selection(self, statistics, monkeypatch):
+        """single은 한 번의 호출, auto는 실험 수가 기준 이상일 때만 병렬"""
+        monkeypatch.setattr(settings, "report_parallel_min_experiments", 3)
+        server = StubModelServer(text=self.SECTIONS_TEXT)
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url)
+
+            await service.generate_full_report_async(
+                "단일", self.make_experiments(statistics, 5), options=ReportOptions(generation_mode="single")
+            )
+            assert len(server.requests) == 1
+
+            await service.generate_full_report_async("자동-소", self.make_experiments(statistics, 2))
+            assert len(server.requests) == 2
+
+            await service.generate_full_report_async("자동-대", self.make_experiments(statistics, 3))
+            assert len(server.requests) == 6
+        finally:
+            server.close()
@@ -0,0 +1,265 @@
+"""
+LabReportAI Job Queue Tests
+백그라운드 작업 큐 및 /api/jobs 엔드포인트 테스트
+"""
+
+import asyncio
+import io
+import json
+import os
+import socket
+import sqlite3
+import time
+
+import openpyxl
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models.schemas import GraphResult, JobStatus, ReportSections
+from app.routers import jobs as jobs_router_module
+from app.services import analysis_pipeline
+from app.services.job_queue import JobFailedError, JobQueue
+
+
+def make_result(text: str = "완료") -> ReportSections:
+    return ReportSections(experiment_results=text, result_analysis="", discussion="")
+
+
+async def wait_for_status(queue: JobQueue, job_id: str, status: JobStatus, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job is not None and job.status == status:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"{job_id} did not reach {status}: {queue.get(job_id)}")
+
+
+class TestJobQueue:
+    """JobQueue 테스트"""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        return JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), max_workers=1, ttl_seconds=60, poll_interval=0.05)
+
+    @pytest.mark.asyncio
+    async def test_progress_is_recorded_per_stage_and_watchable(self, queue):
+        """단계마다 진행률이 기록되고 watch로 순서대로 전달, 결과는 보관"""
+        async def run(context):
+            for stage in ["parse", "analyze", "render"]:
+                await context.stage(stage)
+                await asyncio.sleep(0.02)
+            return make_result()
+
+        job = await queue.submit("batch", ["parse", "analyze", "render"], run)
+        seen = [(info.status, info.stage) async for info in queue.watch(job.job_id)]
+
+        assert (JobStatus.RUNNING, "analyze") in seen
+        assert seen[-1] == (JobStatus.SUCCEEDED, None)
+        done = queue.get(job.job_id)
+        assert done.progress == 1.0
+        assert done.result["experiment_results"] == "완료"
+        assert done.expires_at is not None
+
+    @pytest.mark.asyncio
+    async def test_jobs_beyond_max_workers_wait_and_cancel(self, queue):
+        """max_workers를 넘는 작업은 queued로 대기하고, 실행 중인 작업은 취소 가능"""
+        release = asyncio.Event()
+
+        async def blocking(context):
+            await context.stage("render")
+            await release.wait()
+            return make_result()
+
+        first = await queue.submit("batch", ["render"], blocking)
+        second = await queue.submit("batch", ["render"], blocking)
+        await wait_for_status(queue, first.job_id, JobStatus.RUNNING)
+        assert queue.get(second.job_id).status == JobStatus.QUEUED
+
+        cancelled = await queue.cancel(first.job_id)
+        assert cancelled.status == JobStatus.CANCELLED
+        assert cancelled.error.code == "JOB_CANCELLED"
+
+        await wait_for_status(queue, second.job_id, JobStatus.RUNNING)
+        release.set()
+        await wait_for_status(queue, second.job_id, JobStatus.SUCCEEDED)
+        assert queue.get_stats()["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_and_cross_worker_cancel(self, queue):
+        """실패는 에러 코드로 기록, 다른 워커의 취소 요청은 다음 단계에서 반영"""
+        # 같은 DB를 쓰는 다른 워커 프로세스 (작업 태스크가 없으므로 취소 플래그만 기록)
+        other_worker = JobQueue(db_path=queue.db_path, max_workers=1, ttl_seconds=60)
+
+        async def failing(context):
+            await context.stage("report")
+            raise JobFailedError("GEMINI_TIMEOUT", "시간 초과")
+
+        job = await queue.submit("full_report", ["report"], failing)
+        failed = await wait_for_status(queue, job.job_id, JobStatus.FAILED)
+        assert failed.error.code == "GEMINI_TIMEOUT"
+
+        step = asyncio.Event()
+
+        async def two_stages(context):
+            await context.stage("parse")
+            await step.wait()
+            await context.stage("render")
+            return make_result()
+
+        job = await queue.submit("batch", ["parse", "render"], two_stages)
+        await wait_for_status(queue, job.job_id, JobStatus.RUNNING)
+        assert (await other_worker.cancel(job.job_id)).status == JobStatus.RUNNING
+        step.set()
+        await wait_for_status(queue, job.job_id, JobStatus.CANCELLED)
+
+    @pytest.mark.asyncio
+    async def test_finished_results_expire(self, tmp_path):
+        """결과 보관 기간이 지난 작업은 조회되지 않음"""
+        queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), max_workers=1, ttl_seconds=-1)
+
+        async def run(context):
+            return make_result()
+
+        job = await queue.submit("batch", [], run)
+        for _ in range(100):
+            if job.job_id not in queue._tasks:
+                break
+            await asyncio.sleep(0.01)
+
+        assert queue.get(job.job_id) is None
+
+    def test_jobs_of_dead_process_are_failed_on_startup(self, tmp_path):
+        """종료된 프로세스가 남긴 running 작업은 다음 기동 시 실패로 표시"""
+        db_path = str(tmp_path / "jobs.sqlite3")
+        JobQueue(db_path=db_path, max_workers=1, ttl_seconds=60)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, kind, status, stages, owner, created_at, updated_at) "
+                "VALUES ('orphan', 'batch', 'running', '[]', ?, 0, 0)",
+                (f"{socket.gethostname()}:{os.getpid()}",)
+            )
+
+        job = JobQueue(db_path=db_path, max_workers=1, ttl_seconds=60).get("orphan")
+
+        assert job.status == JobStatus.FAILED
+        assert job.error.code == "JOB_INTERRUPTED"
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_then_cancels_unfinished(self, tmp_path):
+        """종료 시 제한 시간 안에 끝나는 작업은 완료, 넘는 작업은 취소"""
+        queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), max_workers=2, ttl_seconds=60)
+
+        async def quick(context):
+            await asyncio.sleep(0.05)
+            return make_result()
+
+        async def stuck(context):
+            await asyncio.Event().wait()
+
+        done = await queue.submit("batch", [], quick)
+        hung = await queue.submit("batch", [], stuck)
+
+        assert await queue.drain(timeout=0.5) == 1
+        assert queue.get(done.job_id).status == JobStatus.SUCCEEDED
+        assert queue.get(hung.job_id).status == JobStatus.CANCELLED
+        assert queue.get_stats()["active"] == 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 미지원")
+    def test_owner_follows_forked_worker(self, tmp_path):
+        """사전 로딩 후 fork한 워커는 자기 PID로 작업을 소유"""
+        queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), max_workers=1, ttl_seconds=60)
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_fd, queue._owner.encode())
+            os._exit(0)
+        os.waitpid(pid, 0)
+        child_owner = os.read(read_fd, 256).decode()
+        os.close(read_fd)
+        os.close(write_fd)
+
+        assert child_owner == f"{socket.gethostname()}:{pid}"
+        assert queue._owner == f"{socket.gethostname()}:{os.getpid()}"
+
+
+class TestJobsEndpoint:
+    """/api/jobs 엔드포인트 테스트"""
+
+    @pytest.fixture
+    def workbook_bytes(self):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Sheet1"
+        sheet.append(["time", "voltage"])
+        for i in range(1, 11):
+            sheet.append([i * 0.1, i * 2.0])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        return buffer.getvalue()
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), max_workers=2, ttl_seconds=60, poll_interval=0.05)
+        monkeypatch.setattr(jobs_router_module, "job_queue", queue)
+
+        self.render_delay = 0.0
+
+        async def fake_render_batch(graph_input_data, *options):
+            await asyncio.sleep(self.render_delay)
+            return [GraphResult() for _ in graph_input_data]
+
+        monkeypatch.setattr(analysis_pipeline.render_engine, "render_batch", fake_render_batch)
+
+        app = FastAPI()
+        app.include_router(jobs_router_module.router)
+        with TestClient(app) as test_client:
+            yield test_client
+
+    def submit(self, client, workbook_bytes):
+        return client.post(
+            "/api/jobs/batch",
+            files={"file": ("data.xlsx", workbook_bytes)},
+            data={
+                "experiments_json": json.dumps([{
+                    "sheet_name": "Sheet1", "experiment_name": "옴의 법칙",
+                    "x_column": "time", "y_column": "voltage"
+                }]),
+                "report_title": "전기 실험"
+            }
+        )
+
+    def test_submit_then_poll_and_stream(self, client, workbook_bytes):
+        """제출 즉시 202와 job_id, 진행 스트림의 마지막 이벤트에 결과 포함"""
+        response = self.submit(client, workbook_bytes)
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        with client.stream("GET", f"/api/jobs/{job_id}/events") as stream:
+            events = [line[len("event: "):] for line in stream.iter_lines() if line.startswith("event: ")]
+        assert events[-1] == "completed"
+
+        job = client.get(f"/api/jobs/{job_id}").json()["data"]
+        assert job["status"] == "succeeded"
+        assert job["stages"] == ["parse", "analyze", "render"]
+        experiment = job["result"]["batch"]["experiments"][0]
+        assert abs(experiment["statistics"]["slope"] - 20.0) < 1e-9
+
+        assert client.delete(f"/api/jobs/{job_id}").status_code == 409
+        assert client.get("/api/jobs/unknown").status_code == 404
+
+    def test_cancel_running_job(self, client, workbook_bytes):
+        """실행 중인 작업 취소"""
+        self.render_delay = 5.0
+        job_id = self.submit(client, workbook_bytes).json()["job_id"]
+
+        deadline = time.monotonic() + 5
+        while client.get(f"/api/jobs/{job_id}").json()["data"]["stage"] != "render":
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+
+        response = client.delete(f"/api/jobs/{job_id}")
+        assert response.status_code == 200
+        assert response.json()["data"]["status"] == "cancelled"
@@ -0,0 +1,112 @@
+"""
+LabReportAI LLM Response Cache Tests
+LLM 응답 캐시 및 GeminiService 캐시 적용 테스트
+"""
+
+import time
+
+import pytest
+from google.genai import types
+
+from app.models.schemas import StatisticsResult
+from app.services.gemini_service import GeminiService
+from app.services.llm_cache import LLMResponseCache, make_cache_key
+from tests.test_gemini_service import StubModelServer
+
+
+class TestMakeCacheKey:
+    """make_cache_key 테스트"""
+
+    def test_normalizes_prompt_whitespace(self):
+        """줄 끝/앞뒤 공백만 다른 프롬프트는 같은 키"""
+        config = types.GenerateContentConfig(temperature=0.7)
+
+        assert make_cache_key("m", config, "제목  \n본문\n\n") == make_cache_key("m", config, "  제목\n본문")
+
+    def test_model_config_and_binary_content_change_key(self):
+        """모델, 생성 설정, PDF 내용이 다르면 다른 키"""
+        config = types.GenerateContentConfig(temperature=0.7)
+        pdf = lambda data: [types.Content(parts=[types.Part(inline_data=types.Blob(mime_type="application/pdf", data=data))])]
+
+        base = make_cache_key("m", config, pdf(b"%PDF-1"))
+        assert base == make_cache_key("m", config, pdf(b"%PDF-1"))
+        assert base != make_cache_key("m2", config, pdf(b"%PDF-1"))
+        assert base != make_cache_key("m", types.GenerateContentConfig(temperature=0.1), pdf(b"%PDF-1"))
+        assert base != make_cache_key("m", config, pdf(b"%PDF-2"))
+
+
+class TestLLMResponseCache:
+    """LLMResponseCache 테스트"""
+
+    def test_sqlite_tier_shared_between_instances(self, tmp_path):
+        """SQLite 계층은 다른 인스턴스(워커)에서도 조회"""
+        db_path = str(tmp_path / "llm.sqlite3")
+        LLMResponseCache(max_entries=4, ttl_seconds=60, db_path=db_path).put("k", "응답")
+
+        other = LLMResponseCache(max_entries=4, ttl_seconds=60, db_path=db_path)
+
+        assert other.get("k", "discussion") == "응답"
+        assert other.get("missing", "discussion") is None
+        stats = other.get_stats()
+        assert stats["hit_rate"] == 0.5
+        assert stats["by_kind"]["discussion"] == {"hits": 1, "misses": 1}
+
+    def test_expired_entries_are_misses(self):
+        """TTL이 지난 응답은 반환하지 않음"""
+        cache = LLMResponseCache(max_entries=4, ttl_seconds=0)
+        cache.put("k", "응답")
+        time.sleep(0.01)
+
+        assert cache.get("k") is None
+
+
+class TestGeminiServiceCache:
+    """GeminiService 응답 캐시 적용 테스트"""
+
+    @pytest.fixture
+    def statistics(self):
+        return StatisticsResult(
+            slope=1.5, intercept=0.0, r_squared=0.98, std_error=0.02,
+            data_points=8, x_range=(0.0, 7.0), y_range=(0.0, 10.5)
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_uses_cache_unless_regenerate(self, statistics):
+        """같은 입력은 모델을 다시 호출하지 않고, regenerate=True이면 새로 생성"""
+        server = StubModelServer(text="캐시될 고찰")
+        cache = LLMResponseCache(max_entries=8, ttl_seconds=60)
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url, cache=cache)
+
+            first = await service.generate_discussion_async("자유 낙하", statistics)
+            second = await service.generate_discussion_async("자유 낙하", statistics)
+            assert len(server.requests) == 1
+
+            await service.generate_discussion_async("자유 낙하", statistics, regenerate=True)
+            assert len(server.requests) == 2
+
+            streamed = [text async for text in service.stream_discussion_async("자유 낙하", statistics)]
+        finally:
+            server.close()
+
+        assert first.discussion == second.discussion == "캐시될 고찰"
+        assert streamed == ["캐시될 고찰"]
+        assert len(server.requests) == 2
+        assert cache.get_stats()["by_kind"]["discussion"] == {"hits": 2, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_invalid_manual_json_is_not_cached(self):
+        """JSON이 아닌 매뉴얼 추출 응답은 캐시하지 않음"""
+        server = StubModelServer(text="JSON이 아닌 응답")
+        cache = LLMResponseCache(max_entries=8, ttl_seconds=60)
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url, cache=cache)
+
+            await service.extract_manual_from_pdf_async(b"%PDF-1.4", "manual.pdf")
+            info = await service.extract_manual_from_pdf_async(b"%PDF-1.4", "manual.pdf")
+        finally:
+            server.close()
+
+        assert info.experiment_purpose.startswith("PDF 분석 실패")
+        assert len(server.requests) == 2
+        assert cache.get_stats()["stores"] == 0
@@ -0,0 +1,153 @@
+"""
+LabReportAI Manual Extraction Cache Tests
+PDF 해시별 매뉴얼 추출 캐시, 동시 요청 병합, 관리자 API 테스트
+"""
+
+import asyncio
+import hashlib
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.models.schemas import ExperimentManualInfo
+from app.routers import admin as admin_router_module
+from app.services.gemini_service import GeminiService
+from app.services.llm_cache import LLMResponseCache
+from app.services.manual_cache import ManualExtractionCache
+from app.utils.upload_reader import SpooledUpload
+from tests.test_gemini_service import StubModelServer
+
+
+PDF_SHA = hashlib.sha256(b"%PDF-manual").hexdigest()
+
+
+def manual(purpose: str = "RC 회로의 시상수 측정") -> ExperimentManualInfo:
+    return ExperimentManualInfo(experiment_purpose=purpose, theory="τ = RC", error_guides=[])
+
+
+class TestManualExtractionCache:
+    """ManualExtractionCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_extraction(self):
+        """같은 PDF의 동시 요청 50개는 추출 한 번의 결과를 함께 사용"""
+        cache = ManualExtractionCache(cache_dir=None, max_memory_entries=4)
+        calls = 0
+
+        async def extract():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return manual()
+
+        results = await asyncio.gather(*[cache.get_or_extract(PDF_SHA, extract) for _ in range(50)])
+
+        assert calls == 1
+        assert all(r == results[0] for r in results)
+        stats = cache.get_stats()
+        assert stats["misses"] == 1 and stats["coalesced"] == 49 and stats["in_flight"] == 0
+
+        await cache.get_or_extract(PDF_SHA, extract)
+        assert calls == 1 and cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_all_waiters_and_is_not_stored(self):
+        """추출 실패는 기다리던 모든 요청에 전달되고 저장되지 않음"""
+        cache = ManualExtractionCache(cache_dir=None, max_memory_entries=4)
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("모델 오류")
+
+        results = await asyncio.gather(
+            *[cache.get_or_extract(PDF_SHA, failing) for _ in range(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.get(PDF_SHA) is None
+
+    def test_disk_tier_survives_restart_and_invalidate(self, tmp_path):
+        """디스크에 저장된 결과는 새 인스턴스에서도 조회되고, invalidate로 삭제"""
+        ManualExtractionCache(cache_dir=str(tmp_path), max_memory_entries=4).put(PDF_SHA, manual())
+
+        restarted = ManualExtractionCache(cache_dir=str(tmp_path), max_memory_entries=4)
+        assert restarted.get(PDF_SHA) == manual()
+
+        assert restarted.invalidate(PDF_SHA) is True
+        assert restarted.get(PDF_SHA) is None
+        assert restarted.invalidate(PDF_SHA) is False
+        assert restarted.get("../../etc/passwd") is None
+
+
+class TestGeminiManualExtraction:
+    """GeminiService.extract_manual_from_upload_async 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_simultaneous_uploads_make_one_model_call(self):
+        """같은 PDF를 동시에 50번 올려도 모델 호출은 한 번"""
+        text = json.dumps({"experiment_purpose": "옴의 법칙 확인", "theory": "V = IR", "error_guides": []})
+        server = StubModelServer(text=text, delay=0.1)
+        cache = ManualExtractionCache(cache_dir=None, max_memory_entries=4)
+        try:
+            service = GeminiService(
+                api_key="test-key",
+                base_url=server.url,
+                cache=LLMResponseCache(max_entries=8, ttl_seconds=60),
+                manual_extraction_cache=cache
+            )
+            uploads = [SpooledUpload.from_bytes(b"%PDF-ohm") for _ in range(50)]
+
+            results = await asyncio.gather(*[
+                service.extract_manual_from_upload_async(upload, "ohm.pdf") for upload in uploads
+            ])
+        finally:
+            server.close()
+
+        assert len(server.requests) == 1
+        assert {r.experiment_purpose for r in results} == {"옴의 법칙 확인"}
+
+
+class TestAdminManualCacheEndpoint:
+    """DELETE /api/admin/manual-cache/{pdf_sha256} 테스트"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        cache = ManualExtractionCache(cache_dir=str(tmp_path), max_memory_entries=4)
+        monkeypatch.setattr(admin_router_module, "manual_cache", cache)
+        monkeypatch.setattr(settings, "admin_token", "secret")
+
+        app = FastAPI()
+        app.include_router(admin_router_module.router)
+        return TestClient(app), cache
+
+    def test_invalidate_requires_token(self, client, monkeypatch):
+        """토큰이 없거나 틀리면 401, ADMIN_TOKEN 미설정 시 403"""
+        test_client, _ = client
+
+        assert test_client.delete(f"/api/admin/manual-cache/{PDF_SHA}").status_code == 401
+        assert test_client.delete(
+            f"/api/admin/manual-cache/{PDF_SHA}", headers={"X-Admin-Token": "wrong"}
+        ).status_code == 401
+
+        monkeypatch.setattr(settings, "admin_token", "")
+        assert test_client.delete(
+            f"/api/admin/manual-cache/{PDF_SHA}", headers={"X-Admin-Token": "secret"}
+        ).status_code == 403
+
+    def test_invalidate_removes_entry(self, client):
+        """저장된 결과를 삭제하고, 없으면 404"""
+        test_client, cache = client
+        cache.put(PDF_SHA, manual())
+        headers = {"X-Admin-Token": "secret"}
+
+        response = test_client.delete(f"/api/admin/manual-cache/{PDF_SHA}", headers=headers)
+        assert response.status_code == 200
+        assert cache.get(PDF_SHA) is None
+
+        assert test_client.delete(f"/api/admin/manual-cache/{PDF_SHA}", headers=headers).status_code == 404
+        assert test_client.delete("/api/admin/manual-cache/not-a-hash", headers=headers).status_code == 400
+        assert test_client.get("/api/admin/manual-cache", headers=headers).json()["invalidations"] == 1
@@ -0,0 +1,140 @@
+"""
+LabReportAI Prompt Builder Tests
+토큰 추정, 통계 압축 표, 매뉴얼 축약, 프롬프트 토큰 예산 테스트
+"""
+
+import pytest
+
+from app.config import settings
+from app.models.schemas import (
+    DataSummary,
+    ErrorGuideItem,
+    ExperimentManualInfo,
+    GraphResult,
+    ReportOptions,
+    SingleExperimentResult
+)
+from app.services.gemini_service import GeminiService
+from app.services.prompt_builder import (
+    PromptTooLargeError,
+    estimate_tokens,
+    manual_section,
+    statistics_table,
+    truncate_to_tokens
+)
+from tests.test_gemini_service import StubModelServer, statistics  # noqa: F401
+
+
+@pytest.fixture
+def experiments(statistics):
+    return [
+        SingleExperimentResult(
+            experiment_name=f"저항 {i}",
+            sheet_name=f"Sheet{i}",
+            statistics=statistics,
+            graph=GraphResult(),
+            data_summary=DataSummary(columns=["x", "y"], row_count=10)
+        )
+        for i in range(1, 4)
+    ]
+
+
+@pytest.fixture
+def long_manual():
+    return ExperimentManualInfo(
+        experiment_purpose="옴의 법칙을 확인한다.",
+        theory="전압과 전류는 비례한다. " * 2000,
+        error_guides=[ErrorGuideItem(cause="접촉 저항", description="연결부 접촉 불량")],
+        expected_results="기울기는 저항값과 같다."
+    )
+
+
+class TestTokenEstimate:
+    """토큰 추정 및 축약 테스트"""
+
+    def test_estimate_counts_words_and_syllables(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("resistance") == 3
+        assert estimate_tokens("옴의 법칙") == 4
+        assert estimate_tokens("R² = 0.99") == 7
+
+    def test_truncate_respects_budget_and_marks_cut(self):
+        text = "첫 문장입니다. 두 번째 문장입니다. " * 50
+
+        truncated = truncate_to_tokens(text, 40)
+
+        assert estimate_tokens(truncated) <= 40
+        assert truncated.endswith("…(생략)")
+        assert truncate_to_tokens("짧은 글", 40) == "짧은 글"
+
+
+class TestPromptSections:
+    """통계 표와 매뉴얼 섹션 테스트"""
+
+    def test_statistics_table_has_one_row_per_experiment(self, experiments):
+        table = statistics_table(list(enumerate(experiments, 1)))
+
+        rows = table.splitlines()
+        assert len(rows) == 2 + len(experiments)
+        assert rows[2].startswith("| 1 | 저항 1 | 10 | 2 | 0.1 | 0.990000 |")
+
+    def test_manual_is_fitted_keeping_short_fields(self, long_manual):
+        section = manual_section(long_manual, 300)
+
+        assert estimate_tokens(section) <= 300
+        assert "옴의 법칙을 확인한다." in section
+        assert "접촉 저항: 연결부 접촉 불량" in section
+        assert "…(생략)" in section
+
+        assert "…(생략)" not in manual_section(long_manual, 100_000)
+        assert manual_section(None, 300) == ""
+
+
+class TestPromptBudget:
+    """GeminiService 프롬프트 예산 테스트"""
+
+    @pytest.mark.parametrize("mode", ["single", "parallel"])
+    def test_report_prompts_fit_budget(self, experiments, long_manual, monkeypatch, mode):
+        """매뉴얼이 길어도 프롬프트는 예산 안, 통계는 빠짐없이 포함"""
+        monkeypatch.setattr(settings, "prompt_token_budget", 1500)
+        service = GeminiService(api_key="test-key", base_url="http://127.0.0.1:9")
+        options = ReportOptions(generation_mode=mode)
+
+        prompts = [service._full_report_prompt("전기 실험", experiments, long_manual, options)]
+        if mode == "parallel":
+            prompts = [
+                service._build_experiment_section_prompt("전기 실험", 1, 3, experiments[0], long_manual, options),
+                service._build_report_synthesis_prompt("전기 실험", experiments, long_manual, options)
+            ]
+
+        for prompt in prompts:
+            assert estimate_tokens(prompt) <= 1500
+            assert "| 1 | 저항 1 |" in prompt
+            assert "<!-- SECTION: result_analysis -->" in prompt
+
+    @pytest.mark.asyncio
+    async def test_prompt_over_model_limit_is_rejected(self, experiments, monkeypatch):
+        """모델 입력 한도를 넘으면 호출하지 않고 PromptTooLargeError"""
+        monkeypatch.setattr(settings, "gemini_max_input_tokens", 100)
+        server = StubModelServer()
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url)
+            with pytest.raises(PromptTooLargeError):
+                await service.generate_full_report_async("전기 실험", experiments)
+        finally:
+            server.close()
+
+        assert server.requests == []
+
+    @pytest.mark.asyncio
+    async def test_response_reports_prompt_tokens(self, statistics):
+        server = StubModelServer(text="## 결과 분석\n양호")
+        try:
+            service = GeminiService(api_key="test-key", base_url=server.url)
+            response = await service.generate_discussion_async("옴의 법칙", statistics, context="추가 " * 10)
+        finally:
+            server.close()
+
+        sent_prompt = server.requests[0][1]["contents"][0]["parts"][0]["text"]
+        assert response.prompt_tokens == estimate_tokens(sent_prompt)
+        assert response.prompt_tokens == service.discussion_prompt_tokens("옴의 법칙", statistics, "추가 " * 10)
@@ -0,0 +1,152 @@
+"""
+LabReportAI Regression Core Tests
+회귀 코어 단위 테스트
+"""
+
+from fractions import Fraction
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from app.services import regression
+from app.services.analysis_engine import AnalysisService
+from app.services.regression import RegressionError, fit_line
+
+
+def exact_regression(x: np.ndarray, y: np.ndarray):
+    """유리수 연산으로 계산한 정확한 (기울기, y절편, 기울기 표준 오차)"""
+    xf = [Fraction(v) for v in x]
+    yf = [Fraction(v) for v in y]
+    n = len(xf)
+    x_mean = sum(xf) / n
+    y_mean = sum(yf) / n
+    ssxm = sum((v - x_mean) ** 2 for v in xf)
+    ssxym = sum((a - x_mean) * (b - y_mean) for a, b in zip(xf, yf))
+    slope = ssxym / ssxm
+    intercept = y_mean - slope * x_mean
+    sse = sum((b - y_mean - slope * (a - x_mean)) ** 2 for a, b in zip(xf, yf))
+    return float(slope), float(intercept), float(sse / ssxm / (n - 2)) ** 0.5
+
+
+class TestFitLine:
+    """fit_line 테스트"""
+
+    def test_matches_linregress_on_well_conditioned_data(self):
+        """일반 데이터에서 linregress와 같은 결과"""
+        rng = np.random.default_rng(1)
+        x = np.linspace(0.0, 10.0, 500)
+        y = 3.0 * x - 2.0 + rng.normal(0, 0.5, 500)
+
+        fit = fit_line(x, y)
+        expected = stats.linregress(x, y)
+
+        assert fit.slope == pytest.approx(expected.slope, rel=1e-12)
+        assert fit.intercept == pytest.approx(expected.intercept, rel=1e-12)
+        assert fit.r_value == pytest.approx(expected.rvalue, rel=1e-12)
+        assert fit.slope_stderr == pytest.approx(expected.stderr, rel=1e-10)
+        assert fit.intercept_stderr == pytest.approx(expected.intercept_stderr, rel=1e-10)
+        assert fit.n == 500
+        assert fit.x_range == (0.0, 10.0)
+
+    @pytest.mark.parametrize("case", ["timestamps", "offset_y", "near_perfect"])
+    def test_accurate_on_ill_conditioned_data(self, case):
+        """큰 오프셋/거의 완벽한 선형 데이터에서도 표준 오차가 정확"""
+        rng = np.random.default_rng(7)
+        n = 2000
+        if case == "timestamps":
+            x = 1.7e9 + np.arange(n) * 0.01
+            y = 0.25 * (x - x[0]) + rng.normal(0, 0.1, n)
+        elif case == "offset_y":
+            x = np.linspace(0.0, 1.0, n)
+            y = 1e8 + 2.0 * x + rng.normal(0, 1e-6, n)
+        else:
+            x = np.linspace(0.0, 100.0, n)
+            y = 5.0 * x + 1.0 + rng.normal(0, 1e-9, n)
+
+        slope, intercept, stderr = exact_regression(x, y)
+        fit = fit_line(x, y)
+
+        assert fit.slope == pytest.approx(slope, rel=1e-9)
+        assert fit.slope_stderr == pytest.approx(stderr, rel=1e-6)
+
+    def test_block_size_does_not_change_result(self, monkeypatch):
+        """블록 경계가 여러 개여도 결과가 같음"""
+        rng = np.random.default_rng(3)
+        x = rng.uniform(0, 50, 1001)
+        y = -1.5 * x + rng.normal(0, 1.0, 1001)
+        expected = fit_line(x, y)
+
+        monkeypatch.setattr(regression, "_BLOCK_SIZE", 64)
+        fit = fit_line(x, y)
+
+        assert fit.slope == pytest.approx(expected.slope, rel=1e-13)
+        assert fit.slope_stderr == pytest.approx(expected.slope_stderr, rel=1e-12)
+
+    def test_confidence_intervals(self):
+        """신뢰구간 = 추정값 ± t(n-2) · 표준 오차"""
+        x = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        y = np.array([2.1, 3.9, 6.2, 7.8, 10.1, 12.0])
+
+        fit = fit_line(x, y)
+        slope_ci, intercept_ci = fit.confidence_intervals(0.95)
+        t_value = stats.t.ppf(0.975, 4)
+
+        assert slope_ci == pytest.approx((fit.slope - t_value * fit.slope_stderr, fit.slope + t_value * fit.slope_stderr))
+        assert intercept_ci == pytest.approx(
+            (fit.intercept - t_value * fit.intercept_stderr, fit.intercept + t_value * fit.intercept_stderr)
+        )
+
+    def test_rejects_invalid_input(self):
+        """X 값이 모두 같거나 점이 부족하면 RegressionError"""
+        with pytest.raises(RegressionError):
+            fit_line(np.full(5, 2.0), np.arange(5.0))
+        with pytest.raises(RegressionError):
+            fit_line(np.array([1.0]), np.array([1.0]))
+        with pytest.raises(RegressionError):
+            fit_line(np.arange(3.0), np.arange(4.0))
+
+
+class TestRegressionStatistics:
+    """분석 결과의 신뢰구간 필드 테스트"""
+
+    def test_analyze_dataframe_fills_confidence_intervals(self):
+        """analyze_dataframe 결과에 y절편 표준 오차와 신뢰구간 포함"""
+        df = pd.DataFrame({
+            't': [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+            'v': [1.1, 1.9, 3.1, 3.9, 5.2, 5.8, 7.1, 8.0, 9.2, 9.9]
+        })
+
+        stats_result, _, _ = AnalysisService().analyze_dataframe(df, 't', 'v')
+        expected = stats.linregress(df['t'], df['v'])
+
+        assert stats_result.intercept_std_error == pytest.approx(expected.intercept_stderr, abs=1e-6)
+        assert stats_result.confidence_level == 0.95
+        low, high = stats_result.slope_confidence_interval
+        assert low < stats_result.slope < high
+        low, high = stats_result.intercept_confidence_interval
+        assert low < stats_result.intercept < high
+
+    def test_batch_kernel_is_accurate_on_large_offset_x(self, monkeypatch):
+        """타임스탬프 X에서 배치 커널(fit_line 재계산 없이)의 계수와 표준 오차가 정확"""
+        rng = np.random.default_rng(9)
+        xs, ys = [], []
+        for i, n in enumerate([50, 400, 2500]):
+            x = 1.7e9 + i * 86400 + np.arange(n) * 0.5
+            xs.append(x)
+            ys.append(0.25 * (x - x[0]) + 1e4 + rng.normal(0, 3.0, n))
+
+        def no_refit(x, y):
+            raise AssertionError("well-conditioned series must stay in the kernel")
+
+        monkeypatch.setattr(AnalysisService, "_fit_line", staticmethod(no_refit))
+        batch = AnalysisService()._perform_regression_batch(xs, ys, [None] * len(xs))
+
+        # 결과는 소수점 6자리로 반올림됨
+        for x, y, result in zip(xs, ys, batch):
+            slope, intercept, stderr = exact_regression(x, y)
+            assert result.slope == pytest.approx(slope, abs=1e-6)
+            assert result.intercept == pytest.approx(intercept, abs=1e-6)
+            assert result.std_error == pytest.approx(stderr, abs=1e-6)
+            assert result.intercept_std_error == pytest.approx(fit_line(x, y).intercept_stderr, abs=1e-6)
@@ -0,0 +1,181 @@
+"""
+LabReportAI Report Stream Tests
+SSE 섹션 스트림 파서 및 스트리밍 엔드포인트 테스트
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.models.schemas import (
+    DataSummary,
+    GraphResult,
+    SingleExperimentResult,
+    StatisticsResult
+)
+from app.routers import generate as generate_router_module
+from app.services.gemini_service import GeminiService
+from app.services.report_stream import SectionStreamParser, format_sse
+
+
+REPORT_TEXT = (
+    "서론 없음\n"
+    "<!-- SECTION: experiment_results -->\n실험 결과 본문\n"
+    "<!-- SECTION: result_analysis -->\nR² 해석 <b>강조</b>\n"
+    "<!-- SECTION: discussion -->\n토의 본문"
+)
+
+
+def parse_sse(body: str):
+    """SSE 본문을 (event, data) 목록으로 변환"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestSectionStreamParser:
+    """SectionStreamParser 테스트"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, len(REPORT_TEXT)])
+    def test_detects_markers_split_across_chunks(self, chunk_size):
+        """마커가 청크 경계에서 잘려도 같은 섹션과 텍스트로 분리"""
+        parser = SectionStreamParser()
+        events = []
+        for i in range(0, len(REPORT_TEXT), chunk_size):
+            events.extend(parser.feed(REPORT_TEXT[i:i + chunk_size]))
+        events.extend(parser.close())
+
+        names = [data["name"] for event, data in events if event == "section"]
+        assert names == ["experiment_results", "result_analysis", "discussion"]
+
+        texts = {}
+        for event, data in events:
+            if event == "delta":
+                texts[data["section"]] = texts.get(data["section"], "") + data["text"]
+        assert texts[None] == "서론 없음\n"
+        assert texts["experiment_results"].strip() == "실험 결과 본문"
+        assert texts["result_analysis"].strip() == "R² 해석 <b>강조</b>"
+        assert texts["discussion"].strip() == "토의 본문"
+
+    def test_format_sse(self):
+        """이벤트 이름과 JSON 데이터 한 블록"""
+        assert format_sse("section", {"name": "토의"}) == 'event: section\ndata: {"name": "토의"}\n\n'
+
+
+class FakeStreamingService(GeminiService):
+    """모델 대신 고정 조각을 스트리밍하는 서비스"""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    async def stream_full_report_async(self, **kwargs):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error:
+            raise self.error
+
+
+class TestFullReportStreamEndpoint:
+    """POST /api/generate/full-report/stream 테스트"""
+
+    @pytest.fixture
+    def request_body(self):
+        experiment = SingleExperimentResult(
+            experiment_name="실험 1",
+            sheet_name="Sheet1",
+            statistics=StatisticsResult(
+                slope=2.0, intercept=0.0, r_squared=0.99, std_error=0.01,
+                data_points=5, x_range=(0.0, 4.0), y_range=(0.0, 8.0)
+            ),
+            graph=GraphResult(),
+            data_summary=DataSummary(columns=["x", "y"], row_count=5),
+            data_table=[{"x": 0, "y": 0}]
+        )
+        return {"batch_id": "b1", "report_title": "옴의 법칙", "experiments": [experiment.model_dump()]}
+
+    def make_client(self, monkeypatch, service):
+        monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+        monkeypatch.setattr(generate_router_module, "get_gemini_service", lambda: service)
+        app = FastAPI()
+        app.include_router(generate_router_module.router)
+        return TestClient(app)
+
+    def test_streams_sections_then_completed_report(self, monkeypatch, request_body):
+        """started → section/delta → completed(조립된 마크다운) 순서로 전송"""
+        chunks = [REPORT_TEXT[i:i + 10] for i in range(0, len(REPORT_TEXT), 10)]
+        client = self.make_client(monkeypatch, FakeStreamingService(chunks))
+
+        response = client.post("/api/generate/full-report/stream", json=request_body)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+
+        assert events[0] == ("started", {"report_title": "옴의 법칙", "experiment_count": 1})
+        assert [data["name"] for event, data in events if event == "section"] == [
+            "experiment_results", "result_analysis", "discussion"
+        ]
+        event, completed = events[-1]
+        assert event == "completed"
+        assert completed["sections"]["discussion"] == "토의 본문"
+        assert "옴의 법칙" in completed["markdown_content"]
+        assert "실험 결과 본문" in completed["markdown_content"]
+
+    def test_stream_failure_sends_error_event(self, monkeypatch, request_body):
+        """생성 도중 실패하면 error 이벤트로 종료"""
+        client = self.make_client(monkeypatch, FakeStreamingService(["부분"], error=RuntimeError("끊김")))
+
+        events = parse_sse(client.post("/api/generate/full-report/stream", json=request_body).text)
+
+        assert events[-1][0] == "error"
+        assert events[-1][1]["code"] == "REPORT_GENERATION_FAILED"
+
+    def test_url_mode_graph_is_read_off_event_loop(self, monkeypatch, request_body):
+        """url 모드 그래프는 이벤트 루프 밖(스레드 풀)에서 에셋 저장소를 읽어 임베딩"""
+        import asyncio
+        from app.services import report_generator as report_generator_module
+
+        reads = []
+
+        class RecordingAssetStore:
+            def get(self, asset_id):
+                try:
+                    asyncio.get_running_loop()
+                    reads.append("event loop")
+                except RuntimeError:
+                    reads.append("worker")
+                return b"\x89PNG"
+
+        monkeypatch.setattr(report_generator_module, "asset_store", RecordingAssetStore())
+        request_body["experiments"][0]["graph"] = GraphResult(
+            image_url="/api/assets/abc.png", asset_id="abc.png"
+        ).model_dump()
+        client = self.make_client(monkeypatch, FakeStreamingService([REPORT_TEXT]))
+
+        events = parse_sse(client.post("/api/generate/full-report/stream", json=request_body).text)
+
+        assert events[-1][0] == "completed"
+        assert "data:image/png;base64,iVBORw==" in events[-1][1]["markdown_content"]
+        assert reads == ["worker"]
+
+    def test_saturated_executor_sends_busy_event(self, monkeypatch, request_body):
+        """리포트 조립 시 실행기 대기열이 가득 차면 SERVER_BUSY error 이벤트"""
+        from app.utils.executor import CPUExecutor
+
+        saturated = CPUExecutor(thread_workers=1, process_workers=1, max_pending_tasks=0, retry_after_seconds=3)
+        monkeypatch.setattr(generate_router_module, "cpu_executor", saturated)
+        client = self.make_client(monkeypatch, FakeStreamingService([REPORT_TEXT]))
+
+        events = parse_sse(client.post("/api/generate/full-report/stream", json=request_body).text)
+
+        assert events[-1] == ("error", {
+            "code": "SERVER_BUSY",
+            "message": "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.",
+            "retry_after": 3
+        })
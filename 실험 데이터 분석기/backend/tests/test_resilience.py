@@ -0,0 +1,224 @@
+"""
+LabReportAI Resilience Tests
+재시도(백오프, Retry-After, 시간 예산), 서킷 브레이커, Gemini 일시 오류 처리 테스트
+"""
+
+import json
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from google.genai import errors as genai_errors
+
+from app.config import settings
+from app.routers import generate as generate_router_module
+from app.services.gemini_service import GeminiService, GeminiUnavailableError
+from app.services.llm_cache import LLMResponseCache
+from app.services.manual_cache import ManualExtractionCache
+from app.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetriesExhaustedError,
+    RetryPolicy
+)
+from app.utils.upload_reader import SpooledUpload
+from tests.test_gemini_service import StubModelServer, statistics  # noqa: F401
+
+
+def make_policy(max_attempts: int = 3, failure_threshold: int = 5) -> RetryPolicy:
+    return RetryPolicy(
+        max_attempts=max_attempts,
+        base_delay=0.01,
+        max_delay=0.05,
+        breaker=CircuitBreaker(failure_threshold=failure_threshold, reset_seconds=60)
+    )
+
+
+def make_service(server: StubModelServer, policy: RetryPolicy) -> GeminiService:
+    return GeminiService(
+        api_key="test-key",
+        base_url=server.url,
+        cache=LLMResponseCache(max_entries=8, ttl_seconds=60),
+        manual_extraction_cache=ManualExtractionCache(cache_dir=None, max_memory_entries=4),
+        retry_policy=policy
+    )
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+
+    def test_opens_after_threshold_and_allows_one_probe(self, monkeypatch):
+        """연속 실패 시 열리고, 대기 후 시험 호출 하나만 허용, 성공하면 닫힘"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10)
+        now = [1000.0]
+        monkeypatch.setattr("app.services.resilience.time.monotonic", lambda: now[0])
+
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_after == pytest.approx(10)
+
+        now[0] += 11
+        breaker.before_call()  # 시험 호출
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        breaker.before_call()
+        assert breaker.get_stats() == {"state": "closed", "consecutive_failures": 0, "opened": 1, "rejected": 2}
+
+
+class TestRetryPolicy:
+    """RetryPolicy 테스트"""
+
+    def test_backoff_is_jittered_capped_and_honours_retry_after(self):
+        policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=4.0)
+
+        delays = [policy.backoff(3, None) for _ in range(200)]
+
+        assert all(0 <= d <= 4.0 for d in delays)
+        assert len(set(delays)) > 1
+        assert policy.backoff(0, 7.5) >= 7.5
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_retry_after_exceeds_budget(self):
+        """대기 시간이 남은 예산을 넘으면 기다리지 않고 바로 포기"""
+        policy = make_policy(max_attempts=4)
+        calls = []
+
+        async def operation(remaining):
+            calls.append(remaining)
+            raise RuntimeError("throttled")
+
+        started = time.monotonic()
+        with pytest.raises(RetriesExhaustedError) as exc_info:
+            await policy.call_async(operation, lambda e: ("rate_limited", 5.0), budget_seconds=1.0)
+
+        assert time.monotonic() - started < 0.5
+        assert len(calls) == 1
+        assert exc_info.value.retry_after == 5.0
+        assert policy.get_stats()["exhausted"] == 1
+
+
+class TestGeminiRetry:
+    """GeminiService 재시도/서킷 브레이커 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self, statistics):
+        """503, 429 후 성공하면 정상 응답과 사유별 재시도 통계"""
+        server = StubModelServer(text="회복된 고찰", failures=[503, 429], retry_after=0)
+        policy = make_policy()
+        try:
+            response = await make_service(server, policy).generate_discussion_async("옴의 법칙", statistics)
+        finally:
+            server.close()
+
+        assert response.discussion == "회복된 고찰"
+        assert len(server.requests) == 3
+        stats = policy.get_stats()
+        assert stats["retries_by_reason"] == {"unavailable": 1, "rate_limited": 1}
+        assert stats["circuit"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_persistent_failure_opens_circuit(self, statistics):
+        """재시도가 모두 실패하면 503 코드, 연속 실패가 쌓이면 호출 없이 바로 실패"""
+        server = StubModelServer(failures=[429] * 10, retry_after=0)
+        policy = make_policy(max_attempts=2, failure_threshold=4)
+        try:
+            service = make_service(server, policy)
+            with pytest.raises(GeminiUnavailableError) as exc_info:
+                await service.generate_discussion_async("실험 1", statistics)
+            assert exc_info.value.code == "GEMINI_RATE_LIMITED"
+
+            with pytest.raises(GeminiUnavailableError):
+                await service.generate_discussion_async("실험 2", statistics)
+
+            with pytest.raises(GeminiUnavailableError) as exc_info:
+                await service.generate_discussion_async("실험 3", statistics)
+        finally:
+            server.close()
+
+        assert exc_info.value.code == "GEMINI_CIRCUIT_OPEN"
+        assert exc_info.value.retry_after > 0
+        assert len(server.requests) == 4
+        assert policy.get_stats()["circuit"]["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, statistics):
+        """400 오류는 재시도하지 않고 서킷에도 반영하지 않음"""
+        server = StubModelServer(failures=[400])
+        policy = make_policy(failure_threshold=1)
+        try:
+            with pytest.raises(genai_errors.ClientError):
+                await make_service(server, policy).generate_discussion_async("잘못된 요청", statistics)
+        finally:
+            server.close()
+
+        assert len(server.requests) == 1
+        assert policy.get_stats()["circuit"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_before_first_chunk(self, statistics):
+        """스트림은 첫 조각 전 오류만 재시도"""
+        server = StubModelServer(chunks=["첫 조각, ", "두 번째 조각"], failures=[503], retry_after=0)
+        try:
+            service = make_service(server, make_policy())
+            chunks = [text async for text in service.stream_discussion_async("옴의 법칙", statistics)]
+        finally:
+            server.close()
+
+        assert "".join(chunks) == "첫 조각, 두 번째 조각"
+        assert len(server.requests) == 2
+        assert service.in_flight == 0
+
+
+class TestManualExtractionErrors:
+    """매뉴얼 추출 업스트림 오류 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_is_raised_not_placeholder(self):
+        """재시도 후에도 실패하면 'PDF 분석 실패' 기본값 대신 예외 전달 (저장하지 않음)"""
+        text = json.dumps({"experiment_purpose": "옴의 법칙 확인", "theory": "V = IR", "error_guides": []})
+        server = StubModelServer(text=text, failures=[503, 503], retry_after=0)
+        try:
+            service = make_service(server, make_policy(max_attempts=2))
+            upload = SpooledUpload.from_bytes(b"%PDF-ohm")
+
+            with pytest.raises(GeminiUnavailableError):
+                await service.extract_manual_from_upload_async(upload, "ohm.pdf")
+
+            manual = await service.extract_manual_from_upload_async(upload, "ohm.pdf")
+        finally:
+            server.close()
+
+        assert manual.experiment_purpose == "옴의 법칙 확인"
+        assert len(server.requests) == 3
+
+    def test_endpoint_returns_503_with_retry_after(self, monkeypatch):
+        """Retry-After가 남은 시간 예산보다 길면 바로 503 + Retry-After 헤더"""
+        server = StubModelServer(failures=[503] * 4, retry_after=2)
+        service = make_service(server, make_policy())
+        monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+        monkeypatch.setattr(settings, "gemini_timeout_seconds", 1.0)
+        monkeypatch.setattr(generate_router_module, "get_gemini_service", lambda: service)
+
+        app = FastAPI()
+        app.include_router(generate_router_module.router)
+        try:
+            with TestClient(app) as client:
+                response = client.post(
+                    "/api/generate/extract-manual",
+                    files={"file": ("ohm.pdf", b"%PDF-ohm", "application/pdf")}
+                )
+                status = client.get("/api/generate/status").json()
+        finally:
+            server.close()
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "2"
+        assert response.json()["detail"]["code"] == "GEMINI_UNAVAILABLE"
+        assert len(server.requests) == 1
+        assert status["resilience"]["exhausted"] == 1
@@ -0,0 +1,52 @@
+"""
+LabReportAI Production Server Tests
+운영 실행기 인자 파싱 및 워커 예열 테스트
+"""
+
+import pytest
+
+from app import server
+from app.config import settings
+from app.services import warmup
+from app.services.asset_store import LocalAssetStore
+from app.services.graph_generator import GraphGenerator
+from app.services.render_engine import GraphRenderEngine, warm_render_worker
+from app.utils.executor import CPUExecutor
+
+
+class TestServerArgs:
+    """python -m app.server 인자 테스트"""
+
+    def test_defaults_come_from_settings(self):
+        args = server.parse_args([])
+
+        assert args.workers == settings.server_workers
+        assert args.port == settings.port
+        assert args.graceful_timeout == settings.server_graceful_timeout_seconds
+        assert args.access_log is True
+
+    def test_invalid_worker_count_is_rejected(self):
+        with pytest.raises(SystemExit):
+            server.parse_args(["--workers", "0"])
+
+
+class TestWarmUp:
+    """워커 예열 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_runs_synthetic_request(self, tmp_path, monkeypatch):
+        """렌더링 워커 기동과 합성 분석+렌더링 요청을 실행하고 단계별 시간 반환"""
+        executor = CPUExecutor(thread_workers=1, process_workers=1, max_pending_tasks=8, retry_after_seconds=1)
+        executor.set_process_initializer(warm_render_worker)
+        engine = GraphRenderEngine(executor, GraphGenerator(), LocalAssetStore(str(tmp_path)))
+        monkeypatch.setattr(warmup, "render_engine", engine)
+        monkeypatch.setattr(settings, "gemini_api_key", "")
+
+        try:
+            timings = await warmup.warm_up_application()
+        finally:
+            executor.shutdown()
+
+        assert list(timings) == ["render_workers", "synthetic_request"]
+        assert all(seconds >= 0 for seconds in timings.values())
+        assert executor.get_stats()["completed"] >= 2
@@ -0,0 +1,116 @@
+"""
+LabReportAI Single Flight Tests
+동시 중복 분석 요청 병합 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.models.schemas import ExperimentConfig, GraphResult
+from app.routers import analyze as analyze_router_module
+from app.services.single_flight import SingleFlight, make_request_key
+
+
+CSV_CONTENT = "time,voltage\n" + "\n".join(f"{i * 0.1:.1f},{i * 2.0:.1f}" for i in range(1, 11))
+
+
+class TestMakeRequestKey:
+    """make_request_key 테스트"""
+
+    def test_normalizes_models_and_key_order(self):
+        """같은 설정이면 JSON 키 순서와 관계없이 같은 키, 값이 다르면 다른 키"""
+        exp = ExperimentConfig(sheet_name="Sheet1", x_column="t", y_column="v", experiment_name="실험 1")
+        same = ExperimentConfig(**{"experiment_name": "실험 1", "y_column": "v", "x_column": "t", "sheet_name": "Sheet1"})
+
+        key = make_request_key("analyze_batch", "a" * 64, {"experiments": [exp], "report_title": "진자"})
+
+        assert key == make_request_key("analyze_batch", "a" * 64, {"report_title": "진자", "experiments": [same]})
+        assert key != make_request_key("analyze_batch", "b" * 64, {"experiments": [exp], "report_title": "진자"})
+        assert key != make_request_key("analyze_batch", "a" * 64, {"experiments": [exp], "report_title": "용수철"})
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_computation(self):
+        """같은 키의 동시 요청은 계산 한 번의 결과를 공유하고, 끝난 뒤에는 다시 계산"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"run": calls}
+
+        results = await asyncio.gather(*[flight.do("test", "key", compute) for _ in range(20)])
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        stats = flight.get_stats()
+        assert stats["executions"] == 1 and stats["deduplicated"] == 19 and stats["in_flight"] == 0
+
+        await flight.do("test", "key", compute)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_all_waiters(self):
+        """계산이 실패하면 기다리던 모든 요청에 같은 예외 전달"""
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("분석 실패")
+
+        results = await asyncio.gather(
+            *[flight.do("test", "key", failing) for _ in range(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.get_stats()["in_flight"] == 0
+
+
+class TestAnalyzeDataCoalescing:
+    """POST /api/analyze/data 요청 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_identical_uploads_are_analyzed_once(self, monkeypatch):
+        """같은 CSV와 파라미터의 동시 요청 10개는 분석/렌더링 한 번, 같은 analysis_id"""
+        flight = SingleFlight()
+        monkeypatch.setattr(analyze_router_module, "analysis_flight", flight)
+
+        renders = 0
+
+        async def slow_render(**kwargs):
+            nonlocal renders
+            renders += 1
+            await asyncio.sleep(0.2)
+            return GraphResult()
+
+        monkeypatch.setattr(analyze_router_module.render_engine, "render", slow_render)
+
+        app = FastAPI()
+        app.include_router(analyze_router_module.router)
+
+        def post(client, title="옴의 법칙"):
+            return client.post(
+                "/api/analyze/data",
+                files={"file": ("data.csv", CSV_CONTENT.encode(), "text/csv")},
+                data={"title": title, "x_column": "time", "y_column": "voltage"}
+            )
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(*[post(client) for _ in range(10)])
+            other = await post(client, title="다른 제목")
+
+        assert all(r.status_code == 200 for r in responses)
+        assert len({r.json()["data"]["analysis_id"] for r in responses}) == 1
+        assert other.json()["data"]["analysis_id"] != responses[0].json()["data"]["analysis_id"]
+        assert renders == 2
+        assert flight.get_stats()["by_name"]["analyze_data"] == {"executions": 2, "deduplicated": 9}
@@ -0,0 +1,69 @@
+"""
+LabReportAI Upload Reader Tests
+크기 제한 청크 업로드 리더 테스트
+"""
+
+import gc
+import io
+import os
+
+import pytest
+from fastapi import UploadFile
+
+from app.utils.upload_reader import read_upload, UploadTooLargeError
+
+
+class CountingStream(io.BytesIO):
+    """읽은 바이트 수를 기록하는 스트림"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class TestReadUpload:
+    """read_upload 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_small_upload_stays_in_memory(self):
+        """임계값 이하 파일은 메모리에 보관하고 해시를 계산"""
+        upload = await read_upload(UploadFile(io.BytesIO(b"a,b\n1,2\n")), max_size_mb=1)
+
+        assert upload.path is None
+        assert upload.size == 8
+        assert upload.read_bytes() == b"a,b\n1,2\n"
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_is_rejected_while_streaming(self):
+        """크기 정보가 없어도 제한을 넘는 순간 읽기를 중단"""
+        stream = CountingStream(b"x" * (3 * 1024 * 1024))
+
+        with pytest.raises(UploadTooLargeError):
+            await read_upload(UploadFile(stream), max_size_mb=1, chunk_size=64 * 1024)
+
+        assert stream.bytes_read < 2 * 1024 * 1024
+
+    @pytest.mark.asyncio
+    async def test_large_upload_is_spooled_to_temp_file(self):
+        """임계값을 넘으면 임시 파일에 기록하고, 참조가 사라지면 삭제"""
+        data = os.urandom(300 * 1024)
+        upload = await read_upload(
+            UploadFile(io.BytesIO(data)),
+            max_size_mb=1,
+            spool_threshold_bytes=100 * 1024,
+            chunk_size=64 * 1024
+        )
+
+        path = upload.path
+        assert path is not None and upload.in_memory_bytes == 0
+        with upload.open() as f:
+            assert f.read() == data
+
+        del upload
+        gc.collect()
+        assert not os.path.exists(path)
@@ -0,0 +1,216 @@
+"""
+LabReportAI Workbook Cache Tests
+업로드 워크북 캐시 및 upload_id 재사용 테스트
+"""
+
+import hashlib
+import io
+import zipfile
+
+import openpyxl
+import pandas as pd
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from openpyxl.styles import Font
+
+from app.routers import analyze as analyze_router_module
+from app.utils import file_parser
+from app.utils.file_parser import (
+    FileParserError,
+    get_cached_workbook,
+    load_selected_sheets,
+    read_workbook_metadata,
+    _build_sheet_info_list,
+    _read_all_sheets
+)
+from app.utils.upload_reader import SpooledUpload
+from app.utils.workbook_cache import WorkbookCache, CachedWorkbook
+
+
+def make_workbook_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        pd.DataFrame({"x": range(10), "y": range(10)}).to_excel(writer, sheet_name="실험1", index=False)
+        pd.DataFrame({"t": range(6), "v": [1.5, None, 2.5, 3.5, 4.5, 5.5]}).to_excel(writer, sheet_name="실험2", index=False)
+        pd.DataFrame().to_excel(writer, sheet_name="빈 시트", index=False)
+    return buffer.getvalue()
+
+
+def with_empty_string_cells(content: bytes) -> bytes:
+    """openpyxl이 내용 없이 저장한 빈 문자열 셀을 빈 텍스트("")가 있는 셀로 바꿈 (Excel이 저장하는 형태)"""
+    source = zipfile.ZipFile(io.BytesIO(content))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as target:
+        for name in source.namelist():
+            data = source.read(name)
+            if name.startswith("xl/worksheets/"):
+                data = data.replace(b't="inlineStr" />', b't="inlineStr"><is><t></t></is></c>')
+            target.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestWorkbookCache:
+    """WorkbookCache 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        """최대 항목 수를 넘으면 가장 오래 사용되지 않은 워크북 제거"""
+        cache = WorkbookCache(max_entries=2, max_memory_bytes=10 * 1024 * 1024, ttl_seconds=60)
+        workbook = CachedWorkbook(SpooledUpload.from_bytes(b"xlsx-bytes"), ".xlsx")
+
+        cache.put("a", workbook)
+        cache.put("b", workbook)
+        cache.get("a")
+        cache.put("c", workbook)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_oversized_put_drops_existing_entry(self):
+        """다시 저장한 워크북이 한도를 넘으면 이전 항목과 용량도 제거"""
+        cache = WorkbookCache(max_entries=2, max_memory_bytes=1024, ttl_seconds=60)
+        workbook = CachedWorkbook(SpooledUpload.from_bytes(b"xlsx-bytes"), ".xlsx")
+        cache.put("a", workbook)
+
+        workbook.frames[("실험1", None)] = pd.DataFrame({"x": range(1000)})
+        cache.put("a", workbook)
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["memory_bytes"] == 0
+
+
+class TestSelectiveLoading:
+    """메타데이터 fast path 및 선택적 시트/열 로딩 테스트"""
+
+    def test_metadata_matches_full_parse(self):
+        """헤더/행 수/샘플이 전체 파싱 결과와 동일"""
+        content = make_workbook_bytes()
+        workbook = CachedWorkbook(SpooledUpload.from_bytes(content), ".xlsx")
+
+        expected = _build_sheet_info_list(_read_all_sheets(io.BytesIO(content))[1])
+
+        assert read_workbook_metadata(workbook) == expected
+        assert workbook.sheet_names == ["실험1", "실험2", "빈 시트"]
+        assert workbook.frames == {}
+
+    def test_metadata_row_count_ignores_trailing_blank_rows(self):
+        """서식만 있는 끝의 빈 행은 세지 않고, 중간의 빈 행은 pandas처럼 셈"""
+        book = openpyxl.Workbook()
+        sheet = book.active
+        sheet.title = "실험1"
+        sheet.append(["x", "y"])
+        for i in range(4):
+            sheet.append([i, i * 2])
+        sheet.append([None, None])
+        sheet.append([5, 10])
+        for row in range(9, 30):
+            sheet.cell(row=row, column=1).font = Font(bold=True)
+        buffer = io.BytesIO()
+        book.save(buffer)
+        content = buffer.getvalue()
+
+        workbook = CachedWorkbook(SpooledUpload.from_bytes(content), ".xlsx")
+        expected = _build_sheet_info_list(_read_all_sheets(io.BytesIO(content))[1])
+
+        assert read_workbook_metadata(workbook) == expected
+        assert expected[0].row_count == 6
+
+    def test_trailing_empty_string_rows_are_blank_in_both_passes(self):
+        """끝의 빈 문자열("")만 있는 행은 메타데이터와 선택 로딩 모두 빈 행으로 제외"""
+        book = openpyxl.Workbook()
+        sheet = book.active
+        sheet.title = "실험1"
+        sheet.append(["x", "y"])
+        for i in range(4):
+            sheet.append([i, i * 2])
+        for _ in range(3):
+            sheet.append(["", ""])
+        buffer = io.BytesIO()
+        book.save(buffer)
+        content = with_empty_string_cells(buffer.getvalue())
+        assert list(openpyxl.load_workbook(io.BytesIO(content)).active.values)[-1] == ("", "")
+
+        workbook = CachedWorkbook(SpooledUpload.from_bytes(content), ".xlsx")
+        full = _read_all_sheets(io.BytesIO(content))[1]
+        sheet_infos = read_workbook_metadata(workbook)
+        sheets_data = load_selected_sheets(workbook, {"실험1": ["x", "y"]})
+
+        assert sheet_infos == _build_sheet_info_list(full)
+        assert sheet_infos[0].row_count == len(full["실험1"]) == 4
+        assert len(sheets_data["실험1"]) == 4
+
+    def test_loads_only_requested_sheets_and_columns(self):
+        """요청한 시트의 요청한 열만 읽음"""
+        workbook = CachedWorkbook(SpooledUpload.from_bytes(make_workbook_bytes()), ".xlsx")
+
+        sheets_data = load_selected_sheets(workbook, {"실험2": ["v"]})
+
+        assert list(sheets_data) == ["실험2"]
+        assert sheets_data["실험2"].columns.tolist() == ["v"]
+        assert sheets_data["실험2"]["v"].isna().sum() == 1
+        assert len(sheets_data["실험2"]) == 6
+
+    def test_missing_column_is_reported(self):
+        """없는 열은 COLUMN_NOT_FOUND"""
+        workbook = CachedWorkbook(SpooledUpload.from_bytes(make_workbook_bytes()), ".xlsx")
+
+        with pytest.raises(FileParserError) as exc_info:
+            load_selected_sheets(workbook, {"실험1": ["z"]})
+
+        assert exc_info.value.code.value == "COLUMN_NOT_FOUND"
+
+
+class TestUploadIdReuse:
+    """detect-sheets → upload_id 재사용 테스트"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        cache = WorkbookCache(max_entries=4, max_memory_bytes=10 * 1024 * 1024, ttl_seconds=60)
+        monkeypatch.setattr(file_parser, "workbook_cache", cache)
+
+        app = FastAPI()
+        app.include_router(analyze_router_module.router)
+        return TestClient(app), cache
+
+    def test_detect_sheets_caches_parsed_workbook(self, client):
+        """detect-sheets 응답의 upload_id로 파싱된 시트를 다시 조회"""
+        test_client, cache = client
+        content = make_workbook_bytes()
+
+        response = test_client.post(
+            "/api/analyze/detect-sheets",
+            files={"file": ("data.xlsx", content, "application/octet-stream")}
+        )
+
+        assert response.status_code == 200
+        upload_id = response.json()["upload_id"]
+        assert upload_id == hashlib.sha256(content).hexdigest()
+        assert [sheet["sheet_name"] for sheet in response.json()["sheets"]] == ["실험1", "실험2"]
+        assert get_cached_workbook(upload_id) is not None
+
+        # 같은 파일을 다시 올리면 파싱 없이 캐시 적중
+        test_client.post(
+            "/api/analyze/detect-sheets",
+            files={"file": ("data.xlsx", content, "application/octet-stream")}
+        )
+        assert cache.get_stats()["hits"] >= 2
+
+    def test_unknown_upload_id_is_rejected(self, client):
+        """없는 upload_id는 UPLOAD_NOT_FOUND"""
+        test_client, _ = client
+
+        with pytest.raises(FileParserError):
+            get_cached_workbook("missing")
+
+        response = test_client.post(
+            "/api/analyze/batch",
+            data={
+                "upload_id": "missing",
+                "experiments_json": "[]",
+                "report_title": "리포트"
+            }
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"]["code"] == "UPLOAD_NOT_FOUND"
@@ -15,7 +15,7 @@ import {
   BatchAnalysisData,
   AnalysisStep,
 } from '@/types';
-import { generateDiscussion, analyzeBatch, generateFullReport } from '@/lib/api';
+import { generateDiscussion, analyzeBatch, streamFullReport, getGraphSrc } from '@/lib/api';
 
 type AppMode = 'single' | 'multi';
 
@@ -33,6 +33,7 @@ export default function Home() {
   // ========== 멀티 분석 모드 상태 ==========
   const [currentStep, setCurrentStep] = useState<AnalysisStep>('upload');
   const [excelFile, setExcelFile] = useState<File | null>(null);
+  const [uploadId, setUploadId] = useState<string | null>(null);
   const [sheets, setSheets] = useState<SheetInfo[]>([]);
   const [experimentConfigs, setExperimentConfigs] = useState<ExperimentConfig[]>([]);
   const [manualInfo, setManualInfo] = useState<ExperimentManualInfo | null>(null);
@@ -62,6 +63,7 @@ export default function Home() {
     // 멀티 모드 리셋
     setCurrentStep('upload');
     setExcelFile(null);
+    setUploadId(null);
     setSheets([]);
     setExperimentConfigs([]);
     setManualInfo(null);
@@ -95,8 +97,9 @@ export default function Home() {
   };
 
   // ========== 멀티 분석 핸들러 ==========
-  const handleExcelUploaded = (file: File, detectedSheets: SheetInfo[]) => {
+  const handleExcelUploaded = (file: File, detectedSheets: SheetInfo[], detectedUploadId: string | null) => {
     setExcelFile(file);
+    setUploadId(detectedUploadId);
     setSheets(detectedSheets);
     setError(null);
   };
@@ -125,11 +128,16 @@ export default function Home() {
     setCurrentStep('analyzing');
 
     try {
-      const response = await analyzeBatch(excelFile, {
-        experiments: experimentConfigs.filter((c) => c.sheet_name),
-        report_title: reportTitle,
-        manual_info: manualInfo || undefined,
-      });
+      // detect-sheets에서 파싱한 워크북을 재사용 (파일 재업로드 없음)
+      const response = await analyzeBatch(
+        excelFile,
+        {
+          experiments: experimentConfigs.filter((c) => c.sheet_name),
+          report_title: reportTitle,
+          manual_info: manualInfo || undefined,
+        },
+        uploadId
+      );
 
       if (response.success && response.data) {
         setBatchResults(response.data);
@@ -153,12 +161,24 @@ export default function Home() {
     setError(null);
 
     try {
-      const response = await generateFullReport({
-        batch_id: batchResults.batch_id,
-        report_title: batchResults.report_title,
-        experiments: batchResults.experiments,
-        manual_info: batchResults.manual_info || undefined,
-      });
+      // 실험 결과(그래프 포함)는 서버에 저장되어 있으므로 다시 전송하지 않음
+      // 생성되는 텍스트를 바로 보여주고, 완료되면 테이블/그래프가 포함된 리포트로 교체
+      let streamedText = '';
+      const response = await streamFullReport(
+        {
+          batch_id: batchResults.batch_id,
+          report_title: batchResults.report_title,
+          manual_info: batchResults.manual_info || undefined,
+        },
+        {
+          onDelta: (text) => {
+            streamedText += text;
+            setMarkdownReport(streamedText);
+            setCurrentStep('report');
+          },
+        },
+        batchResults.experiments
+      );
 
       if (response.success && response.markdown_content) {
         setMarkdownReport(response.markdown_content);
@@ -167,6 +187,9 @@ export default function Home() {
         setError(response.message || '리포트 생성에 실패했습니다.');
       }
     } catch (err) {
+      // 스트리밍 도중 실패하면 부분 리포트 대신 결과 화면으로 복귀
+      setMarkdownReport(null);
+      setCurrentStep('results');
       setError(err instanceof Error ? err.message : '리포트 생성 중 오류가 발생했습니다.');
     } finally {
       setIsLoading(false);
@@ -292,7 +315,7 @@ export default function Home() {
               <div className="bg-white rounded-xl shadow-lg p-6">
                 <h3 className="text-lg font-bold text-gray-800 mb-4">회귀 분석 그래프</h3>
                 <img
-                  src={analysisResult.graph.image_base64}
+                  src={getGraphSrc(analysisResult.graph)}
                   alt="분석 그래프"
                   className="w-full rounded-lg"
                 />
@@ -2,6 +2,7 @@
 
 import { useState } from 'react';
 import { BatchAnalysisData, SingleExperimentResult } from '@/types';
+import { getGraphSrc } from '@/lib/api';
 
 interface BatchResultsViewProps {
     results: BatchAnalysisData;
@@ -71,7 +72,7 @@ export default function BatchResultsView({
                         </h3>
                         <div className="flex justify-center">
                             <img
-                                src={currentExperiment.graph.image_base64}
+                                src={getGraphSrc(currentExperiment.graph)}
                                 alt={`${currentExperiment.experiment_name} 그래프`}
                                 className="max-w-full h-auto rounded-lg shadow"
                             />
@@ -5,7 +5,7 @@ import { SheetInfo, ExperimentManualInfo } from '@/types';
 import { detectExcelSheets, extractManualFromPdf } from '@/lib/api';
 
 interface MultiFileUploaderProps {
-    onExcelUploaded: (file: File, sheets: SheetInfo[]) => void;
+    onExcelUploaded: (file: File, sheets: SheetInfo[], uploadId: string | null) => void;
     onManualExtracted: (manualInfo: ExperimentManualInfo) => void;
     onError: (message: string) => void;
 }
@@ -38,7 +38,7 @@ export default function MultiFileUploader({
             try {
                 const response = await detectExcelSheets(file);
                 if (response.success) {
-                    onExcelUploaded(file, response.sheets);
+                    onExcelUploaded(file, response.sheets, response.upload_id ?? null);
                 } else {
                     onError(response.message || '시트 감지에 실패했습니다.');
                 }
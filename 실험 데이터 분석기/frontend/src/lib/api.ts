@@ -13,11 +13,26 @@ import {
     PDFExtractionResponse,
     FullReportRequest,
     FullReportResponse,
-    SingleExperimentResult
+    SingleExperimentResult,
+    GraphResult
 } from '@/types';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
+/**
+ * 그래프 이미지의 src 반환 (inline Base64 또는 에셋 URL)
+ */
+export function getGraphSrc(graph: GraphResult): string {
+    if (graph.image_base64) {
+        return graph.image_base64;
+    }
+    if (graph.image_url) {
+        // 상대 경로(/api/assets/...)는 백엔드 주소 기준으로 변환
+        return graph.image_url.startsWith('/') ? `${API_BASE_URL}${graph.image_url}` : graph.image_url;
+    }
+    return '';
+}
+
 /**
  * 파일을 분석하고 통계 결과를 반환
  */
@@ -154,6 +169,9 @@ export async function detectExcelSheets(file: File): Promise<MultiSheetDetection
 
 /**
  * 여러 시트의 데이터를 배치로 분석
+ *
+ * uploadId가 있으면 파일 대신 업로드 ID를 보내 서버에 캐시된 파싱 결과를 사용합니다.
+ * 서버 캐시가 만료된 경우(UPLOAD_NOT_FOUND) 파일로 한 번 재요청합니다.
  */
 export async function analyzeBatch(
     file: File,
@@ -161,12 +179,19 @@ export async function analyzeBatch(
         experiments: ExperimentConfig[];
         report_title: string;
         manual_info?: ExperimentManualInfo;
-    }
+    },
+    uploadId?: string | null
 ): Promise<BatchAnalysisResponse> {
     const formData = new FormData();
-    formData.append('file', file);
+    if (uploadId) {
+        formData.append('upload_id', uploadId);
+    } else {
+        formData.append('file', file);
+    }
     formData.append('experiments_json', JSON.stringify(config.experiments));
     formData.append('report_title', config.report_title);
+    // 그래프는 URL로 받아 응답 크기를 줄이고 브라우저 캐시를 활용
+    formData.append('image_mode', 'url');
 
     if (config.manual_info) {
         formData.append('manual_info_json', JSON.stringify(config.manual_info));
@@ -178,7 +203,10 @@ export async function analyzeBatch(
     });
 
     if (!response.ok) {
-        const error: ErrorResponse = await response.json();
+        const error = await response.json();
+        if (uploadId && error.detail?.error?.code === 'UPLOAD_NOT_FOUND') {
+            return analyzeBatch(file, config);
+        }
         throw new Error(error.error?.message || '배치 분석 중 오류가 발생했습니다.');
     }
 
@@ -215,9 +243,13 @@ export async function extractManualFromPdf(file: File): Promise<PDFExtractionRes
 
 /**
  * 배치 분석 결과를 바탕으로 전체 마크다운 리포트 생성
+ *
+ * experiments를 생략하면 서버에 저장된 배치 결과를 사용합니다.
+ * 서버 저장본이 만료된 경우(BATCH_NOT_FOUND) fallbackExperiments로 한 번 재요청합니다.
  */
 export async function generateFullReport(
-    request: FullReportRequest
+    request: FullReportRequest,
+    fallbackExperiments?: SingleExperimentResult[]
 ): Promise<FullReportResponse> {
     const response = await fetch(`${API_BASE_URL}/api/generate/full-report`, {
         method: 'POST',
@@ -229,12 +261,108 @@ export async function generateFullReport(
 
     if (!response.ok) {
         const error = await response.json();
+        if (
+            error.detail?.code === 'BATCH_NOT_FOUND' &&
+            !request.experiments &&
+            fallbackExperiments
+        ) {
+            return generateFullReport({ ...request, experiments: fallbackExperiments });
+        }
         throw new Error(error.detail?.message || '리포트 생성 중 오류가 발생했습니다.');
     }
 
     return response.json();
 }
 
+/**
+ * 스트리밍 리포트 이벤트 핸들러
+ */
+export interface ReportStreamHandlers {
+    /** 섹션 마커 감지 (experiment_results, result_analysis, discussion) */
+    onSection?: (name: string) => void;
+    /** 생성된 텍스트 조각 */
+    onDelta?: (text: string, section: string | null) => void;
+}
+
+/**
+ * Server-Sent Events 응답을 읽어 이벤트마다 콜백 호출
+ */
+async function readEventStream(
+    response: Response,
+    onEvent: (event: string, data: any) => void
+): Promise<void> {
+    const reader = response.body!.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary = buffer.indexOf('\n\n');
+        while (boundary !== -1) {
+            const block = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = 'message';
+            let data = '';
+            for (const line of block.split('\n')) {
+                if (line.startsWith('event: ')) event = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            }
+            if (data) onEvent(event, JSON.parse(data));
+
+            boundary = buffer.indexOf('\n\n');
+        }
+    }
+}
+
+/**
+ * 전체 마크다운 리포트를 스트리밍으로 생성
+ *
+ * 생성되는 텍스트를 handlers로 바로 전달하고, 완료되면 데이터 테이블과 그래프가
+ * 포함된 완성 리포트를 반환합니다. BATCH_NOT_FOUND 처리는 generateFullReport와 같습니다.
+ */
+export async function streamFullReport(
+    request: FullReportRequest,
+    handlers: ReportStreamHandlers,
+    fallbackExperiments?: SingleExperimentResult[]
+): Promise<FullReportResponse> {
+    const response = await fetch(`${API_BASE_URL}/api/generate/full-report/stream`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(request),
+    });
+
+    if (!response.ok) {
+        const error = await response.json();
+        if (
+            error.detail?.code === 'BATCH_NOT_FOUND' &&
+            !request.experiments &&
+            fallbackExperiments
+        ) {
+            return streamFullReport({ ...request, experiments: fallbackExperiments }, handlers);
+        }
+        throw new Error(error.detail?.message || '리포트 생성 중 오류가 발생했습니다.');
+    }
+
+    const outcome: { result: FullReportResponse | null; error: string | null } = { result: null, error: null };
+
+    await readEventStream(response, (event, data) => {
+        if (event === 'section') handlers.onSection?.(data.name);
+        else if (event === 'delta') handlers.onDelta?.(data.text, data.section);
+        else if (event === 'completed') outcome.result = data;
+        else if (event === 'error') outcome.error = data.message;
+    });
+
+    if (outcome.error) throw new Error(outcome.error);
+    if (!outcome.result) throw new Error('리포트 생성이 완료되기 전에 연결이 끊어졌습니다.');
+    return outcome.result;
+}
+
 /**
  * 마크다운 파일 다운로드 유틸리티
  */
@@ -12,6 +12,10 @@ export interface StatisticsResult {
   intercept: number;
   r_squared: number;
   std_error: number;
+  intercept_std_error?: number | null;
+  slope_confidence_interval?: [number, number] | null;
+  intercept_confidence_interval?: [number, number] | null;
+  confidence_level?: number | null;
   error_rate_percent: number | null;
   data_points: number;
   x_range: [number, number];
@@ -19,10 +23,19 @@ export interface StatisticsResult {
 }
 
 export interface GraphResult {
-  image_base64: string;
-  image_url: string | null;
+  image_base64: string | null;  // inline 모드
+  image_url: string | null;     // url 모드 (/api/assets/{id} 또는 Storage URL)
+  asset_id?: string | null;
+  resolution?: GraphResolution | null;  // 해상도 프로필
+  graph_id?: string | null;             // 해상도와 무관한 그래프 식별자
+  format?: GraphFormat | null;          // 이미지 형식
+  plotted_points?: number | null;       // 그래프에 그린 점 수 (LOD 축소 시 data_points보다 작음)
 }
 
+export type GraphResolution = 'preview' | 'screen' | 'print';
+
+export type GraphFormat = 'png' | 'png_optimized' | 'svg' | 'webp';
+
 export interface DataSummary {
   columns: string[];
   row_count: number;
@@ -113,6 +126,8 @@ export interface MultiSheetDetectionResponse {
   message: string;
   sheets: SheetInfo[];
   total_sheets: number;
+  // batch 요청에서 파일 대신 보낼 업로드 ID (서버에 파싱 결과가 캐시됨)
+  upload_id?: string | null;
 }
 
 export interface ExperimentConfig {
@@ -159,6 +174,7 @@ export interface ReportOptions {
   include_data_tables: boolean;
   include_individual_analysis: boolean;
   tone: string;
+  generation_mode?: 'auto' | 'single' | 'parallel';
 }
 
 export interface ReportSections {
@@ -169,8 +185,9 @@ export interface ReportSections {
 
 export interface FullReportRequest {
   batch_id: string;
-  report_title: string;
-  experiments: SingleExperimentResult[];
+  report_title?: string;
+  // 생략하면 서버에 저장된 배치 결과를 사용
+  experiments?: SingleExperimentResult[];
   manual_info?: ExperimentManualInfo;
   options?: ReportOptions;
 }
@@ -180,6 +197,7 @@ export interface FullReportResponse {
   message: string;
   markdown_content: string;
   sections: ReportSections;
+  prompt_tokens?: number;  // 프롬프트 입력 토큰 수 (서버 추정)
 }
 
 // ============================================================